@@ -0,0 +1,268 @@
+from concurrent.futures import Executor
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+import Geodesy
+import Geometry
+import hashlib
+import hdbscan
+import numpy as np
+
+
+# Detections further than this many km. from every other detection of a group are clustered separately
+LINK_DISTANCE = 25
+
+# Groups spanning at most this many km. from their centre are clustered on a local projection instead of the sphere
+PROJECTION_MAX_EXTENT = 500
+
+# Groups are sent to the worker processes, when an executor is given, in tasks of about this many detections. Most
+# groups are a few detections whose fits take longer to set up than to run, so they are sent together
+PARALLEL_CHUNK_SIZE = 2000
+
+
+def group_detections(lats: np.ndarray, lngs: np.ndarray, link_distance: float=LINK_DISTANCE) -> np.ndarray:
+    """
+    Split detections into groups that are chained together by neighbours within a distance
+
+    Two detections in different groups are further apart than the distance, so no cluster spans two groups and the
+    groups can be clustered independently without merging clusters across their borders.
+
+    Args:
+      lats: Latitudes in degrees
+      lngs: Longitudes in degrees
+      link_distance: Distance in km.
+
+    Returns:
+      Group label of each detection
+    """
+    if len(lats) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # Chord length subtending the same angle as the great-circle distance
+    chord = 2 * np.sin(min(link_distance / Geodesy.EARTH_RADIUS, np.pi) / 2)
+
+    pairs = cKDTree(Geodesy.unit_vectors(lats, lngs)).query_pairs(chord, output_type='ndarray')
+    graph = coo_matrix((np.ones(len(pairs), dtype=np.int8), (pairs[:, 0], pairs[:, 1])), shape=(len(lats), len(lats)))
+
+    return connected_components(graph, directed=False)[1]
+
+
+def _cluster_group(lats: np.ndarray, lngs: np.ndarray, min_cluster_size: int, link_distance: float) -> np.ndarray:
+    """
+    Auxiliary function to cluster a single group of detections, returning -1 for noise
+    """
+    if len(lats) < min_cluster_size:
+        return np.full(len(lats), -1, dtype=np.int64)
+
+    centre = (float(np.mean(lats)), float(np.mean(lngs)))
+    extent = Geodesy.haversine_distance(np.radians(centre[0]), np.radians(centre[1]), np.radians(lats), np.radians(lngs)).max()
+
+    if extent <= PROJECTION_MAX_EXTENT:
+        # Distances on an equirectangular projection in km. are accurate over a few hundred km.
+        xs, ys = Geometry.project(lats, lngs, centre)
+        metric, points, split_distance = 'euclidean', np.column_stack((ys, xs)), link_distance
+    else:
+        metric, points, split_distance = 'haversine', np.radians(np.column_stack((lats, lngs))), link_distance / Geodesy.EARTH_RADIUS
+
+    clusterer = hdbscan.HDBSCAN(metric=metric, min_cluster_size=min_cluster_size).fit(points)
+
+    # Every other detection is further than the link distance, so the group splits from them no later than that distance
+    return _select_clusters(clusterer.condensed_tree_.to_numpy(), len(lats), 1 / split_distance)
+
+
+def _select_clusters(tree: np.ndarray, size: int, root_lambda: float) -> np.ndarray:
+    """
+    Auxiliary function to label the detections of a group by the excess of mass clusters of its condensed tree
+
+    HDBSCAN never selects the root of the tree, or with allow_single_cluster only keeps its densest detections, while
+    the group is a node of the tree over every detection that is born where it splits from the other detections. The
+    root is given that birth, so the group is selected as a whole when clustering all the detections at once would.
+    """
+    parent, child, lambdas, child_size = tree['parent'], tree['child'], tree['lambda_val'], tree['child_size']
+
+    # Detections are the nodes below size, and clusters are numbered from the root at size in the order they are born
+    nodes = max(int(child.max()), size) + 1
+    is_cluster = child >= size
+
+    birth = np.full(nodes, root_lambda, dtype=np.float64)
+    birth[child[is_cluster]] = lambdas[is_cluster]
+
+    stability = np.zeros(nodes, dtype=np.float64)
+    np.add.at(stability, parent, (lambdas - birth[parent]) * child_size)
+
+    parents = np.full(nodes, -1, dtype=np.int64)
+    parents[child] = parent
+
+    # Children are born after their parent, so every cluster is visited after its children
+    selected = np.zeros(nodes, dtype=bool)
+    for cluster in range(nodes - 1, size - 1, -1):
+        children = child[is_cluster & (parent == cluster)]
+        if len(children) == 0 or stability[cluster] >= stability[children].sum():
+            selected[cluster] = True
+            descendants = list(children)
+            while descendants:
+                descendant = descendants.pop()
+                selected[descendant] = False
+                descendants.extend(child[is_cluster & (parent == descendant)])
+        else:
+            stability[cluster] = stability[children].sum()
+
+    # Detections belong to their selected ancestor, if any
+    owner = np.full(nodes, -1, dtype=np.int64)
+    for cluster in range(size, nodes):
+        owner[cluster] = cluster if selected[cluster] else (owner[parents[cluster]] if cluster > size else -1)
+
+    owners = np.full(size, -1, dtype=np.int64)
+    owners[child[~is_cluster]] = owner[parent[~is_cluster]]
+
+    labels = np.full(size, -1, dtype=np.int64)
+    labels[owners >= 0] = np.unique(owners[owners >= 0], return_inverse=True)[1]
+
+    return labels
+
+
+def _group_members(groups: np.ndarray, min_cluster_size: int) -> list[np.ndarray]:
+    """
+    Auxiliary function to list the indices of the detections of each group, skipping groups too small to hold a cluster
+    """
+    order = np.argsort(groups, kind='stable')
+    return [indices for indices in np.split(order, np.flatnonzero(np.diff(groups[order])) + 1) if len(indices) >= min_cluster_size]
+
+
+def _cluster_chunk(groups: list[tuple[np.ndarray, np.ndarray]], min_cluster_size: int, link_distance: float) -> list[np.ndarray]:
+    """
+    Auxiliary function to cluster the groups of a task sent to a worker, given the latitudes and longitudes of each
+    """
+    return [_cluster_group(lats, lngs, min_cluster_size, link_distance) for lats, lngs in groups]
+
+
+def _cluster_groups(lats: np.ndarray, lngs: np.ndarray, members: list[np.ndarray], min_cluster_size: int, link_distance: float, executor: Executor=None) -> list[np.ndarray]:
+    """
+    Auxiliary function to cluster groups of detections, one after another or by the workers of the executor if given
+    """
+    if executor is None or len(members) <= 1:
+        return [_cluster_group(lats[indices], lngs[indices], min_cluster_size, link_distance) for indices in members]
+
+    # Largest groups first, in tasks of about the same number of detections so the workers finish together
+    chunks, chunk, chunk_size = [], [], 0
+    for index in sorted(range(len(members)), key=lambda index: -len(members[index])):
+        chunk.append(index)
+        chunk_size += len(members[index])
+        if chunk_size >= PARALLEL_CHUNK_SIZE:
+            chunks.append(chunk)
+            chunk, chunk_size = [], 0
+    if chunk:
+        chunks.append(chunk)
+
+    futures = [
+        executor.submit(_cluster_chunk, [(lats[members[index]], lngs[members[index]]) for index in chunk], min_cluster_size, link_distance) 
+        for chunk in chunks
+    ]
+
+    group_labels = [None] * len(members)
+    for chunk, future in zip(chunks, futures):
+        for index, local_labels in zip(chunk, future.result()):
+            group_labels[index] = local_labels
+
+    return group_labels
+
+
+def _combine_labels(size: int, members: list[np.ndarray], group_labels: list[np.ndarray]) -> np.ndarray:
+    """
+    Auxiliary function to offset the labels of every group so they are unique across groups
+    """
+    labels = np.full(size, -1, dtype=np.int64)
+
+    next_label = 0
+    for indices, local_labels in zip(members, group_labels):
+        clustered = local_labels >= 0
+        labels[indices[clustered]] = local_labels[clustered] + next_label
+        next_label += local_labels.max() + 1 if clustered.any() else 0
+
+    return labels
+
+
+def cluster_detections(lats: np.ndarray, lngs: np.ndarray, min_cluster_size: int, link_distance: float=LINK_DISTANCE, executor: Executor=None) -> np.ndarray:
+    """
+    Cluster detections with HDBSCAN, one isolated group at a time
+
+    Args:
+      lats: Latitudes in degrees
+      lngs: Longitudes in degrees
+      min_cluster_size: Minimum number of detections in a cluster
+      link_distance: Distance in km. beyond which detections are clustered separately
+      executor: Process pool clustering the groups. None clusters every group in this process
+
+    Returns:
+      Cluster label of each detection, or -1 for noise
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+
+    members = _group_members(group_detections(lats, lngs, link_distance), min_cluster_size)
+
+    return _combine_labels(len(lats), members, _cluster_groups(lats, lngs, members, min_cluster_size, link_distance, executor))
+
+
+class IncrementalClusterer:
+    """
+    Constructor
+
+    Args:
+      min_cluster_size: Minimum number of detections in a cluster
+      link_distance: Distance in km. beyond which detections are clustered separately
+    """
+    def __init__(self, min_cluster_size: int, link_distance: float=LINK_DISTANCE):
+        self.min_cluster_size = min_cluster_size
+        self.link_distance = link_distance
+
+        # Signature of the detections of a group -> cluster label of each of its detections, from the previous update
+        self.groups = {}
+
+    def update(self, lats: np.ndarray, lngs: np.ndarray, keys: np.ndarray, executor: Executor=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cluster the current detections, reclustering only the groups whose detections were added or expired since the previous update
+
+        Args:
+          lats: Latitudes in degrees
+          lngs: Longitudes in degrees
+          keys: Strings uniquely identifying each detection across updates
+          executor: Process pool clustering the groups. None clusters every group in this process
+
+        Returns:
+          Cluster label of each detection, or -1 for noise, and whether the cluster of each detection changed since the previous update
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        keys = np.asarray(keys, dtype=str)
+
+        # Grouping is cheap next to HDBSCAN, so the groups are found again over every detection
+        members = _group_members(group_detections(lats, lngs, self.link_distance), self.min_cluster_size)
+        signatures = [hashlib.sha256('\n'.join(np.sort(keys[indices])).encode()).hexdigest() for indices in members]
+
+        changed_members = [index for index, signature in enumerate(signatures) if signature not in self.groups]
+        reclustered = _cluster_groups(lats, lngs, [members[index] for index in changed_members], self.min_cluster_size, self.link_distance, executor)
+
+        group_labels = [None] * len(members)
+        for index, local_labels in zip(changed_members, reclustered):
+            group_labels[index] = local_labels
+
+        groups = {}
+        for index, (indices, signature) in enumerate(zip(members, signatures)):
+            if group_labels[index] is None:
+                previous = self.groups[signature]
+                group_labels[index] = np.array([previous[key] for key in keys[indices]], dtype=np.int64)
+
+            groups[signature] = dict(zip(keys[indices].tolist(), group_labels[index].tolist()))
+
+        # Groups that are no longer present are forgotten
+        self.groups = groups
+
+        changed = np.zeros(len(lats), dtype=bool)
+        for index in changed_members:
+            changed[members[index]] = True
+
+        print(f'Reclustered {len(changed_members)} of {len(members)} groups of detections.', flush=True)
+
+        return _combine_labels(len(lats), members, group_labels), changed
@@ -1,34 +1,148 @@
 import mysql.connector
+import mysql.connector.pooling
 import constants
+import json
+import threading
 
 host_name = constants.DATABASE_HOST_NAME
 
+# Number of connections kept open and shared by every caller in the process
+POOL_SIZE = 8
+
+CONNECTION_CONFIG = {
+    'user': "root",
+    'password': "test",
+    'host': host_name,
+    'port': 3306,
+    'database': "test"
+}
+
+# The pool is created on first use since the database may still be starting up on import
+connection_pool = None
+pool_lock = threading.Lock()
+
+def get_connection_pool():
+    global connection_pool
+
+    with pool_lock:
+        if connection_pool is None:
+            connection_pool = mysql.connector.pooling.MySQLConnectionPool(pool_name="emberalert", pool_size=POOL_SIZE, pool_reset_session=True, **CONNECTION_CONFIG)
+
+    return connection_pool
+
+# closing the returned connection hands it back to the pool
 def open_connection():
-    db_connection = mysql.connector.connect(user="root", password="test", host=host_name, port=3306, database="test")
+    try:
+        db_connection = get_connection_pool().get_connection()
+    except mysql.connector.errors.PoolError:
+        # every pooled connection is in use, so fall back to a dedicated connection
+        return mysql.connector.connect(**CONNECTION_CONFIG)
+
+    # health check, reconnecting if the server dropped the connection while it sat in the pool
+    try:
+        db_connection.ping(reconnect=True, attempts=3, delay=1)
+    except Exception:
+        db_connection.close()
+        raise
+
     return db_connection
 
+# begin a transaction on its own connection, which is passed to the other transaction functions
 def begin_transaction():
-    # begin a transaction
-    pass
+    db_connection = open_connection()
+    db_connection.start_transaction()
+    return db_connection
 
-def commit_transaction():
-    # commit transaction to database
-    pass
+# commit transaction to database and release its connection
+def commit_transaction(db_connection):
+    try:
+        db_connection.commit()
+    finally:
+        db_connection.close()
 
-def rollback_transaction():
-    # rollback the transaction
-    # this will likely occur if something went awry
-    pass
+# rollback the transaction and release its connection
+# this will likely occur if something went awry
+def rollback_transaction(db_connection):
+    try:
+        db_connection.rollback()
+    finally:
+        db_connection.close()
+
+# run a stored procedure inside a transaction started by begin_transaction, without committing
+def execute_transaction_stored_procedure(db_connection, procedure, params=[]):
+    output = []
+    with db_connection.cursor() as cursor:
+        cursor.callproc(procedure, params)
 
-# params: list of arguments. if no argumments are wanted then pass an empty list 
+        for result in cursor.stored_results():
+            output.append(result.fetchall())
+
+    return output
+
+# well-known text of a mask polygon, closed by repeating its first point
+# coords: [(lat, lng), ...] with the polygon points in order. latitudes are x, like every other POINT in the database
+def to_polygon_text(coords):
+    ring = list(coords) + list(coords[:1])
+    return 'POLYGON((' + ','.join(f'{float(lat)} {float(lng)}' for lat, lng in ring) + '))'
+
+# ordered [(lat, lng), ...] points of a mask polygon read with ST_AsText, without the closing point
+def from_polygon_text(text):
+    ring = text[text.rindex('(') + 1:text.index(')')]
+    coords = [tuple(float(value) for value in point.split()) for point in ring.split(',')]
+    return coords[:-1]
+
+# write a fire with its region and masks in a single transaction, so a failure leaves none of its rows behind
+# masks: list of (status_id, [(lat, lng), ...], [(zoom, polyline, [lat, lng, ...]), ...]) with the polygon points in order
+# and the polygon simplified for each zoom level
+# region: [lat_min, lng_min, lat_max, lng_max, wind_direction, wind_speed, temp_min, temp_max, humidity, precipitation, detection_hash]
+# db_connection: transaction to write in, committed by the caller. if None the fire is committed on its own
+# fire_id: identifier of a fire tracked from an earlier run, or None to add a new fire
+def write_fire(run_id, middle_point, identification_date, region, masks, db_connection=None, fire_id=None):
+    owns_transaction = db_connection is None
+    if owns_transaction:
+        db_connection = begin_transaction()
+
+    try:
+        if fire_id is None:
+            fire_id = execute_transaction_stored_procedure(db_connection, "add_fire", [middle_point[0], middle_point[1], identification_date])[0][0][0]
+        else:
+            execute_transaction_stored_procedure(db_connection, "update_fire", [fire_id, middle_point[0], middle_point[1]])
+        execute_transaction_stored_procedure(db_connection, "add_region", [fire_id, run_id, *region])
+
+        for status_id, coords, geometries in masks:
+            # the polygon is stored whole in the mask row
+            mask_id = execute_transaction_stored_procedure(db_connection, "add_mask", [status_id, fire_id, run_id, to_polygon_text(coords)])[0][0][0]
+
+            # and every simplified version of it is inserted by one more statement
+            execute_transaction_stored_procedure(db_connection, "add_mask_geometries", [mask_id, json.dumps([list(geometry) for geometry in geometries])])
+    except Exception as e:
+        print(e)
+        if owns_transaction:
+            rollback_transaction(db_connection)
+        raise
+
+    if owns_transaction:
+        commit_transaction(db_connection)
+    return fire_id
+
+# params: list of arguments. if no argumments are wanted then pass an empty list
 def execute_read_stored_procedure(procedure, params=[]):
+    # reads are safe to repeat, so retry once on a fresh connection if the connection was lost mid-call
+    try:
+        return _execute_read_stored_procedure(procedure, params)
+    except (mysql.connector.errors.InterfaceError, mysql.connector.errors.OperationalError) as e:
+        print(f'Lost database connection, retrying. {e}')
+        return _execute_read_stored_procedure(procedure, params)
+
+
+def _execute_read_stored_procedure(procedure, params):
     db_connection = open_connection()
 
     output = []
     try:
         with db_connection.cursor() as cursor:
             cursor.callproc(procedure, params)
-            
+
             for result in cursor.stored_results():
                 output.append(result.fetchall())
     except Exception as e:
@@ -40,7 +154,7 @@ def execute_read_stored_procedure(procedure, params=[]):
     return output
 
 
-# params: list of arguments. if no argumments are wanted then pass an empty list 
+# params: list of arguments. if no argumments are wanted then pass an empty list
 def execute_write_stored_procedure(procedure, params=[]):
     db_connection = open_connection()
 
@@ -59,3 +173,14 @@ def execute_write_stored_procedure(procedure, params=[]):
         db_connection.close()
 
     return output
+
+
+# masks of the fire's latest run as (mask_id, fire_status, [(lat, lng), ...])
+def read_fire_masks(fire_id):
+    masks = execute_read_stored_procedure("get_fire_mask_data", [fire_id])[0]
+    return [(mask_id, fire_status, from_polygon_text(polygon)) for mask_id, fire_status, polygon in masks]
+
+# predicted masks of active fires in the latest published run as (fire_id, mask_id, [(lat, lng), ...])
+def read_active_predicted_masks():
+    masks = execute_read_stored_procedure("get_active_predicted_masks")[0]
+    return [(fire_id, mask_id, from_polygon_text(polygon)) for fire_id, mask_id, polygon in masks]
@@ -8,10 +8,10 @@ def purge_data():
     except Exception as e:
         print('There was an issue executing the data purger procedure')
 
-def remove_failed_run(): 
+def remove_failed_run(run_id): 
     try: 
         # Execute the remove failed run stored procedure
-        execute_write_stored_procedure("remove_failed_run")
+        execute_write_stored_procedure("remove_failed_run", [run_id])
         print("Remove failed run executed successfully.")
     except Exception as e:
         print('There was an issue executing the remove failed run procedure')
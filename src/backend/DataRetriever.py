@@ -1,58 +1,26 @@
-import constants, DataManager
+import Clustering, constants, DataManager, Geodesy, Geometry, Interpolation
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from FeatureCache import TileCache, WeatherCache
+from FetchScheduler import FetchScheduler, LimitAPI, wait_all
+from FirmsIngestor import FirmsIngestor
 from datetime import datetime, timedelta
 from enum import Enum
-from math import atan2, cos, radians, sin, sqrt
-from PIL import Image, ImageDraw
-from scipy.interpolate import griddata, interp1d
 from scipy.spatial import ConvexHull
 from tensorflow.keras.models import load_model
 
 import ee
-import hdbscan
+import hashlib
+import multiprocessing
 import numpy as np
+import os
 import pandas as pd
 import requests
-import time
+import threading
 import tensorflow as tf
 import xmltodict
 
 
-class LimitAPI:
-    """
-    Constructor
-
-    Args:
-      call_limit: Maximum number of calls
-      interval: Interval in seconds until number of calls is refreshed
-    """
-    def __init__(self, call_limit, interval):
-        self.call_limit = call_limit
-        self.interval = interval
-        self.calls = 0
-        self.start_time = time.time()
-
-    def can_call(self):
-        if time.time() - self.start_time > self.interval:
-            self.calls = 0
-            self.start_time = time.time()
-
-        return self.calls < self.call_limit
-
-    def call(self):
-        if (self.calls >= self.call_limit):
-            # Wait until refresh
-            cushion = 5
-            time.sleep(max(0, self.interval - (time.time() - self.start_time) + cushion))
-            print('Currently waiting...', flush=True)
-
-        # Refresh number of calls if possible
-        if (time.time() - self.start_time > self.interval):
-            self.calls = 0
-            self.start_time = time.time()
-
-        self.calls += 1
-
-
 Feature = Enum('Feature', 
                [
                    'ELEVATION', 
@@ -136,92 +104,242 @@ start_date = f'{(generation_time - timedelta(days=30)).strftime("%Y-%m-%d")}'
 
 FIRMS_API_KEY = constants.FIRMS_API_KEY
 FIRMS_AREA_COORDS = '-125,25,-65,50'    # America
-FIRMS_DAY_RANGE = f'{1}'
+
+FIRMS_SOURCES = [
+    # 'LANDSAT_NRT', 
+    'MODIS_NRT', 
+    'VIIRS_NOAA20_NRT', 
+    'VIIRS_NOAA21_NRT', 
+    'VIIRS_SNPP_NRT'
+]
+
+# Detections of every source are retained between runs
+FIRMS_CACHE_DIR = 'cache/firms'
+
+MIN_CLUSTER_SIZE = 3
+
+# Clusters of the previous run are kept, so only groups of detections that changed are clustered again
+clusterer = Clustering.IncrementalClusterer(MIN_CLUSTER_SIZE)
 
 BLOCK_SIZE = 32
-ARC_DEGREE_DISTANCE = 111.32
 SCALING_FACTOR = 40
 
+# Minimum overlap (intersection over union) between a cluster region and a region of the previous run for them to be the same fire
+FIRE_OVERLAP_THRESHOLD = 0.1
+
+# Predictions of a fire whose detections have not changed are reused for this long before weather changes are considered meaningful
+FIRE_REUSE_MAX_AGE = timedelta(hours=12)
+
+# Number of 32x32km blocks evaluated by the model at once
+PREDICTION_BATCH_SIZE = 256
+
+# Model input features, in the order expected by the model
+MODEL_FEATURES = [
+    Feature.ELEVATION, 
+    Feature.WIND_DIRECTION, 
+    Feature.WIND_SPEED, 
+    Feature.TEMP_MIN, 
+    Feature.TEMP_MAX, 
+    Feature.HUMIDITY, 
+    Feature.PRECIPITATION, 
+    Feature.DROUGHT, 
+    Feature.VEGETATION, 
+    Feature.POPULATION, 
+    Feature.ERC, 
+    Feature.PREV_MASK
+]
+
+# Features interpolated from the API data, the model features before the previous fire mask
+INTERPOLATED_FEATURES = MODEL_FEATURES[:MODEL_FEATURES.index(Feature.PREV_MASK)]
+
+# Clipping bounds and normalization statistics of the model features, in order
+FEATURE_MIN, FEATURE_MAX, FEATURE_MEAN, FEATURE_STD = np.array([DATA_STATS[feature] for feature in MODEL_FEATURES], dtype=np.float32).T
+
 OPENWEATHERMAP_API_KEY = constants.OPENWEATHERMAP_API_KEY
+OPENWEATHERMAP_URL = 'https://api.openweathermap.org/data/2.5/weather'
 
 # OpenWeatherMap API limiter
 weather_limiter = LimitAPI(60, 60)
 
-try:
-    # Earth Engine setup
-    ee.Authenticate()
-    ee.Initialize(project=constants.EE_PROJECT_NAME)
-except Exception:
-    print('There was an issue initializing the Google Earth Engine API', flush=True)
-    raise
+# Weather responses are shared by points within the same 0.1 degree cell and hour. Runs are 6 hours apart, so responses
+# are only shared within a run and are not persisted
+WEATHER_CACHE_CELL_SIZE = 0.1
+WEATHER_CACHE_BUCKET = 3600
+weather_cache = WeatherCache(WEATHER_CACHE_CELL_SIZE, WEATHER_CACHE_BUCKET)
+
+# Band sampled for each GEE feature
+GEE_BANDS = {
+    Feature.ELEVATION: 'elevation', 
+    Feature.DROUGHT: 'pdsi', 
+    Feature.VEGETATION: 'NDVI', 
+    Feature.POPULATION: 'population_density', 
+    Feature.ERC: 'erc'
+}
+
+# Buffer in m. around a point that GEE features are averaged over
+GEE_BUFFERS = {
+    Feature.ELEVATION: 500, 
+    Feature.DROUGHT: 1000, 
+    Feature.VEGETATION: 1000, 
+    Feature.POPULATION: 1000, 
+    Feature.ERC: 1000
+}
+
+# Static GEE features and how long in seconds their values are cached for
+STATIC_GEE_FEATURES = {
+    Feature.ELEVATION: 365 * 24 * 3600, 
+    Feature.POPULATION: 90 * 24 * 3600
+}
 
-# Load the prediction model
-model = load_model('assets/fire_predict_50.h5')
+# On-disk cache of static GEE feature values
+FEATURE_CACHE_DIR = 'cache/features'
 
-run_id = -1
+# Sample every grid point of a cluster with one GEE request instead of one request per feature and point
+GEE_BATCH_REDUCTION = True
 
-def haversine(coord1: tuple[float, float], coord2: tuple[float, float]) -> dict[str, float]:
+# Maximum number of requests in flight at once for each API
+WEATHER_FETCH_WORKERS = 4
+GEE_FETCH_WORKERS = 16
+
+# TensorFlow threads used by each cluster worker. Workers times threads should not exceed the number of cores
+WORKER_INTRA_OP_THREADS = 2
+WORKER_INTER_OP_THREADS = 1
+
+# Processes evaluating clusters in parallel, each with its own model instance. 1 evaluates clusters in the engine process
+# Defaults to the cores this process may run on, which follows container CPU sets, and is set with the CLUSTER_WORKERS
+# environment variable where memory allows fewer model instances
+AVAILABLE_CORES = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+CLUSTER_WORKERS = max(1, int(os.environ.get('CLUSTER_WORKERS', AVAILABLE_CORES // WORKER_INTRA_OP_THREADS)))
+
+MODEL_PATH = 'assets/fire_predict_50.h5'
+
+# Earth Engine, the prediction model, the FIRMS detections and the feature cache are set up on first use, so that
+# cluster workers importing this module only load the model, and the engine process does not load it when clusters are
+# evaluated by workers
+ee_initialized = False
+model = None
+model_lock = threading.Lock()
+firms_ingestor = None
+feature_cache = None
+resource_lock = threading.Lock()
+
+# Cluster workers are started on first use and kept for later runs
+worker_pool = None
+worker_pool_lock = threading.Lock()
+
+
+def initialize_ee():
+    """
+    Authenticate and initialize the Google Earth Engine API, once per process
     """
-    Compute the haversine distance between two coordinate points
+    global ee_initialized
 
-    Args:
-      coord1: Coordinate point
-      coord2: Coordinate point
+    if ee_initialized:
+        return
+
+    try:
+        # Earth Engine setup
+        ee.Authenticate()
+        ee.Initialize(project=constants.EE_PROJECT_NAME)
+    except Exception:
+        print('There was an issue initializing the Google Earth Engine API', flush=True)
+        raise
+
+    ee_initialized = True
+
+
+def get_model():
+    """
+    Get the prediction model, loading it on the first call in the process
 
     Returns:
-      Dictionary with keys 'lat', 'lng', and 'dst' for latitudinal distance, longitudinal distance, and distance respectively.
+      Keras model predicting fire masks
     """
-    lat1, lng1, lat2, lng2 = map(radians, [coord1[0], coord1[1], coord2[0], coord2[1]])
+    global model
 
-    return {
-        "lat": _haversine(lat1, (lng1 + lng2) / 2.0, lat2, (lng1 + lng2) / 2.0), 
-        "lng": _haversine((lat1 + lat2) / 2.0, lng1, (lat1 + lat2) / 2.0, lng2), 
-        "dst": _haversine(lat1, lng1, lat2, lng2)
-    }
+    with model_lock:
+        if model is None:
+            model = load_model(MODEL_PATH)
 
+    return model
 
-def _haversine(lat1: float=0.0, lng1: float=0.0, lat2: float=0.0, lng2: float=0.0) -> float:
+
+def get_firms_ingestor() -> FirmsIngestor:
     """
-    Auxiliary function to compute the haversine distance
+    Get the FIRMS ingestor, loading the retained detections on the first call in the process
+
+    Returns:
+      Ingestor of the detections of every FIRMS source
     """
-    lat = lat2 - lat1
-    lng = lng2 - lng1
+    global firms_ingestor
 
-    a = sin(lat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(lng / 2) ** 2
-    c = 2 * atan2(sqrt(a), sqrt(1-a))
-    return c * 6371
+    with resource_lock:
+        if firms_ingestor is None:
+            firms_ingestor = FirmsIngestor(FIRMS_API_KEY, FIRMS_AREA_COORDS, FIRMS_SOURCES, FIRMS_CACHE_DIR)
 
+    return firms_ingestor
 
-def _adjust_latitude(coordinate: tuple[float, float], distance: float) -> float:
+
+def get_feature_cache() -> TileCache:
     """
-    Compute the necessary change in latitude at a particular coordinate to account for kilometer distance adjustment
+    Get the cache of static GEE feature values, indexing its tiles on the first call in the process
+
+    Returns:
+      On-disk cache of static GEE feature values
     """
-    return distance / ARC_DEGREE_DISTANCE
+    global feature_cache
 
+    with resource_lock:
+        if feature_cache is None:
+            feature_cache = TileCache(FEATURE_CACHE_DIR, {GEE_BANDS[feature]: ttl for feature, ttl in STATIC_GEE_FEATURES.items()})
 
-def _adjust_longitude(coordinate: tuple[float, float], distance: float) -> float:
+    return feature_cache
+
+
+def _initialize_worker(intra_op_threads: int, inter_op_threads: int):
     """
-    Compute the necessary change in longitude at a particular coordinate to account for kilometer distance adjustment
+    Auxiliary function to limit the TensorFlow threads of a cluster worker and load its model instance
     """
-    return distance / (cos(radians(coordinate[0])) * ARC_DEGREE_DISTANCE)
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+    get_model()
 
 
-def adjusted_coordinate(coordinate: tuple[float, float], lat_adj: float, lng_adj: float) -> tuple[float, float]:
+def get_worker_pool(workers: int=CLUSTER_WORKERS) -> ProcessPoolExecutor:
     """
-    Compute coordinate after a km adjustment to the latitude and/or longitude
+    Get the pool of cluster workers, starting it on the first call
 
     Args:
-      coordinate: Coordinate point to adjust
-      lat_adj: Kilometer adjustment to latitude, with positive adjustment relating to North
-      lng_adj: Kilometer adjustment to longitude, with positive adjustment relating to East
+      workers: Number of worker processes
 
     Returns:
-      Coordinate point with latitude and/or longitude adjusted
+      Process pool whose workers each hold a model instance
     """
-    return (
-        coordinate[0] + _adjust_latitude(coordinate, lat_adj), 
-        coordinate[1] + _adjust_longitude(coordinate, lng_adj)
-    )
+    global worker_pool
+
+    with worker_pool_lock:
+        if worker_pool is None:
+            # TensorFlow is not fork-safe, so workers are started as fresh interpreters
+            worker_pool = ProcessPoolExecutor(
+                max_workers=workers, 
+                mp_context=multiprocessing.get_context('spawn'), 
+                initializer=_initialize_worker, 
+                initargs=(WORKER_INTRA_OP_THREADS, WORKER_INTER_OP_THREADS)
+            )
+
+    return worker_pool
+
+
+def shutdown_worker_pool():
+    """
+    Stop the cluster workers, which are started again on the next use
+    """
+    global worker_pool
+
+    with worker_pool_lock:
+        if worker_pool is not None:
+            worker_pool.shutdown(wait=True, cancel_futures=True)
+            worker_pool = None
 
 
 def pad_region(coord_min: tuple[float, float], coord_max: tuple[float, float]) -> tuple[tuple[float, float], tuple[float, float]]:
@@ -235,16 +353,20 @@ def pad_region(coord_min: tuple[float, float], coord_max: tuple[float, float]) -
     Returns:
       Minimum and maximum coordinate point identifying the region
     """
-    d_lat = haversine(coord_min, coord_max)['lat']  # Latitudinal distance
-    d_lng = haversine(coord_min, coord_max)['lng']  # Longitudinal distance
+    # Latitudinal and longitudinal distance
+    d_lat, d_lng, _ = Geodesy.haversine_components(coord_min[0], coord_min[1], coord_max[0], coord_max[1])
 
     lat_pad = (float(BLOCK_SIZE) - (d_lat % BLOCK_SIZE)) / 2.0
     lng_pad = (float(BLOCK_SIZE) - (d_lng % BLOCK_SIZE)) / 2.0
 
-    padded_coord_min = adjusted_coordinate(coord_min, -lat_pad, -lng_pad)
-    padded_coord_max = adjusted_coordinate(coord_max, lat_pad, lng_pad)
+    # Adjust both points at once
+    lats, lngs = Geodesy.offset_coordinates(
+        ([coord_min[0], coord_max[0]], [coord_min[1], coord_max[1]]), 
+        [-lat_pad, lat_pad], 
+        [-lng_pad, lng_pad]
+    )
 
-    return padded_coord_min, padded_coord_max
+    return (lats[0].item(), lngs[0].item()), (lats[1].item(), lngs[1].item())
 
 
 def get_clusters(firms_date: str) -> pd.DataFrame:
@@ -255,64 +377,36 @@ def get_clusters(firms_date: str) -> pd.DataFrame:
       firms_date: String representing the FIRMS date
 
     Returns:
-      Dataframe containing cluster data
+      Dataframe containing cluster data, with whether the cluster of each point changed since the previous run
 
     Raises:
       Error if there are no clusters retrieved
     """
-    firms_sources = [
-        # 'LANDSAT_NRT', 
-        'MODIS_NRT', 
-        'VIIRS_NOAA20_NRT', 
-        'VIIRS_NOAA21_NRT', 
-        'VIIRS_SNPP_NRT'
-    ]
-
-    dfs = []
-
     try:
-        for source in firms_sources:
-            # Read API endpoint CSV response
-            temp_df = pd.read_csv(f'https://firms.modaps.eosdis.nasa.gov/usfs/api/area/csv/{FIRMS_API_KEY}/{source}/{FIRMS_AREA_COORDS}/{FIRMS_DAY_RANGE}/{firms_date}', sep=',')
-
-            if 'MODIS' in source:
-                # Refer to: https://www.earthdata.nasa.gov/learn/find-data/near-real-time/firms/mcd14dl-nrt#ed-firms-attributes
-                temp_df = temp_df[temp_df['confidence'] >= 50]
-            elif 'VIIRS' in source:
-                # 'l' : low; 'n' : nominal; 'h' : high
-                # Refer to: https://www.earthdata.nasa.gov/learn/find-data/near-real-time/firms/vj114imgtdlnrt
-                # temp_df = temp_df[(temp_df['confidence'] == 'l') | (temp_df['confidence'] == 'n') | (temp_df['confidence'] == 'h')]
-                temp_df = temp_df[(temp_df['confidence'] == 'h')]
-            # elif 'LANDSAT' in source:
-            #     # 'L' : low, 'M' : medium, 'H' : high
-            #     temp_df = temp_df[(temp_df['confidence'] == 'H')]
-            else:
-                raise Exception("Unexpected FIRMS source found.")
-
-            temp_df[['latitude', 'longitude']]
-            temp_df['source'] = source
-
-            dfs.append(temp_df)
+        df = get_firms_ingestor().fetch(firms_date)
     except Exception:
         print(f'There was an issue retrieving data from FIRMS.', flush=True)
         raise
 
-    df = pd.concat(dfs, ignore_index=True)
-
-    min_cluster_size = 3
-
     # There is an abnormally low number of points
-    if len(df) < min_cluster_size:
+    if len(df) < MIN_CLUSTER_SIZE:
         return pd.DataFrame()
 
-    clustering = hdbscan.HDBSCAN(
-        metric='haversine',
-        min_cluster_size=min_cluster_size, 
-        gen_min_span_tree=True
-    ).fit(np.radians(df[['latitude', 'longitude']]))
-
-    labels = clustering.labels_
+    # Isolated groups of detections are clustered separately, and only if they changed since the last run, by the
+    # cluster workers when there is more than one
+    try:
+        labels, changed = clusterer.update(
+            df['latitude'].to_numpy(), 
+            df['longitude'].to_numpy(), 
+            get_detection_keys(df), 
+            get_worker_pool() if CLUSTER_WORKERS > 1 else None
+        )
+    except BrokenProcessPool:
+        print('A cluster worker exited unexpectedly. The workers will be restarted on the next run.', flush=True)
+        shutdown_worker_pool()
+        raise
     df['cluster'] = labels
+    df['changed'] = changed
 
     # Retrieve number of clusters
     n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
@@ -368,87 +462,80 @@ def get_current_mask(d_lat: int, d_lng: int, origin: tuple[float, float], points
     Returns:
       Array representing presence of fire in region with bit values
     """
-    # Image voodoo
-    # Make sure scaling factor is divisible by 8 so we can represent 375m (3/8)
-
-    width = d_lng * SCALING_FACTOR
-    height = d_lat * SCALING_FACTOR
-
-    img = Image.new('1', (width, height))
-
-    draw = ImageDraw.Draw(img)
-    for _, row in points.iterrows():
-        point = (row['latitude'], row['longitude'])
-        # print(f"Lat: {row['latitude']} ; Lng: {row['longitude']}", flush=True)
-
-        offsets = haversine(origin, point)
-        # print(f"Latitudinal offset is {offsets['lat']}; Longitudinal offset is {offsets['lng']}", flush=True)
-
-        offset_y = offsets['lat'] * SCALING_FACTOR
-        offset_x = offsets['lng'] * SCALING_FACTOR
-
-        scale = -1
-        if 'MODIS' in row['source']:
-            scale = 1
-        elif 'VIIRS' in row['source']:
-            # VIIRS has 375m spatial resolution so adjust accordingly
-            scale = 0.375
-        # elif 'LANDSAT' in row['source']:
-        #     # LANDSAT has 30m spatial resolution so adjust accordingly
-        #     scale = 0.03
-        else:
-            raise Exception("Unexpected FIRMS source found.")
-
-        adjustment = scale * SCALING_FACTOR
-        square = [
-            (offset_x - adjustment, offset_y - adjustment), 
-            (offset_x + adjustment, offset_y + adjustment)
-        ]
+    # Half-width in km. of the footprint of each detection
+    # VIIRS has 375m spatial resolution so adjust accordingly
+    scales = np.select(
+        [points['source'].str.contains('MODIS'), points['source'].str.contains('VIIRS')], 
+        [1.0, 0.375], 
+        np.nan
+    )
 
-        draw.rectangle(square, fill=1)
-    
-    # Downsample the array and get the bit matrix
-    return np.array(
-        img.resize(
-            (
-                round(width / SCALING_FACTOR), 
-                round(height / SCALING_FACTOR)
-            )
-        )
+    if np.isnan(scales).any():
+        raise Exception("Unexpected FIRMS source found.")
+
+    # Latitudinal and longitudinal offsets of every point from the origin
+    offset_y, offset_x, _ = Geodesy.haversine_components(
+        origin[0], 
+        origin[1], 
+        points['latitude'].to_numpy(dtype=np.float64), 
+        points['longitude'].to_numpy(dtype=np.float64)
     )
 
+    # Footprints are measured on a grid SCALING_FACTOR times finer than the mask, with their corners truncated to
+    # whole sub-cells, and each mask cell takes the value of the sub-cell at its centre.
+    # A footprint spanning [start, end] sub-cells covers cell k when int(start) <= k * SCALING_FACTOR + SCALING_FACTOR // 2 <= int(end)
+    def _covered_cells(offset, length):
+        start = (offset - scales) * SCALING_FACTOR
+        end = (offset + scales) * SCALING_FACTOR
+        centre = SCALING_FACTOR // 2
 
-def get_weather_data(coord: tuple[float, float], dict: dict[str, float]):
-    """
-    Get relevant weather data from OpenWeatherMap API
+        first = np.floor((start - centre - 1) / SCALING_FACTOR).astype(np.int64) + 1
+        last = np.floor((end - centre) / SCALING_FACTOR).astype(np.int64)
 
-    Args:
-      coord: Coordinate point to get weather data at
-      dict: Dictionary to populate
-    """
+        return np.clip(first, 0, length), np.clip(last + 1, 0, length)
 
-    retrieval_start = time.time()
+    row_start, row_end = _covered_cells(offset_y, d_lat)
+    col_start, col_end = _covered_cells(offset_x, d_lng)
 
-    while True:
-        try:
-            weather_limiter.call()
-            response = requests.get(f'https://api.openweathermap.org/data/2.5/weather?lat={coord[0]}&lon={coord[1]}&appid={OPENWEATHERMAP_API_KEY}&mode=xml')
-            break
-        except Exception as e:
-            print(f'Failed to get weather data. Details: {e}', flush=True)
-            
-            if time.time() - retrieval_start > 300:
-                print(f'Time to retrieve weather data has exceeded 5 minutes.', flush=True)
-                raise
+    valid = (row_start < row_end) & (col_start < col_end)
+    row_start, row_end, col_start, col_end = row_start[valid], row_end[valid], col_start[valid], col_end[valid]
+
+    # Mark the corners of every footprint and accumulate them into coverage counts
+    coverage = np.zeros((d_lat + 1, d_lng + 1), dtype=np.int32)
+    np.add.at(coverage, (row_start, col_start), 1)
+    np.add.at(coverage, (row_end, col_start), -1)
+    np.add.at(coverage, (row_start, col_end), -1)
+    np.add.at(coverage, (row_end, col_end), 1)
+
+    return coverage.cumsum(axis=0).cumsum(axis=1)[:d_lat, :d_lng] > 0
 
-            time.sleep(30)
+
+def _fetch_weather(coord: tuple[float, float]) -> str:
+    """
+    Auxiliary function to request the current weather at a point from OpenWeatherMap
+    """
+    weather_limiter.call()
+    response = requests.get(f'{OPENWEATHERMAP_URL}?lat={coord[0]}&lon={coord[1]}&appid={OPENWEATHERMAP_API_KEY}&mode=xml', timeout=30)
 
     if response.status_code != 200:
         raise Exception('Could not access OpenWeatherMap.')
 
+    return response.text
+
+
+def get_weather_data(coord: tuple[float, float], dict: dict[str, float]):
+    """
+    Get relevant weather data from OpenWeatherMap API. Failed requests are retried by the fetch scheduler
+
+    Args:
+      coord: Coordinate point to get weather data at
+      dict: Dictionary to populate
+    """
+    response = weather_cache.get_or_fetch(coord, _fetch_weather)
+
     # assumptions about units (wind speed, temperature, humidity, precipitation in mm)
     # Refer to "https://openweathermap.org/current"
-    weather_dict = xmltodict.parse(response.content)
+    weather_dict = xmltodict.parse(response)
 
     dict[Feature.WIND_SPEED] = _process_weather(weather_dict, Feature.WIND_SPEED)
     dict[Feature.WIND_DIRECTION] = _process_weather(weather_dict, Feature.WIND_DIRECTION)
@@ -458,6 +545,34 @@ def get_weather_data(coord: tuple[float, float], dict: dict[str, float]):
     dict[Feature.PRECIPITATION] = _process_weather(weather_dict, Feature.PRECIPITATION)
 
 
+def _get_gee_images(bounding_box: ee.Geometry) -> dict[Feature, ee.Image]:
+    """
+    Build the Google Earth Engine images used as features for a cluster region
+
+    Args:
+      bounding_box: Geometry identifying cluster region
+
+    Returns:
+      Dictionary with a single-band image for each GEE feature
+    """
+    return {
+        # Elevation
+        Feature.ELEVATION: ee.Image('CGIAR/SRTM90_V4').clip(bounding_box).select('elevation'), 
+
+        # Drought
+        Feature.DROUGHT: ee.ImageCollection('GRIDMET/DROUGHT').filterDate(start_date, end_date).filterBounds(bounding_box).sort('system:time_start', False).first().select('pdsi'), 
+
+        # Vegetation
+        Feature.VEGETATION: ee.ImageCollection('NOAA/VIIRS/001/VNP13A1').filterDate(start_date, end_date).filterBounds(bounding_box).select('NDVI').mean(), 
+
+        # Population Density
+        Feature.POPULATION: ee.ImageCollection("CIESIN/GPWv411/GPW_Population_Density").sort('system:time_start', False).first().select('population_density'), 
+
+        # Energy Release Component
+        Feature.ERC: ee.ImageCollection("IDAHO_EPSCOR/GRIDMET").filterDate(start_date, end_date).filterBounds(bounding_box).sort('system:time_start', False).first().select('erc')
+    }
+
+
 def get_gee_data(coord: tuple[float, float], bounding_coords: list[float], dict: dict[str, float]):
     """
     Get relevant feature data from Google Earth Engine
@@ -470,59 +585,119 @@ def get_gee_data(coord: tuple[float, float], bounding_coords: list[float], dict:
     point = ee.Geometry.Point(coord[1], coord[0])
     bounding_box = ee.Geometry.Rectangle(bounding_coords)
 
-    # Elevation
-    elevation = ee.Image('CGIAR/SRTM90_V4')
-    elevation_clipped = elevation.clip(bounding_box)
-    dict[Feature.ELEVATION] = elevation_clipped.reduceRegion(reducer = ee.Reducer.mean(), geometry = point.buffer(500).bounds(), scale = 1000).get('elevation').getInfo()
+    for feature, image in _get_gee_images(bounding_box).items():
+        # Static features are read from the cache when possible
+        value = get_feature_cache().get(GEE_BANDS[feature], coord)
+
+        if value is None:
+            value = image.reduceRegion(reducer = ee.Reducer.mean(), geometry = point.buffer(GEE_BUFFERS[feature]).bounds(), scale = 1000).get(GEE_BANDS[feature]).getInfo()
+            get_feature_cache().put(GEE_BANDS[feature], coord, value)
+
+        dict[feature] = value
+
+
+def get_gee_cluster_data(grid: dict[tuple[int, int], tuple[float, float]], bounding_coords: list[float], api_data: dict[tuple[int, int], dict[Feature, float]]):
+    """
+    Get relevant feature data from Google Earth Engine at every grid point of a cluster with a single request
+
+    Args:
+      grid: Coordinate points keyed by grid offset
+      bounding_coords: Coordinates identifying cluster region
+      api_data: Dictionaries to populate, keyed by grid offset
+    """
+    bounding_box = ee.Geometry.Rectangle(bounding_coords)
+    images = _get_gee_images(bounding_box)
+
+    # Static features are read from the cache when possible
+    for key, coord in grid.items():
+        for feature in STATIC_GEE_FEATURES:
+            value = get_feature_cache().get(GEE_BANDS[feature], coord)
 
-    # Drought
-    drought = ee.ImageCollection('GRIDMET/DROUGHT').filterDate(start_date, end_date).filterBounds(bounding_box).sort('system:time_start', False).first().select('pdsi')
-    dict[Feature.DROUGHT] = drought.reduceRegion(reducer = ee.Reducer.mean(), geometry = point.buffer(1000).bounds(), scale = 1000).get('pdsi').getInfo()
+            if value is not None:
+                api_data[key][feature] = value
 
-    # Vegetation
-    veg = ee.ImageCollection('NOAA/VIIRS/001/VNP13A1').filterDate(start_date, end_date).filterBounds(bounding_box).select('NDVI').mean()
-    dict[Feature.VEGETATION] = veg.reduceRegion(reducer = ee.Reducer.mean(), geometry = point.buffer(1000).bounds(), scale = 1000).get('NDVI').getInfo()
+    # Grid points still missing each feature
+    missing = {feature: [key for key in grid if feature not in api_data[key]] for feature in images}
 
-    # Population Density
-    pop_dens = ee.ImageCollection("CIESIN/GPWv411/GPW_Population_Density").sort('system:time_start', False).first().select('population_density')
-    dict[Feature.POPULATION] = pop_dens.reduceRegion(reducer = ee.Reducer.mean(), geometry = point.buffer(1000).bounds(), scale = 1000).get('population_density').getInfo()
+    # Features sampled over the same buffer share a composite image and a single reduction
+    reductions = {}
+    for buffer in set(GEE_BUFFERS.values()):
+        features = [feature for feature in images if GEE_BUFFERS[feature] == buffer and len(missing[feature]) > 0]
 
-    # Energy Release Component
-    erc = ee.ImageCollection("IDAHO_EPSCOR/GRIDMET").filterDate(start_date, end_date).filterBounds(bounding_box).sort('system:time_start', False).first().select('erc')
-    dict[Feature.ERC] = erc.reduceRegion(reducer = ee.Reducer.mean(), geometry = point.buffer(1000).bounds(), scale = 1000).get('erc').getInfo()
+        if len(features) == 0:
+            continue
 
+        keys = {key for feature in features for key in missing[feature]}
 
-def get_interpolated_data(dict: dict[tuple[float, float], dict[str, float]], d_lat: int, d_lng: int) -> dict[str, np.ndarray]:
-    coords = list(dict.keys())
-    data = list(dict.values())
-    attributes = list(data[0].keys())
+        composite = ee.Image.cat([images[feature] for feature in features])
+        samples = ee.FeatureCollection([
+            ee.Feature(ee.Geometry.Point(grid[key][1], grid[key][0]).buffer(buffer).bounds(), {'j': key[0], 'i': key[1]})
+            for key in keys
+        ])
 
-    xv, yv = np.meshgrid(
-        np.arange(0, d_lng), 
-        np.arange(0, d_lat)
-    )
+        # Name outputs after the bands, since a single-band reduction would otherwise be named after the reducer
+        reducer = ee.Reducer.mean().setOutputs([GEE_BANDS[feature] for feature in features]) if len(features) == 1 else ee.Reducer.mean()
 
-    interpolated_data = {}
-    try:
-        for attribute in attributes:
-            values = [float(datum[attribute]) if datum[attribute] is not None else np.nan for datum in data]
+        reductions[str(buffer)] = composite.reduceRegions(collection = samples, reducer = reducer, scale = 1000)
 
-            valid_indices = ~np.isnan(np.array(values))
+    # Every value was cached
+    if len(reductions) == 0:
+        return
+
+    result = ee.Dictionary(reductions).getInfo()
+
+    for buffer, collection in result.items():
+        for sample in collection['features']:
+            properties = sample['properties']
+            key = (int(properties['j']), int(properties['i']))
 
-            valid_coords = np.array(coords)[valid_indices]
-            valid_values = np.array(values)[valid_indices]
+            for feature in images:
+                if str(GEE_BUFFERS[feature]) == buffer and feature not in api_data[key]:
+                    api_data[key][feature] = properties.get(GEE_BANDS[feature])
+                    get_feature_cache().put(GEE_BANDS[feature], grid[key], api_data[key][feature])
 
-            # if sum(valid_indices) < 3:
-            #     print(f'There were not enough points for interpolation. Cluster will not be included.', flush=True)
-            #     return {}
 
-            interpolated = griddata(valid_coords, valid_values, (xv, yv), method='linear', fill_value=np.mean(valid_values))
-            interpolated_data[attribute] = interpolated.tolist()
+def get_interpolated_data(api_data: dict[tuple[int, int], dict[Feature, float]], d_lat: int, d_lng: int) -> np.ndarray:
+    """
+    Interpolate the API data of a region over its 1km grid
+
+    Args:
+      api_data: API data keyed by grid offset
+      d_lat: Latitudinal distance
+      d_lng: Longitudinal distance
+
+    Returns:
+      Array of shape (d_lat, d_lng, NUM_FEATURES) with the model features in order, with the previous fire mask
+      left unassigned, or None if the data could not be interpolated
+    """
+    coords = list(api_data.keys())
+    values = np.array(
+        [[np.nan if datum.get(feature) is None else float(datum[feature]) for feature in INTERPOLATED_FEATURES] for datum in api_data.values()], 
+        dtype=np.float64
+    )
+
+    features = np.empty((d_lat, d_lng, len(MODEL_FEATURES)), dtype=np.float32)
+    try:
+        # One triangulation of the grid points is shared by every feature
+        features[..., :len(INTERPOLATED_FEATURES)] = Interpolation.GridInterpolator(coords, (d_lat, d_lng)).interpolate(values)
     except Exception as e:
         print(f'Issue occurred during interpolation. Fire will be ignored.', flush=True)
-        interpolated_data.clear()
-    
-    return interpolated_data
+        return None
+
+    return features
+
+
+def normalize_features(features: np.ndarray) -> np.ndarray:
+    """
+    Clip and normalize model features with the statistics of the training data
+
+    Args:
+      features: Array of shape (..., NUM_FEATURES) with the model features in order
+
+    Returns:
+      Array of the same shape with the clipped and normalized features
+    """
+    return ((np.clip(features, FEATURE_MIN, FEATURE_MAX) - FEATURE_MEAN) / FEATURE_STD).astype(np.float32, copy=False)
 
 
 def get_mask_coords(data: np.ndarray, origin: tuple[float,float], predicted: bool=False) -> list[tuple[float, float]]:
@@ -557,178 +732,480 @@ def get_mask_coords(data: np.ndarray, origin: tuple[float,float], predicted: boo
 
     ordering = hull.vertices[np.argsort(angles)]
 
-    return [adjusted_coordinate(origin, -lat_adj, lng_adj) for lat_adj, lng_adj in fire_indices[ordering]]
+    lats, lngs = Geodesy.offset_coordinates(origin, -fire_indices[ordering, 0], fire_indices[ordering, 1])
+
+    return list(zip(lats.tolist(), lngs.tolist()))
 
 
-def process_clusters(run_id: int, df: pd.DataFrame):
+def get_model_blocks(data: np.ndarray, d_lat: int, d_lng: int) -> np.ndarray:
     """
-    Process each cluster by retrieving data from APIs and running the AI model to generate a predicted fire mask
+    Split the clipped and normalized region data into 32x32km blocks for the model
 
     Args:
-      run_id: Engine run identifier
-      df: DataFrame containing cluster data
+      data: Array of shape (d_lat, d_lng, NUM_FEATURES) with the clipped and normalized model features
+      d_lat: Latitudinal distance
+      d_lng: Longitudinal distance
+
+    Returns:
+      Array of shape (N, BLOCK_SIZE, BLOCK_SIZE, NUM_FEATURES) with the blocks in row-major order
     """
-    # Filter unique clusters
-    clusters = df[df['cluster'] >= 0]['cluster'].unique()
+    n_rows = round(d_lat / BLOCK_SIZE)
+    n_cols = round(d_lng / BLOCK_SIZE)
+    height = n_rows * BLOCK_SIZE
+    width = n_cols * BLOCK_SIZE
+
+    region = data[:height, :width]
+
+    # Rounding can leave the region a few kilometres short of a whole block
+    if region.shape[0] < height or region.shape[1] < width:
+        region = np.pad(region, ((0, height - region.shape[0]), (0, width - region.shape[1]), (0, 0)), mode='edge')
+
+    return region.reshape(n_rows, BLOCK_SIZE, n_cols, BLOCK_SIZE, len(MODEL_FEATURES)).swapaxes(1, 2).reshape(-1, BLOCK_SIZE, BLOCK_SIZE, len(MODEL_FEATURES))
+
+
+def assemble_mask(blocks: np.ndarray, d_lat: int, d_lng: int) -> np.ndarray:
+    """
+    Combine predicted 32x32km blocks back into a single mask for the region
 
-    for i, cluster in enumerate(clusters):
-        # Retrieve points in this cluster
-        cluster_points = df[df['cluster'] == cluster]
+    Args:
+      blocks: Array of shape (N, BLOCK_SIZE, BLOCK_SIZE) with the blocks in row-major order
+      d_lat: Latitudinal distance
+      d_lng: Longitudinal distance
+
+    Returns:
+      Predicted fire mask covering the region
+    """
+    n_rows = round(d_lat / BLOCK_SIZE)
+    n_cols = round(d_lng / BLOCK_SIZE)
+
+    return blocks.reshape(n_rows, n_cols, BLOCK_SIZE, BLOCK_SIZE).swapaxes(1, 2).reshape(n_rows * BLOCK_SIZE, n_cols * BLOCK_SIZE)
+
+
+@tf.function(input_signature=[tf.TensorSpec([None, BLOCK_SIZE, BLOCK_SIZE, len(MODEL_FEATURES)], tf.float32)])
+def _predict_batch(x: tf.Tensor) -> tf.Tensor:
+    """
+    Auxiliary function to evaluate a batch of blocks with a single compiled model call
+    """
+    return get_model()(x, training=False)
+
+
+def predict_masks(cluster_blocks: list[np.ndarray], batch_size: int=PREDICTION_BATCH_SIZE) -> list[np.ndarray]:
+    """
+    Run the model over the blocks of every cluster in large batches
+
+    Args:
+      cluster_blocks: Model input blocks for each cluster, as returned by get_model_blocks
+      batch_size: Number of blocks evaluated by the model at once
+
+    Returns:
+      Predicted blocks of shape (N, BLOCK_SIZE, BLOCK_SIZE) for each cluster, in the same order as the input
+    """
+    if len(cluster_blocks) == 0:
+        return []
+
+    blocks = np.concatenate(cluster_blocks, axis=0)
+    predictions = np.empty(blocks.shape[:3], dtype=np.float32)
+
+    for start in range(0, len(blocks), batch_size):
+        end = min(start + batch_size, len(blocks))
+        predictions[start:end] = _predict_batch(tf.convert_to_tensor(blocks[start:end]))[..., 0].numpy()
+
+    # Scatter the predictions back to their clusters
+    return np.split(predictions, np.cumsum([len(cluster) for cluster in cluster_blocks])[:-1])
+
+
+def _get_cluster_region(index: int, cluster_points: pd.DataFrame) -> dict[str, any]:
+    """
+    Identify the padded region of a cluster and the grid points its data is retrieved at
+
+    Args:
+      index: Position of the cluster in the current run, used for logging
+      cluster_points: Points in the cluster
+
+    Returns:
+      Dictionary describing the cluster region
+    """
+    # Retrieve minimum and maximum coordinates identifying cluster region
+    coord_min = (cluster_points['latitude'].min(), cluster_points['longitude'].min())
+    coord_max = (cluster_points['latitude'].max(), cluster_points['longitude'].max())
+
+    # Retrieve coordinates identifying the padded cluster region
+    padded_coord_min, padded_coord_max = pad_region(coord_min, coord_max)
+    padded_lat_min, padded_lng_min = padded_coord_min[0], padded_coord_min[1]
+    padded_lat_max, padded_lng_max = padded_coord_max[0], padded_coord_max[1]
+
+    # North-west origin point
+    origin = (padded_lat_max, padded_lng_min)
+
+    # Get distance metrics
+    distances = Geodesy.haversine_components(padded_lat_min, padded_lng_min, padded_lat_max, padded_lng_max)
+    d_lat = round(distances[0])
+    d_lng = round(distances[1])
+
+    print(f'Cluster {index}; Origin: {origin}; Lat Dist: {d_lat}; Long Dist: {d_lng}', flush=True)
+
+    # Every point separated by 32km
+    i_offsets, j_offsets = np.meshgrid(
+        BLOCK_SIZE * np.arange(round(d_lat / BLOCK_SIZE)+1), 
+        BLOCK_SIZE * np.arange(round(d_lng / BLOCK_SIZE)+1), 
+        indexing='ij'
+    )
+    lats, lngs = Geodesy.offset_coordinates(origin, -i_offsets, j_offsets)
+
+    grid = {
+        (j, i): (lat, lng) 
+        for i, j, lat, lng in zip(i_offsets.ravel().tolist(), j_offsets.ravel().tolist(), lats.ravel().tolist(), lngs.ravel().tolist())
+    }
+
+    return {
+        'points': cluster_points, 
+        'origin': origin, 
+        'bounds': (padded_lat_min, padded_lng_min, padded_lat_max, padded_lng_max), 
+        'd_lat': d_lat, 
+        'd_lng': d_lng, 
+        'grid': grid, 
+        'detection_hash': get_detection_hash(cluster_points), 
+        'changed': bool(cluster_points['changed'].any()) if 'changed' in cluster_points.columns else True, 
+        'fire_id': None, 
+        'reuse_run_id': None
+    }
+
+
+def get_detection_keys(points: pd.DataFrame) -> np.ndarray:
+    """
+    Identify detections by their rounded position, source and acquisition time
+
+    Args:
+      points: FIRMS detections
+
+    Returns:
+      String identifying each detection
+    """
+    columns = [column for column in ['latitude', 'longitude', 'source', 'acq_date', 'acq_time'] if column in points.columns]
+    values = points[columns].round({'latitude': 4, 'longitude': 4}).astype(str)
 
-        # Retrieve minimum and maximum coordinates identifying cluster region
-        coord_min = (cluster_points['latitude'].min(), cluster_points['longitude'].min())
-        coord_max = (cluster_points['latitude'].max(), cluster_points['longitude'].max())
+    # Columns are joined a whole column at a time, giving the same keys as joining the values of every row
+    keys = values[columns[0]]
+    for column in columns[1:]:
+        keys = keys + '|' + values[column]
 
-        # Retrieve coordinates identifying the padded cluster region
-        padded_coord_min, padded_coord_max = pad_region(coord_min, coord_max)
-        padded_lat_min, padded_lng_min = padded_coord_min[0], padded_coord_min[1]
-        padded_lat_max, padded_lng_max = padded_coord_max[0], padded_coord_max[1]
+    return keys.to_numpy(dtype=str)
 
-        # North-west origin point
-        origin = (padded_lat_max, padded_lng_min)
 
-        # Get distance metrics
-        distances = haversine(padded_coord_min, padded_coord_max)
-        d_lat = round(distances['lat'])
-        d_lng = round(distances['lng'])
+def get_detection_hash(cluster_points: pd.DataFrame) -> str:
+    """
+    Compute a signature of the detections in a cluster, independent of their order
 
-        print(f'Cluster {i}; Origin: {origin}; Lat Dist: {d_lat}; Long Dist: {d_lng}', flush=True)
+    Args:
+      cluster_points: Points in the cluster
 
+    Returns:
+      Hexadecimal SHA-256 digest of the detections
+    """
+    return hashlib.sha256('\n'.join(sorted(get_detection_keys(cluster_points))).encode()).hexdigest()
+
+
+def associate_fires(regions: list[dict[str, any]], tracked_fires: list[tuple]):
+    """
+    Associate cluster regions with the fires of the previous run by the overlap of their regions, and mark the
+    unchanged regions whose detections match the fire so their previous predictions are reused
 
-        # Call APIs on every point separated by 32km
-        api_data = {}
-        for i in [BLOCK_SIZE * m for m in range(round(d_lat / BLOCK_SIZE)+1)]:
-            for j in [BLOCK_SIZE * n for n in range(round(d_lng / BLOCK_SIZE)+1)]:
-                coord = adjusted_coordinate(origin, -i, j)
-                
-                api_data[(j, i)] = {}
+    Args:
+      regions: Cluster regions, as returned by _get_cluster_region, populated in place
+      tracked_fires: Rows of (fire_id, run_id, lat_min, lng_min, lat_max, lng_max, detection_hash, prediction_date)
+    """
+    if len(regions) == 0 or len(tracked_fires) == 0:
+        return
+
+    bounds = np.array([region['bounds'] for region in regions], dtype=np.float64)
+    previous = np.array([fire[2:6] for fire in tracked_fires], dtype=np.float64)
+
+    # Intersection over union of every pair of regions
+    lat_overlap = np.clip(np.minimum(bounds[:, None, 2], previous[None, :, 2]) - np.maximum(bounds[:, None, 0], previous[None, :, 0]), 0, None)
+    lng_overlap = np.clip(np.minimum(bounds[:, None, 3], previous[None, :, 3]) - np.maximum(bounds[:, None, 1], previous[None, :, 1]), 0, None)
+    intersection = lat_overlap * lng_overlap
+
+    area = (bounds[:, 2] - bounds[:, 0]) * (bounds[:, 3] - bounds[:, 1])
+    previous_area = (previous[:, 2] - previous[:, 0]) * (previous[:, 3] - previous[:, 1])
+    overlap = intersection / (area[:, None] + previous_area[None, :] - intersection)
+
+    # Match the most overlapping pairs first, each region and fire at most once
+    matched_fires = set()
+    for region_index, fire_index in zip(*np.unravel_index(np.argsort(-overlap, axis=None), overlap.shape)):
+        if overlap[region_index, fire_index] < FIRE_OVERLAP_THRESHOLD:
+            break
+
+        region = regions[region_index]
+        if region['fire_id'] is not None or fire_index in matched_fires:
+            continue
 
+        fire_id, run_id, _, _, _, _, detection_hash, prediction_date = tracked_fires[fire_index]
+        matched_fires.add(fire_index)
+        region['fire_id'] = fire_id
+
+        if not region['changed'] and detection_hash == region['detection_hash'] and prediction_date is not None and generation_time - prediction_date < FIRE_REUSE_MAX_AGE:
+            region['reuse_run_id'] = run_id
+
+
+def fetch_api_data(regions: list[dict[str, any]]) -> list[dict[tuple[int, int], dict[Feature, float]]]:
+    """
+    Retrieve weather and GEE data at the grid points of every cluster region concurrently
+
+    Args:
+      regions: Cluster regions, as returned by _get_cluster_region
+
+    Returns:
+      API data keyed by grid offset for each region, in the same order as the input
+    """
+    all_api_data = [{key: {} for key in region['grid']} for region in regions]
+
+    with FetchScheduler(WEATHER_FETCH_WORKERS) as weather_scheduler, FetchScheduler(GEE_FETCH_WORKERS) as gee_scheduler:
+        futures = []
+        for region, api_data in zip(regions, all_api_data):
+            padded_lat_min, padded_lng_min, padded_lat_max, padded_lng_max = region['bounds']
+
+            for key, coord in region['grid'].items():
                 # Populate dictionary with weather data
-                get_weather_data(
-                    coord, 
-                    api_data[(j, i)]
-                )
+                futures.append(weather_scheduler.submit(get_weather_data, coord, api_data[key]))
 
                 # Populate dictionary with gee data
-                get_gee_data(
-                    coord, 
-                    [padded_lng_min, padded_lat_min, padded_lng_max, padded_lat_max], 
-                    api_data[(j, i)]
-                )
+                if not GEE_BATCH_REDUCTION:
+                    futures.append(gee_scheduler.submit(get_gee_data, coord, [padded_lng_min, padded_lat_min, padded_lng_max, padded_lat_max], api_data[key]))
 
-        # Interpolate the API data
-        interpolated_data = get_interpolated_data(api_data, d_lat, d_lng)
+            # Populate every dictionary of the cluster with gee data at once
+            if GEE_BATCH_REDUCTION:
+                futures.append(gee_scheduler.submit(get_gee_cluster_data, region['grid'], [padded_lng_min, padded_lat_min, padded_lng_max, padded_lat_max], api_data))
 
-        # Something went wrong and an empty dictionary was returned
-        # Proceed to next cluster
-        if len(interpolated_data) == 0:
-            continue
+        wait_all(futures)
 
-        # Assign the previous fire mask
-        interpolated_data[Feature.PREV_MASK] = get_current_mask(d_lat, d_lng, origin, cluster_points)
+    return all_api_data
 
-        # clip and normalize data
-        clipped_and_normalized = {
-            key: (tf.clip_by_value(tf.convert_to_tensor(value, dtype=tf.float32), DATA_STATS[key][0], DATA_STATS[key][1]) - DATA_STATS[key][2]) / DATA_STATS[key][3]
-            for key, value in interpolated_data.items()
-        }
 
-        if tf.reduce_any([tf.reduce_any(tf.math.is_nan(tensor)) for key, tensor in clipped_and_normalized.items()]):
-            print('There was found to be a null. This cluster will not be evaluated', flush=True)
-            continue
+def _prepare_cluster(region: dict[str, any], api_data: dict[tuple[int, int], dict[Feature, float]]) -> dict[str, any]:
+    """
+    Interpolate and normalize the data of a cluster so that it can be evaluated by the model
+
+    Args:
+      region: Cluster region, as returned by _get_cluster_region
+      api_data: API data retrieved at the grid points of the region
+
+    Returns:
+      Region populated with its features and its model input blocks, or None if the cluster cannot be evaluated
+    """
+    origin = region['origin']
+    d_lat = region['d_lat']
+    d_lng = region['d_lng']
 
+    # Interpolate the API data
+    features = get_interpolated_data(api_data, d_lat, d_lng)
 
-        # Generate 32x32km predicted fire masks
-        predicted_masks = []
-        for i in range(round(d_lat / BLOCK_SIZE)):
-            for j in range(round(d_lng / BLOCK_SIZE)):
-                num_features = len(clipped_and_normalized)
-                blocks = np.zeros((BLOCK_SIZE, BLOCK_SIZE, num_features))
+    # Something went wrong and no features were returned
+    if features is None:
+        return None
+
+    # Assign the previous fire mask
+    features[..., MODEL_FEATURES.index(Feature.PREV_MASK)] = get_current_mask(d_lat, d_lng, origin, region['points'])
+
+    # clip and normalize data
+    clipped_and_normalized = normalize_features(features)
 
-                # Transform into shape (1, BLOCK_SIZE, BLOCK_SIZE, NUM_FEATURES) for model
-                for k, feature in enumerate([Feature.ELEVATION, Feature.WIND_DIRECTION, Feature.WIND_SPEED, Feature.TEMP_MIN, Feature.TEMP_MAX, Feature.HUMIDITY, Feature.PRECIPITATION, Feature.DROUGHT, Feature.VEGETATION, Feature.POPULATION, Feature.ERC, Feature.PREV_MASK]):
-                    blocks[:, :, k] = clipped_and_normalized[feature][(i)*BLOCK_SIZE:(i+1)*BLOCK_SIZE, (j)*BLOCK_SIZE:(j+1)*BLOCK_SIZE]
+    if np.isnan(clipped_and_normalized).any():
+        print('There was found to be a null. This cluster will not be evaluated', flush=True)
+        return None
+
+    region['features'] = features
+    region['blocks'] = get_model_blocks(clipped_and_normalized, d_lat, d_lng)
 
-                x = np.expand_dims(blocks, axis=0)
-                y = model.predict(x)
+    return region
 
-                predicted_masks.append(y[0,:,:,0])
 
+def _summarize_cluster(cluster: dict[str, any]) -> dict[str, any]:
+    """
+    Reduce an evaluated cluster to the values saved to the database
+
+    Args:
+      cluster: Evaluated cluster with its features and predicted fire mask populated
+
+    Returns:
+      Dictionary with the middle point, mean weather and mask coordinates of the fire with the masks simplified for every
+      zoom level, or None if a mask could not be created
+    """
+    origin = cluster['origin']
+    features = cluster['features']
+
+    # Get coordinates identifying previous and predicted fire masks
+    prev_mask_coords = get_mask_coords(features[..., MODEL_FEATURES.index(Feature.PREV_MASK)], origin)
+    pred_mask_coords = get_mask_coords(cluster['prediction'], origin, True)
+
+    if len(prev_mask_coords) == 0 or len(pred_mask_coords) == 0:
+        print(f'There were not enough coordinates to create a mask. Cluster will not be included.', flush=True)
+        return None
+
+    return {
+        'point': tuple(np.mean(np.array(prev_mask_coords), axis=0).tolist()), 
+        'weather': [
+            np.mean(features[..., MODEL_FEATURES.index(feature)], dtype=np.float64).item() 
+            for feature in [Feature.WIND_DIRECTION, Feature.WIND_SPEED, Feature.TEMP_MIN, Feature.TEMP_MAX, Feature.HUMIDITY, Feature.PRECIPITATION]
+        ], 
+        'masks': [
+            # Simplified versions of the masks for every zoom level, so map reads are lookups
+            (1, prev_mask_coords, Geometry.simplify_mask(prev_mask_coords)), 
+            (2, pred_mask_coords, Geometry.simplify_mask(pred_mask_coords))
+        ]
+    }
+
+
+def _evaluate_shard(shard: list[tuple[dict[str, any], dict[tuple[int, int], dict[Feature, float]]]], batch_size: int) -> list[dict[str, any]]:
+    """
+    Auxiliary function to interpolate, predict and summarize a shard of clusters, in the engine process or in a cluster worker
+    """
+    prepared_indices = []
+    prepared_clusters = []
+    for index, (region, api_data) in enumerate(shard):
+        prepared = _prepare_cluster(region, api_data)
+
+        # Proceed to next cluster
+        if prepared is not None:
+            prepared_indices.append(index)
+            prepared_clusters.append(prepared)
+
+    # Generate 32x32km predicted fire masks for every cluster of the shard at once
+    predicted_blocks = predict_masks([cluster['blocks'] for cluster in prepared_clusters], batch_size)
+
+    summaries = [None] * len(shard)
+    for index, cluster, blocks in zip(prepared_indices, prepared_clusters, predicted_blocks):
         # Combine masks
-        interpolated_data[Feature.NEW_MASK] = np.stack(predicted_masks, axis=0).reshape(d_lat, d_lng)
+        cluster['prediction'] = assemble_mask(blocks, cluster['d_lat'], cluster['d_lng'])
 
+        summaries[index] = _summarize_cluster(cluster)
 
+    return summaries
 
-        # Get coordinates identifying previous and predicted fire masks
-        prev_mask_coords = get_mask_coords(interpolated_data[Feature.PREV_MASK], origin)
-        pred_mask_coords = get_mask_coords(interpolated_data[Feature.NEW_MASK], origin, True)
 
-        if len(prev_mask_coords) == 0 or len(pred_mask_coords) == 0:
-            print(f'There were not enough coordinates to create a mask. Cluster will not be included.', flush=True)
-            continue
+def evaluate_clusters(regions: list[dict[str, any]], all_api_data: list[dict[tuple[int, int], dict[Feature, float]]], batch_size: int=PREDICTION_BATCH_SIZE, workers: int=CLUSTER_WORKERS) -> list[dict[str, any]]:
+    """
+    Evaluate clusters, sharded across the cluster workers when there is more than one
 
-        # Fire table
-        fire_id = -1
-        try:
-            point = tuple(np.mean(np.array(prev_mask_coords), axis=0))
-
-            fire_id = DataManager.execute_write_stored_procedure("add_fire", [point[0], point[1], generation_time])[0][0][0]
-        except Exception as e:
-            print('There was an issue adding a fire to the database', flush=True)
-            raise
-
-        # Region table
-        try:
-            DataManager.execute_write_stored_procedure(
-                "add_region", 
-                [
-                    fire_id, 
-                    run_id, 
-                    padded_lat_min, 
-                    padded_lng_min, 
-                    padded_lat_max, 
-                    padded_lng_max, 
-                    np.mean(interpolated_data[Feature.WIND_DIRECTION]).item(), 
-                    np.mean(interpolated_data[Feature.WIND_SPEED]).item(), 
-                    np.mean(interpolated_data[Feature.TEMP_MIN]).item(), 
-                    np.mean(interpolated_data[Feature.TEMP_MAX]).item(), 
-                    np.mean(interpolated_data[Feature.HUMIDITY]).item(), 
-                    np.mean(interpolated_data[Feature.PRECIPITATION]).item()
-                ]
-            )
-        except Exception as e:
-            print('There was an issue adding a region to the database', flush=True)
-            raise
-        
-        # Process previous mask (& points)
-        prev_mask_id = -1
-        try:
-            prev_mask_id = DataManager.execute_write_stored_procedure("add_mask", [1, fire_id, run_id])[0][0][0]
-        except Exception as e:
-            print('Issue saving previous fire mask to database.', flush=True)
-            raise
-
-        for i, coord in enumerate(prev_mask_coords):
-            try:
-                DataManager.execute_write_stored_procedure('add_mask_point', [prev_mask_id, i, coord[0], coord[1]])
-            except Exception as e:
-                print('Issue saving previous fire mask point to database.', flush=True)
-                raise
-
-        # Process predicted mask (& points)
-        pred_mask_id = -1
-        try:
-            pred_mask_id = DataManager.execute_write_stored_procedure("add_mask", [2, fire_id, run_id])[0][0][0]
-        except Exception as e:
-            print('Issue saving predicted fire mask to database.', flush=True)
-            raise
-
-        for i, coord in enumerate(pred_mask_coords):
-            try:
-                DataManager.execute_write_stored_procedure('add_mask_point', [pred_mask_id, i, coord[0], coord[1]])
-            except Exception as e:
-                print('Issue saving predicted fire mask point to database.', flush=True)
-                raise
+    Args:
+      regions: Cluster regions, as returned by _get_cluster_region
+      all_api_data: API data of each region, as returned by fetch_api_data
+      batch_size: Number of 32x32km blocks evaluated by the model at once
+      workers: Number of worker processes. 1 evaluates the clusters in the engine process
+
+    Returns:
+      Summary of each cluster, as returned by _summarize_cluster, in the same order as the input
+    """
+    # Only what the workers need is sent to them
+    items = [
+        ({key: region[key] for key in ('points', 'origin', 'd_lat', 'd_lng')}, api_data) 
+        for region, api_data in zip(regions, all_api_data)
+    ]
+
+    if workers <= 1 or len(items) <= 1:
+        return _evaluate_shard(items, batch_size)
+
+    # Largest clusters first, each to the least loaded shard
+    shards = [[] for _ in range(min(workers, len(items)))]
+    loads = [0] * len(shards)
+    for index in sorted(range(len(items)), key=lambda index: -regions[index]['d_lat'] * regions[index]['d_lng']):
+        shard = loads.index(min(loads))
+        shards[shard].append(index)
+        loads[shard] += regions[index]['d_lat'] * regions[index]['d_lng']
+
+    pool = get_worker_pool(workers)
+    futures = [pool.submit(_evaluate_shard, [items[index] for index in shard], batch_size) for shard in shards]
+
+    summaries = [None] * len(items)
+    try:
+        for shard, future in zip(shards, futures):
+            for index, summary in zip(shard, future.result()):
+                summaries[index] = summary
+    except BrokenProcessPool:
+        print('A cluster worker exited unexpectedly. The workers will be restarted on the next run.', flush=True)
+        shutdown_worker_pool()
+        raise
+
+    return summaries
+
+
+def _save_cluster(db_connection, run_id: int, region: dict[str, any], summary: dict[str, any]):
+    """
+    Save a fire, its region and its masks to the database
+
+    Args:
+      db_connection: Transaction of the run
+      run_id: Engine run identifier
+      region: Cluster region, as returned by _get_cluster_region
+      summary: Evaluated cluster, as returned by _summarize_cluster
+    """
+    padded_lat_min, padded_lng_min, padded_lat_max, padded_lng_max = region['bounds']
+
+    region_data = [
+        padded_lat_min, 
+        padded_lng_min, 
+        padded_lat_max, 
+        padded_lng_max, 
+        *summary['weather'], 
+        region['detection_hash']
+    ]
+
+    # Fire, region, mask and polygon point tables, written in a single transaction
+    try:
+        DataManager.write_fire(run_id, summary['point'], generation_time, region_data, summary['masks'], db_connection, region['fire_id'])
+    except Exception as e:
+        print('There was an issue adding a fire to the database', flush=True)
+        raise
+
+
+def process_clusters(run_id: int, df: pd.DataFrame, batch_size: int=PREDICTION_BATCH_SIZE, workers: int=CLUSTER_WORKERS):
+    """
+    Process each cluster by retrieving data from APIs and running the AI model to generate a predicted fire mask
+
+    Args:
+      run_id: Engine run identifier
+      df: DataFrame containing cluster data
+      batch_size: Number of 32x32km blocks evaluated by the model at once
+      workers: Number of processes evaluating clusters in parallel
+    """
+    # Filter unique clusters
+    clusters = df[df['cluster'] >= 0]['cluster'].unique()
+
+    regions = [_get_cluster_region(i, df[df['cluster'] == cluster]) for i, cluster in enumerate(clusters)]
+
+    # Track fires from the previous run so they keep their identifiers
+    associate_fires(regions, DataManager.execute_read_stored_procedure("get_tracked_fires")[0])
+
+    reused_regions = [region for region in regions if region['reuse_run_id'] is not None]
+    updated_regions = [region for region in regions if region['reuse_run_id'] is None]
+
+    print(f'Reusing predictions of {len(reused_regions)} unchanged fires.', flush=True)
+
+    # Call APIs on every grid point of every changed cluster
+    all_api_data = fetch_api_data(updated_regions)
+
+    # Interpolate, predict and summarize the changed clusters
+    summaries = evaluate_clusters(updated_regions, all_api_data, batch_size, workers)
+
+    # Results of the run are staged in a single transaction and published together, so readers never see
+    # a partially written run and a failed run leaves nothing behind
+    db_connection = DataManager.begin_transaction()
+
+    try:
+        # Unchanged fires are published again with their previous results
+        for region in reused_regions:
+            DataManager.execute_transaction_stored_procedure(db_connection, "copy_fire_run", [region['fire_id'], region['reuse_run_id'], run_id])
+
+        for region, summary in zip(updated_regions, summaries):
+            if summary is not None:
+                _save_cluster(db_connection, run_id, region, summary)
+
+        DataManager.execute_transaction_stored_procedure(db_connection, "publish_run", [run_id])
+    except Exception:
+        print('Issue saving the run to the database. The run will be rolled back.', flush=True)
+        DataManager.rollback_transaction(db_connection)
+        raise
+
+    DataManager.commit_transaction(db_connection)
 
 
 def run(id: int):
@@ -739,10 +1216,17 @@ def run(id: int):
       id: Engine run identifier provided by the engine
     """
 
+    global generation_time, start_date, end_date
+
     if (id == -1):
         return
-    
-    run_id = id
+
+    initialize_ee()
+
+    # The engine process runs indefinitely, so the dates are refreshed for every run
+    generation_time = datetime.now()
+    end_date = f'{generation_time.strftime("%Y-%m-%d")}'
+    start_date = f'{(generation_time - timedelta(days=30)).strftime("%Y-%m-%d")}'
 
     # Perform clustering
     df = get_clusters(f'{(generation_time - timedelta(days=0)).strftime("%Y-%m-%d")}')
@@ -761,3 +1245,5 @@ def run(id: int):
     end = datetime.now()
 
     print(f'Cluster processing complete in {(end-start).total_seconds()} seconds.', flush=True)
+    print(f'Feature cache statistics: {get_feature_cache().stats()}', flush=True)
+    print(f'Weather cache statistics: {weather_cache.stats()}', flush=True)
@@ -0,0 +1,277 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from math import floor
+
+import numpy as np
+import os
+import threading
+import time
+
+
+class TileCache:
+    """
+    Constructor
+
+    Args:
+      directory: Directory the tiles are stored in
+      ttls: Time to live in seconds of the tiles of each layer. Layers without a TTL are not cached
+      resolution: Size in degrees of a cached cell
+      tile_size: Number of cells along each side of a tile
+      max_tiles: Maximum number of tiles kept on disk before the least recently used are evicted
+    """
+    def __init__(self, directory: str, ttls: dict[str, float], resolution: float=0.01, tile_size: int=256, max_tiles: int=512):
+        self.directory = directory
+        self.ttls = ttls
+        self.resolution = resolution
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        # (layer, row, col) -> [path, creation time, memory-mapped array or None], in least recently used order
+        self.tiles = OrderedDict()
+        self._load_index()
+
+    def get(self, layer: str, coord: tuple[float, float]) -> float:
+        """
+        Retrieve a cached value
+
+        Args:
+          layer: Layer name
+          coord: Coordinate point
+
+        Returns:
+          Cached value of the cell containing the point, or None if it is not cached
+        """
+        if layer not in self.ttls:
+            return None
+
+        key, cell = self._locate(layer, coord)
+
+        with self.lock:
+            tile = self._get_tile(key, False)
+            value = np.nan if tile is None else tile[cell]
+
+            if np.isnan(value):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return value.item()
+
+    def put(self, layer: str, coord: tuple[float, float], value: float):
+        """
+        Cache a value
+
+        Args:
+          layer: Layer name
+          coord: Coordinate point
+          value: Value at the point
+        """
+        if layer not in self.ttls or value is None:
+            return
+
+        key, cell = self._locate(layer, coord)
+
+        with self.lock:
+            self._get_tile(key, True)[cell] = value
+
+    def stats(self) -> dict[str, int]:
+        """
+        Retrieve the cache counters
+
+        Returns:
+          Dictionary with keys 'hits', 'misses' and 'tiles'
+        """
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'tiles': len(self.tiles)}
+
+    def _locate(self, layer: str, coord: tuple[float, float]) -> tuple[tuple[str, int, int], tuple[int, int]]:
+        """
+        Auxiliary function to quantize a coordinate into a tile key and a cell within the tile
+        """
+        lat = floor(coord[0] / self.resolution)
+        lng = floor(coord[1] / self.resolution)
+
+        return (layer, lat // self.tile_size, lng // self.tile_size), (lat % self.tile_size, lng % self.tile_size)
+
+    def _path(self, key: tuple[str, int, int], created: int) -> str:
+        """
+        Auxiliary function to compute the file path of a tile
+        """
+        layer, row, col = key
+        return os.path.join(self.directory, layer, f'{row}_{col}_{created}.npy')
+
+    def _load_index(self):
+        """
+        Auxiliary function to index the tiles already on disk, oldest access first
+        """
+        entries = []
+        for layer in self.ttls:
+            os.makedirs(os.path.join(self.directory, layer), exist_ok=True)
+
+            for name in os.listdir(os.path.join(self.directory, layer)):
+                try:
+                    row, col, created = map(int, name.removesuffix('.npy').split('_'))
+                except ValueError:
+                    continue
+
+                path = os.path.join(self.directory, layer, name)
+                entries.append((os.path.getatime(path), (layer, row, col), path, created))
+
+        for _, key, path, created in sorted(entries):
+            self.tiles[key] = [path, created, None]
+
+    def _get_tile(self, key: tuple[str, int, int], create: bool) -> np.ndarray:
+        """
+        Auxiliary function to open a tile, discarding it if it has expired and creating it if requested
+        """
+        entry = self.tiles.get(key)
+
+        if entry is not None and time.time() - entry[1] > self.ttls[key[0]]:
+            self._evict(key)
+            entry = None
+
+        if entry is None:
+            if not create:
+                return None
+
+            created = int(time.time())
+            path = self._path(key, created)
+            tile = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(self.tile_size, self.tile_size))
+            tile[:] = np.nan
+
+            entry = [path, created, tile]
+            self.tiles[key] = entry
+
+            while len(self.tiles) > self.max_tiles:
+                self._evict(next(iter(self.tiles)))
+        elif entry[2] is None:
+            entry[2] = np.load(entry[0], mmap_mode='r+')
+
+        self.tiles.move_to_end(key)
+        return entry[2]
+
+    def _evict(self, key: tuple[str, int, int]):
+        """
+        Auxiliary function to remove a tile from the cache
+        """
+        path, _, tile = self.tiles.pop(key)
+
+        if tile is not None:
+            tile.flush()
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class WeatherCache:
+    """
+    Constructor
+
+    Args:
+      cell_size: Size in degrees of the cells responses are shared within
+      bucket: Length in seconds of the time buckets responses are shared within
+      max_entries: Maximum number of responses kept before the least recently used are evicted
+    """
+    def __init__(self, cell_size: float=0.1, bucket: int=3600, max_entries: int=4096):
+        self.cell_size = cell_size
+        self.bucket = bucket
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        # (lat cell, lng cell, time bucket) -> response, in least recently used order
+        self.entries = OrderedDict()
+
+        # (lat cell, lng cell, time bucket) -> future of a response currently being fetched
+        self.pending = {}
+
+    def get_or_fetch(self, coord: tuple[float, float], fetch: callable) -> str:
+        """
+        Retrieve the cached response for the cell containing a point, fetching it at the centre of the cell if it is not cached
+
+        Every point of a cell gets the same response whichever point is processed first, and concurrent requests for the
+        same cell wait on a single fetch.
+
+        Args:
+          coord: Coordinate point
+          fetch: Function taking a coordinate point and returning the response
+
+        Returns:
+          Response for the cell containing the point
+        """
+        key = self._key(coord)
+
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key]
+
+            pending = self.pending.get(key)
+            owner = pending is None
+
+            if owner:
+                self.misses += 1
+                pending = Future()
+                self.pending[key] = pending
+            else:
+                self.hits += 1
+
+        if not owner:
+            return pending.result()
+
+        try:
+            response = fetch(((key[0] + 0.5) * self.cell_size, (key[1] + 0.5) * self.cell_size))
+        except Exception as e:
+            with self.lock:
+                del self.pending[key]
+            pending.set_exception(e)
+            raise
+
+        with self.lock:
+            del self.pending[key]
+            self._insert(key, response)
+        pending.set_result(response)
+
+        return response
+
+    def stats(self) -> dict[str, int]:
+        """
+        Retrieve the cache counters
+
+        Returns:
+          Dictionary with keys 'hits', 'misses' and 'entries'
+        """
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.entries)}
+
+    def _bucket(self) -> int:
+        """
+        Auxiliary function to compute the current time bucket
+        """
+        return int(time.time() // self.bucket)
+
+    def _key(self, coord: tuple[float, float]) -> tuple[int, int, int]:
+        """
+        Auxiliary function to quantize a coordinate and the current time into a cache key
+        """
+        return (floor(coord[0] / self.cell_size), floor(coord[1] / self.cell_size), self._bucket())
+
+    def _insert(self, key: tuple[int, int, int], response: str):
+        """
+        Auxiliary function to cache a response, evicting expired and least recently used responses
+        """
+        current = self._bucket()
+        for expired in [entry for entry in self.entries if entry[2] != current]:
+            del self.entries[expired]
+
+        self.entries[key] = response
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
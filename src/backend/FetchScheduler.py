@@ -0,0 +1,126 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import random
+import threading
+import time
+
+
+class LimitAPI:
+    """
+    Constructor
+
+    Args:
+      call_limit: Maximum number of calls
+      interval: Interval in seconds until number of calls is refreshed
+      cushion: Seconds waited past the refresh before calling again
+    """
+    def __init__(self, call_limit, interval, cushion=5):
+        self.call_limit = call_limit
+        self.interval = interval
+        self.cushion = cushion
+        self.calls = 0
+        self.start_time = time.time()
+        self.lock = threading.Lock()
+
+    def can_call(self):
+        with self.lock:
+            if time.time() - self.start_time > self.interval:
+                self.calls = 0
+                self.start_time = time.time()
+
+            return self.calls < self.call_limit
+
+    def call(self):
+        # Callers over the limit wait for the calls to be refreshed without holding the lock, then check again
+        while True:
+            with self.lock:
+                # Refresh number of calls if possible
+                if (time.time() - self.start_time > self.interval):
+                    self.calls = 0
+                    self.start_time = time.time()
+
+                if (self.calls < self.call_limit):
+                    self.calls += 1
+                    return
+
+                # Wait until refresh
+                wait = max(0, self.interval - (time.time() - self.start_time) + self.cushion)
+
+            print('Currently waiting...', flush=True)
+            time.sleep(wait)
+
+
+class FetchScheduler:
+    """
+    Constructor
+
+    Args:
+      max_workers: Maximum number of requests in flight at once
+      attempts: Number of times a request is attempted before its error is raised
+      backoff: Delay in seconds before the first retry, doubled after every failed attempt
+      max_backoff: Maximum delay in seconds between attempts
+    """
+    def __init__(self, max_workers: int, attempts: int=5, backoff: float=2.0, max_backoff: float=60.0):
+        self.max_workers = max_workers
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, fetch: callable, *args) -> Future:
+        """
+        Schedule a request
+
+        Args:
+          fetch: Function performing the request
+          args: Arguments passed to the function
+
+        Returns:
+          Future resolving to the return value of the function
+        """
+        return self.executor.submit(self._attempt, fetch, args)
+
+    def shutdown(self):
+        """
+        Cancel pending requests and wait for the requests in flight to finish
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def _attempt(self, fetch: callable, args: tuple) -> any:
+        """
+        Auxiliary function to perform a request, retrying with exponential backoff on failure
+        """
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return fetch(*args)
+            except Exception as e:
+                if attempt == self.attempts:
+                    print(f'Request failed after {self.attempts} attempts. Details: {e}', flush=True)
+                    raise
+
+                # Jitter the delay so failed requests do not retry in lockstep
+                delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+                print(f'Request failed, retrying in {delay:.1f} seconds. Details: {e}', flush=True)
+                time.sleep(delay)
+
+
+def wait_all(futures: list[Future]) -> list[any]:
+    """
+    Wait for every scheduled request to finish
+
+    Args:
+      futures: Futures returned by FetchScheduler.submit
+
+    Returns:
+      Results in the same order as the futures
+
+    Raises:
+      Error of the first request that failed
+    """
+    return [future.result() for future in futures]
@@ -0,0 +1,210 @@
+from FetchScheduler import FetchScheduler, wait_all
+
+import os
+import pandas as pd
+import requests
+import threading
+
+
+FIRMS_URL = 'https://firms.modaps.eosdis.nasa.gov/usfs/api/area/csv'
+
+# Only these columns are parsed from the FIRMS responses
+FIRMS_COLUMNS = {
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'acq_date': 'str',
+    'acq_time': 'str',
+    'confidence': 'str'
+}
+
+# Columns identifying a detection
+DETECTION_KEY = ['latitude', 'longitude', 'acquired']
+
+# Detections are published late and out of order. Rows acquired up to this long before the latest retained detection of
+# the date are checked against the retained detections, and older rows are dropped as retained by an earlier fetch
+LATE_DETECTION_GRACE = pd.Timedelta(hours=3)
+
+
+def is_confident(source: str, confidence: pd.Series) -> pd.Series:
+    """
+    Identify the confident detections of a FIRMS source
+
+    Args:
+      source: FIRMS source name
+      confidence: Confidence column of the detections, as strings
+
+    Returns:
+      Boolean series identifying the detections to keep
+
+    Raises:
+      Error if the source is not a MODIS or VIIRS source
+    """
+    if 'MODIS' in source:
+        # Refer to: https://www.earthdata.nasa.gov/learn/find-data/near-real-time/firms/mcd14dl-nrt#ed-firms-attributes
+        return pd.to_numeric(confidence, errors='coerce') >= 50
+    elif 'VIIRS' in source:
+        # 'l' : low; 'n' : nominal; 'h' : high
+        # Refer to: https://www.earthdata.nasa.gov/learn/find-data/near-real-time/firms/vj114imgtdlnrt
+        return confidence == 'h'
+    # elif 'LANDSAT' in source:
+    #     # 'L' : low, 'M' : medium, 'H' : high
+    #     return confidence == 'H'
+
+    raise Exception("Unexpected FIRMS source found.")
+
+
+class FirmsIngestor:
+    """
+    Constructor
+
+    Args:
+      api_key: FIRMS map key
+      area: Bounding box of the detections as 'west,south,east,north'
+      sources: FIRMS sources to fetch
+      directory: Directory the detections of each source are kept in between runs, or None to keep them in memory only
+      base_url: FIRMS area endpoint, which can be pointed at a local stub server
+      chunk_size: Number of rows parsed at once while the response is streamed
+      max_workers: Maximum number of sources fetched at once
+      grace: How long before the latest retained detection of the date a detection may be acquired and still be added
+    """
+    def __init__(self, api_key: str, area: str, sources: list[str], directory: str=None, base_url: str=FIRMS_URL, chunk_size: int=10000, max_workers: int=4, grace: pd.Timedelta=LATE_DETECTION_GRACE):
+        self.api_key = api_key
+        self.area = area
+        self.sources = sources
+        self.directory = directory
+        self.base_url = base_url
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.grace = grace
+        self.lock = threading.Lock()
+
+        # source -> confident detections retained from earlier fetches
+        self.detections = {source: self._load(source) for source in sources}
+
+    def fetch(self, firms_date: str) -> pd.DataFrame:
+        """
+        Retrieve the confident detections of every source on a date, adding only those acquired since the watermark of
+        each source and not retained by an earlier fetch
+
+        Args:
+          firms_date: String representing the FIRMS date
+
+        Returns:
+          Dataframe with the latitude, longitude, acq_date, acq_time and source of every detection
+        """
+        with FetchScheduler(self.max_workers) as scheduler:
+            dfs = wait_all([scheduler.submit(self._fetch_source, source, firms_date) for source in self.sources])
+
+        return pd.concat(dfs, ignore_index=True)
+
+    def _fetch_source(self, source: str, firms_date: str) -> pd.DataFrame:
+        """
+        Auxiliary function to merge the new detections of a source into its retained detections
+        """
+        with self.lock:
+            retained = self.detections[source]
+
+        date = pd.Timestamp(firms_date)
+        retained = retained[retained['acquired'].dt.normalize() >= date - pd.Timedelta(days=1)]
+        on_date = retained[retained['acquired'].dt.normalize() == date]
+
+        # Rows acquired before the watermark were retained by an earlier fetch, and rows after it may have been
+        watermark = on_date['acquired'].max() - self.grace if len(on_date) > 0 else None
+        recent = on_date if watermark is None else on_date[on_date['acquired'] > watermark]
+
+        new = self._read_source(source, firms_date, watermark, pd.MultiIndex.from_frame(recent[DETECTION_KEY]))
+
+        merged = pd.concat([retained, new], ignore_index=True)
+
+        with self.lock:
+            self.detections[source] = merged
+        self._save(source, merged)
+
+        print(f'FIRMS {source}: {len(new)} new detections since {watermark}.', flush=True)
+
+        detections = merged[merged['acquired'].dt.normalize() == date]
+
+        return pd.DataFrame({
+            'latitude': detections['latitude'].to_numpy(),
+            'longitude': detections['longitude'].to_numpy(),
+            'acq_date': detections['acquired'].dt.strftime('%Y-%m-%d').to_numpy(),
+            'acq_time': detections['acquired'].dt.strftime('%H%M').to_numpy(),
+            'source': source
+        })
+
+    def _read_source(self, source: str, firms_date: str, watermark: pd.Timestamp, retained: pd.MultiIndex) -> pd.DataFrame:
+        """
+        Auxiliary function to stream the response of a source, keeping the confident detections acquired after the
+        watermark, if any, whose key is not retained
+        """
+        chunks = []
+
+        with requests.get(f'{self.base_url}/{self.api_key}/{source}/{self.area}/1/{firms_date}', stream=True, timeout=60) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            reader = pd.read_csv(response.raw, usecols=list(FIRMS_COLUMNS), dtype=FIRMS_COLUMNS, chunksize=self.chunk_size)
+
+            for chunk in reader:
+                chunk = chunk[is_confident(source, chunk['confidence'])]
+
+                acquired = pd.to_datetime(chunk['acq_date'] + ' ' + chunk['acq_time'].str.zfill(4), format='%Y-%m-%d %H%M')
+
+                detections = pd.DataFrame({
+                    'latitude': chunk['latitude'].to_numpy(),
+                    'longitude': chunk['longitude'].to_numpy(),
+                    'acquired': acquired.to_numpy()
+                })
+                if watermark is not None:
+                    detections = detections[detections['acquired'] > watermark]
+
+                chunks.append(detections[~pd.MultiIndex.from_frame(detections[DETECTION_KEY]).isin(retained)])
+
+        if len(chunks) == 0:
+            return self._empty()
+
+        # A detection may also be repeated within the response
+        return pd.concat(chunks, ignore_index=True).drop_duplicates(subset=DETECTION_KEY, ignore_index=True)
+
+    def _path(self, source: str) -> str:
+        """
+        Auxiliary function to get the file the detections of a source are kept in
+        """
+        return os.path.join(self.directory, f'{source}.csv')
+
+    def _load(self, source: str) -> pd.DataFrame:
+        """
+        Auxiliary function to load the detections of a source retained by an earlier process
+        """
+        if self.directory is None:
+            return self._empty()
+
+        try:
+            return pd.read_csv(self._path(source), dtype={'latitude': 'float64', 'longitude': 'float64'}, parse_dates=['acquired'])
+        except (FileNotFoundError, ValueError, pd.errors.EmptyDataError):
+            return self._empty()
+
+    def _save(self, source: str, detections: pd.DataFrame):
+        """
+        Auxiliary function to persist the retained detections of a source, if the ingestor has a directory
+        """
+        if self.directory is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Write to a temporary file first so an interrupted save does not corrupt the detections
+        path = self._path(source)
+        detections.to_csv(f'{path}.tmp', index=False)
+        os.replace(f'{path}.tmp', path)
+
+    @staticmethod
+    def _empty() -> pd.DataFrame:
+        """
+        Auxiliary function to create a frame with no detections
+        """
+        return pd.DataFrame({
+            'latitude': pd.Series(dtype='float64'),
+            'longitude': pd.Series(dtype='float64'),
+            'acquired': pd.Series(dtype='datetime64[ns]')
+        })
@@ -0,0 +1,83 @@
+import numpy as np
+
+EARTH_RADIUS = 6371
+ARC_DEGREE_DISTANCE = 111.32
+
+
+def haversine_distance(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+    """
+    Compute the haversine distance between coordinate points, broadcasting over arrays
+
+    Args:
+      lat1: Latitudes of the first points in radians
+      lng1: Longitudes of the first points in radians
+      lat2: Latitudes of the second points in radians
+      lng2: Longitudes of the second points in radians
+
+    Returns:
+      Distances in km.
+    """
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)) * EARTH_RADIUS
+
+
+def unit_vectors(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """
+    Convert coordinate points to points on the unit sphere, whose straight-line distances grow with great-circle distance
+
+    Args:
+      lats: Latitudes in degrees
+      lngs: Longitudes in degrees
+
+    Returns:
+      Array of shape (N, 3) with the points on the unit sphere
+    """
+    lats, lngs = np.radians(lats), np.radians(lngs)
+    return np.column_stack((np.cos(lats) * np.cos(lngs), np.cos(lats) * np.sin(lngs), np.sin(lats)))
+
+
+def haversine_components(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the latitudinal, longitudinal and total haversine distances between coordinate points, broadcasting over arrays
+
+    The latitudinal distance is measured along the mean longitude and the longitudinal distance along the mean latitude.
+
+    Args:
+      lat1: Latitudes of the first points in degrees
+      lng1: Longitudes of the first points in degrees
+      lat2: Latitudes of the second points in degrees
+      lng2: Longitudes of the second points in degrees
+
+    Returns:
+      Latitudinal, longitudinal and total distances in km.
+    """
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+
+    mid_lat = (lat1 + lat2) / 2.0
+    mid_lng = (lng1 + lng2) / 2.0
+
+    return (
+        haversine_distance(lat1, mid_lng, lat2, mid_lng),
+        haversine_distance(mid_lat, lng1, mid_lat, lng2),
+        haversine_distance(lat1, lng1, lat2, lng2)
+    )
+
+
+def offset_coordinates(origin: tuple[np.ndarray, np.ndarray], dlat_km: np.ndarray, dlng_km: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute coordinates after km adjustments to the latitude and/or longitude, broadcasting over arrays
+
+    Args:
+      origin: Latitudes and longitudes in degrees of the points to adjust
+      dlat_km: Kilometer adjustments to latitude, with positive adjustment relating to North
+      dlng_km: Kilometer adjustments to longitude, with positive adjustment relating to East
+
+    Returns:
+      Latitudes and longitudes in degrees of the adjusted points
+    """
+    lat, lng = np.asarray(origin[0], dtype=np.float64), np.asarray(origin[1], dtype=np.float64)
+
+    return (
+        lat + np.asarray(dlat_km) / ARC_DEGREE_DISTANCE,
+        lng + np.asarray(dlng_km) / (np.cos(np.radians(lat)) * ARC_DEGREE_DISTANCE)
+    )
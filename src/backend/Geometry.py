@@ -0,0 +1,279 @@
+import Geodesy
+import numpy as np
+
+
+def project(lats: np.ndarray, lngs: np.ndarray, origin: tuple[float, float]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Project coordinates onto a local plane in km. centred at an origin
+
+    The projection is equirectangular, which is accurate for the few hundred kilometres spanned by a fire region.
+
+    Args:
+      lats: Latitudes in degrees
+      lngs: Longitudes in degrees
+      origin: Coordinate point at the centre of the plane
+
+    Returns:
+      East and north offsets from the origin in km.
+    """
+    x = (np.asarray(lngs, dtype=np.float64) - origin[1]) * np.cos(np.radians(origin[0])) * Geodesy.ARC_DEGREE_DISTANCE
+    y = (np.asarray(lats, dtype=np.float64) - origin[0]) * Geodesy.ARC_DEGREE_DISTANCE
+    return x, y
+
+
+def azimuthal_project(origin_lats: np.ndarray, origin_lngs: np.ndarray, lats: np.ndarray, lngs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Project coordinates onto an azimuthal equidistant plane in km. centred at each of a set of origins
+
+    Distances and bearings from the origin are preserved, so the distance of every projected point from the origin is
+    its haversine distance.
+
+    Args:
+      origin_lats: Latitudes of the origins in degrees
+      origin_lngs: Longitudes of the origins in degrees
+      lats: Latitudes in degrees
+      lngs: Longitudes in degrees
+
+    Returns:
+      East and north offsets in km. of every coordinate point, in one row per origin
+    """
+    lat1 = np.radians(np.asarray(origin_lats, dtype=np.float64))[:, None]
+    lng1 = np.radians(np.asarray(origin_lngs, dtype=np.float64))[:, None]
+    lat2 = np.radians(np.asarray(lats, dtype=np.float64))[None, :]
+    lng2 = np.radians(np.asarray(lngs, dtype=np.float64))[None, :]
+
+    # Sines and cosines are taken per point, and the differences of longitude are expanded into their products
+    sin_lat1, cos_lat1, sin_lat2, cos_lat2 = np.sin(lat1), np.cos(lat1), np.sin(lat2), np.cos(lat2)
+    sin_dlng = np.sin(lng2) * np.cos(lng1) - np.cos(lng2) * np.sin(lng1)
+    cos_dlng = np.cos(lng2) * np.cos(lng1) + np.sin(lng2) * np.sin(lng1)
+
+    # East and north components of the direction to each point, whose length is the sine of the angle to it
+    east = cos_lat2 * sin_dlng
+    north = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_dlng
+    length = np.hypot(east, north)
+
+    # The angle is taken from both its sine and cosine, which stays accurate at short distances
+    scale = Geodesy.EARTH_RADIUS * np.arctan2(length, sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_dlng) / np.where(length > 0, length, 1)
+
+    return east * scale, north * scale
+
+
+def points_in_polygon(xs: np.ndarray, ys: np.ndarray, polygon_xs: np.ndarray, polygon_ys: np.ndarray) -> np.ndarray:
+    """
+    Test points for containment in a polygon by casting a ray from every point against every edge at once
+
+    Args:
+      xs: Horizontal positions of the points
+      ys: Vertical positions of the points
+      polygon_xs: Horizontal positions of the ordered polygon vertices, shared by the points or in one row per point
+      polygon_ys: Vertical positions of the ordered polygon vertices, shared by the points or in one row per point
+
+    Returns:
+      Boolean array identifying the points inside the polygon
+    """
+    if np.shape(polygon_xs)[-1] < 3:
+        return np.zeros(len(xs), dtype=bool)
+
+    x1, y1 = np.atleast_2d(polygon_xs), np.atleast_2d(polygon_ys)
+    x2, y2 = np.roll(x1, -1, axis=1), np.roll(y1, -1, axis=1)
+    x, y = xs[:, None], ys[:, None]
+
+    # Horizontal edges never straddle the ray, so their division result is discarded
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crossings = ((y1 > y) != (y2 > y)) & (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1)
+
+    return crossings.sum(axis=1) % 2 == 1
+
+
+def distance_to_edges(xs: np.ndarray, ys: np.ndarray, polygon_xs: np.ndarray, polygon_ys: np.ndarray) -> np.ndarray:
+    """
+    Compute the distance from points to the closest edge of a polygon
+
+    Args:
+      xs: Horizontal positions of the points
+      ys: Vertical positions of the points
+      polygon_xs: Horizontal positions of the ordered polygon vertices, shared by the points or in one row per point
+      polygon_ys: Vertical positions of the ordered polygon vertices, shared by the points or in one row per point
+
+    Returns:
+      Distance from each point to the closest edge, in the units of the positions
+    """
+    x1, y1 = np.atleast_2d(polygon_xs), np.atleast_2d(polygon_ys)
+    dx = np.roll(x1, -1, axis=1) - x1
+    dy = np.roll(y1, -1, axis=1) - y1
+    x, y = xs[:, None], ys[:, None]
+
+    # Position of the closest point along each edge, clamped to the edge
+    length = dx ** 2 + dy ** 2
+    t = np.clip(((x - x1) * dx + (y - y1) * dy) / np.where(length > 0, length, 1), 0, 1)
+
+    return np.sqrt((x1 + t * dx - x) ** 2 + (y1 + t * dy - y) ** 2).min(axis=1)
+
+
+def polygon_distances(lats: np.ndarray, lngs: np.ndarray, polygon_lats: np.ndarray, polygon_lngs: np.ndarray) -> np.ndarray:
+    """
+    Compute the distance from coordinate points to a polygon
+
+    Args:
+      lats: Latitudes of the points in degrees
+      lngs: Longitudes of the points in degrees
+      polygon_lats: Latitudes of the ordered polygon vertices in degrees
+      polygon_lngs: Longitudes of the ordered polygon vertices in degrees
+
+    Returns:
+      Distance in km. from each point to the polygon, or 0 for points inside the polygon
+    """
+    # The polygon is seen from every point on its own azimuthal equidistant plane, where the vertices are at their
+    # haversine distance from the point and the short edges between them are close to straight
+    polygon_xs, polygon_ys = azimuthal_project(lats, lngs, polygon_lats, polygon_lngs)
+    origins = np.zeros(len(polygon_xs), dtype=np.float64)
+
+    distances = distance_to_edges(origins, origins, polygon_xs, polygon_ys)
+    distances[points_in_polygon(origins, origins, polygon_xs, polygon_ys)] = 0.0
+
+    return distances
+
+
+# Zoom levels mask polygons are simplified for, each to the size of a map pixel at that zoom
+SIMPLIFICATION_ZOOMS = [4, 6, 8, 10, 12]
+TILE_SIZE = 256
+
+
+def pixel_size(zoom: int, lat: float) -> float:
+    """
+    Compute the size of a web map pixel
+
+    Args:
+      zoom: Map zoom level
+      lat: Latitude in degrees
+
+    Returns:
+      Width of a pixel at the latitude in km.
+    """
+    return 2 * np.pi * Geodesy.EARTH_RADIUS * np.cos(np.radians(lat)) / (TILE_SIZE * 2 ** zoom)
+
+
+def simplification_zoom(zoom: int) -> int:
+    """
+    Get the zoom level of the simplified polygons served at a map zoom level
+
+    Args:
+      zoom: Map zoom level
+
+    Returns:
+      Closest simplification zoom level that is not more detailed than needed, or the least detailed one
+    """
+    return max([level for level in SIMPLIFICATION_ZOOMS if level <= zoom], default=SIMPLIFICATION_ZOOMS[0])
+
+
+def _segment_distances(xs: np.ndarray, ys: np.ndarray, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+    """
+    Auxiliary function to compute the distance from points to a segment
+    """
+    dx, dy = x2 - x1, y2 - y1
+    length = dx ** 2 + dy ** 2
+    t = np.clip(((xs - x1) * dx + (ys - y1) * dy) / length, 0, 1) if length > 0 else np.zeros(len(xs))
+
+    return np.hypot(x1 + t * dx - xs, y1 + t * dy - ys)
+
+
+def simplify_polygon(xs: np.ndarray, ys: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplify a polygon with the Douglas-Peucker algorithm, keeping at least a triangle
+
+    Args:
+      xs: Horizontal positions of the ordered polygon vertices
+      ys: Vertical positions of the ordered polygon vertices
+      tolerance: Maximum distance from a removed vertex to the simplified polygon, in the units of the positions
+
+    Returns:
+      Indices of the kept vertices, in order
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    n = len(xs)
+
+    if n <= 3:
+        return np.arange(n)
+
+    # The ring is split at the first vertex and the vertex furthest from it, with the first vertex repeated at the end
+    far = int(np.argmax(np.hypot(xs - xs[0], ys - ys[0])))
+    ring_xs, ring_ys = np.append(xs, xs[0]), np.append(ys, ys[0])
+
+    keep = np.zeros(n + 1, dtype=bool)
+    keep[[0, far, n]] = True
+
+    segments = [(0, far), (far, n)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2:
+            continue
+
+        distances = _segment_distances(ring_xs[start + 1:end], ring_ys[start + 1:end], ring_xs[start], ring_ys[start], ring_xs[end], ring_ys[end])
+        furthest = start + 1 + int(np.argmax(distances))
+
+        if distances[furthest - start - 1] > tolerance:
+            keep[furthest] = True
+            segments.extend([(start, furthest), (furthest, end)])
+
+    # A polygon needs a third vertex, the one furthest from the line through the first two
+    if keep[:n].sum() < 3:
+        distances = _segment_distances(xs, ys, xs[0], ys[0], xs[far], ys[far])
+        distances[[0, far]] = -1
+        keep[int(np.argmax(distances))] = True
+
+    return np.flatnonzero(keep[:n])
+
+
+def encode_polyline(lats: np.ndarray, lngs: np.ndarray, precision: int=5) -> str:
+    """
+    Encode coordinates with the encoded polyline algorithm format
+
+    Args:
+      lats: Latitudes in degrees
+      lngs: Longitudes in degrees
+      precision: Number of decimal places kept
+
+    Returns:
+      Encoded polyline
+    """
+    values = np.round(np.column_stack((lats, lngs)) * 10 ** precision).astype(np.int64)
+    deltas = np.diff(values, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel()
+
+    chunks = []
+    for delta in deltas.tolist():
+        value = ~(delta << 1) if delta < 0 else delta << 1
+
+        while value >= 0x20:
+            chunks.append(chr((0x20 | (value & 0x1f)) + 63))
+            value >>= 5
+        chunks.append(chr(value + 63))
+
+    return ''.join(chunks)
+
+
+def simplify_mask(coords: list[tuple[float, float]], zooms: list[int]=SIMPLIFICATION_ZOOMS) -> list[tuple[int, str, list[float]]]:
+    """
+    Simplify a mask polygon for every zoom level
+
+    Args:
+      coords: Ordered coordinates of the polygon in degrees
+      zooms: Zoom levels to simplify the polygon for
+
+    Returns:
+      Rows of (zoom, encoded polyline, flat [lat, lng, lat, lng, ...] array) for each zoom level
+    """
+    lats, lngs = np.array(coords, dtype=np.float64).T
+    origin = (float(np.mean(lats)), float(np.mean(lngs)))
+    xs, ys = project(lats, lngs, origin)
+
+    simplified = []
+    for zoom in zooms:
+        kept = simplify_polygon(xs, ys, pixel_size(zoom, origin[0]))
+        simplified.append((
+            zoom, 
+            encode_polyline(lats[kept], lngs[kept]), 
+            np.round(np.column_stack((lats[kept], lngs[kept])), 5).ravel().tolist()
+        ))
+
+    return simplified
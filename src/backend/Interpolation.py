@@ -0,0 +1,90 @@
+from scipy.sparse import csr_matrix
+from scipy.spatial import Delaunay
+
+import numpy as np
+
+
+class GridInterpolator:
+    """
+    Constructor
+
+    Args:
+      coords: Positions of the samples as (x, y) rows
+      shape: Height and width of the grid, whose cell (i, j) is at position (j, i)
+    """
+    def __init__(self, coords: np.ndarray, shape: tuple[int, int]):
+        self.coords = np.asarray(coords, dtype=np.float64)
+        self.shape = shape
+
+        ys, xs = np.mgrid[0:shape[0], 0:shape[1]]
+        self.targets = np.column_stack((xs.ravel(), ys.ravel())).astype(np.float64)
+
+        # Valid samples -> sparse matrix of the barycentric weights of every grid cell on the samples, and the cells outside their triangulation
+        self.weights = {}
+
+    def interpolate(self, values: np.ndarray) -> np.ndarray:
+        """
+        Linearly interpolate every attribute over the grid, filling cells outside the samples with the mean of the attribute
+
+        Samples with a missing value only leave out that attribute, and attributes missing at the same samples share a triangulation.
+
+        Args:
+          values: Array of shape (N, F) with the value of every attribute at every sample, NaN where missing
+
+        Returns:
+          Array of shape (H, W, F) with the interpolated attributes
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n_attributes = values.shape[1]
+
+        flat = np.empty((self.shape[0] * self.shape[1], n_attributes), dtype=np.float32)
+
+        valid = ~np.isnan(values)
+        patterns, pattern_indices = np.unique(valid, axis=1, return_inverse=True)
+
+        for pattern, samples in enumerate(patterns.T):
+            attributes = np.flatnonzero(pattern_indices.ravel() == pattern)
+            weights, outside = self._get_weights(samples)
+
+            sample_values = values[samples][:, attributes]
+
+            interpolated = weights @ sample_values
+            interpolated[outside] = sample_values.mean(axis=0)
+            flat[:, attributes] = interpolated
+
+        return flat.reshape(*self.shape, n_attributes)
+
+    def _get_weights(self, samples: np.ndarray) -> tuple[csr_matrix, np.ndarray]:
+        """
+        Auxiliary function to triangulate the valid samples once and locate every grid cell in the triangulation
+        """
+        key = samples.tobytes()
+
+        if key not in self.weights:
+            triangulation = Delaunay(self.coords[samples])
+
+            simplices = triangulation.find_simplex(self.targets)
+            inside = np.flatnonzero(simplices >= 0)
+
+            # Barycentric coordinates of every cell inside the triangulation
+            transform = triangulation.transform[simplices[inside]]
+            barycentric = np.einsum('nij,nj->ni', transform[:, :2], self.targets[inside] - transform[:, 2])
+
+            # Each cell inside weighs the 3 vertices of its triangle, and cells outside have no weights.
+            # Indices are given as int32 so scipy does not copy them
+            row_lengths = np.zeros(len(self.targets) + 1, dtype=np.int32)
+            row_lengths[inside + 1] = 3
+
+            self.weights[key] = (
+                csr_matrix(
+                    (
+                        np.column_stack((barycentric, 1 - barycentric.sum(axis=1))).ravel(),
+                        triangulation.simplices[simplices[inside]].astype(np.int32).ravel(),
+                        np.cumsum(row_lengths, dtype=np.int32)
+                    ),
+                    shape=(len(self.targets), len(triangulation.points))
+                ),
+                simplices < 0
+            )
+
+        return self.weights[key]
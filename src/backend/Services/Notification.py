@@ -5,9 +5,22 @@ fpath = os.path.abspath(os.path.join(
     os.pardir
 ))
 sys.path.append(fpath)
+from Services import Proximity
 import DataManager
+import json
 import messages
 
+# Kilometers per degree used to interpret distances given in degrees
+KM_PER_DEGREE = 111.139
+
+# Alert tiers by distance in km. Lower tiers are more urgent
+URGENT_TIER, WARNING_TIER, NOTE_TIER = 0, 1, 2
+URGENT_DISTANCE = 50
+WARNING_DISTANCE = 200
+
+# A user already alerted about a fire is alerted again when it enters a closer tier or comes this many km. closer
+REALERT_DISTANCE_MARGIN = 10
+
 
 def handle_opt_in(latitude, longitude, phone_number): 
     try:
@@ -29,19 +42,72 @@ def handle_opt_out(phone_number):
         print(e)
         return False
 
-def handle_notify_users(minimum_distance):
-    result = DataManager.execute_read_stored_procedure("get_users_near_fire", [minimum_distance])
-    for row in result[0]:
-        dist_km = round((111139 * row[1])/1000,0)
-        if(dist_km < 50):
-            messages.send_message(row[0], ("URGENT: Emberalert has detected a potential wildfire that is predicted to " 
+def get_tier(dist_km):
+    if dist_km < URGENT_DISTANCE:
+        return URGENT_TIER
+    elif dist_km < WARNING_DISTANCE:
+        return WARNING_TIER
+    return NOTE_TIER
+
+# previous: (tier, distance) of the closest alert already delivered for the fire, or None
+def should_alert(previous, tier, dist_km, margin):
+    if previous is None:
+        return True
+    previous_tier, previous_distance = previous
+    return tier < previous_tier or dist_km <= previous_distance - margin
+
+# minimum_distance: distance in degrees from a predicted fire mask within which users are notified
+# realert_margin: km. a fire must come closer to a user already alerted about it to alert them again in the same tier
+def handle_notify_users(minimum_distance, realert_margin=REALERT_DISTANCE_MARGIN):
+    users = DataManager.execute_read_stored_procedure("get_users")[0]
+
+    # one polygon per predicted mask of the latest published run
+    polygons = {}
+    for fire_id, mask_id, coords in DataManager.read_active_predicted_masks():
+        latitudes, longitudes = zip(*coords)
+        polygons[mask_id] = (fire_id, list(latitudes), list(longitudes))
+
+    # users are matched against the polygons through an index of their locations
+    index = Proximity.UserIndex(users)
+    nearest = Proximity.users_near_polygons(index, list(polygons.values()), minimum_distance * KM_PER_DEGREE)
+
+    # alerts already delivered, keyed by (phone_number, fire_id)
+    ledger = {
+        (phone_number, fire_id): (tier, distance)
+        for phone_number, fire_id, tier, distance in DataManager.execute_read_stored_procedure("get_alert_deliveries")[0]
+    }
+
+    outgoing = []
+    deliveries = []
+    for phone_number, (fire_id, distance) in nearest.items():
+        dist_km = round(distance, 0)
+        tier = get_tier(dist_km)
+
+        if not should_alert(ledger.get((phone_number, fire_id)), tier, dist_km, realert_margin):
+            continue
+
+        deliveries.append([phone_number, fire_id, tier, dist_km])
+        if(tier == URGENT_TIER):
+            outgoing.append((phone_number, ("URGENT: Emberalert has detected a potential wildfire that is predicted to " 
                                   f"be within {dist_km}km in the next 24 hours. Please check with local authorities to see if an "
-                                    "evacuation order has been issued"))
-        elif(dist_km < 200):
-            messages.send_message(row[0], ("WARNING: Emberalert has detected a potential wildfire that is predicted to " 
+                                    "evacuation order has been issued")))
+        elif(tier == WARNING_TIER):
+            outgoing.append((phone_number, ("WARNING: Emberalert has detected a potential wildfire that is predicted to " 
                                   + f"be within {dist_km}km in the next 24 hours. Please check with local authorities for more "
-                                  + "information"))
+                                  + "information")))
         else:
-            messages.send_message(row[0], ("NOTE: Emberalert has detected a potential wildfire that is predicted to be "
+            outgoing.append((phone_number, ("NOTE: Emberalert has detected a potential wildfire that is predicted to be "
                                  + f"within {dist_km}km in the next 24 hours. Please check with local authorities for more "
-                                 + "information"))
\ No newline at end of file
+                                 + "information")))
+
+    # alerts are sent concurrently within the Twilio rate limit
+    results = messages.send_messages(outgoing)
+    failed = [result['to'] for result in results if not result['success']]
+    print(f'Sent {len(results) - len(failed)} of {len(results)} alerts, skipped {len(nearest) - len(results)} already delivered.', flush=True)
+
+    # record the delivered alerts so they are not repeated by the next run
+    delivered = [delivery for delivery, result in zip(deliveries, results) if result['success']]
+    if len(delivered) > 0:
+        DataManager.execute_write_stored_procedure("add_alert_deliveries", [json.dumps(delivered)])
+
+    return results
@@ -0,0 +1,99 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from scipy.spatial import cKDTree
+import Geodesy
+import Geometry
+import numpy as np
+
+
+class UserIndex:
+    """
+    Constructor
+
+    Args:
+      users: Rows of (phone_number, latitude, longitude)
+    """
+    def __init__(self, users: list[tuple[str, float, float]]):
+        self.phone_numbers = [user[0] for user in users]
+        self.lats = np.array([float(user[1]) for user in users], dtype=np.float64)
+        self.lngs = np.array([float(user[2]) for user in users], dtype=np.float64)
+
+        # Distances on the unit sphere are straight chords, so the tree is built over 3D points
+        self.tree = cKDTree(Geodesy.unit_vectors(self.lats, self.lngs)) if len(users) > 0 else None
+
+    def query(self, lats: np.ndarray, lngs: np.ndarray, radius: float) -> list[list[int]]:
+        """
+        Find the users within a distance of each point
+
+        Args:
+          lats: Latitudes of the points in degrees
+          lngs: Longitudes of the points in degrees
+          radius: Distance in km.
+
+        Returns:
+          Indices of the users within the distance of each point
+        """
+        if self.tree is None or len(lats) == 0:
+            return [[] for _ in range(len(lats))]
+
+        # Chord length subtending the same angle as the great-circle distance
+        chord = 2 * np.sin(min(radius / Geodesy.EARTH_RADIUS, np.pi) / 2)
+
+        return self.tree.query_ball_point(Geodesy.unit_vectors(lats, lngs), chord)
+
+
+def users_near_polygons(index: UserIndex, polygons: list[tuple[int, np.ndarray, np.ndarray]], radius: float) -> dict[str, tuple[int, float]]:
+    """
+    Find the closest polygon to every user inside or within a distance of any polygon
+
+    Args:
+      index: Index over user locations
+      polygons: Rows of (fire_id, vertex latitudes, vertex longitudes) with the vertices in order
+      radius: Distance in km.
+
+    Returns:
+      Dictionary mapping phone numbers to the fire identifier of the closest polygon and the distance to its edges in km., which is 0 inside it
+    """
+    nearest = {}
+
+    for fire_id, polygon_lats, polygon_lngs in polygons:
+        polygon_lats = np.asarray(polygon_lats, dtype=np.float64)
+        polygon_lngs = np.asarray(polygon_lngs, dtype=np.float64)
+
+        # Users within the radius of the circle enclosing the polygon
+        centre_lat, centre_lng = np.mean(polygon_lats), np.mean(polygon_lngs)
+        extent = Geodesy.haversine_distance(
+            np.radians(centre_lat), np.radians(centre_lng), np.radians(polygon_lats), np.radians(polygon_lngs)
+        ).max()
+        candidates = np.asarray(index.query(np.array([centre_lat]), np.array([centre_lng]), extent + radius)[0], dtype=np.int64)
+
+        if len(candidates) == 0:
+            continue
+
+        lats, lngs = index.lats[candidates], index.lngs[candidates]
+
+        # Users within the bounding box of the polygon grown by the radius, on the sphere of the haversine distances.
+        # A point further in longitude than asin(sin(radius / R) / cos(latitude)) is further than the radius from a meridian
+        lat_margin = np.degrees(radius / Geodesy.EARTH_RADIUS)
+        reach = np.sin(radius / Geodesy.EARTH_RADIUS) / np.cos(np.radians(min(np.abs(polygon_lats).max() + lat_margin, 90.0)))
+        lng_margin = np.degrees(np.arcsin(reach)) if reach < 1 else 180.0
+        in_box = (
+            (lats >= polygon_lats.min() - lat_margin) & (lats <= polygon_lats.max() + lat_margin) &
+            (lngs >= polygon_lngs.min() - lng_margin) & (lngs <= polygon_lngs.max() + lng_margin)
+        )
+        candidates, lats, lngs = candidates[in_box], lats[in_box], lngs[in_box]
+
+        distances = Geometry.polygon_distances(lats, lngs, polygon_lats, polygon_lngs)
+
+        for user_index, distance in zip(candidates.tolist(), distances.tolist()):
+            phone_number = index.phone_numbers[user_index]
+
+            if distance <= radius and (phone_number not in nearest or distance < nearest[phone_number][1]):
+                nearest[phone_number] = (fire_id, distance)
+
+    return nearest
@@ -0,0 +1,178 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from collections import OrderedDict
+from concurrent.futures import Future
+from flask import Response
+from DataManager import execute_read_stored_procedure
+
+import gzip
+import hashlib
+import threading
+import time
+
+
+class ResponseCache:
+    """
+    Constructor
+
+    Args:
+      serialize: Function converting response data to a JSON string
+      max_bytes: Maximum size in bytes of the cached bodies before the least recently used are evicted
+      version_interval: Seconds between checks for a newly published engine run
+      compression_level: Gzip compression level of the cached bodies
+    """
+    def __init__(self, serialize: callable, max_bytes: int=64 * 1024 * 1024, version_interval: float=30.0, compression_level: int=6):
+        self.serialize = serialize
+        self.max_bytes = max_bytes
+        self.version_interval = version_interval
+        self.compression_level = compression_level
+        self.lock = threading.Lock()
+
+        # Latest published engine run, and when it was last checked
+        self.version = None
+        self.checked = 0.0
+
+        # key -> (etag, body, gzip body), in least recently used order
+        self.entries = OrderedDict()
+        self.size = 0
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+
+    def respond(self, request, key: str, build: callable) -> Response:
+        """
+        Serve the cached response for a key, building it if it is not cached for the latest published run
+
+        Concurrent requests for the same key wait on a single build.
+
+        Args:
+          request: Flask request being answered
+          key: Identifier of the response, such as the request path
+          build: Function returning the JSON serializable response data
+
+        Returns:
+          200 response with the body, gzip compressed if the client accepts it, or 304 response if the client has it already
+        """
+        version = self.get_version()
+        etag, body, compressed = self._get_or_build((version, key), build)
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        elif 'gzip' in request.accept_encodings:
+            response = Response(compressed, status=200, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(body, status=200, mimetype='application/json')
+
+        # Clients revalidate on every request, which is answered without a body until the next run is published
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['Vary'] = 'Accept-Encoding'
+
+        return response
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the cache statistics
+
+        Returns:
+          Dictionary with the number of hits, misses, cached responses and their size in bytes
+        """
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'responses': len(self.entries), 'bytes': self.size}
+
+    def get_version(self) -> int:
+        """
+        Get the latest published engine run, querying the database at most once per interval
+
+        Returns:
+          Identifier of the latest published engine run
+        """
+        with self.lock:
+            if time.monotonic() - self.checked < self.version_interval:
+                return self.version
+
+            # Other requests keep serving the current version while it is checked
+            self.checked = time.monotonic()
+
+        try:
+            version = execute_read_stored_procedure("get_published_run")[0][0][0]
+        except Exception:
+            with self.lock:
+                self.checked = 0.0
+            raise
+
+        with self.lock:
+            if version != self.version:
+                # Responses of the previous run are no longer served
+                self.version = version
+                self.entries.clear()
+                self.size = 0
+
+            return self.version
+
+    def _get_or_build(self, key: tuple[int, str], build: callable) -> tuple[str, bytes, bytes]:
+        """
+        Auxiliary function to retrieve a cached entry, building it if it is not cached
+        """
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key]
+
+            pending = self.pending.get(key)
+            owner = pending is None
+
+            if owner:
+                self.misses += 1
+                pending = Future()
+                self.pending[key] = pending
+            else:
+                self.hits += 1
+
+        if not owner:
+            return pending.result()
+
+        try:
+            body = self.serialize(build()).encode()
+            entry = (
+                f'{key[0]}-{hashlib.sha1(body).hexdigest()[:16]}',
+                body,
+                gzip.compress(body, compresslevel=self.compression_level)
+            )
+        except Exception as e:
+            with self.lock:
+                del self.pending[key]
+            pending.set_exception(e)
+            raise
+
+        with self.lock:
+            del self.pending[key]
+            self._insert(key, entry)
+        pending.set_result(entry)
+
+        return entry
+
+    def _insert(self, key: tuple[int, str], entry: tuple[str, bytes, bytes]):
+        """
+        Auxiliary function to add an entry of the current version, evicting the least recently used entries over the size limit
+        """
+        if key[0] != self.version:
+            return
+
+        size = len(entry[1]) + len(entry[2])
+        if size > self.max_bytes:
+            return
+
+        self.entries[key] = entry
+        self.size += size
+
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted[1]) + len(evicted[2])
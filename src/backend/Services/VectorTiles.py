@@ -0,0 +1,420 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from DataManager import execute_read_stored_procedure
+
+import Geometry
+import gzip
+import json
+import numpy as np
+import shutil
+import threading
+
+
+# Size of the tile grid and of the buffer drawn around it, in tile units
+EXTENT = 4096
+BUFFER = 64
+
+# Tiles up to this zoom level that contain a fire are generated as soon as a new run is published
+PREGENERATE_MAX_ZOOM = 6
+
+MIMETYPE = 'application/vnd.mapbox-vector-tile'
+
+MASKS_LAYER = 'masks'
+FIRES_LAYER = 'fires'
+
+# Geometry types and commands of the Mapbox Vector Tile specification
+POINT, POLYGON = 1, 3
+MOVE_TO, LINE_TO, CLOSE_PATH = 1, 2, 7
+
+
+def _varint(value: int) -> bytes:
+    """
+    Auxiliary function to encode an unsigned protobuf varint
+    """
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _field(number: int, wire_type: int, payload: bytes) -> bytes:
+    """
+    Auxiliary function to encode a protobuf field, with its length if it is length delimited
+    """
+    key = _varint((number << 3) | wire_type)
+    if wire_type == 2:
+        return key + _varint(len(payload)) + payload
+    return key + payload
+
+
+def _zigzag(value: int) -> int:
+    """
+    Auxiliary function to map a signed integer to an unsigned one
+    """
+    return (value << 1) ^ (value >> 31)
+
+
+def _command(command: int, count: int) -> int:
+    """
+    Auxiliary function to encode a geometry command integer
+    """
+    return (command & 0x7) | (count << 3)
+
+
+def encode_point(x: int, y: int) -> list[int]:
+    """
+    Encode a point as geometry commands
+
+    Args:
+      x: Horizontal position in tile units
+      y: Vertical position in tile units
+
+    Returns:
+      Geometry command integers
+    """
+    return [_command(MOVE_TO, 1), _zigzag(x), _zigzag(y)]
+
+
+def encode_polygon(xs: np.ndarray, ys: np.ndarray) -> list[int]:
+    """
+    Encode a polygon ring as geometry commands, with the winding order of an exterior ring
+
+    Args:
+      xs: Horizontal positions of the ordered vertices in tile units
+      ys: Vertical positions of the ordered vertices in tile units
+
+    Returns:
+      Geometry command integers, or an empty list if the ring has no area
+    """
+    xs, ys = np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64)
+
+    # Quantization can leave repeated vertices
+    distinct = np.ones(len(xs), dtype=bool)
+    distinct[1:] = (np.diff(xs) != 0) | (np.diff(ys) != 0)
+    xs, ys = xs[distinct], ys[distinct]
+    if len(xs) > 1 and xs[0] == xs[-1] and ys[0] == ys[-1]:
+        xs, ys = xs[:-1], ys[:-1]
+
+    area = np.sum(xs * np.roll(ys, -1) - np.roll(xs, -1) * ys)
+    if len(xs) < 3 or area == 0:
+        return []
+
+    # Exterior rings have a positive area with the y axis pointing down
+    if area < 0:
+        xs, ys = xs[::-1], ys[::-1]
+
+    dxs = np.diff(xs, prepend=0).tolist()
+    dys = np.diff(ys, prepend=0).tolist()
+
+    commands = [_command(MOVE_TO, 1), _zigzag(dxs[0]), _zigzag(dys[0]), _command(LINE_TO, len(xs) - 1)]
+    for dx, dy in zip(dxs[1:], dys[1:]):
+        commands.extend((_zigzag(dx), _zigzag(dy)))
+    commands.append(_command(CLOSE_PATH, 1))
+
+    return commands
+
+
+def encode_layer(name: str, features: list[tuple[int, int, list[int], dict[str, any]]]) -> bytes:
+    """
+    Encode a vector tile layer
+
+    Args:
+      name: Layer name
+      features: Rows of (id, geometry type, geometry command integers, properties)
+
+    Returns:
+      Encoded layer message
+    """
+    keys, values = {}, {}
+    encoded_features = []
+
+    for feature_id, geometry_type, geometry, properties in features:
+        tags = []
+        for key, value in properties.items():
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault(value, len(values)))
+
+        encoded_features.append(_field(2, 2, (
+            _field(1, 0, _varint(feature_id)) +
+            _field(2, 2, b''.join(_varint(tag) for tag in tags)) +
+            _field(3, 0, _varint(geometry_type)) +
+            _field(4, 2, b''.join(_varint(command) for command in geometry))
+        )))
+
+    encoded_values = []
+    for value in values:
+        if isinstance(value, str):
+            encoded_values.append(_field(4, 2, _field(1, 2, value.encode())))
+        else:
+            encoded_values.append(_field(4, 2, _field(5, 0, _varint(int(value)))))
+
+    return (
+        _field(15, 0, _varint(2)) +
+        _field(1, 2, name.encode()) +
+        b''.join(encoded_features) +
+        b''.join(_field(3, 2, key.encode()) for key in keys) +
+        b''.join(encoded_values) +
+        _field(5, 0, _varint(EXTENT))
+    )
+
+
+def encode_tile(layers: list[tuple[str, list[tuple[int, int, list[int], dict[str, any]]]]]) -> bytes:
+    """
+    Encode a vector tile, leaving out empty layers
+
+    Args:
+      layers: Rows of (name, features) with the features as accepted by encode_layer
+
+    Returns:
+      Encoded tile message
+    """
+    return b''.join(_field(3, 2, encode_layer(name, features)) for name, features in layers if len(features) > 0)
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """
+    Get the coordinates covered by a web map tile
+
+    Args:
+      z: Zoom level
+      x: Column of the tile
+      y: Row of the tile
+
+    Returns:
+      Minimum latitude, minimum longitude, maximum latitude and maximum longitude in degrees
+    """
+    n = 2 ** z
+    lat_max = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * y / n))))
+    lat_min = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (y + 1) / n))))
+
+    return float(lat_min), x / n * 360 - 180, float(lat_max), (x + 1) / n * 360 - 180
+
+
+def to_tile_units(lats: np.ndarray, lngs: np.ndarray, z: int, x: int, y: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Project coordinates with web mercator onto the grid of a tile
+
+    Args:
+      lats: Latitudes in degrees
+      lngs: Longitudes in degrees
+      z: Zoom level
+      x: Column of the tile
+      y: Row of the tile
+
+    Returns:
+      Horizontal and vertical positions in tile units, unrounded
+    """
+    n = 2 ** z
+    lats = np.radians(np.clip(np.asarray(lats, dtype=np.float64), -85.0511, 85.0511))
+
+    xs = ((np.asarray(lngs, dtype=np.float64) + 180) / 360 * n - x) * EXTENT
+    ys = ((1 - np.log(np.tan(lats) + 1 / np.cos(lats)) / np.pi) / 2 * n - y) * EXTENT
+
+    return xs, ys
+
+
+def clip_polygon(xs: np.ndarray, ys: np.ndarray, low: float, high: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Clip a polygon to a square with the Sutherland-Hodgman algorithm
+
+    Args:
+      xs: Horizontal positions of the ordered vertices
+      ys: Vertical positions of the ordered vertices
+      low: Lower bound of the square along both axes
+      high: Upper bound of the square along both axes
+
+    Returns:
+      Horizontal and vertical positions of the vertices of the clipped polygon
+    """
+    points = list(zip(np.asarray(xs, dtype=np.float64).tolist(), np.asarray(ys, dtype=np.float64).tolist()))
+
+    # Each edge of the square as the axis it bounds, the bound and whether points must be above it
+    for axis, bound, above in ((0, low, True), (0, high, False), (1, low, True), (1, high, False)):
+        if len(points) == 0:
+            break
+
+        inside = lambda point: point[axis] >= bound if above else point[axis] <= bound
+
+        clipped = []
+        for current, previous in zip(points, points[-1:] + points[:-1]):
+            if inside(current) != inside(previous):
+                t = (bound - previous[axis]) / (current[axis] - previous[axis])
+                crossing = [previous[0] + t * (current[0] - previous[0]), previous[1] + t * (current[1] - previous[1])]
+                crossing[axis] = bound
+                clipped.append(tuple(crossing))
+            if inside(current):
+                clipped.append(current)
+
+        points = clipped
+
+    if len(points) == 0:
+        return np.empty(0), np.empty(0)
+
+    return tuple(np.array(points, dtype=np.float64).T)
+
+
+class VectorTileStore:
+    """
+    Constructor
+
+    Args:
+      directory: Directory the tiles of each run are stored in
+      get_version: Function returning the latest published engine run
+    """
+    def __init__(self, directory: str, get_version: callable):
+        self.directory = directory
+        self.get_version = get_version
+        self.lock = threading.Lock()
+
+        # Fires and masks of the current run, loaded once per simplification zoom level
+        self.version = None
+        self.runs = {}
+
+    def get_tile(self, z: int, x: int, y: int) -> tuple[int, bytes]:
+        """
+        Retrieve a tile of the latest published run, generating it if it is not stored
+
+        Args:
+          z: Zoom level
+          x: Column of the tile
+          y: Row of the tile
+
+        Returns:
+          Identifier of the run the tile belongs to, and the gzip compressed tile
+        """
+        if z < 0 or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            raise ValueError('Tile out of range')
+
+        version = self._check_version()
+        path = os.path.join(self.directory, str(version), str(z), str(x), f'{y}.mvt')
+
+        try:
+            with open(path, 'rb') as file:
+                return version, file.read()
+        except FileNotFoundError:
+            pass
+
+        tile = gzip.compress(self._build_tile(version, z, x, y))
+
+        # Write to a temporary file first so a concurrent read never sees a partial tile
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f'{path}.{threading.get_ident()}.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(tile)
+        os.replace(temporary, path)
+
+        return version, tile
+
+    def _check_version(self) -> int:
+        """
+        Auxiliary function to get the latest published run, removing the tiles of earlier runs when a new run is published
+        """
+        version = self.get_version()
+
+        with self.lock:
+            if version == self.version:
+                return version
+
+            self.version = version
+            self.runs = {}
+
+        # Tiles of earlier runs are invalid
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name != str(version):
+                    shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+        threading.Thread(target=self._pregenerate, args=(version,), daemon=True).start()
+
+        return version
+
+    def _pregenerate(self, version: int):
+        """
+        Auxiliary function to generate the tiles of the low zoom levels that contain a fire
+        """
+        try:
+            fires = self._load_run(version, Geometry.simplification_zoom(0))[0]
+
+            for z in range(PREGENERATE_MAX_ZOOM + 1):
+                tiles = set()
+                for _, _, _, (lat_min, lng_min, lat_max, lng_max) in fires:
+                    xs, ys = to_tile_units([lat_max, lat_min], [lng_min, lng_max], z, 0, 0)
+                    for x in range(int(xs[0] // EXTENT), min(int(xs[1] // EXTENT), 2 ** z - 1) + 1):
+                        for y in range(int(ys[0] // EXTENT), min(int(ys[1] // EXTENT), 2 ** z - 1) + 1):
+                            tiles.add((x, y))
+
+                for x, y in tiles:
+                    if self.version != version:
+                        return
+                    self.get_tile(z, x, y)
+        except Exception as e:
+            print(f'There was an issue generating the tiles of run {version}. {e}', flush=True)
+
+    def _load_run(self, version: int, geometry_zoom: int) -> tuple[list, list]:
+        """
+        Auxiliary function to load every active fire and its masks simplified for a zoom level, once per run
+        """
+        with self.lock:
+            if version == self.version and geometry_zoom in self.runs:
+                return self.runs[geometry_zoom]
+
+        results = execute_read_stored_procedure("get_fires_in_bounds", [-90, -180, 90, 180, True, geometry_zoom])
+
+        fires = [
+            (fire_id, float(lat), float(lng), (float(min_lat), float(min_lng), float(max_lat), float(max_lng)))
+            for fire_id, lat, lng, min_lat, min_lng, max_lat, max_lng in results[0]
+        ]
+        masks = [
+            (fire_id, mask_id, fire_status, np.array(json.loads(coordinates), dtype=np.float64).reshape(-1, 2))
+            for fire_id, mask_id, fire_status, polyline, coordinates in (results[1] if len(results) > 1 else [])
+        ]
+
+        with self.lock:
+            if version == self.version:
+                self.runs[geometry_zoom] = (fires, masks)
+
+        return fires, masks
+
+    def _build_tile(self, version: int, z: int, x: int, y: int) -> bytes:
+        """
+        Auxiliary function to encode the fire centroids and the clipped, simplified and quantized masks of a tile
+        """
+        fires, masks = self._load_run(version, Geometry.simplification_zoom(z))
+        lat_min, lng_min, lat_max, lng_max = tile_bounds(z, x, y)
+
+        # Fires whose region overlaps the tile
+        overlapping = {
+            fire_id for fire_id, _, _, bounds in fires
+            if bounds[0] <= lat_max and bounds[2] >= lat_min and bounds[1] <= lng_max and bounds[3] >= lng_min
+        }
+
+        fire_features = []
+        for fire_id, lat, lng, _ in fires:
+            if fire_id not in overlapping:
+                continue
+
+            px, py = to_tile_units([lat], [lng], z, x, y)
+            px, py = int(np.floor(px[0])), int(np.floor(py[0]))
+            if 0 <= px < EXTENT and 0 <= py < EXTENT:
+                fire_features.append((fire_id, POINT, encode_point(px, py), {'fire_id': fire_id}))
+
+        mask_features = []
+        for fire_id, mask_id, fire_status, coords in masks:
+            if fire_id not in overlapping:
+                continue
+
+            xs, ys = to_tile_units(coords[:, 0], coords[:, 1], z, x, y)
+            xs, ys = clip_polygon(xs, ys, -BUFFER, EXTENT + BUFFER)
+            geometry = encode_polygon(np.round(xs), np.round(ys))
+
+            if len(geometry) > 0:
+                mask_features.append((mask_id, POLYGON, geometry, {'fire_id': fire_id, 'fire_status': fire_status}))
+
+        return encode_tile([(MASKS_LAYER, mask_features), (FIRES_LAYER, fire_features)])
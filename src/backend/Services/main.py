@@ -5,137 +5,159 @@ fpath = os.path.abspath(os.path.join(
     os.pardir
 ))
 sys.path.append(fpath)
-from flask import Flask, redirect, url_for, jsonify, request
-from Services import Notification 
+from flask import Flask, Response, redirect, url_for, jsonify, request
+from Services import Notification
+from Services import VectorTiles
+from Services.ResponseCache import ResponseCache
 from flask_cors import CORS, cross_origin
-from DataManager import open_connection, execute_read_stored_procedure
+from DataManager import open_connection, execute_read_stored_procedure, read_fire_masks, from_polygon_text
+import Geometry
+import gzip
+import json
+import math
 
 app = Flask(__name__)
 CORS(app)
 
+# map data only changes when the engine publishes a run, so responses are cached per run
+response_cache = ResponseCache(app.json.dumps)
+
+# vector tiles are stored on disk per run and share the run check of the response cache
+tile_store = VectorTiles.VectorTileStore('cache/tiles', response_cache.get_version)
+
 users = []
 
+# compact geometry encodings selected with the format query parameter. masks are returned point by point without one
+GEOMETRY_FORMATS = ['polyline', 'flat']
+
+# zoom level of the simplified masks served for a request, or None for the full masks point by point
+def get_geometry_zoom(args):
+    geometry_format = args.get('format')
+    if geometry_format is None:
+        return None
+    if geometry_format not in GEOMETRY_FORMATS:
+        raise ValueError(f'Unknown format {geometry_format}')
+
+    return Geometry.simplification_zoom(int(args.get('zoom', Geometry.SIMPLIFICATION_ZOOMS[-1])))
+
+# a simplified mask in the requested encoding
+def format_geometry(geometry_format, mask_id, fire_status, polyline, coordinates):
+    mask = {'mask_id': mask_id, 'fire_status': fire_status}
+    if geometry_format == 'polyline':
+        mask['polyline'] = polyline
+    else:
+        mask['coordinates'] = json.loads(coordinates)
+    return mask
+
 @app.route("/map/get-fires")
 def get_fires():
     try:
-        fires = execute_read_stored_procedure("find_fires", [])
-
-        # Format the result as a list of dictionaries
-        fire_data = []
-        for sublist in fires:
-            for fire in sublist:
-                fire_dict = {'id': fire[0], 'lat': fire[1], 'lng': fire[2]}
-                fire_data.append(fire_dict)
-
         # Return the fire data as JSON
-        return jsonify(fire_data), 200
+        return response_cache.respond(request, request.path, build_fires)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def build_fires():
+    fires = execute_read_stored_procedure("find_fires", [])
+
+    # Format the result as a list of dictionaries
+    fire_data = []
+    for sublist in fires:
+        for fire in sublist:
+            fire_dict = {'id': fire[0], 'lat': fire[1], 'lng': fire[2]}
+            fire_data.append(fire_dict)
+
+    return fire_data
+
+
 @app.route("/map/get-fire-mask/<fire_id>")
 def get_fire_mask(fire_id):
 
-    print("Received request for fire mask with fire_id:", fire_id)
-    
     try:
         # Convert fire_id to integer
         fire_id = int(fire_id)
 
-        mask_details = execute_read_stored_procedure("get_fire_mask_data", [fire_id])
-        
-        # Initialize a dictionary to store data based on fire_mask number
-        response_data = {}
-
-        # Grouping data based on fire_mask number
-        for sublist in mask_details:
-            for mask_id, point_id, latitude, longitude, fire_status in sublist:
-                # Check if mask_id exists in response_data, if not, add it
-                if mask_id not in response_data:
-                    response_data[mask_id] = {'mask_id': mask_id, 'points': []}
-                
-                # Append the point data to the corresponding mask_id
-                response_data[mask_id]['points'].append({
-                    'point_id': point_id,
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'fire_status': fire_status
-                })
-
-        # Convert the dictionary values to a list
-        response_data_list = list(response_data.values())
+        geometry_format = request.args.get('format')
+        geometry_zoom = get_geometry_zoom(request.args)
 
         # Return the JSON response
-        return jsonify(response_data_list), 200
+        if geometry_zoom is not None:
+            key = f'{request.path}/{geometry_format}/{geometry_zoom}'
+            return response_cache.respond(request, key, lambda: build_fire_mask_geometry(fire_id, geometry_format, geometry_zoom))
+
+        return response_cache.respond(request, request.path, lambda: build_fire_mask(fire_id))
     except ValueError:
-        return jsonify({'error': 'Invalid fire ID'}), 400
+        return jsonify({'error': 'Invalid fire ID, format or zoom'}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def build_fire_mask(fire_id):
+    print("Building fire mask for fire_id:", fire_id)
+
+    # Each mask is read as one polygon, and its points are listed in order
+    response_data = []
+    for mask_id, fire_status, coords in read_fire_masks(fire_id):
+        response_data.append({
+            'mask_id': mask_id,
+            'points': [
+                {'point_id': point_id, 'latitude': latitude, 'longitude': longitude, 'fire_status': fire_status}
+                for point_id, (latitude, longitude) in enumerate(coords)
+            ]
+        })
+
+    return response_data
+
+
+def build_fire_mask_geometry(fire_id, geometry_format, geometry_zoom):
+    masks = execute_read_stored_procedure("get_fire_mask_geometry", [fire_id, geometry_zoom])
+
+    return [format_geometry(geometry_format, *mask) for sublist in masks for mask in sublist]
+
+
 @app.route("/map/get-region-data/<fire_id>")
 def get_region_data(fire_id):
     try:
-        print("fnsknflsdn this is the fire_id: ",fire_id )
-        table_details = execute_read_stored_procedure("get_table_data", [fire_id])
-
-        # Format the result as a list of dictionaries
-        region_data = []
-        for sublist in table_details:
-            for data in sublist:
-                region_dict = {
-                    'wind_direction': data[4],
-                    'wind_speed': data[5],
-                    'min_temp': data[6],
-                    'max_temp': data[7],
-                    'humidity': data[8],
-                    'precipitation': data[9],
-                    'generation_date': data[10]
-                }
-                region_data.append(region_dict)
-
-        # Log the region data
-        print("Region data:", region_data)
-
         # Return the region data as JSON
-        return jsonify(region_data), 200
+        return response_cache.respond(request, request.path, lambda: build_region_data(fire_id))
     except Exception as e:
         # Log the error
         print("Error fetching region data:", e)
         return jsonify({'error': str(e)}), 500
 
+def build_region_data(fire_id):
+    table_details = execute_read_stored_procedure("get_table_data", [fire_id])
+
+    # Format the result as a list of dictionaries
+    region_data = []
+    for sublist in table_details:
+        for data in sublist:
+            region_dict = {
+                'wind_direction': data[4],
+                'wind_speed': data[5],
+                'min_temp': data[6],
+                'max_temp': data[7],
+                'humidity': data[8],
+                'precipitation': data[9],
+                'generation_date': data[10]
+            }
+            region_data.append(region_dict)
+
+    # Log the region data
+    print("Region data:", region_data)
+
+    return region_data
+
+
 @app.route("/map/get-min-max/<fire_id>")
 def get_fire_bounds(fire_id):
     try:
         # Convert fire_id to integer
         fire_id = int(fire_id)
 
-        # Call the stored procedure to get the min and max coordinates
-        fire_data = execute_read_stored_procedure("get_max_and_min", [fire_id])
-        
-        # Initialize a list to store the response data
-        response_data_list = []
-        print(fire_data)
-        # Extract the min and max coordinates from the response
-        if fire_data:
-            for sublist in fire_data:
-                for point in sublist:
-                    min_lat = point[0]
-                    min_lng = point[1]
-                    max_lat = point[2]
-                    max_lng = point[3]
-
-                    # Construct dictionaries for min and max coordinates
-                    min_coord = {'lat': min_lat, 'lng': min_lng}
-                    max_coord = {'lat': max_lat, 'lng': max_lng}
-
-                    # Append dictionaries to the response list
-                    response_data_list.append(min_coord)
-                    response_data_list.append(max_coord)
-
         # Return the JSON response
-        print(response_data_list)
-        return jsonify(response_data_list), 200
+        return response_cache.respond(request, request.path, lambda: build_fire_bounds(fire_id))
 
     except ValueError:
         return jsonify({'error': 'Invalid fire ID'}), 400
@@ -143,6 +165,120 @@ def get_fire_bounds(fire_id):
         return jsonify({'error': str(e)}), 500
 
 
+def build_fire_bounds(fire_id):
+    # Call the stored procedure to get the min and max coordinates
+    fire_data = execute_read_stored_procedure("get_max_and_min", [fire_id])
+    
+    # Initialize a list to store the response data
+    response_data_list = []
+
+    # Extract the min and max coordinates from the response
+    if fire_data:
+        for sublist in fire_data:
+            for point in sublist:
+                min_lat = point[0]
+                min_lng = point[1]
+                max_lat = point[2]
+                max_lng = point[3]
+
+                # Construct dictionaries for min and max coordinates
+                min_coord = {'lat': min_lat, 'lng': min_lng}
+                max_coord = {'lat': max_lat, 'lng': max_lng}
+
+                # Append dictionaries to the response list
+                response_data_list.append(min_coord)
+                response_data_list.append(max_coord)
+
+    print(response_data_list)
+    return response_data_list
+
+
+# masks are too small to be seen below this zoom level, so only the fires are returned
+MASK_MIN_ZOOM = 5
+
+@app.route("/map/get-viewport")
+def get_viewport():
+    try:
+        # bbox: min_lng,min_lat,max_lng,max_lat
+        min_lng, min_lat, max_lng, max_lat = [float(value) for value in request.args['bbox'].split(',')]
+        zoom = int(request.args.get('zoom', MASK_MIN_ZOOM))
+
+        # snap the viewport outwards to a grid that scales with the zoom level, so nearby viewports share a cached response
+        step = 360 / 2 ** max(zoom, 0) / 4
+        bounds = (
+            math.floor(min_lat / step) * step, 
+            math.floor(min_lng / step) * step, 
+            math.ceil(max_lat / step) * step, 
+            math.ceil(max_lng / step) * step
+        )
+        include_masks = zoom >= MASK_MIN_ZOOM
+        geometry_format = request.args.get('format')
+        geometry_zoom = get_geometry_zoom(request.args)
+
+        key = f'/map/get-viewport/{bounds}/{include_masks}/{geometry_format}/{geometry_zoom}'
+        return response_cache.respond(request, key, lambda: build_viewport(bounds, include_masks, geometry_format, geometry_zoom))
+    except (KeyError, ValueError):
+        return jsonify({'error': 'Invalid viewport'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+def build_viewport(bounds, include_masks, geometry_format=None, geometry_zoom=None):
+    results = execute_read_stored_procedure("get_fires_in_bounds", [*bounds, include_masks, geometry_zoom])
+
+    # Fires in the viewport, keyed by id to attach their masks
+    fires = {}
+    for fire_id, lat, lng, min_lat, min_lng, max_lat, max_lng in results[0]:
+        fires[fire_id] = {
+            'id': fire_id, 
+            'lat': lat, 
+            'lng': lng, 
+            'bounds': [{'lat': min_lat, 'lng': min_lng}, {'lat': max_lat, 'lng': max_lng}], 
+            'masks': []
+        }
+
+    if include_masks and geometry_zoom is not None:
+        for fire_id, *mask in results[1]:
+            fires[fire_id]['masks'].append(format_geometry(geometry_format, *mask))
+    elif include_masks:
+        for fire_id, mask_id, fire_status, polygon in results[1]:
+            fires[fire_id]['masks'].append({
+                'mask_id': mask_id,
+                'fire_status': fire_status,
+                'points': [
+                    {'point_id': point_id, 'latitude': latitude, 'longitude': longitude}
+                    for point_id, (latitude, longitude) in enumerate(from_polygon_text(polygon))
+                ]
+            })
+
+    return list(fires.values())
+
+
+@app.route("/tiles/<int:z>/<int:x>/<int:y>.mvt")
+def get_tile(z, x, y):
+    try:
+        version, tile = tile_store.get_tile(z, x, y)
+        etag = f'{version}-{z}-{x}-{y}'
+
+        # tiles are stored gzip compressed, so they are only decompressed for clients that do not accept it
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        elif 'gzip' in request.accept_encodings:
+            response = Response(tile, status=200, mimetype=VectorTiles.MIMETYPE)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(gzip.decompress(tile), status=200, mimetype=VectorTiles.MIMETYPE)
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+    except ValueError:
+        return jsonify({'error': 'Invalid tile'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route("/notification/process-opt-in", methods=['POST'])
 def process_opt_in():
     success = False
@@ -0,0 +1,108 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.metrics import adjusted_rand_score
+
+import Clustering
+import Geodesy
+import hdbscan
+import multiprocessing
+import numpy as np
+import time
+
+
+MIN_CLUSTER_SIZE = 3
+
+# Fire complexes of a peak-season day, with the detections of every fire in them
+N_COMPLEXES = 4
+COMPLEX_SIZE = (2000, 5000)
+N_FIRES = 120
+FIRE_SIZE = (20, 250)
+N_SMALL_FIRES = 1200
+SMALL_FIRE_SIZE = (2, 12)
+N_SCATTERED = 2000
+
+# Runs of the grouped clustering, of which the fastest is reported
+REPEATS = 3
+
+WORKERS = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+
+
+def scene(rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Detections of a peak-season day in the FIRMS area: fire complexes of thousands of detections and fires of tens to
+    hundreds of detections in the west, small fires across the area and scattered single detections
+    """
+    lats, lngs = [], []
+
+    def fire(centre_lats, centre_lngs, sizes, spread):
+        for centre_lat, centre_lng, size in zip(centre_lats, centre_lngs, sizes):
+            fire_lats, fire_lngs = Geodesy.offset_coordinates((centre_lat, centre_lng), rng.normal(0, spread, size), rng.normal(0, spread, size))
+            lats.append(fire_lats)
+            lngs.append(fire_lngs)
+
+    # Complexes burn as several fronts around the same area
+    for _ in range(N_COMPLEXES):
+        centre = (rng.uniform(36, 46), rng.uniform(-123, -114))
+        fronts = rng.integers(3, 8)
+        front_lats, front_lngs = Geodesy.offset_coordinates(centre, rng.normal(0, 15, fronts), rng.normal(0, 15, fronts))
+        fire(front_lats, front_lngs, rng.multinomial(rng.integers(*COMPLEX_SIZE), np.full(fronts, 1 / fronts)), 5)
+
+    fire(rng.uniform(32, 49, N_FIRES), rng.uniform(-124, -104, N_FIRES), rng.integers(*FIRE_SIZE, N_FIRES), 2)
+    fire(rng.uniform(25, 50, N_SMALL_FIRES), rng.uniform(-125, -65, N_SMALL_FIRES), rng.integers(*SMALL_FIRE_SIZE, N_SMALL_FIRES), 0.5)
+
+    lats.append(rng.uniform(25, 50, N_SCATTERED))
+    lngs.append(rng.uniform(-125, -65, N_SCATTERED))
+
+    return np.concatenate(lats), np.concatenate(lngs)
+
+
+def single_hdbscan(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """
+    Clustering of the baseline DataRetriever, a single haversine HDBSCAN over every detection
+    """
+    return hdbscan.HDBSCAN(metric='haversine', min_cluster_size=MIN_CLUSTER_SIZE).fit(np.radians(np.column_stack((lats, lngs)))).labels_
+
+
+def timed(function, *args, repeats: int=1, **kwargs):
+    """
+    Run a function a number of times, returning its result and the seconds the fastest run took
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+if __name__ == '__main__':
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else WORKERS
+
+    lats, lngs = scene(np.random.default_rng(0))
+    groups, grouping_time = timed(Clustering.group_detections, lats, lngs, repeats=REPEATS)
+    sizes = np.bincount(groups)
+
+    print(f'{len(lats)} detections, {len(sizes)} groups, largest {sizes.max()} detections, {workers} workers')
+
+    baseline, baseline_time = timed(single_hdbscan, lats, lngs)
+    grouped, grouped_time = timed(Clustering.cluster_detections, lats, lngs, MIN_CLUSTER_SIZE, repeats=REPEATS)
+
+    # Workers are started and import the clustering before timing, as the cluster workers are kept between runs
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        list(pool.map(Clustering.cluster_detections, [lats[:MIN_CLUSTER_SIZE]] * workers, [lngs[:MIN_CLUSTER_SIZE]] * workers, [MIN_CLUSTER_SIZE] * workers))
+        pooled, pooled_time = timed(Clustering.cluster_detections, lats, lngs, MIN_CLUSTER_SIZE, repeats=REPEATS, executor=pool)
+
+    assert np.array_equal(grouped, pooled)
+
+    clustered = (baseline >= 0) & (grouped >= 0)
+    print(f'  single haversine HDBSCAN {baseline_time:>8.2f} s  {len(np.unique(baseline[baseline >= 0]))} clusters')
+    print(f'  grouped, this process    {grouped_time:>8.2f} s  {len(np.unique(grouped[grouped >= 0]))} clusters')
+    print(f'  grouped, worker pool     {pooled_time:>8.2f} s  tasks of {Clustering.PARALLEL_CHUNK_SIZE} detections')
+    print(f'  grouping alone           {grouping_time:>8.2f} s  in this process in both')
+    print(f'  adjusted Rand index against the baseline, detections clustered by both: {adjusted_rand_score(baseline[clustered], grouped[clustered]):.4f}')
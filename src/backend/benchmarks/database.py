@@ -0,0 +1,59 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from concurrent.futures import ThreadPoolExecutor
+
+import DataManager
+import mysql.connector
+import time
+
+
+# Reads of a notification run, made by a few threads at once, against the database of the compose file
+N_CALLS = 500
+THREADS = 4
+PROCEDURE = 'get_published_run'
+
+
+def connected_read(procedure: str) -> list:
+    """
+    Read of the baseline DataManager, opening a connection for every call
+    """
+    db_connection = mysql.connector.connect(**DataManager.CONNECTION_CONFIG)
+
+    output = []
+    try:
+        with db_connection.cursor() as cursor:
+            cursor.callproc(procedure, [])
+
+            for result in cursor.stored_results():
+                output.append(result.fetchall())
+    finally:
+        db_connection.close()
+
+    return output
+
+
+def timed(read) -> float:
+    """
+    Seconds taken by N_CALLS reads spread over THREADS threads
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(read, [PROCEDURE] * N_CALLS))
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    # The pool is opened before timing, as it is kept for the life of the process
+    DataManager.execute_read_stored_procedure(PROCEDURE)
+
+    pooled_time = timed(DataManager.execute_read_stored_procedure)
+    connected_time = timed(connected_read)
+
+    print(f'{N_CALLS} calls of {PROCEDURE} on {THREADS} threads, pool of {DataManager.POOL_SIZE} connections')
+    print(f'  connection per call  {connected_time * 1000 / N_CALLS:>7.2f} ms per call')
+    print(f'  pooled connections   {pooled_time * 1000 / N_CALLS:>7.2f} ms per call  {connected_time / pooled_time:.1f}x')
@@ -0,0 +1,142 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from math import atan2, cos, radians, sin, sqrt
+
+import Geodesy
+import numpy as np
+import timeit
+
+
+BLOCK_SIZE = 32
+
+REPEATS = 5
+
+
+def haversine(coord1: tuple[float, float], coord2: tuple[float, float]) -> dict[str, float]:
+    """
+    Scalar haversine of the baseline DataRetriever
+    """
+    lat1, lng1, lat2, lng2 = map(radians, [coord1[0], coord1[1], coord2[0], coord2[1]])
+
+    return {
+        "lat": _haversine(lat1, (lng1 + lng2) / 2.0, lat2, (lng1 + lng2) / 2.0),
+        "lng": _haversine((lat1 + lat2) / 2.0, lng1, (lat1 + lat2) / 2.0, lng2),
+        "dst": _haversine(lat1, lng1, lat2, lng2)
+    }
+
+
+def _haversine(lat1: float=0.0, lng1: float=0.0, lat2: float=0.0, lng2: float=0.0) -> float:
+    """
+    Auxiliary function of the baseline to compute the haversine distance
+    """
+    lat = lat2 - lat1
+    lng = lng2 - lng1
+
+    a = sin(lat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(lng / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1-a))
+    return c * 6371
+
+
+def adjusted_coordinate(coordinate: tuple[float, float], lat_adj: float, lng_adj: float) -> tuple[float, float]:
+    """
+    Scalar coordinate adjustment of the baseline DataRetriever
+    """
+    return (
+        coordinate[0] + lat_adj / Geodesy.ARC_DEGREE_DISTANCE,
+        coordinate[1] + lng_adj / (cos(radians(coordinate[0])) * Geodesy.ARC_DEGREE_DISTANCE)
+    )
+
+
+# Call sites of the baseline and their replacements, each given the same inputs
+
+def pad_region_scalar(coord_min, coord_max):
+    d_lat = haversine(coord_min, coord_max)['lat']
+    d_lng = haversine(coord_min, coord_max)['lng']
+
+    lat_pad = (float(BLOCK_SIZE) - (d_lat % BLOCK_SIZE)) / 2.0
+    lng_pad = (float(BLOCK_SIZE) - (d_lng % BLOCK_SIZE)) / 2.0
+
+    return adjusted_coordinate(coord_min, -lat_pad, -lng_pad), adjusted_coordinate(coord_max, lat_pad, lng_pad)
+
+
+def pad_region_array(coord_min, coord_max):
+    d_lat, d_lng, _ = Geodesy.haversine_components(coord_min[0], coord_min[1], coord_max[0], coord_max[1])
+
+    lat_pad = (float(BLOCK_SIZE) - (d_lat % BLOCK_SIZE)) / 2.0
+    lng_pad = (float(BLOCK_SIZE) - (d_lng % BLOCK_SIZE)) / 2.0
+
+    lats, lngs = Geodesy.offset_coordinates(([coord_min[0], coord_max[0]], [coord_min[1], coord_max[1]]), [-lat_pad, lat_pad], [-lng_pad, lng_pad])
+
+    return (lats[0].item(), lngs[0].item()), (lats[1].item(), lngs[1].item())
+
+
+def mask_offsets_scalar(origin, lats, lngs):
+    offsets = [haversine(origin, point) for point in zip(lats, lngs)]
+    return [offset['lat'] for offset in offsets], [offset['lng'] for offset in offsets]
+
+
+def mask_offsets_array(origin, lats, lngs):
+    d_lat, d_lng, _ = Geodesy.haversine_components(origin[0], origin[1], lats, lngs)
+    return d_lat, d_lng
+
+
+def mask_coords_scalar(origin, indices):
+    return [adjusted_coordinate(origin, -lat_adj, lng_adj) for lat_adj, lng_adj in indices]
+
+
+def mask_coords_array(origin, indices):
+    lats, lngs = Geodesy.offset_coordinates(origin, -indices[:, 0], indices[:, 1])
+    return list(zip(lats.tolist(), lngs.tolist()))
+
+
+def grid_scalar(origin, d_lat, d_lng):
+    return {
+        (j, i): adjusted_coordinate(origin, -i, j)
+        for i in range(0, BLOCK_SIZE * (round(d_lat / BLOCK_SIZE) + 1), BLOCK_SIZE)
+        for j in range(0, BLOCK_SIZE * (round(d_lng / BLOCK_SIZE) + 1), BLOCK_SIZE)
+    }
+
+
+def grid_array(origin, d_lat, d_lng):
+    i_offsets, j_offsets = np.meshgrid(BLOCK_SIZE * np.arange(round(d_lat / BLOCK_SIZE) + 1), BLOCK_SIZE * np.arange(round(d_lng / BLOCK_SIZE) + 1), indexing='ij')
+    lats, lngs = Geodesy.offset_coordinates(origin, -i_offsets, j_offsets)
+
+    return {
+        (j, i): (lat, lng)
+        for i, j, lat, lng in zip(i_offsets.ravel().tolist(), j_offsets.ravel().tolist(), lats.ravel().tolist(), lngs.ravel().tolist())
+    }
+
+
+def best(function, *args, number: int=1) -> float:
+    """
+    Fastest time in ms. of a call, over REPEATS runs of number calls
+    """
+    return min(timeit.repeat(lambda: function(*args), number=number, repeat=REPEATS)) / number * 1000
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    origin = (44.2, -114.7)
+
+    lats, lngs = Geodesy.offset_coordinates(origin, -rng.uniform(0, 96, 2000), rng.uniform(0, 128, 2000))
+    indices = rng.integers(0, 128, (200, 2))
+
+    cases = [
+        ('pad_region', pad_region_scalar, pad_region_array, ((44.0, -115.0), (44.6, -114.2)), 1000),
+        ('get_current_mask, 2000 detections', mask_offsets_scalar, mask_offsets_array, (origin, lats, lngs), 10),
+        ('get_mask_coords, 200 vertices', mask_coords_scalar, mask_coords_array, (origin, indices), 100),
+        ('grid points, 320x480 km.', grid_scalar, grid_array, (origin, 320, 480), 100),
+        ('grid points, 1600x1600 km.', grid_scalar, grid_array, (origin, 1600, 1600), 10)
+    ]
+
+    print(f'{"call site":<36} {"scalar ms":>10} {"array ms":>9} {"speedup":>8}')
+    for name, scalar, array, args, number in cases:
+        scalar_time = best(scalar, *args, number=number)
+        array_time = best(array, *args, number=number)
+
+        print(f'{name:<36} {scalar_time:>10.4f} {array_time:>9.4f} {scalar_time / array_time:>7.1f}x')
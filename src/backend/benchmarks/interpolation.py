@@ -0,0 +1,74 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from scipy.interpolate import griddata
+
+import Interpolation
+import numpy as np
+import timeit
+
+
+# Interpolated features of the model
+N_ATTRIBUTES = 11
+
+# Latitudinal and longitudinal distances in km. of the benchmarked regions
+REGION_SIZES = [(64, 64), (160, 160), (320, 480)]
+
+# Spacing in km. of the grid points sampled in a region
+SPACING = 32
+
+REPEATS = 5
+
+
+def region(shape: tuple[int, int], rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Grid points of a region and their values, with the GEE features missing at a tenth of the points
+    """
+    ys, xs = np.meshgrid(SPACING * np.arange(round(shape[0] / SPACING) + 1), SPACING * np.arange(round(shape[1] / SPACING) + 1), indexing='ij')
+    coords = np.column_stack((xs.ravel(), ys.ravel())).astype(np.float64)
+
+    values = rng.normal(0, 1, (len(coords), N_ATTRIBUTES))
+    values[rng.random(len(coords)) < 0.1, :4] = np.nan
+
+    return coords, values
+
+
+def interpolate_griddata(coords: np.ndarray, values: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """
+    Interpolation of the baseline, calling griddata for every attribute over its valid samples
+    """
+    xv, yv = np.meshgrid(np.arange(0, shape[1]), np.arange(0, shape[0]))
+
+    attributes = []
+    for attribute in values.T:
+        valid = ~np.isnan(attribute)
+        attributes.append(griddata(coords[valid], attribute[valid], (xv, yv), method='linear', fill_value=np.mean(attribute[valid])))
+
+    return np.stack(attributes, axis=-1)
+
+
+def interpolate_grid(coords: np.ndarray, values: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """
+    Interpolation of the engine, sharing triangulations between attributes
+    """
+    return Interpolation.GridInterpolator(coords, shape).interpolate(values)
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+
+    print(f'{"region":>10} {"points":>7} {"griddata ms":>12} {"grid ms":>8} {"speedup":>8} {"max diff":>9}')
+    for shape in REGION_SIZES:
+        coords, values = region(shape, rng)
+
+        expected = interpolate_griddata(coords, values, shape)
+        actual = interpolate_grid(coords, values, shape)
+
+        baseline = min(timeit.repeat(lambda: interpolate_griddata(coords, values, shape), number=1, repeat=REPEATS))
+        current = min(timeit.repeat(lambda: interpolate_grid(coords, values, shape), number=1, repeat=REPEATS))
+
+        print(f'{f"{shape[0]}x{shape[1]}":>10} {len(coords):>7} {baseline * 1000:>12.2f} {current * 1000:>8.2f} {baseline / current:>7.1f}x {np.abs(actual - expected).max():>9.1e}')
@@ -0,0 +1,99 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from tensorflow import keras
+
+import DataRetriever
+import numpy as np
+import time
+
+
+# Blocks of the clusters of a run, as numbers of blocks per cluster
+CLUSTER_SIZES = [1] * 30 + [2] * 10 + [4] * 8 + [9] * 4 + [20, 36]
+
+REPEATS = 3
+
+
+def stub_model() -> keras.Model:
+    """
+    Untrained model with the layers of the ResNet in model/Training.ipynb, mapping (32, 32, 12) blocks to (32, 32, 1) masks
+    """
+    def block(x, filters, main):
+        shortcut = keras.layers.Conv2D(filters, 3, padding='same')(x)
+        x = keras.layers.Activation('relu')(x)
+        x = main(x)
+        x = keras.layers.Activation('relu')(x)
+        x = keras.layers.Conv2D(filters, 3, padding='same')(x)
+        return keras.layers.Add()([x, shortcut])
+
+    inputs = keras.Input((DataRetriever.BLOCK_SIZE, DataRetriever.BLOCK_SIZE, len(DataRetriever.MODEL_FEATURES)))
+
+    x = keras.layers.Conv2D(16, 3, padding='same')(inputs)
+    x = keras.layers.BatchNormalization()(x)
+    x = keras.layers.Activation('relu')(x)
+    x = keras.layers.Conv2D(16, 3, padding='same')(x)
+    for _ in range(2):
+        x = block(x, 16, keras.layers.MaxPooling2D(2, strides=1, padding='same'))
+    for _ in range(2):
+        x = block(x, 32, keras.layers.Conv2D(32, 2, padding='same'))
+    x = keras.layers.Conv2D(16, 3, padding='same', activation='relu')(x)
+    x = keras.layers.AveragePooling2D(2, strides=1, padding='same')(x)
+    outputs = keras.layers.Conv2D(1, 3, padding='same', activation='sigmoid')(x)
+
+    return keras.Model(inputs, outputs)
+
+
+def predict_per_block(model: keras.Model, cluster_blocks: list[np.ndarray]) -> list[np.ndarray]:
+    """
+    Prediction of the baseline, calling model.predict on one block at a time
+    """
+    return [np.stack([model.predict(np.expand_dims(block, axis=0), verbose=0)[0, :, :, 0] for block in blocks]) for blocks in cluster_blocks]
+
+
+def timed(function, *args) -> tuple[any, float]:
+    """
+    Run a function REPEATS times, returning its last result and the seconds of its fastest run
+    """
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+
+    return result, min(times)
+
+
+if __name__ == '__main__':
+    keras.utils.set_random_seed(0)
+    rng = np.random.default_rng(0)
+
+    # Every worker process loads its own model through get_model, so the stub takes the place of the loaded model
+    model = stub_model()
+    DataRetriever.model = model
+
+    cluster_blocks = [
+        rng.normal(0, 1, (size, DataRetriever.BLOCK_SIZE, DataRetriever.BLOCK_SIZE, len(DataRetriever.MODEL_FEATURES))).astype(np.float32)
+        for size in CLUSTER_SIZES
+    ]
+
+    # Warm up both paths so tracing is not timed
+    DataRetriever.predict_masks(cluster_blocks[:1])
+    predict_per_block(model, cluster_blocks[:1])
+
+    per_block, per_block_time = timed(predict_per_block, model, cluster_blocks)
+
+    print(f'{len(cluster_blocks)} clusters, {sum(CLUSTER_SIZES)} blocks')
+    print(f'  per block            {per_block_time * 1000:>9.1f} ms')
+
+    # Clusters are split across batches when the batches are smaller than the run
+    for batch_size in [DataRetriever.PREDICTION_BATCH_SIZE, 32]:
+        batched, batched_time = timed(DataRetriever.predict_masks, cluster_blocks, batch_size)
+
+        identical = all(np.array_equal(a, b) for a, b in zip(batched, per_block))
+        difference = max(np.abs(a - b).max() for a, b in zip(batched, per_block))
+
+        print(f'  batches of {batch_size:<4}     {batched_time * 1000:>9.1f} ms  {per_block_time / batched_time:>5.1f}x  identical: {identical}, max difference {difference:.1e}')
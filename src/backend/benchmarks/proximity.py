@@ -0,0 +1,89 @@
+import sys
+import os
+fpath = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    os.pardir
+))
+sys.path.append(fpath)
+from Services import Proximity
+
+import Geodesy
+import numpy as np
+import time
+
+
+N_USERS = 100000
+
+# Predicted masks of a run, 10000 vertices in total
+N_POLYGONS = 100
+N_VERTICES = 100
+
+# Distance in km. users are notified within, as 0.8 degrees of the notification job
+RADIUS = 0.8 * 111.139
+
+
+def scene(rng: np.random.Generator) -> tuple[list[tuple[str, float, float]], list[tuple[int, np.ndarray, np.ndarray]]]:
+    """
+    Users across the FIRMS area, a fifth of them living near a fire, and star shaped fire masks
+    """
+    polygons = []
+    for fire_id in range(N_POLYGONS):
+        centre = (rng.uniform(30, 48), rng.uniform(-124, -70))
+        angles = np.sort(rng.uniform(0, 2 * np.pi, N_VERTICES))
+        distances = rng.uniform(1, 30) * rng.uniform(0.3, 1, N_VERTICES)
+        polygons.append((fire_id, *Geodesy.offset_coordinates(centre, distances * np.sin(angles), distances * np.cos(angles))))
+
+    lats = rng.uniform(25, 50, N_USERS)
+    lngs = rng.uniform(-125, -65, N_USERS)
+
+    near = rng.random(N_USERS) < 0.2
+    fires = rng.integers(N_POLYGONS, size=near.sum())
+    centres = np.array([(polygon_lats.mean(), polygon_lngs.mean()) for _, polygon_lats, polygon_lngs in polygons])[fires]
+    lats[near], lngs[near] = Geodesy.offset_coordinates((centres[:, 0], centres[:, 1]), rng.normal(0, 50, near.sum()), rng.normal(0, 50, near.sum()))
+
+    return [(f'{user:010d}', lat, lng) for user, (lat, lng) in enumerate(zip(lats.tolist(), lngs.tolist()))], polygons
+
+
+def vertex_search(users: list[tuple[str, float, float]], polygons: list[tuple[int, np.ndarray, np.ndarray]], radius: float) -> dict[str, tuple[int, float]]:
+    """
+    Closest mask vertex to every user, measuring the haversine distance of every pair of user and mask point
+    """
+    lats = np.radians([user[1] for user in users])[:, None]
+    lngs = np.radians([user[2] for user in users])[:, None]
+
+    closest = np.full(len(users), np.inf)
+    fire_ids = np.full(len(users), -1)
+    for fire_id, polygon_lats, polygon_lngs in polygons:
+        distances = Geodesy.haversine_distance(lats, lngs, np.radians(polygon_lats)[None, :], np.radians(polygon_lngs)[None, :]).min(axis=1)
+
+        closer = distances < closest
+        closest[closer] = distances[closer]
+        fire_ids[closer] = fire_id
+
+    return {users[user][0]: (int(fire_ids[user]), float(closest[user])) for user in np.flatnonzero(closest <= radius)}
+
+
+def timed(function, *args):
+    """
+    Run a function once, returning its result and the seconds it took
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    users, polygons = scene(np.random.default_rng(0))
+
+    index, index_time = timed(Proximity.UserIndex, users)
+    nearest, query_time = timed(Proximity.users_near_polygons, index, polygons, RADIUS)
+    vertices, vertex_time = timed(vertex_search, users, polygons, RADIUS)
+
+    print(f'{N_USERS} users, {N_POLYGONS * N_VERTICES} vertices, {RADIUS:.1f} km.')
+    print(f'  index build              {index_time * 1000:>9.1f} ms')
+    print(f'  polygon query            {query_time * 1000:>9.1f} ms  {len(nearest)} users')
+    print(f'  haversine to every vertex {vertex_time * 1000:>8.1f} ms  {len(vertices)} users')
+
+    # Distances to the edges are never further than to the closest vertex, so every user found by the vertex search is found
+    assert vertices.keys() <= nearest.keys()
+    print(f'  users only within the radius of an edge: {len(nearest.keys() - vertices.keys())}')
@@ -5,6 +5,7 @@ USE test;
 CREATE TABLE IF NOT EXISTS engine_run (
     id INT NOT NULL AUTO_INCREMENT,
     generation_date DATETIME NOT NULL,
+    publish_date DATETIME,
     purge_date DATETIME,
     PRIMARY KEY(id)
 );
@@ -35,18 +36,22 @@ CREATE TABLE IF NOT EXISTS mask (
     status_id INT NOT NULL, 
     fire_id INT NOT NULL, 
     run_id INT NOT NULL, 
+    polygon POLYGON NOT NULL SRID 0, 
     PRIMARY KEY(id), 
+    SPATIAL INDEX(polygon), 
     FOREIGN KEY (fire_id) REFERENCES fire(id), 
     FOREIGN KEY (status_id) REFERENCES mask_status(id), 
     FOREIGN KEY (run_id) REFERENCES engine_run(id)
 );
 
-CREATE TABLE IF NOT EXISTS polygon_point (
+-- Mask polygons simplified for each zoom level when they are written, as an encoded polyline and a flat [lat, lng, ...] array
+CREATE TABLE IF NOT EXISTS mask_geometry (
     mask_id INT NOT NULL, 
-    point_id INT NOT NULL, 
-    coordinate POINT NOT NULL, 
-    PRIMARY KEY(mask_id, point_id), 
-    FOREIGN KEY (mask_id) REFERENCES mask(id)
+    zoom INT NOT NULL, 
+    polyline TEXT NOT NULL, 
+    coordinates JSON NOT NULL, 
+    PRIMARY KEY(mask_id, zoom), 
+    FOREIGN KEY (mask_id) REFERENCES mask(id) ON DELETE CASCADE
 );
 
 CREATE TABLE IF NOT EXISTS region(
@@ -60,21 +65,241 @@ CREATE TABLE IF NOT EXISTS region(
     temp_max FLOAT, 
     humidity FLOAT, 
     precipitation FLOAT, 
+    detection_hash CHAR(64), 
+    predicted_run_id INT, 
+    bounds POLYGON NOT NULL SRID 0, 
     PRIMARY KEY(fire_id, run_id), 
+    SPATIAL INDEX(bounds), 
     FOREIGN KEY(fire_id) REFERENCES fire(id),
     FOREIGN KEY(run_id) REFERENCES engine_run(id)
 );
 
+-- Alerts delivered to each user for each fire and tier (0 urgent, 1 warning, 2 note)
+CREATE TABLE IF NOT EXISTS alert_delivery (
+    phone_number VARCHAR(11) NOT NULL, 
+    fire_id INT NOT NULL, 
+    tier INT NOT NULL, 
+    distance FLOAT NOT NULL, 
+    delivery_date DATETIME NOT NULL, 
+    PRIMARY KEY(phone_number, fire_id, tier), 
+    FOREIGN KEY (fire_id) REFERENCES fire(id) ON DELETE CASCADE
+);
+
+-- Migration of tables created by an earlier version of this script, which CREATE TABLE IF NOT EXISTS leaves unchanged
+-- Every step checks the current schema, so running it again on every start does nothing
+DROP PROCEDURE IF EXISTS migrate_schema;
+DELIMITER $$
+$$
+CREATE PROCEDURE migrate_schema()
+SQL SECURITY INVOKER
+BEGIN
+	-- Runs written before runs were published were shown as soon as they were written
+	IF NOT EXISTS (SELECT 1 FROM information_schema.columns c WHERE c.table_schema = DATABASE() AND c.table_name = 'engine_run' AND c.column_name = 'publish_date') THEN
+		ALTER TABLE engine_run ADD COLUMN publish_date DATETIME AFTER generation_date;
+
+		UPDATE
+			engine_run er
+		SET
+			er.publish_date = er.generation_date;
+	END IF;
+
+	IF NOT EXISTS (SELECT 1 FROM information_schema.columns c WHERE c.table_schema = DATABASE() AND c.table_name = 'region' AND c.column_name = 'detection_hash') THEN
+		ALTER TABLE region ADD COLUMN detection_hash CHAR(64);
+	END IF;
+
+	IF NOT EXISTS (SELECT 1 FROM information_schema.columns c WHERE c.table_schema = DATABASE() AND c.table_name = 'region' AND c.column_name = 'predicted_run_id') THEN
+		ALTER TABLE region ADD COLUMN predicted_run_id INT;
+
+		UPDATE
+			region r
+		SET
+			r.predicted_run_id = r.run_id;
+	END IF;
+
+	-- Region bounds from the corners of the existing regions
+	IF NOT EXISTS (SELECT 1 FROM information_schema.columns c WHERE c.table_schema = DATABASE() AND c.table_name = 'region' AND c.column_name = 'bounds') THEN
+		ALTER TABLE region ADD COLUMN bounds POLYGON SRID 0;
+
+		UPDATE
+			region r
+		SET
+			r.bounds = POLYGON(LINESTRING(
+				POINT(ST_X(r.min_coord), ST_Y(r.min_coord)),
+				POINT(ST_X(r.max_coord), ST_Y(r.min_coord)),
+				POINT(ST_X(r.max_coord), ST_Y(r.max_coord)),
+				POINT(ST_X(r.min_coord), ST_Y(r.max_coord)),
+				POINT(ST_X(r.min_coord), ST_Y(r.min_coord))
+			));
+
+		ALTER TABLE region MODIFY bounds POLYGON NOT NULL SRID 0, ADD SPATIAL INDEX(bounds);
+	END IF;
+
+	-- Mask polygons from their ordered polygon_point rows, which are then dropped
+	IF NOT EXISTS (SELECT 1 FROM information_schema.columns c WHERE c.table_schema = DATABASE() AND c.table_name = 'mask' AND c.column_name = 'polygon') THEN
+		ALTER TABLE mask ADD COLUMN polygon POLYGON SRID 0;
+
+		SET SESSION group_concat_max_len = 16777216;
+
+		UPDATE
+			mask m
+			JOIN (
+				SELECT
+					pp.mask_id,
+					GROUP_CONCAT(CONCAT(ST_X(pp.coordinate), ' ', ST_Y(pp.coordinate)) ORDER BY pp.point_id SEPARATOR ', ') AS ring
+				FROM
+					polygon_point pp
+				GROUP BY
+					pp.mask_id
+				HAVING
+					COUNT(*) >= 3
+			) p ON p.mask_id = m.id
+		SET
+			m.polygon = ST_GeomFromText(CONCAT('POLYGON ((', p.ring, ', ', SUBSTRING_INDEX(p.ring, ', ', 1), '))'));
+
+		DROP TABLE polygon_point;
+
+		-- Masks with fewer than 3 points have no area and were never drawn
+		DELETE
+			m
+		FROM
+			mask m
+		WHERE
+			m.polygon IS NULL;
+
+		ALTER TABLE mask MODIFY polygon POLYGON NOT NULL SRID 0, ADD SPATIAL INDEX(polygon);
+	END IF;
+END
+$$
+DELIMITER ;
+
+CALL migrate_schema();
+
+-- Replaced by the polygon written by add_mask and read back whole
+DROP PROCEDURE IF EXISTS add_mask_point;
+DROP PROCEDURE IF EXISTS add_mask_points;
+DROP PROCEDURE IF EXISTS get_active_predicted_points;
+
+-- Unused, users near a fire are found by the notification service
 DROP PROCEDURE IF EXISTS get_users_near_fire;
+
+
+DROP PROCEDURE IF EXISTS get_users;
+DELIMITER $$
+$$
+CREATE PROCEDURE get_users()
+SQL SECURITY INVOKER
+BEGIN
+	SELECT 
+		`user`.phone_number, 
+		ST_X(`user`.coordinate) AS latitude, 
+		ST_Y(`user`.coordinate) AS longitude 
+	FROM 
+		`user`;
+END
+$$
+DELIMITER ;
+
+
+-- Polygons of the predicted masks of active fires in the latest published run
+DROP PROCEDURE IF EXISTS get_active_predicted_masks;
 DELIMITER $$
 $$
-CREATE PROCEDURE get_users_near_fire(minimum_distance VARCHAR(20))
+CREATE PROCEDURE get_active_predicted_masks()
 SQL SECURITY INVOKER
 BEGIN
-	SELECT DISTINCT `user`.phone_number, MIN(ST_DISTANCE(`user`.coordinate, polygon_point.coordinate)) 
-	FROM `user`, polygon_point 
-	WHERE ST_DISTANCE(`user`.coordinate, polygon_point.coordinate) < minimum_distance
-	GROUP BY `user`.phone_number;
+	DECLARE latest_run_id INT;
+
+	SELECT 
+		MAX(er.id) 
+	INTO 
+		latest_run_id 
+	FROM 
+		engine_run er 
+	WHERE 
+		er.publish_date IS NOT NULL 
+		AND er.purge_date IS NULL;
+
+	SELECT 
+		m.fire_id, 
+		m.id AS mask_id, 
+		ST_AsText(m.polygon) AS polygon 
+	FROM 
+		mask m 
+		INNER JOIN fire f ON f.id = m.fire_id 
+	WHERE 
+		m.run_id = latest_run_id 
+		AND m.status_id = 2 
+		AND f.is_active = b'1' 
+	ORDER BY 
+		m.id;
+END
+$$
+DELIMITER ;
+
+
+-- Closest tier and distance already alerted for each user and active fire
+DROP PROCEDURE IF EXISTS get_alert_deliveries;
+DELIMITER $$
+$$
+CREATE PROCEDURE get_alert_deliveries()
+SQL SECURITY INVOKER
+BEGIN
+	SELECT 
+		ad.phone_number, 
+		ad.fire_id, 
+		MIN(ad.tier), 
+		MIN(ad.distance) 
+	FROM 
+		alert_delivery ad 
+		INNER JOIN fire f ON f.id = ad.fire_id 
+	WHERE 
+		f.is_active = b'1' 
+	GROUP BY 
+		ad.phone_number, 
+		ad.fire_id;
+END
+$$
+DELIMITER ;
+
+
+DROP PROCEDURE IF EXISTS add_alert_deliveries;
+DELIMITER $$
+$$
+CREATE PROCEDURE add_alert_deliveries(deliveries JSON)
+SQL SECURITY INVOKER
+BEGIN
+	-- deliveries is a JSON array of [phone_number, fire_id, tier, distance]
+	INSERT INTO 
+		alert_delivery (
+			phone_number, 
+			fire_id, 
+			tier, 
+			distance, 
+			delivery_date
+		)
+	SELECT 
+		* 
+	FROM (
+		SELECT 
+			jt.phone_number, 
+			jt.fire_id, 
+			jt.tier, 
+			jt.distance, 
+			NOW() AS delivery_date 
+		FROM 
+			JSON_TABLE(
+				deliveries, 
+				'$[*]' COLUMNS (
+					phone_number VARCHAR(11) PATH '$[0]', 
+					fire_id INT PATH '$[1]', 
+					tier INT PATH '$[2]', 
+					distance DOUBLE PATH '$[3]'
+				)
+			) AS jt
+	) AS delivered 
+	ON DUPLICATE KEY UPDATE 
+		distance = delivered.distance, 
+		delivery_date = delivered.delivery_date;
 END
 $$
 DELIMITER ;
@@ -148,6 +373,181 @@ DELIMITER ;
 
 
 
+-- Fire tracked across runs keeps its id, with its middle point moved to the latest detections
+DROP PROCEDURE IF EXISTS update_fire;
+DELIMITER $$
+$$
+CREATE PROCEDURE 
+	update_fire(
+		fire_id INT, 
+		latitude float, 
+		longitude float
+	)
+    SQL SECURITY INVOKER
+BEGIN
+	UPDATE 
+		fire 
+	SET 
+		fire.middle_point = POINT(latitude, longitude), 
+		fire.is_active = 1 
+	WHERE 
+		fire.id = fire_id;
+END
+$$
+DELIMITER ;
+
+
+-- Fires of the latest published run, with the detections and run their prediction was made from
+DROP PROCEDURE IF EXISTS get_tracked_fires;
+DELIMITER $$
+$$
+CREATE PROCEDURE get_tracked_fires()
+SQL SECURITY INVOKER
+BEGIN
+	DECLARE latest_run_id INT;
+
+	SELECT 
+		MAX(er.id) 
+	INTO 
+		latest_run_id 
+	FROM 
+		engine_run er 
+	WHERE 
+		er.publish_date IS NOT NULL 
+		AND er.purge_date IS NULL;
+
+	SELECT 
+		r.fire_id, 
+		r.run_id, 
+		ST_X(r.min_coord) AS lat_min, 
+		ST_Y(r.min_coord) AS lng_min, 
+		ST_X(r.max_coord) AS lat_max, 
+		ST_Y(r.max_coord) AS lng_max, 
+		r.detection_hash, 
+		e.generation_date AS prediction_date 
+	FROM 
+		region r 
+		LEFT JOIN engine_run e ON e.id = r.predicted_run_id 
+	WHERE 
+		r.run_id = latest_run_id;
+END
+$$
+DELIMITER ;
+
+
+-- Publish the region and masks of an unchanged fire from an earlier run under a new run
+DROP PROCEDURE IF EXISTS copy_fire_run;
+DELIMITER $$
+$$
+CREATE PROCEDURE 
+	copy_fire_run(
+		fire_id INT, 
+		from_run_id INT, 
+		to_run_id INT
+	)
+	SQL SECURITY INVOKER
+BEGIN
+	DECLARE done INT DEFAULT 0;
+	DECLARE old_mask_id INT;
+	DECLARE new_mask_id INT;
+	DECLARE masks CURSOR FOR 
+		SELECT 
+			m.id 
+		FROM 
+			mask m 
+		WHERE 
+			m.fire_id = fire_id 
+			AND m.run_id = from_run_id;
+	DECLARE CONTINUE HANDLER FOR NOT FOUND SET done = 1;
+
+	INSERT INTO 
+		region (
+			fire_id, 
+			run_id, 
+			min_coord, 
+			max_coord, 
+			wind_direction, 
+			wind_speed, 
+			temp_min, 
+			temp_max, 
+			humidity, 
+			precipitation, 
+			detection_hash, 
+			predicted_run_id, 
+			bounds 
+		)
+	SELECT 
+		r.fire_id, 
+		to_run_id, 
+		r.min_coord, 
+		r.max_coord, 
+		r.wind_direction, 
+		r.wind_speed, 
+		r.temp_min, 
+		r.temp_max, 
+		r.humidity, 
+		r.precipitation, 
+		r.detection_hash, 
+		r.predicted_run_id, 
+		r.bounds 
+	FROM 
+		region r 
+	WHERE 
+		r.fire_id = fire_id 
+		AND r.run_id = from_run_id;
+
+	OPEN masks;
+
+	copy_masks: LOOP
+		FETCH masks INTO old_mask_id;
+
+		IF done THEN
+			LEAVE copy_masks;
+		END IF;
+
+		INSERT INTO 
+			mask (
+				status_id, 
+				fire_id, 
+				run_id, 
+				polygon
+			)
+		SELECT 
+			m.status_id, 
+			m.fire_id, 
+			to_run_id, 
+			m.polygon 
+		FROM 
+			mask m 
+		WHERE 
+			m.id = old_mask_id;
+
+		SET new_mask_id = LAST_INSERT_ID();
+
+		INSERT INTO 
+			mask_geometry (
+				mask_id, 
+				zoom, 
+				polyline, 
+				coordinates
+			)
+		SELECT 
+			new_mask_id, 
+			g.zoom, 
+			g.polyline, 
+			g.coordinates 
+		FROM 
+			mask_geometry g 
+		WHERE 
+			g.mask_id = old_mask_id;
+	END LOOP;
+
+	CLOSE masks;
+END
+$$
+DELIMITER ;
+
+
 DROP PROCEDURE IF EXISTS add_region;
 DELIMITER $$
 $$
@@ -164,7 +564,8 @@ CREATE PROCEDURE
 		temp_min FLOAT, 
 		temp_max FLOAT, 
 		humidity FLOAT, 
-		precipitation FLOAT
+		precipitation FLOAT, 
+		detection_hash CHAR(64)
 	)
 	SQL SECURITY INVOKER
 BEGIN
@@ -179,7 +580,10 @@ BEGIN
 			temp_min, 
 			temp_max, 
 			humidity, 
-			precipitation 
+			precipitation, 
+			detection_hash, 
+			predicted_run_id, 
+			bounds 
 		)
 	VALUES (
 		fire_id, 
@@ -191,7 +595,16 @@ BEGIN
 		temp_min, 
 		temp_max, 
 		humidity, 
-		precipitation
+		precipitation, 
+		detection_hash, 
+		run_id, 
+		POLYGON(LINESTRING(
+			POINT(lat_min, lng_min), 
+			POINT(lat_max, lng_min), 
+			POINT(lat_max, lng_max), 
+			POINT(lat_min, lng_max), 
+			POINT(lat_min, lng_min)
+		))
 	);
 END
 $$
@@ -205,20 +618,24 @@ CREATE PROCEDURE
 	add_mask(
 		status_id INT, 
 		fire_id INT, 
-		run_id INT
+		run_id INT, 
+		polygon LONGTEXT
 	)
 	SQL SECURITY INVOKER
 BEGIN
+	-- polygon is well-known text with latitudes as x, like every other POINT
 	INSERT INTO 
 		mask (
 			status_id, 
 			fire_id, 
-			run_id
+			run_id, 
+			polygon
 		)
 	VALUES (
 		status_id, 
 		fire_id, 
-		run_id
+		run_id, 
+		ST_GeomFromText(polygon)
 	);
 
 	SELECT LAST_INSERT_ID();
@@ -229,29 +646,38 @@ DELIMITER ;
 
 
 
-DROP PROCEDURE IF EXISTS add_mask_point;
+DROP PROCEDURE IF EXISTS add_mask_geometries;
 DELIMITER $$
 $$
 CREATE PROCEDURE 
-	add_mask_point(
+	add_mask_geometries(
 		mask_id INT, 
-		point_id INT, 
-		lat float, 
-		lng float
+		geometries JSON
 	)
 	SQL SECURITY INVOKER
 BEGIN
+	-- geometries is a JSON array of [zoom, polyline, [lat, lng, lat, lng, ...]]
 	INSERT INTO 
-		polygon_point (
+		mask_geometry (
 			mask_id, 
-			point_id, 
-			coordinate
+			zoom, 
+			polyline, 
+			coordinates
 		)
-	VALUES (
+	SELECT 
 		mask_id, 
-		point_id, 
-		POINT(lat, lng)
-	);
+		jt.zoom, 
+		jt.polyline, 
+		jt.coordinates
+	FROM 
+		JSON_TABLE(
+			geometries, 
+			'$[*]' COLUMNS (
+				zoom INT PATH '$[0]', 
+				polyline TEXT PATH '$[1]', 
+				coordinates JSON PATH '$[2]'
+			)
+		) AS jt;
 END
 $$
 DELIMITER ;
@@ -276,6 +702,101 @@ DELIMITER ;
 
 
 
+-- Active fires of the latest published run whose region intersects a viewport, with their bounds, 
+-- followed by the polygons of their masks in the viewport, or those masks simplified for geometry_zoom, if requested
+DROP PROCEDURE IF EXISTS get_fires_in_bounds;
+DELIMITER $$
+$$
+CREATE PROCEDURE get_fires_in_bounds(IN lat_min FLOAT, IN lng_min FLOAT, IN lat_max FLOAT, IN lng_max FLOAT, IN include_masks BOOLEAN, IN geometry_zoom INT)
+SQL SECURITY INVOKER
+BEGIN
+	DECLARE latest_run_id INT;
+	DECLARE viewport POLYGON;
+
+	SELECT 
+		MAX(er.id) 
+	INTO 
+		latest_run_id 
+	FROM 
+		engine_run er 
+	WHERE 
+		er.publish_date IS NOT NULL 
+		AND er.purge_date IS NULL;
+
+	SET viewport = POLYGON(LINESTRING(
+		POINT(lat_min, lng_min), 
+		POINT(lat_max, lng_min), 
+		POINT(lat_max, lng_max), 
+		POINT(lat_min, lng_max), 
+		POINT(lat_min, lng_min)
+	));
+
+	-- The spatial index on the region bounds finds the regions in the viewport
+	SELECT 
+		f.id, 
+		ST_X(f.middle_point) AS lat, 
+		ST_Y(f.middle_point) AS lng, 
+		ST_X(r.min_coord) AS min_lat, 
+		ST_Y(r.min_coord) AS min_lng, 
+		ST_X(r.max_coord) AS max_lat, 
+		ST_Y(r.max_coord) AS max_lng 
+	FROM 
+		region r 
+		JOIN fire f ON f.id = r.fire_id 
+	WHERE 
+		r.run_id = latest_run_id 
+		AND f.is_active = b'1' 
+		AND MBRIntersects(r.bounds, viewport) 
+	ORDER BY 
+		f.id;
+
+	IF include_masks AND geometry_zoom IS NOT NULL THEN
+		SELECT 
+			m.fire_id, 
+			m.id AS mask_id, 
+			ms.fire_status, 
+			g.polyline, 
+			g.coordinates 
+		FROM 
+			region r 
+			JOIN fire f ON f.id = r.fire_id 
+			JOIN mask m ON m.fire_id = r.fire_id AND m.run_id = r.run_id 
+			JOIN mask_geometry g ON g.mask_id = m.id AND g.zoom = geometry_zoom 
+			JOIN mask_status ms ON ms.id = m.status_id 
+		WHERE 
+			r.run_id = latest_run_id 
+			AND f.is_active = b'1' 
+			AND MBRIntersects(r.bounds, viewport) 
+			AND MBRIntersects(m.polygon, viewport) 
+		ORDER BY 
+			m.fire_id, 
+			m.id;
+	ELSEIF include_masks THEN
+		SELECT 
+			m.fire_id, 
+			m.id AS mask_id, 
+			ms.fire_status, 
+			ST_AsText(m.polygon) AS polygon 
+		FROM 
+			region r 
+			JOIN fire f ON f.id = r.fire_id 
+			JOIN mask m ON m.fire_id = r.fire_id AND m.run_id = r.run_id 
+			JOIN mask_status ms ON ms.id = m.status_id 
+		WHERE 
+			r.run_id = latest_run_id 
+			AND f.is_active = b'1' 
+			AND MBRIntersects(r.bounds, viewport) 
+			AND MBRIntersects(m.polygon, viewport) 
+		ORDER BY 
+			m.fire_id, 
+			m.id;
+	END IF;
+END
+$$
+DELIMITER ;
+
+
+
 DROP PROCEDURE IF EXISTS get_max_and_min;
 DELIMITER $$
 $$
@@ -290,7 +811,10 @@ BEGIN
     FROM 
         region
     WHERE
-        region.fire_id = fire_id;
+        region.fire_id = fire_id
+    ORDER BY 
+        region.run_id DESC
+    LIMIT 1;
 END 
 $$
 DELIMITER ;
@@ -305,18 +829,46 @@ SQL SECURITY INVOKER
 BEGIN
     SELECT 
         mask.id AS mask_id,
-        polygon_point.point_id,
-        ST_X(polygon_point.coordinate) AS latitude,
-        ST_Y(polygon_point.coordinate) AS longitude,
-        mask_status.fire_status
+        mask_status.fire_status,
+        ST_AsText(mask.polygon) AS polygon
     FROM 
         mask
     JOIN 
-        polygon_point ON mask.id = polygon_point.mask_id
+        mask_status ON mask.status_id = mask_status.id
+    WHERE 
+        mask.fire_id = fire_id
+        AND mask.run_id = (SELECT MAX(m.run_id) FROM mask m WHERE m.fire_id = fire_id)
+    ORDER BY 
+        mask.id;
+END 
+$$
+DELIMITER ;
+
+
+
+-- Mask polygons of the fire's latest run, simplified for a zoom level
+DROP PROCEDURE IF EXISTS get_fire_mask_geometry;
+DELIMITER $$
+$$
+CREATE PROCEDURE get_fire_mask_geometry(IN fire_id INT, IN zoom INT)
+SQL SECURITY INVOKER
+BEGIN
+    SELECT 
+        mask.id AS mask_id,
+        mask_status.fire_status,
+        mask_geometry.polyline,
+        mask_geometry.coordinates
+    FROM 
+        mask
+    JOIN 
+        mask_geometry ON mask.id = mask_geometry.mask_id AND mask_geometry.zoom = zoom
     JOIN 
         mask_status ON mask.status_id = mask_status.id
     WHERE 
-        mask.fire_id = fire_id;
+        mask.fire_id = fire_id
+        AND mask.run_id = (SELECT MAX(m.run_id) FROM mask m WHERE m.fire_id = fire_id)
+    ORDER BY 
+        mask.id;
 END 
 $$
 DELIMITER ;
@@ -330,7 +882,17 @@ CREATE PROCEDURE get_table_data(IN fire_id INT)
 SQL SECURITY INVOKER
 BEGIN
 	SELECT 
-		r.*, e.generation_date
+		r.fire_id, 
+		r.run_id, 
+		r.min_coord, 
+		r.max_coord, 
+		r.wind_direction, 
+		r.wind_speed, 
+		r.temp_min, 
+		r.temp_max, 
+		r.humidity, 
+		r.precipitation, 
+		e.generation_date
 	FROM 
 		region r
 	JOIN 
@@ -364,15 +926,6 @@ BEGIN
 	WHERE 
 		DATEDIFF(NOW(), er.generation_date) >= ttl;
 		
-	-- Purge point data
-	DELETE 
-		pp 
-	FROM 
-		polygon_point pp 
-		INNER JOIN mask m 
-	WHERE 
-		m.run_id <= latest_to_purge_id;
-	
 	-- Purge region data
 	DELETE 
 		r 
@@ -389,12 +942,15 @@ BEGIN
 	WHERE 
 		m.run_id <= latest_to_purge_id;
 	
+	-- Fires tracked into later runs still have regions and are kept
 	DELETE 
 		f 
 	FROM 
 		fire f 
 	WHERE 
-		DATEDIFF(NOW(), f.identification_date) >= ttl;
+		DATEDIFF(NOW(), f.identification_date) >= ttl 
+		AND NOT EXISTS (SELECT 1 FROM region r WHERE r.fire_id = f.id) 
+		AND NOT EXISTS (SELECT 1 FROM mask m WHERE m.fire_id = f.id);
 	
 	-- Update engine run table
 	UPDATE 
@@ -409,68 +965,103 @@ DELIMITER ;
 
 
 
--- remove last failed run procedure 
-DROP PROCEDURE IF EXISTS remove_failed_run;
+-- publish a run once all of its results have been written
+DROP PROCEDURE IF EXISTS publish_run;
 DELIMITER $$
 $$
 CREATE PROCEDURE 
-	remove_failed_run()
+	publish_run(
+		run_id INT
+	)
 	SQL SECURITY INVOKER
 BEGIN
-    DECLARE run_id INT;
-	DECLARE gen_date DATETIME;
-
-	SELECT 
-		MAX(id) 
-	INTO 
-		run_id 
-	FROM 
-		engine_run;
-
-	SELECT 
-		generation_date 
-	INTO 
-		gen_date 
-	FROM 
+	UPDATE 
 		engine_run 
+	SET 
+		publish_date = NOW() 
 	WHERE 
 		id = run_id;
 	
-	DELETE 
-		pp 
-	FROM 
-		polygon_point pp 
-		INNER JOIN mask m
-	WHERE 
-		m.run_id = run_id;
-	
-	DELETE 
-		r 
-	FROM 
-		region r
-	WHERE 
-		r.run_id = run_id;
-	
-	DELETE 
-		m 
-	FROM 
-		mask m 
-	WHERE  
-		m.run_id = run_id;
-	
-	DELETE 
-		f 
+	-- Active fires change together with the published run, so cached map responses are versioned by the run alone
+	CALL update_active();
+END
+$$
+DELIMITER ;
+
+
+
+-- latest published run, which versions the cached map responses
+DROP PROCEDURE IF EXISTS get_published_run;
+DELIMITER $$
+$$
+CREATE PROCEDURE get_published_run()
+SQL SECURITY INVOKER
+BEGIN
+	SELECT 
+		MAX(er.id) 
 	FROM 
-		fire f
-	WHERE 
-		ABS(HOUR(TIMEDIFF(f.identification_date, gen_date))) < 2;
-	
-	UPDATE 
-		engine_run 
-	SET 
-		purge_date = NOW() 
+		engine_run er 
 	WHERE 
-		id = run_id;
+		er.publish_date IS NOT NULL 
+		AND er.purge_date IS NULL;
+END
+$$
+DELIMITER ;
+
+
+
+-- remove failed run procedure 
+-- results are written in a single transaction with the publish step, so a failed run normally has no rows left
+-- published runs are kept, as the run can only fail after publishing in steps that do not write to it
+DROP PROCEDURE IF EXISTS remove_failed_run;
+DELIMITER $$
+$$
+CREATE PROCEDURE 
+	remove_failed_run(
+		run_id INT
+	)
+	SQL SECURITY INVOKER
+BEGIN
+	IF EXISTS (SELECT 1 FROM engine_run er WHERE er.id = run_id AND er.publish_date IS NULL) THEN
+		DROP TEMPORARY TABLE IF EXISTS failed_run_fire;
+		CREATE TEMPORARY TABLE failed_run_fire (id INT NOT NULL, PRIMARY KEY(id)) 
+			SELECT r.fire_id AS id FROM region r WHERE r.run_id = run_id 
+			UNION 
+			SELECT m.fire_id AS id FROM mask m WHERE m.run_id = run_id;
+
+		DELETE 
+			r 
+		FROM 
+			region r
+		WHERE 
+			r.run_id = run_id;
+		
+		DELETE 
+			m 
+		FROM 
+			mask m 
+		WHERE  
+			m.run_id = run_id;
+		
+		-- Fires of the run left without any region or mask
+		DELETE 
+			f 
+		FROM 
+			fire f
+			JOIN failed_run_fire frf ON frf.id = f.id 
+		WHERE 
+			NOT EXISTS (SELECT 1 FROM region r WHERE r.fire_id = f.id) 
+			AND NOT EXISTS (SELECT 1 FROM mask m WHERE m.fire_id = f.id);
+
+		DROP TEMPORARY TABLE failed_run_fire;
+		
+		UPDATE 
+			engine_run er 
+		SET 
+			er.purge_date = NOW() 
+		WHERE 
+			er.id = run_id;
+	END IF;
 END
 $$
 DELIMITER ;
@@ -483,25 +1074,24 @@ $$
 CREATE PROCEDURE update_active()
 SQL SECURITY INVOKER
 BEGIN
-     -- Get the latest engine run that is older than 7 days
-     DECLARE latest_run_date DATETIME;
+     -- Get the latest published engine run
+     DECLARE latest_run_id INT;
 
      SELECT 
-          MAX(er.generation_date) 
+          MAX(er.id) 
      INTO 
-          latest_run_date 
+          latest_run_id 
      FROM 
           engine_run er 
      WHERE 
-          er.purge_date IS NULL;
+          er.publish_date IS NOT NULL 
+          AND er.purge_date IS NULL;
           
-     -- Set the is_active to 0
+     -- Fires are active while they are part of the latest run
      UPDATE 
           fire f 
      SET 
-          f.is_active = 0 
-     WHERE 
-          ABS(HOUR(TIMEDIFF(f.identification_date, latest_run_date))) > 2;
+          f.is_active = EXISTS (SELECT 1 FROM region r WHERE r.fire_id = f.id AND r.run_id = latest_run_id);
 END 
 $$
 DELIMITER ;
@@ -517,8 +1107,8 @@ INSERT INTO mask_status (fire_status) VALUES
      ('ARCHIVED PREDICTION');
 
 
-INSERT INTO engine_run (generation_date,purge_date) VALUES
-     ('2024-03-20 13:40:24',NULL);
+INSERT INTO engine_run (generation_date,publish_date,purge_date) VALUES
+     ('2024-03-20 13:40:24','2024-03-20 13:40:24',NULL);
 
 
 INSERT INTO fire (middle_point,identification_date,is_active) VALUES
@@ -624,1543 +1214,307 @@ INSERT INTO fire (middle_point,identification_date,is_active) VALUES
      (ST_GeomFromText('POINT (46.850929260253906 -117.68331146240234)'),'2024-03-20 13:40:24',1);
 
 
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (1,1,ST_GeomFromText('POINT (36.46148681640625 -96.5511245727539)'),ST_GeomFromText('POINT (36.74910354614258 -96.19298553466797)'),145.092,1.91335,290.843,294.526,43.4834,0.0953613),
-     (2,1,ST_GeomFromText('POINT (46.61035919189453 -111.96013641357422)'),ST_GeomFromText('POINT (46.8978385925293 -111.5405502319336)'),161.362,1.64917,278.753,284.014,53.7549,0.0),
-     (3,1,ST_GeomFromText('POINT (39.16218566894531 -93.82846069335938)'),ST_GeomFromText('POINT (42.9030647277832 -89.2498779296875)'),272.581,6.09735,276.434,278.87,29.888,0.0),
-     (4,1,ST_GeomFromText('POINT (32.40029525756836 -82.63731384277344)'),ST_GeomFromText('POINT (33.55131530761719 -81.60846710205078)'),255.753,4.4005,291.76,294.343,33.878,0.0),
-     (5,1,ST_GeomFromText('POINT (33.11381912231445 -80.50120544433594)'),ST_GeomFromText('POINT (33.97715759277344 -79.4654541015625)'),249.118,4.6221,292.188,294.947,31.3705,0.0),
-     (6,1,ST_GeomFromText('POINT (33.0116081237793 -83.97045135498047)'),ST_GeomFromText('POINT (33.874691009521484 -82.59114074707031)'),261.453,3.38224,291.877,294.392,35.369,0.0),
-     (7,1,ST_GeomFromText('POINT (33.444149017333984 -85.63385772705078)'),ST_GeomFromText('POINT (34.01939392089844 -85.28792572021484)'),276.536,3.30212,289.861,292.826,42.2537,0.0),
-     (8,1,ST_GeomFromText('POINT (33.70273208618164 -82.69898986816406)'),ST_GeomFromText('POINT (34.27822494506836 -81.65809631347656)'),262.83,4.86301,292.362,294.992,32.8977,0.0),
-     (9,1,ST_GeomFromText('POINT (34.001319885253906 -80.9576416015625)'),ST_GeomFromText('POINT (34.57685089111328 -80.26110076904297)'),227.719,3.32548,292.699,295.58,27.1259,0.0),
-     (10,1,ST_GeomFromText('POINT (34.062992095947266 -78.55426788330078)'),ST_GeomFromText('POINT (34.350746154785156 -77.85855865478516)'),237.68,2.93252,290.799,294.084,34.6606,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (11,1,ST_GeomFromText('POINT (34.8125 -80.20854187011719)'),ST_GeomFromText('POINT (35.10020065307617 -79.15544128417969)'),265.968,3.90525,291.922,294.226,30.8734,0.0),
-     (12,1,ST_GeomFromText('POINT (35.51723861694336 -82.0479965209961)'),ST_GeomFromText('POINT (36.09272384643555 -80.98381805419922)'),270.726,5.40729,289.596,293.509,27.1932,0.0),
-     (13,1,ST_GeomFromText('POINT (26.410228729248047 -81.71448516845703)'),ST_GeomFromText('POINT (27.56133270263672 -80.42281341552734)'),113.026,1.88223,295.769,298.785,45.6265,0.0),
-     (14,1,ST_GeomFromText('POINT (27.12138557434082 -82.05194854736328)'),ST_GeomFromText('POINT (27.6966552734375 -81.72779846191406)'),137.429,1.07444,294.646,297.407,46.6169,0.0),
-     (15,1,ST_GeomFromText('POINT (27.600048065185547 -82.54598999023438)'),ST_GeomFromText('POINT (27.88774299621582 -82.2209243774414)'),163.399,1.99501,292.739,297.353,44.8882,0.0),
-     (16,1,ST_GeomFromText('POINT (28.818883895874023 -82.4157943725586)'),ST_GeomFromText('POINT (29.10663604736328 -82.0871810913086)'),244.363,1.31579,292.441,296.56,33.0718,0.0),
-     (17,1,ST_GeomFromText('POINT (29.634410858154297 -82.49757385253906)'),ST_GeomFromText('POINT (30.497549057006836 -81.83273315429688)'),289.87,1.7237,292.125,295.262,27.508,0.0),
-     (18,1,ST_GeomFromText('POINT (29.834495544433594 -83.20563507080078)'),ST_GeomFromText('POINT (30.12206268310547 -82.54151916503906)'),284.144,1.62788,292.998,294.999,25.447,0.0),
-     (19,1,ST_GeomFromText('POINT (30.086528778076172 -84.6080322265625)'),ST_GeomFromText('POINT (30.661882400512695 -84.2746353149414)'),200.168,1.55871,291.211,294.674,31.0093,0.0),
-     (20,1,ST_GeomFromText('POINT (30.370092391967773 -84.29512786865234)'),ST_GeomFromText('POINT (30.94561767578125 -83.62605285644531)'),269.033,1.82866,291.631,294.544,32.4437,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (21,1,ST_GeomFromText('POINT (30.713977813720703 -87.107666015625)'),ST_GeomFromText('POINT (31.0014705657959 -86.77275085449219)'),251.61,1.5851,290.729,294.734,32.9595,0.0),
-     (22,1,ST_GeomFromText('POINT (30.861038208007812 -87.11625671386719)'),ST_GeomFromText('POINT (31.148542404174805 -86.78079986572266)'),273.315,2.01712,291.4,294.468,32.9585,0.0),
-     (23,1,ST_GeomFromText('POINT (31.071956634521484 -87.1207046508789)'),ST_GeomFromText('POINT (31.359493255615234 -86.78443145751953)'),256.909,1.74525,291.714,293.6,32.3726,0.0),
-     (24,1,ST_GeomFromText('POINT (31.167247772216797 -84.62726593017578)'),ST_GeomFromText('POINT (31.454853057861328 -84.29068756103516)'),267.069,3.02109,291.121,292.068,33.8345,0.0),
-     (25,1,ST_GeomFromText('POINT (31.302656173706055 -84.39421844482422)'),ST_GeomFromText('POINT (31.5902042388916 -84.05713653564453)'),277.709,3.55737,291.041,291.511,30.875,0.0),
-     (26,1,ST_GeomFromText('POINT (31.391019821166992 -81.80372619628906)'),ST_GeomFromText('POINT (31.678508758544922 -81.4663314819336)'),285.802,2.6411,292.627,294.422,27.1514,0.0),
-     (27,1,ST_GeomFromText('POINT (32.06714630126953 -85.72249603271484)'),ST_GeomFromText('POINT (32.354713439941406 -85.38262939453125)'),276.479,2.33804,291.323,293.331,40.9839,0.0),
-     (28,1,ST_GeomFromText('POINT (32.38069152832031 -81.41996002197266)'),ST_GeomFromText('POINT (32.668426513671875 -80.39627838134766)'),263.023,4.76891,292.381,294.213,31.8161,0.0),
-     (29,1,ST_GeomFromText('POINT (32.52851104736328 -81.48596954345703)'),ST_GeomFromText('POINT (33.10383987426758 -81.14370727539062)'),255.897,4.6002,292.615,294.514,31.9526,0.0),
-     (30,1,ST_GeomFromText('POINT (32.75856399536133 -85.09857177734375)'),ST_GeomFromText('POINT (33.33393478393555 -84.41212463378906)'),279.566,3.05593,290.934,293.751,34.3685,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (31,1,ST_GeomFromText('POINT (32.5771598815918 -88.11705780029297)'),ST_GeomFromText('POINT (33.440269470214844 -86.7444839477539)'),255.718,2.16851,290.48,292.952,40.4517,0.0),
-     (32,1,ST_GeomFromText('POINT (47.51405334472656 -110.9845199584961)'),ST_GeomFromText('POINT (47.80168914794922 -110.5574951171875)'),102.407,2.83372,272.005,273.039,67.8447,0.0),
-     (33,1,ST_GeomFromText('POINT (36.256629943847656 -92.70265197753906)'),ST_GeomFromText('POINT (36.8319091796875 -92.34446716308594)'),249.459,1.48729,292.471,295.555,42.1677,0.0),
-     (34,1,ST_GeomFromText('POINT (37.366817474365234 -96.91858673095703)'),ST_GeomFromText('POINT (37.654541015625 -96.55599212646484)'),67.1445,7.00897,290.232,293.332,44.6821,0.0),
-     (35,1,ST_GeomFromText('POINT (37.608673095703125 -96.47489166259766)'),ST_GeomFromText('POINT (37.896236419677734 -96.11106872558594)'),68.3491,7.89602,289.258,290.253,41.6196,0.0),
-     (36,1,ST_GeomFromText('POINT (38.547630310058594 -97.52764129638672)'),ST_GeomFromText('POINT (38.835208892822266 -97.15904235839844)'),51.1406,7.2831,284.793,288.199,40.999,0.0),
-     (37,1,ST_GeomFromText('POINT (39.524532318115234 -96.96451568603516)'),ST_GeomFromText('POINT (39.812049865722656 -96.21709442138672)'),52.9954,6.70168,281.212,283.565,41.615,0.0),
-     (38,1,ST_GeomFromText('POINT (39.574951171875 -97.85773468017578)'),ST_GeomFromText('POINT (40.150230407714844 -97.1082992553711)'),58.1107,7.34539,280.58,281.603,42.4412,0.0),
-     (39,1,ST_GeomFromText('POINT (40.311683654785156 -95.84721374511719)'),ST_GeomFromText('POINT (40.59927749633789 -95.46929168701172)'),32.6943,6.81553,278.52,280.369,26.7397,0.0),
-     (40,1,ST_GeomFromText('POINT (40.505252838134766 -95.9576416015625)'),ST_GeomFromText('POINT (40.792728424072266 -95.5787124633789)'),28.5674,7.1557,278.01,279.93,24.9546,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (41,1,ST_GeomFromText('POINT (41.13328170776367 -99.93553161621094)'),ST_GeomFromText('POINT (41.420955657958984 -99.55294036865234)'),74.1128,5.10565,277.379,279.809,43.6802,0.0),
-     (42,1,ST_GeomFromText('POINT (41.45199203491211 -99.75674438476562)'),ST_GeomFromText('POINT (41.73953628540039 -99.37225341796875)'),73.9136,4.6288,276.566,279.264,45.0371,0.0),
-     (43,1,ST_GeomFromText('POINT (41.58364486694336 -99.1602783203125)'),ST_GeomFromText('POINT (41.87119674682617 -98.77505493164062)'),50.1943,4.98738,277.887,278.207,43.0679,0.0),
-     (44,1,ST_GeomFromText('POINT (41.85578918457031 -98.3096694946289)'),ST_GeomFromText('POINT (43.29450225830078 -97.52824401855469)'),33.1422,4.24038,273.132,275.274,27.8758,0.0),
-     (45,1,ST_GeomFromText('POINT (45.60602951049805 -109.07310485839844)'),ST_GeomFromText('POINT (46.181419372558594 -107.41958618164062)'),195.072,1.49443,276.71,278.957,53.9821,0.0),
-     (46,1,ST_GeomFromText('POINT (31.95567512512207 -102.79161834716797)'),ST_GeomFromText('POINT (32.24339294433594 -101.7728271484375)'),150.809,2.40098,288.268,292.396,45.8861,0.0),
-     (47,1,ST_GeomFromText('POINT (31.507144927978516 -99.92810821533203)'),ST_GeomFromText('POINT (32.65826416015625 -98.2301254272461)'),208.323,3.70827,289.909,292.405,58.8363,0.0),
-     (48,1,ST_GeomFromText('POINT (33.2925910949707 -97.60629272460938)'),ST_GeomFromText('POINT (35.01914978027344 -96.56302642822266)'),176.616,3.78866,292.414,295.404,45.5188,0.0),
-     (49,1,ST_GeomFromText('POINT (34.18438720703125 -99.02894592285156)'),ST_GeomFromText('POINT (34.75978469848633 -98.68009948730469)'),209.254,3.96656,293.016,295.374,44.8618,0.0),
-     (50,1,ST_GeomFromText('POINT (34.15032958984375 -94.6352310180664)'),ST_GeomFromText('POINT (34.43781280517578 -94.2872314453125)'),222.823,2.84828,286.285,292.989,48.6167,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (51,1,ST_GeomFromText('POINT (34.664058685302734 -94.54705047607422)'),ST_GeomFromText('POINT (34.9515495300293 -94.1968994140625)'),216.762,2.71037,292.165,293.334,38.2544,0.0),
-     (52,1,ST_GeomFromText('POINT (34.632057189941406 -96.12694549560547)'),ST_GeomFromText('POINT (35.783172607421875 -95.42267608642578)'),185.657,3.67955,292.355,293.819,44.8018,0.0),
-     (53,1,ST_GeomFromText('POINT (35.6405029296875 -95.27555847167969)'),ST_GeomFromText('POINT (36.50360870361328 -94.56356811523438)'),213.22,1.9885,292.463,295.226,43.5953,0.0),
-     (54,1,ST_GeomFromText('POINT (35.710445404052734 -92.49485778808594)'),ST_GeomFromText('POINT (35.99821472167969 -91.78504180908203)'),309.315,1.36631,294.314,295.54,41.4329,0.0),
-     (55,1,ST_GeomFromText('POINT (36.14925003051758 -96.52323150634766)'),ST_GeomFromText('POINT (36.43682861328125 -96.1664810180664)'),162.815,2.17097,293.518,297.251,41.229,0.0),
-     (56,1,ST_GeomFromText('POINT (36.40350341796875 -96.37086486816406)'),ST_GeomFromText('POINT (36.69098663330078 -96.01300048828125)'),148.925,1.9348,290.943,296.104,47.2827,0.0),
-     (57,1,ST_GeomFromText('POINT (36.949317932128906 -101.73961639404297)'),ST_GeomFromText('POINT (37.236820220947266 -101.3791732788086)'),86.7227,5.90784,292.081,294.207,24.6831,0.0),
-     (58,1,ST_GeomFromText('POINT (43.97015380859375 -121.1942367553711)'),ST_GeomFromText('POINT (44.54558563232422 -117.5780258178711)'),216.538,2.38632,283.81,285.532,49.7558,0.0),
-     (59,1,ST_GeomFromText('POINT (46.26691436767578 -118.26094055175781)'),ST_GeomFromText('POINT (46.55460739135742 -117.84375)'),225.737,6.97095,285.97,289.089,48.9121,0.0),
-     (60,1,ST_GeomFromText('POINT (47.65292739868164 -120.51197814941406)'),ST_GeomFromText('POINT (49.37932205200195 -118.34004974365234)'),228.858,1.2993,280.736,283.312,60.5798,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (61,1,ST_GeomFromText('POINT (38.47929763793945 -123.8177261352539)'),ST_GeomFromText('POINT (41.357093811035156 -120.44055938720703)'),201.363,2.23767,283.952,287.861,55.8676,0.0),
-     (62,1,ST_GeomFromText('POINT (31.224191665649414 -84.21187591552734)'),ST_GeomFromText('POINT (31.51181983947754 -83.87516021728516)'),269.293,3.10554,290.973,292.024,29.8306,0.0),
-     (63,1,ST_GeomFromText('POINT (31.333959579467773 -88.3239974975586)'),ST_GeomFromText('POINT (31.909481048583984 -87.3102798461914)'),250.53,1.85979,292.959,293.413,36.4516,0.0),
-     (64,1,ST_GeomFromText('POINT (31.45073699951172 -84.69783020019531)'),ST_GeomFromText('POINT (32.02606201171875 -84.35961151123047)'),281.204,2.76098,291.564,292.358,33.4377,0.0),
-     (65,1,ST_GeomFromText('POINT (33.084869384765625 -81.6797866821289)'),ST_GeomFromText('POINT (33.37255096435547 -81.33586883544922)'),246.767,4.80095,292.678,295.677,30.5762,0.0),
-     (66,1,ST_GeomFromText('POINT (33.2054557800293 -92.41950225830078)'),ST_GeomFromText('POINT (33.780704498291016 -91.72938537597656)'),231.371,2.92674,291.245,291.872,40.036,0.0),
-     (67,1,ST_GeomFromText('POINT (33.535491943359375 -89.81859588623047)'),ST_GeomFromText('POINT (34.11098861694336 -89.1258316040039)'),245.396,3.10824,292.0,292.607,43.3569,0.0),
-     (68,1,ST_GeomFromText('POINT (33.84652328491211 -93.54780578613281)'),ST_GeomFromText('POINT (34.42197799682617 -93.20020294189453)'),224.503,2.91806,289.725,292.166,42.499,0.0),
-     (69,1,ST_GeomFromText('POINT (33.98876953125 -88.155517578125)'),ST_GeomFromText('POINT (35.139888763427734 -86.75786590576172)'),253.382,3.07286,290.82,293.501,41.1452,0.0),
-     (70,1,ST_GeomFromText('POINT (34.46026611328125 -89.61217498779297)'),ST_GeomFromText('POINT (34.74800491333008 -88.5634994506836)'),265.537,2.83957,293.087,293.796,44.3255,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (71,1,ST_GeomFromText('POINT (34.557857513427734 -84.88082885742188)'),ST_GeomFromText('POINT (34.84543991088867 -84.18107604980469)'),170.156,3.24264,289.31,292.412,44.0605,0.0),
-     (72,1,ST_GeomFromText('POINT (34.6893196105957 -93.0876693725586)'),ST_GeomFromText('POINT (35.55240249633789 -92.38432312011719)'),223.406,2.44067,292.152,296.423,40.5995,0.0),
-     (73,1,ST_GeomFromText('POINT (34.69294738769531 -94.4190444946289)'),ST_GeomFromText('POINT (34.98043441772461 -94.06874084472656)'),196.479,2.52041,291.845,292.889,38.4209,0.0),
-     (74,1,ST_GeomFromText('POINT (34.95915603637695 -84.2867202758789)'),ST_GeomFromText('POINT (35.53450393676758 -83.93467712402344)'),218.795,3.51886,288.161,291.673,42.3354,0.0),
-     (75,1,ST_GeomFromText('POINT (35.03358459472656 -91.60346221923828)'),ST_GeomFromText('POINT (35.89675521850586 -90.54374694824219)'),273.338,2.33739,292.985,294.629,44.4502,0.0),
-     (76,1,ST_GeomFromText('POINT (35.22866439819336 -93.9430923461914)'),ST_GeomFromText('POINT (35.80404281616211 -93.23632049560547)'),233.473,1.70737,291.738,294.713,44.6703,0.0),
-     (77,1,ST_GeomFromText('POINT (35.87663650512695 -87.98678588867188)'),ST_GeomFromText('POINT (36.739933013916016 -86.55830383300781)'),252.643,2.71036,290.692,293.027,39.9311,0.0),
-     (78,1,ST_GeomFromText('POINT (36.358299255371094 -91.84829711914062)'),ST_GeomFromText('POINT (36.64604187011719 -91.13259887695312)'),82.1714,1.91974,293.081,294.739,42.4844,0.0),
-     (79,1,ST_GeomFromText('POINT (37.572608947753906 -89.65935516357422)'),ST_GeomFromText('POINT (39.299041748046875 -87.08779907226562)'),265.813,5.37782,285.169,287.953,31.7828,0.0),
-     (80,1,ST_GeomFromText('POINT (38.930267333984375 -97.53042602539062)'),ST_GeomFromText('POINT (39.217933654785156 -97.15996551513672)'),68.7983,7.65773,282.632,287.068,41.1099,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (81,1,ST_GeomFromText('POINT (40.6191291809082 -100.24585723876953)'),ST_GeomFromText('POINT (40.906612396240234 -99.86629486083984)'),87.0947,5.532,280.196,280.744,44.5308,0.0),
-     (82,1,ST_GeomFromText('POINT (40.82418441772461 -100.57318115234375)'),ST_GeomFromText('POINT (41.11188507080078 -100.1921157836914)'),93.8232,5.25656,280.047,280.34,48.1099,0.0),
-     (83,1,ST_GeomFromText('POINT (43.93101501464844 -95.0597152709961)'),ST_GeomFromText('POINT (44.218482971191406 -94.6595687866211)'),344.252,5.86456,270.141,271.329,27.6963,0.0),
-     (84,1,ST_GeomFromText('POINT (45.12283706665039 -94.22359466552734)'),ST_GeomFromText('POINT (45.985992431640625 -93.40205383300781)'),315.679,5.0846,267.465,270.059,41.7074,0.0),
-     (85,1,ST_GeomFromText('POINT (43.900630950927734 -108.15746307373047)'),ST_GeomFromText('POINT (44.18830108642578 -107.75737762451172)'),265.591,1.04167,281.923,284.411,46.0,0.0),
-     (86,1,ST_GeomFromText('POINT (44.786128997802734 -108.24590301513672)'),ST_GeomFromText('POINT (45.07360076904297 -107.83983612060547)'),221.154,2.30665,277.044,279.383,50.209,0.0),
-     (87,1,ST_GeomFromText('POINT (45.80165481567383 -116.42875671386719)'),ST_GeomFromText('POINT (46.0892448425293 -116.01508331298828)'),257.174,2.80732,284.918,288.012,42.1655,0.0),
-     (88,1,ST_GeomFromText('POINT (45.90814208984375 -115.51866912841797)'),ST_GeomFromText('POINT (46.19561767578125 -115.10444641113281)'),241.094,1.86715,284.949,284.999,56.3311,0.0),
-     (89,1,ST_GeomFromText('POINT (46.13179397583008 -116.51864624023438)'),ST_GeomFromText('POINT (46.419315338134766 -116.1025390625)'),259.039,3.71854,285.317,289.643,47.4126,0.0),
-     (90,1,ST_GeomFromText('POINT (46.36740493774414 -117.68375396728516)'),ST_GeomFromText('POINT (46.655033111572266 -117.26580047607422)'),232.653,3.60588,286.091,288.589,51.2686,0.0);
-INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation) VALUES
-     (91,1,ST_GeomFromText('POINT (46.71598815917969 -117.8984603881836)'),ST_GeomFromText('POINT (47.00364303588867 -117.47797393798828)'),226.476,7.12532,287.175,288.669,53.353,0.0);
-
-
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,1,1),
-     (2,1,1),
-     (1,2,1),
-     (2,2,1),
-     (1,3,1),
-     (2,3,1),
-     (1,4,1),
-     (2,4,1),
-     (1,5,1),
-     (2,5,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,6,1),
-     (2,6,1),
-     (1,7,1),
-     (2,7,1),
-     (1,8,1),
-     (2,8,1),
-     (1,9,1),
-     (2,9,1),
-     (1,10,1),
-     (2,10,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,11,1),
-     (2,11,1),
-     (1,12,1),
-     (2,12,1),
-     (1,13,1),
-     (2,13,1),
-     (1,14,1),
-     (2,14,1),
-     (1,15,1),
-     (2,15,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,16,1),
-     (2,16,1),
-     (1,17,1),
-     (2,17,1),
-     (1,18,1),
-     (2,18,1),
-     (1,19,1),
-     (2,19,1),
-     (1,20,1),
-     (2,20,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,21,1),
-     (2,21,1),
-     (1,22,1),
-     (2,22,1),
-     (1,23,1),
-     (2,23,1),
-     (1,24,1),
-     (2,24,1),
-     (1,25,1),
-     (2,25,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,26,1),
-     (2,26,1),
-     (1,27,1),
-     (2,27,1),
-     (1,28,1),
-     (2,28,1),
-     (1,29,1),
-     (2,29,1),
-     (1,30,1),
-     (2,30,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,31,1),
-     (2,31,1),
-     (1,32,1),
-     (2,32,1),
-     (1,33,1),
-     (2,33,1),
-     (1,34,1),
-     (2,34,1),
-     (1,35,1),
-     (2,35,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,36,1),
-     (2,36,1),
-     (1,37,1),
-     (2,37,1),
-     (1,38,1),
-     (2,38,1),
-     (1,39,1),
-     (2,39,1),
-     (1,40,1),
-     (2,40,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,41,1),
-     (2,41,1),
-     (1,42,1),
-     (2,42,1),
-     (1,43,1),
-     (2,43,1),
-     (1,44,1),
-     (2,44,1),
-     (1,45,1),
-     (2,45,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,46,1),
-     (2,46,1),
-     (1,47,1),
-     (2,47,1),
-     (1,48,1),
-     (2,48,1),
-     (1,49,1),
-     (2,49,1),
-     (1,50,1),
-     (2,50,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,51,1),
-     (2,51,1),
-     (1,52,1),
-     (2,52,1),
-     (1,53,1),
-     (2,53,1),
-     (1,54,1),
-     (2,54,1),
-     (1,55,1),
-     (2,55,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,56,1),
-     (2,56,1),
-     (1,57,1),
-     (2,57,1),
-     (1,58,1),
-     (2,58,1),
-     (1,59,1),
-     (2,59,1),
-     (1,60,1),
-     (2,60,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,61,1),
-     (2,61,1),
-     (1,62,1),
-     (2,62,1),
-     (1,63,1),
-     (2,63,1),
-     (1,64,1),
-     (2,64,1),
-     (1,65,1),
-     (2,65,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,66,1),
-     (2,66,1),
-     (1,67,1),
-     (2,67,1),
-     (1,68,1),
-     (2,68,1),
-     (1,69,1),
-     (2,69,1),
-     (1,70,1),
-     (2,70,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,71,1),
-     (2,71,1),
-     (1,72,1),
-     (2,72,1),
-     (1,73,1),
-     (2,73,1),
-     (1,74,1),
-     (2,74,1),
-     (1,75,1),
-     (2,75,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,76,1),
-     (2,76,1),
-     (1,77,1),
-     (2,77,1),
-     (1,78,1),
-     (2,78,1),
-     (1,79,1),
-     (2,79,1),
-     (1,80,1),
-     (2,80,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,81,1),
-     (2,81,1),
-     (1,82,1),
-     (2,82,1),
-     (1,83,1),
-     (2,83,1),
-     (1,84,1),
-     (2,84,1),
-     (1,85,1),
-     (2,85,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,86,1),
-     (2,86,1),
-     (1,87,1),
-     (2,87,1),
-     (1,88,1),
-     (2,88,1),
-     (1,89,1),
-     (2,89,1),
-     (1,90,1),
-     (2,90,1);
-INSERT INTO mask (status_id,fire_id,run_id) VALUES
-     (1,91,1),
-     (2,91,1);
-
-
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (1,0,ST_GeomFromText('POINT (36.59638977050781 -96.40538024902344)')),
-     (1,1,ST_GeomFromText('POINT (36.587406158447266 -96.40538024902344)')),
-     (1,2,ST_GeomFromText('POINT (36.53350830078125 -96.3941650390625)')),
-     (1,3,ST_GeomFromText('POINT (36.53350830078125 -96.3829574584961)')),
-     (1,4,ST_GeomFromText('POINT (36.5424919128418 -96.36053466796875)')),
-     (1,5,ST_GeomFromText('POINT (36.587406158447266 -96.34931945800781)')),
-     (1,6,ST_GeomFromText('POINT (36.59638977050781 -96.34931945800781)')),
-     (1,7,ST_GeomFromText('POINT (36.686222076416016 -96.36053466796875)')),
-     (1,8,ST_GeomFromText('POINT (36.686222076416016 -96.37174224853516)')),
-     (2,0,ST_GeomFromText('POINT (36.49757766723633 -96.30447387695312)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (2,1,ST_GeomFromText('POINT (36.49757766723633 -96.25962829589844)')),
-     (2,2,ST_GeomFromText('POINT (36.71316909790039 -96.27084350585938)')),
-     (3,0,ST_GeomFromText('POINT (46.763092041015625 -111.77608489990234)')),
-     (3,1,ST_GeomFromText('POINT (46.74512481689453 -111.77608489990234)')),
-     (3,2,ST_GeomFromText('POINT (46.74512481689453 -111.73664093017578)')),
-     (3,3,ST_GeomFromText('POINT (46.75410842895508 -111.73664093017578)')),
-     (3,4,ST_GeomFromText('POINT (46.763092041015625 -111.74979400634766)')),
-     (4,0,ST_GeomFromText('POINT (46.64631271362305 -111.6840591430664)')),
-     (4,1,ST_GeomFromText('POINT (46.64631271362305 -111.61832427978516)')),
-     (4,2,ST_GeomFromText('POINT (46.861907958984375 -111.6314697265625)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (5,0,ST_GeomFromText('POINT (41.67237854003906 -92.78606414794922)')),
-     (5,1,ST_GeomFromText('POINT (41.2591552734375 -93.82846069335938)')),
-     (5,2,ST_GeomFromText('POINT (41.25017166137695 -93.82846069335938)')),
-     (5,3,ST_GeomFromText('POINT (39.561344146728516 -93.10491180419922)')),
-     (5,4,ST_GeomFromText('POINT (39.30083465576172 -92.56531524658203)')),
-     (5,5,ST_GeomFromText('POINT (39.30083465576172 -92.55305480957031)')),
-     (5,6,ST_GeomFromText('POINT (42.543739318847656 -89.24190521240234)')),
-     (5,7,ST_GeomFromText('POINT (42.5527229309082 -89.24190521240234)')),
-     (5,8,ST_GeomFromText('POINT (42.5527229309082 -89.26642608642578)')),
-     (6,0,ST_GeomFromText('POINT (42.9030647277832 -91.95214080810547)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (6,1,ST_GeomFromText('POINT (42.87611389160156 -93.5218734741211)')),
-     (6,2,ST_GeomFromText('POINT (42.85814666748047 -93.55866241455078)')),
-     (6,3,ST_GeomFromText('POINT (39.19303894042969 -93.55866241455078)')),
-     (6,4,ST_GeomFromText('POINT (39.175071716308594 -90.41919708251953)')),
-     (6,5,ST_GeomFromText('POINT (39.175071716308594 -90.37014770507812)')),
-     (6,6,ST_GeomFromText('POINT (42.840179443359375 -90.37014770507812)')),
-     (6,7,ST_GeomFromText('POINT (42.85814666748047 -90.38240814208984)')),
-     (7,0,ST_GeomFromText('POINT (33.50639724731445 -82.49718475341797)')),
-     (7,1,ST_GeomFromText('POINT (33.50639724731445 -82.50796508789062)')),
-     (7,2,ST_GeomFromText('POINT (33.49741744995117 -82.50796508789062)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (7,3,ST_GeomFromText('POINT (33.05724334716797 -82.41094970703125)')),
-     (7,4,ST_GeomFromText('POINT (32.6619873046875 -82.27082824707031)')),
-     (7,5,ST_GeomFromText('POINT (32.45537567138672 -82.03368377685547)')),
-     (7,6,ST_GeomFromText('POINT (32.45537567138672 -82.02291107177734)')),
-     (7,7,ST_GeomFromText('POINT (32.91351318359375 -81.75343322753906)')),
-     (7,8,ST_GeomFromText('POINT (32.9224967956543 -81.75343322753906)')),
-     (7,9,ST_GeomFromText('POINT (33.183006286621094 -81.99057006835938)')),
-     (8,0,ST_GeomFromText('POINT (33.44351577758789 -82.36783599853516)')),
-     (8,1,ST_GeomFromText('POINT (33.37165069580078 -82.4001693725586)')),
-     (8,2,ST_GeomFromText('POINT (32.581138610839844 -82.59419250488281)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (8,3,ST_GeomFromText('POINT (32.509273529052734 -82.45407104492188)')),
-     (8,4,ST_GeomFromText('POINT (32.41944122314453 -81.71031951904297)')),
-     (8,5,ST_GeomFromText('POINT (32.41944122314453 -81.66719818115234)')),
-     (8,6,ST_GeomFromText('POINT (33.281822204589844 -81.66719818115234)')),
-     (8,7,ST_GeomFromText('POINT (33.35368728637695 -81.677978515625)')),
-     (8,8,ST_GeomFromText('POINT (33.54233169555664 -82.02291107177734)')),
-     (9,0,ST_GeomFromText('POINT (33.97715759277344 -79.94873809814453)')),
-     (9,1,ST_GeomFromText('POINT (33.65376663208008 -80.4470443725586)')),
-     (9,2,ST_GeomFromText('POINT (33.64478302001953 -80.4470443725586)')),
-     (9,3,ST_GeomFromText('POINT (33.22257614135742 -79.61292266845703)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (9,4,ST_GeomFromText('POINT (33.22257614135742 -79.60209655761719)')),
-     (9,5,ST_GeomFromText('POINT (33.240543365478516 -79.58042907714844)')),
-     (9,6,ST_GeomFromText('POINT (33.60885238647461 -79.5262680053711)')),
-     (9,7,ST_GeomFromText('POINT (33.617835998535156 -79.5262680053711)')),
-     (9,8,ST_GeomFromText('POINT (33.97715759277344 -79.56959533691406)')),
-     (10,0,ST_GeomFromText('POINT (33.968177795410156 -79.88374328613281)')),
-     (10,1,ST_GeomFromText('POINT (33.869361877441406 -80.2520523071289)')),
-     (10,2,ST_GeomFromText('POINT (33.58190155029297 -80.4037094116211)')),
-     (10,3,ST_GeomFromText('POINT (33.22257614135742 -80.26288604736328)')),
-     (10,4,ST_GeomFromText('POINT (33.132747650146484 -79.56959533691406)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (10,5,ST_GeomFromText('POINT (33.132747650146484 -79.5262680053711)')),
-     (10,6,ST_GeomFromText('POINT (33.707664489746094 -79.5262680053711)')),
-     (10,7,ST_GeomFromText('POINT (33.7795295715332 -79.53709411621094)')),
-     (11,0,ST_GeomFromText('POINT (33.76689529418945 -83.67831420898438)')),
-     (11,1,ST_GeomFromText('POINT (33.76689529418945 -83.68914031982422)')),
-     (11,2,ST_GeomFromText('POINT (33.13807678222656 -83.8730697631836)')),
-     (11,3,ST_GeomFromText('POINT (33.129093170166016 -83.8730697631836)')),
-     (11,4,ST_GeomFromText('POINT (33.129093170166016 -83.85143280029297)')),
-     (11,5,ST_GeomFromText('POINT (33.43452072143555 -82.6937255859375)')),
-     (11,6,ST_GeomFromText('POINT (33.443504333496094 -82.6937255859375)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (11,7,ST_GeomFromText('POINT (33.650115966796875 -83.03995513916016)')),
-     (12,0,ST_GeomFromText('POINT (33.6680793762207 -83.8189697265625)')),
-     (12,1,ST_GeomFromText('POINT (33.1650276184082 -83.8838882446289)')),
-     (12,2,ST_GeomFromText('POINT (33.021297454833984 -83.73241424560547)')),
-     (12,3,ST_GeomFromText('POINT (33.021297454833984 -83.68914031982422)')),
-     (12,4,ST_GeomFromText('POINT (33.81180953979492 -83.68914031982422)')),
-     (12,5,ST_GeomFromText('POINT (33.86570739746094 -83.69995880126953)')),
-     (13,0,ST_GeomFromText('POINT (33.884647369384766 -85.56883239746094)')),
-     (13,1,ST_GeomFromText('POINT (33.884647369384766 -85.60134887695312)')),
-     (13,2,ST_GeomFromText('POINT (33.86668014526367 -85.60134887695312)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (13,3,ST_GeomFromText('POINT (33.58820343017578 -85.34123229980469)')),
-     (13,4,ST_GeomFromText('POINT (33.58820343017578 -85.33039855957031)')),
-     (13,5,ST_GeomFromText('POINT (33.59718704223633 -85.33039855957031)')),
-     (14,0,ST_GeomFromText('POINT (33.76786422729492 -85.39542388916016)')),
-     (14,1,ST_GeomFromText('POINT (33.480403900146484 -85.39542388916016)')),
-     (14,2,ST_GeomFromText('POINT (33.480403900146484 -85.3520736694336)')),
-     (14,3,ST_GeomFromText('POINT (33.76786422729492 -85.3520736694336)')),
-     (14,4,ST_GeomFromText('POINT (33.98345947265625 -85.36290740966797)')),
-     (15,0,ST_GeomFromText('POINT (34.251277923583984 -82.29674530029297)')),
-     (15,1,ST_GeomFromText('POINT (34.251277923583984 -82.32936096191406)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (15,2,ST_GeomFromText('POINT (33.90991973876953 -82.53591918945312)')),
-     (15,3,ST_GeomFromText('POINT (33.900936126708984 -82.53591918945312)')),
-     (15,4,ST_GeomFromText('POINT (33.73923873901367 -82.05757904052734)')),
-     (15,5,ST_GeomFromText('POINT (33.73923873901367 -82.04670715332031)')),
-     (15,6,ST_GeomFromText('POINT (34.0626335144043 -81.84014892578125)')),
-     (15,7,ST_GeomFromText('POINT (34.07161331176758 -81.84014892578125)')),
-     (16,0,ST_GeomFromText('POINT (34.17042922973633 -82.65550231933594)')),
-     (16,1,ST_GeomFromText('POINT (33.88296890258789 -82.6446304321289)')),
-     (16,2,ST_GeomFromText('POINT (33.81110382080078 -82.48155975341797)')),
-     (16,3,ST_GeomFromText('POINT (33.72127151489258 -81.76405334472656)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (16,4,ST_GeomFromText('POINT (33.72127151489258 -81.72056579589844)')),
-     (16,5,ST_GeomFromText('POINT (34.008731842041016 -81.72056579589844)')),
-     (16,6,ST_GeomFromText('POINT (34.080596923828125 -81.73143768310547)')),
-     (16,7,ST_GeomFromText('POINT (34.26924133300781 -82.0793228149414)')),
-     (17,0,ST_GeomFromText('POINT (34.424137115478516 -80.9249038696289)')),
-     (17,1,ST_GeomFromText('POINT (34.41515350341797 -80.9249038696289)')),
-     (17,2,ST_GeomFromText('POINT (34.0198974609375 -80.87035369873047)')),
-     (17,3,ST_GeomFromText('POINT (34.0198974609375 -80.8485336303711)')),
-     (17,4,ST_GeomFromText('POINT (34.23549270629883 -80.30302429199219)')),
-     (17,5,ST_GeomFromText('POINT (34.244476318359375 -80.30302429199219)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (17,6,ST_GeomFromText('POINT (34.496002197265625 -80.39030456542969)')),
-     (17,7,ST_GeomFromText('POINT (34.50498580932617 -80.40121459960938)')),
-     (17,8,ST_GeomFromText('POINT (34.567867279052734 -80.54305267333984)')),
-     (17,9,ST_GeomFromText('POINT (34.567867279052734 -80.55396270751953)')),
-     (18,0,ST_GeomFromText('POINT (34.41515350341797 -80.90308380126953)')),
-     (18,1,ST_GeomFromText('POINT (34.16362762451172 -80.90308380126953)')),
-     (18,2,ST_GeomFromText('POINT (34.0198974609375 -80.71761322021484)')),
-     (18,3,ST_GeomFromText('POINT (34.0198974609375 -80.6739730834961)')),
-     (18,4,ST_GeomFromText('POINT (34.451087951660156 -80.6739730834961)')),
-     (18,5,ST_GeomFromText('POINT (34.55888366699219 -80.68488311767578)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (19,0,ST_GeomFromText('POINT (34.34176254272461 -78.4454574584961)')),
-     (19,1,ST_GeomFromText('POINT (34.08125305175781 -78.0102310180664)')),
-     (19,2,ST_GeomFromText('POINT (34.072269439697266 -77.97759246826172)')),
-     (19,3,ST_GeomFromText('POINT (34.072269439697266 -77.96670532226562)')),
-     (19,4,ST_GeomFromText('POINT (34.08125305175781 -77.96670532226562)')),
-     (19,5,ST_GeomFromText('POINT (34.09023666381836 -77.97759246826172)')),
-     (20,0,ST_GeomFromText('POINT (34.08125305175781 -78.43457794189453)')),
-     (20,1,ST_GeomFromText('POINT (34.08125305175781 -78.2822494506836)')),
-     (20,2,ST_GeomFromText('POINT (34.22498321533203 -78.27136993408203)')),
-     (20,3,ST_GeomFromText('POINT (34.33277893066406 -78.2822494506836)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (21,0,ST_GeomFromText('POINT (35.07324981689453 -79.78032684326172)')),
-     (21,1,ST_GeomFromText('POINT (35.07324981689453 -79.80228424072266)')),
-     (21,2,ST_GeomFromText('POINT (34.884605407714844 -80.08776092529297)')),
-     (21,3,ST_GeomFromText('POINT (34.8756217956543 -80.08776092529297)')),
-     (21,4,ST_GeomFromText('POINT (34.84867477416992 -79.30819702148438)')),
-     (21,5,ST_GeomFromText('POINT (34.84867477416992 -79.2862319946289)')),
-     (21,6,ST_GeomFromText('POINT (34.85765838623047 -79.2862319946289)')),
-     (22,0,ST_GeomFromText('POINT (34.99240493774414 -80.15364074707031)')),
-     (22,1,ST_GeomFromText('POINT (34.92053985595703 -79.96697998046875)')),
-     (22,2,ST_GeomFromText('POINT (34.83070755004883 -79.38505554199219)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (22,3,ST_GeomFromText('POINT (34.83070755004883 -79.22035217285156)')),
-     (22,4,ST_GeomFromText('POINT (34.90257263183594 -79.23133850097656)')),
-     (22,5,ST_GeomFromText('POINT (35.091217041015625 -79.58268737792969)')),
-     (23,0,ST_GeomFromText('POINT (35.77831268310547 -81.8923568725586)')),
-     (23,1,ST_GeomFromText('POINT (35.76933288574219 -81.8923568725586)')),
-     (23,2,ST_GeomFromText('POINT (35.55373764038086 -81.74784088134766)')),
-     (23,3,ST_GeomFromText('POINT (35.55373764038086 -81.72560119628906)')),
-     (23,4,ST_GeomFromText('POINT (36.05678939819336 -81.14752960205078)')),
-     (23,5,ST_GeomFromText('POINT (36.065773010253906 -81.14752960205078)')),
-     (23,6,ST_GeomFromText('POINT (36.065773010253906 -81.15864562988281)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (24,0,ST_GeomFromText('POINT (36.083740234375 -81.41433715820312)')),
-     (24,1,ST_GeomFromText('POINT (35.98492431640625 -81.77007293701172)')),
-     (24,2,ST_GeomFromText('POINT (35.91305923461914 -81.80342102050781)')),
-     (24,3,ST_GeomFromText('POINT (35.62560272216797 -81.80342102050781)')),
-     (24,4,ST_GeomFromText('POINT (35.535770416259766 -81.09194946289062)')),
-     (24,5,ST_GeomFromText('POINT (35.535770416259766 -81.04747772216797)')),
-     (24,6,ST_GeomFromText('POINT (35.8232307434082 -81.04747772216797)')),
-     (24,7,ST_GeomFromText('POINT (35.89509582519531 -81.05859375)')),
-     (25,0,ST_GeomFromText('POINT (27.15709114074707 -81.14703369140625)')),
-     (25,1,ST_GeomFromText('POINT (26.582172393798828 -81.6739501953125)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (25,2,ST_GeomFromText('POINT (26.57318878173828 -81.6739501953125)')),
-     (25,3,ST_GeomFromText('POINT (26.42047691345215 -80.99503326416016)')),
-     (25,4,ST_GeomFromText('POINT (26.42047691345215 -80.98490142822266)')),
-     (25,5,ST_GeomFromText('POINT (26.546239852905273 -80.51878356933594)')),
-     (25,6,ST_GeomFromText('POINT (26.680986404418945 -80.4782485961914)')),
-     (25,7,ST_GeomFromText('POINT (27.543365478515625 -80.71131134033203)')),
-     (25,8,ST_GeomFromText('POINT (27.56133270263672 -80.73157501220703)')),
-     (25,9,ST_GeomFromText('POINT (27.56133270263672 -80.74171447753906)')),
-     (26,0,ST_GeomFromText('POINT (27.336753845214844 -81.68408203125)')),
-     (26,1,ST_GeomFromText('POINT (26.851665496826172 -81.59288787841797)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (26,2,ST_GeomFromText('POINT (26.42047691345215 -81.5016860961914)')),
-     (26,3,ST_GeomFromText('POINT (26.42047691345215 -81.4510269165039)')),
-     (26,4,ST_GeomFromText('POINT (27.498449325561523 -81.4510269165039)')),
-     (26,5,ST_GeomFromText('POINT (27.552349090576172 -81.4611587524414)')),
-     (27,0,ST_GeomFromText('POINT (27.570890426635742 -82.04180145263672)')),
-     (27,1,ST_GeomFromText('POINT (27.570890426635742 -82.05194854736328)')),
-     (27,2,ST_GeomFromText('POINT (27.561908721923828 -82.05194854736328)')),
-     (27,3,ST_GeomFromText('POINT (27.25648307800293 -81.89976501464844)')),
-     (27,4,ST_GeomFromText('POINT (27.25648307800293 -81.88961791992188)')),
-     (27,5,ST_GeomFromText('POINT (27.50800895690918 -81.73743438720703)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (27,6,ST_GeomFromText('POINT (27.516992568969727 -81.73743438720703)')),
-     (28,0,ST_GeomFromText('POINT (27.445127487182617 -81.82874298095703)')),
-     (28,1,ST_GeomFromText('POINT (27.157669067382812 -81.82874298095703)')),
-     (28,2,ST_GeomFromText('POINT (27.157669067382812 -81.78816223144531)')),
-     (28,3,ST_GeomFromText('POINT (27.445127487182617 -81.78816223144531)')),
-     (28,4,ST_GeomFromText('POINT (27.660722732543945 -81.79830932617188)')),
-     (29,0,ST_GeomFromText('POINT (27.86079216003418 -82.50533294677734)')),
-     (29,1,ST_GeomFromText('POINT (27.86079216003418 -82.5155029296875)')),
-     (29,2,ST_GeomFromText('POINT (27.851810455322266 -82.5155029296875)')),
-     (29,3,ST_GeomFromText('POINT (27.833843231201172 -82.50533294677734)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (29,4,ST_GeomFromText('POINT (27.636215209960938 -82.27157592773438)')),
-     (29,5,ST_GeomFromText('POINT (27.636215209960938 -82.26141357421875)')),
-     (29,6,ST_GeomFromText('POINT (27.645198822021484 -82.26141357421875)')),
-     (30,0,ST_GeomFromText('POINT (27.86079216003418 -82.53582763671875)')),
-     (30,1,ST_GeomFromText('POINT (27.636215209960938 -82.34272003173828)')),
-     (30,2,ST_GeomFromText('POINT (27.636215209960938 -82.28173828125)')),
-     (30,3,ST_GeomFromText('POINT (27.851810455322266 -82.29190063476562)')),
-     (31,0,ST_GeomFromText('POINT (28.962905883789062 -82.29241943359375)')),
-     (31,1,ST_GeomFromText('POINT (28.953922271728516 -82.29241943359375)')),
-     (31,2,ST_GeomFromText('POINT (28.837142944335938 -82.24101257324219)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (31,3,ST_GeomFromText('POINT (28.837142944335938 -82.23072814941406)')),
-     (31,4,ST_GeomFromText('POINT (29.097652435302734 -82.23072814941406)')),
-     (31,5,ST_GeomFromText('POINT (29.097652435302734 -82.24101257324219)')),
-     (32,0,ST_GeomFromText('POINT (29.070703506469727 -82.24101257324219)')),
-     (32,1,ST_GeomFromText('POINT (28.8551082611084 -82.3232650756836)')),
-     (32,2,ST_GeomFromText('POINT (28.8551082611084 -82.14847564697266)')),
-     (32,3,ST_GeomFromText('POINT (29.070703506469727 -82.15876007080078)')),
-     (33,0,ST_GeomFromText('POINT (30.20110511779785 -82.41416931152344)')),
-     (33,1,ST_GeomFromText('POINT (30.192123413085938 -82.41416931152344)')),
-     (33,2,ST_GeomFromText('POINT (29.733983993530273 -81.99715423583984)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (33,3,ST_GeomFromText('POINT (29.725000381469727 -81.98672485351562)')),
-     (33,4,ST_GeomFromText('POINT (29.725000381469727 -81.97630310058594)')),
-     (33,5,ST_GeomFromText('POINT (30.407716751098633 -81.9241714477539)')),
-     (33,6,ST_GeomFromText('POINT (30.41670036315918 -81.9241714477539)')),
-     (33,7,ST_GeomFromText('POINT (30.41670036315918 -81.93460083007812)')),
-     (34,0,ST_GeomFromText('POINT (30.192123413085938 -82.40374755859375)')),
-     (34,1,ST_GeomFromText('POINT (29.653135299682617 -82.26821899414062)')),
-     (34,2,ST_GeomFromText('POINT (29.653135299682617 -82.22651672363281)')),
-     (34,3,ST_GeomFromText('POINT (30.371784210205078 -82.22651672363281)')),
-     (34,4,ST_GeomFromText('POINT (30.479581832885742 -82.2369384765625)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (35,0,ST_GeomFromText('POINT (30.0322322845459 -83.06024169921875)')),
-     (35,1,ST_GeomFromText('POINT (30.02324867248535 -83.06024169921875)')),
-     (35,2,ST_GeomFromText('POINT (29.942401885986328 -82.8629150390625)')),
-     (35,3,ST_GeomFromText('POINT (29.93341827392578 -82.7071304321289)')),
-     (35,4,ST_GeomFromText('POINT (29.93341827392578 -82.69674682617188)')),
-     (35,5,ST_GeomFromText('POINT (29.942401885986328 -82.69674682617188)')),
-     (35,6,ST_GeomFromText('POINT (30.0322322845459 -82.81098175048828)')),
-     (36,0,ST_GeomFromText('POINT (29.996299743652344 -82.98754119873047)')),
-     (36,1,ST_GeomFromText('POINT (29.852569580078125 -82.97715759277344)')),
-     (36,2,ST_GeomFromText('POINT (29.852569580078125 -82.93561553955078)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (36,3,ST_GeomFromText('POINT (29.996299743652344 -82.93561553955078)')),
-     (36,4,ST_GeomFromText('POINT (30.104097366333008 -82.94599914550781)')),
-     (37,0,ST_GeomFromText('POINT (30.58103370666504 -84.45137786865234)')),
-     (37,1,ST_GeomFromText('POINT (30.34747314453125 -84.53492736816406)')),
-     (37,2,ST_GeomFromText('POINT (30.338489532470703 -84.53492736816406)')),
-     (37,3,ST_GeomFromText('POINT (30.311540603637695 -84.52448272705078)')),
-     (37,4,ST_GeomFromText('POINT (30.18577766418457 -84.36783599853516)')),
-     (37,5,ST_GeomFromText('POINT (30.18577766418457 -84.35739135742188)')),
-     (37,6,ST_GeomFromText('POINT (30.194759368896484 -84.35739135742188)')),
-     (37,7,ST_GeomFromText('POINT (30.58103370666504 -84.4409408569336)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (38,0,ST_GeomFromText('POINT (30.338489532470703 -84.55581665039062)')),
-     (38,1,ST_GeomFromText('POINT (30.122894287109375 -84.37828063964844)')),
-     (38,2,ST_GeomFromText('POINT (30.122894287109375 -84.33650970458984)')),
-     (38,3,ST_GeomFromText('POINT (30.410354614257812 -84.33650970458984)')),
-     (38,4,ST_GeomFromText('POINT (30.62594985961914 -84.3469467163086)')),
-     (39,0,ST_GeomFromText('POINT (30.936634063720703 -83.98091125488281)')),
-     (39,1,ST_GeomFromText('POINT (30.936634063720703 -83.99137878417969)')),
-     (39,2,ST_GeomFromText('POINT (30.90070152282715 -84.17991638183594)')),
-     (39,3,ST_GeomFromText('POINT (30.703073501586914 -84.29512786865234)')),
-     (39,4,ST_GeomFromText('POINT (30.694089889526367 -84.29512786865234)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (39,5,ST_GeomFromText('POINT (30.59527587890625 -84.21133422851562)')),
-     (39,6,ST_GeomFromText('POINT (30.397647857666016 -83.9599609375)')),
-     (39,7,ST_GeomFromText('POINT (30.38866424560547 -83.81332397460938)')),
-     (39,8,ST_GeomFromText('POINT (30.38866424560547 -83.80284881591797)')),
-     (39,9,ST_GeomFromText('POINT (30.532394409179688 -83.63526153564453)')),
-     (39,10,ST_GeomFromText('POINT (30.658157348632812 -83.64573669433594)')),
-     (39,11,ST_GeomFromText('POINT (30.855785369873047 -83.82379913330078)')),
-     (40,0,ST_GeomFromText('POINT (30.819852828979492 -84.23228454589844)')),
-     (40,1,ST_GeomFromText('POINT (30.64019203186035 -84.24275970458984)')),
-     (40,2,ST_GeomFromText('POINT (30.38866424560547 -84.22180938720703)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (40,3,ST_GeomFromText('POINT (30.38866424560547 -84.0228042602539)')),
-     (40,4,ST_GeomFromText('POINT (30.532394409179688 -84.0228042602539)')),
-     (40,5,ST_GeomFromText('POINT (30.927650451660156 -84.03327941894531)')),
-     (41,0,ST_GeomFromText('POINT (30.875707626342773 -86.9504623413086)')),
-     (41,1,ST_GeomFromText('POINT (30.857742309570312 -86.97142028808594)')),
-     (41,2,ST_GeomFromText('POINT (30.848758697509766 -86.97142028808594)')),
-     (41,3,ST_GeomFromText('POINT (30.83977508544922 -86.92949676513672)')),
-     (41,4,ST_GeomFromText('POINT (30.83977508544922 -86.91902160644531)')),
-     (41,5,ST_GeomFromText('POINT (30.866724014282227 -86.91902160644531)')),
-     (41,6,ST_GeomFromText('POINT (30.875707626342773 -86.92949676513672)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (42,0,ST_GeomFromText('POINT (30.74994468688965 -86.88758087158203)')),
-     (42,1,ST_GeomFromText('POINT (30.74994468688965 -86.8351821899414)')),
-     (42,2,ST_GeomFromText('POINT (30.965538024902344 -86.84565734863281)')),
-     (43,0,ST_GeomFromText('POINT (31.004812240600586 -86.99030303955078)')),
-     (43,1,ST_GeomFromText('POINT (30.986846923828125 -86.99030303955078)')),
-     (43,2,ST_GeomFromText('POINT (30.986846923828125 -86.96930694580078)')),
-     (43,3,ST_GeomFromText('POINT (31.013795852661133 -86.91682434082031)')),
-     (43,4,ST_GeomFromText('POINT (31.02277946472168 -86.91682434082031)')),
-     (43,5,ST_GeomFromText('POINT (31.031761169433594 -86.92732238769531)')),
-     (43,6,ST_GeomFromText('POINT (31.031761169433594 -86.93782043457031)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (44,0,ST_GeomFromText('POINT (30.897014617919922 -86.88533782958984)')),
-     (44,1,ST_GeomFromText('POINT (30.897014617919922 -86.84335327148438)')),
-     (44,2,ST_GeomFromText('POINT (31.11260986328125 -86.85384368896484)')),
-     (45,0,ST_GeomFromText('POINT (31.260679244995117 -86.99446868896484)')),
-     (45,1,ST_GeomFromText('POINT (31.260679244995117 -87.0155029296875)')),
-     (45,2,ST_GeomFromText('POINT (31.251697540283203 -87.0260238647461)')),
-     (45,3,ST_GeomFromText('POINT (31.242713928222656 -87.0260238647461)')),
-     (45,4,ST_GeomFromText('POINT (31.179832458496094 -86.91030883789062)')),
-     (45,5,ST_GeomFromText('POINT (31.179832458496094 -86.88926696777344)')),
-     (45,6,ST_GeomFromText('POINT (31.188814163208008 -86.88926696777344)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (46,0,ST_GeomFromText('POINT (31.107967376708984 -86.88926696777344)')),
-     (46,1,ST_GeomFromText('POINT (31.107967376708984 -86.8471908569336)')),
-     (46,2,ST_GeomFromText('POINT (31.32356071472168 -86.85770416259766)')),
-     (47,0,ST_GeomFromText('POINT (31.38298797607422 -84.51142883300781)')),
-     (47,1,ST_GeomFromText('POINT (31.38298797607422 -84.52195739746094)')),
-     (47,2,ST_GeomFromText('POINT (31.248241424560547 -84.52195739746094)')),
-     (47,3,ST_GeomFromText('POINT (31.248241424560547 -84.50090026855469)')),
-     (47,4,ST_GeomFromText('POINT (31.320106506347656 -84.40612030029297)')),
-     (47,5,ST_GeomFromText('POINT (31.32908821105957 -84.40612030029297)')),
-     (48,0,ST_GeomFromText('POINT (31.203325271606445 -84.39559173583984)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (48,1,ST_GeomFromText('POINT (31.203325271606445 -84.35346984863281)')),
-     (48,2,ST_GeomFromText('POINT (31.418920516967773 -84.36399841308594)')),
-     (49,0,ST_GeomFromText('POINT (31.464441299438477 -84.29930877685547)')),
-     (49,1,ST_GeomFromText('POINT (31.45545768737793 -84.29930877685547)')),
-     (49,2,ST_GeomFromText('POINT (31.419525146484375 -84.25711822509766)')),
-     (49,3,ST_GeomFromText('POINT (31.419525146484375 -84.24657440185547)')),
-     (49,4,ST_GeomFromText('POINT (31.446474075317383 -84.20439147949219)')),
-     (49,5,ST_GeomFromText('POINT (31.47342300415039 -84.1727523803711)')),
-     (49,6,ST_GeomFromText('POINT (31.491390228271484 -84.1727523803711)')),
-     (49,7,ST_GeomFromText('POINT (31.491390228271484 -84.19384765625)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (50,0,ST_GeomFromText('POINT (31.33867645263672 -84.1622085571289)')),
-     (50,1,ST_GeomFromText('POINT (31.33867645263672 -84.12002563476562)')),
-     (50,2,ST_GeomFromText('POINT (31.554271697998047 -84.13056945800781)')),
-     (51,0,ST_GeomFromText('POINT (31.54376220703125 -81.69816589355469)')),
-     (51,1,ST_GeomFromText('POINT (31.52579689025879 -81.69816589355469)')),
-     (51,2,ST_GeomFromText('POINT (31.52579689025879 -81.67705535888672)')),
-     (51,3,ST_GeomFromText('POINT (31.54376220703125 -81.5820541381836)')),
-     (51,4,ST_GeomFromText('POINT (31.552745819091797 -81.5820541381836)')),
-     (51,5,ST_GeomFromText('POINT (31.552745819091797 -81.60316467285156)')),
-     (52,0,ST_GeomFromText('POINT (31.426982879638672 -81.57149505615234)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (52,1,ST_GeomFromText('POINT (31.426982879638672 -81.5292739868164)')),
-     (52,2,ST_GeomFromText('POINT (31.642576217651367 -81.53982543945312)')),
-     (53,0,ST_GeomFromText('POINT (32.21098327636719 -85.61615753173828)')),
-     (53,1,ST_GeomFromText('POINT (32.20199966430664 -85.61615753173828)')),
-     (53,2,ST_GeomFromText('POINT (32.16606903076172 -85.52044677734375)')),
-     (53,3,ST_GeomFromText('POINT (32.16606903076172 -85.50981140136719)')),
-     (53,4,ST_GeomFromText('POINT (32.255897521972656 -85.49917602539062)')),
-     (53,5,ST_GeomFromText('POINT (32.2648811340332 -85.49917602539062)')),
-     (53,6,ST_GeomFromText('POINT (32.2648811340332 -85.50981140136719)')),
-     (54,0,ST_GeomFromText('POINT (32.10318374633789 -85.4885482788086)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (54,1,ST_GeomFromText('POINT (32.10318374633789 -85.44600677490234)')),
-     (54,2,ST_GeomFromText('POINT (32.31877899169922 -85.4566421508789)')),
-     (55,0,ST_GeomFromText('POINT (32.61452865600586 -81.31324768066406)')),
-     (55,1,ST_GeomFromText('POINT (32.60554504394531 -81.31324768066406)')),
-     (55,2,ST_GeomFromText('POINT (32.45283508300781 -81.05713653564453)')),
-     (55,3,ST_GeomFromText('POINT (32.443851470947266 -80.85438537597656)')),
-     (55,4,ST_GeomFromText('POINT (32.623512268066406 -80.5235824584961)')),
-     (55,5,ST_GeomFromText('POINT (32.623512268066406 -80.60894775390625)')),
-     (56,0,ST_GeomFromText('POINT (32.659446716308594 -80.81169891357422)')),
-     (56,1,ST_GeomFromText('POINT (32.560630798339844 -81.15318298339844)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (56,2,ST_GeomFromText('POINT (32.488765716552734 -81.21720886230469)')),
-     (56,3,ST_GeomFromText('POINT (32.39893341064453 -80.50223541259766)')),
-     (56,4,ST_GeomFromText('POINT (32.39893341064453 -80.45954895019531)')),
-     (56,5,ST_GeomFromText('POINT (32.47079849243164 -80.47022247314453)')),
-     (57,0,ST_GeomFromText('POINT (33.005027770996094 -81.41090393066406)')),
-     (57,1,ST_GeomFromText('POINT (32.99604415893555 -81.421630859375)')),
-     (57,2,ST_GeomFromText('POINT (32.987060546875 -81.421630859375)')),
-     (57,3,ST_GeomFromText('POINT (32.64570236206055 -81.38945770263672)')),
-     (57,4,ST_GeomFromText('POINT (32.63671875 -81.37873840332031)')),
-     (57,5,ST_GeomFromText('POINT (32.63671875 -81.36801147460938)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (57,6,ST_GeomFromText('POINT (32.95112609863281 -81.21788024902344)')),
-     (57,7,ST_GeomFromText('POINT (32.96010971069336 -81.21788024902344)')),
-     (58,0,ST_GeomFromText('POINT (32.78044891357422 -81.38945770263672)')),
-     (58,1,ST_GeomFromText('POINT (32.56485366821289 -81.25005340576172)')),
-     (58,2,ST_GeomFromText('POINT (32.56485366821289 -81.2071533203125)')),
-     (58,3,ST_GeomFromText('POINT (32.85231399536133 -81.2071533203125)')),
-     (58,4,ST_GeomFromText('POINT (33.067909240722656 -81.21788024902344)')),
-     (59,0,ST_GeomFromText('POINT (33.244102478027344 -85.02330780029297)')),
-     (59,1,ST_GeomFromText('POINT (33.19020462036133 -85.02330780029297)')),
-     (59,2,ST_GeomFromText('POINT (32.848846435546875 -84.95880126953125)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (59,3,ST_GeomFromText('POINT (32.848846435546875 -84.94804382324219)')),
-     (59,4,ST_GeomFromText('POINT (32.85783004760742 -84.4964599609375)')),
-     (59,5,ST_GeomFromText('POINT (32.86681365966797 -84.4964599609375)')),
-     (59,6,ST_GeomFromText('POINT (33.25308609008789 -84.67924499511719)')),
-     (60,0,ST_GeomFromText('POINT (33.20817184448242 -84.96955108642578)')),
-     (60,1,ST_GeomFromText('POINT (33.0644416809082 -84.96955108642578)')),
-     (60,2,ST_GeomFromText('POINT (32.776981353759766 -84.86203002929688)')),
-     (60,3,ST_GeomFromText('POINT (32.776981353759766 -84.81902313232422)')),
-     (60,4,ST_GeomFromText('POINT (33.20817184448242 -84.81902313232422)')),
-     (60,5,ST_GeomFromText('POINT (33.31596755981445 -84.82977294921875)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (61,0,ST_GeomFromText('POINT (33.34145736694336 -87.52497863769531)')),
-     (61,1,ST_GeomFromText('POINT (32.88331604003906 -88.063232421875)')),
-     (61,2,ST_GeomFromText('POINT (32.874332427978516 -88.063232421875)')),
-     (61,3,ST_GeomFromText('POINT (32.68568801879883 -87.60033416748047)')),
-     (61,4,ST_GeomFromText('POINT (32.68568801879883 -87.57880401611328)')),
-     (61,5,ST_GeomFromText('POINT (33.089927673339844 -86.8037109375)')),
-     (61,6,ST_GeomFromText('POINT (33.09891128540039 -86.8037109375)')),
-     (62,0,ST_GeomFromText('POINT (33.37738800048828 -87.8802261352539)')),
-     (62,1,ST_GeomFromText('POINT (32.802467346191406 -87.8909912109375)')),
-     (62,2,ST_GeomFromText('POINT (32.586875915527344 -87.8909912109375)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (62,3,ST_GeomFromText('POINT (32.586875915527344 -87.83716583251953)')),
-     (62,4,ST_GeomFromText('POINT (33.37738800048828 -87.83716583251953)')),
-     (62,5,ST_GeomFromText('POINT (33.4312858581543 -87.84793090820312)')),
-     (63,0,ST_GeomFromText('POINT (47.7477912902832 -110.83740997314453)')),
-     (63,1,ST_GeomFromText('POINT (47.7477912902832 -110.85078430175781)')),
-     (63,2,ST_GeomFromText('POINT (47.70287322998047 -110.89090728759766)')),
-     (63,3,ST_GeomFromText('POINT (47.58609390258789 -110.87753295898438)')),
-     (63,4,ST_GeomFromText('POINT (47.613040924072266 -110.79728698730469)')),
-     (63,5,ST_GeomFromText('POINT (47.69388961791992 -110.6635513305664)')),
-     (63,6,ST_GeomFromText('POINT (47.70287322998047 -110.6635513305664)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (63,7,ST_GeomFromText('POINT (47.738807678222656 -110.73042297363281)')),
-     (64,0,ST_GeomFromText('POINT (47.5501594543457 -110.71704864501953)')),
-     (64,1,ST_GeomFromText('POINT (47.5501594543457 -110.63680267333984)')),
-     (64,2,ST_GeomFromText('POINT (47.76575469970703 -110.65017700195312)')),
-     (65,0,ST_GeomFromText('POINT (36.71512985229492 -92.59041595458984)')),
-     (65,1,ST_GeomFromText('POINT (36.71512985229492 -92.60163879394531)')),
-     (65,2,ST_GeomFromText('POINT (36.39173889160156 -92.70265197753906)')),
-     (65,3,ST_GeomFromText('POINT (36.382755279541016 -92.70265197753906)')),
-     (65,4,ST_GeomFromText('POINT (36.382755279541016 -92.6914291381836)')),
-     (65,5,ST_GeomFromText('POINT (36.526485443115234 -92.36595153808594)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (65,6,ST_GeomFromText('POINT (36.535465240478516 -92.35472869873047)')),
-     (65,7,ST_GeomFromText('POINT (36.54444885253906 -92.35472869873047)')),
-     (66,0,ST_GeomFromText('POINT (36.58038330078125 -92.46695709228516)')),
-     (66,1,ST_GeomFromText('POINT (36.29292297363281 -92.45573425292969)')),
-     (66,2,ST_GeomFromText('POINT (36.29292297363281 -92.41084289550781)')),
-     (66,3,ST_GeomFromText('POINT (36.58038330078125 -92.41084289550781)')),
-     (66,4,ST_GeomFromText('POINT (36.79597854614258 -92.42206573486328)')),
-     (67,0,ST_GeomFromText('POINT (37.420982360839844 -96.83915710449219)')),
-     (67,1,ST_GeomFromText('POINT (37.3940315246582 -96.83915710449219)')),
-     (67,2,ST_GeomFromText('POINT (37.3940315246582 -96.82781219482422)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (67,3,ST_GeomFromText('POINT (37.4119987487793 -96.79376983642578)')),
-     (67,4,ST_GeomFromText('POINT (37.61861038208008 -96.6576156616211)')),
-     (67,5,ST_GeomFromText('POINT (37.63657760620117 -96.6576156616211)')),
-     (67,6,ST_GeomFromText('POINT (37.627593994140625 -96.66896057128906)')),
-     (68,0,ST_GeomFromText('POINT (37.61861038208008 -96.86185455322266)')),
-     (68,1,ST_GeomFromText('POINT (37.40301513671875 -96.87319946289062)')),
-     (68,2,ST_GeomFromText('POINT (37.40301513671875 -96.62357330322266)')),
-     (68,3,ST_GeomFromText('POINT (37.61861038208008 -96.63491821289062)')),
-     (69,0,ST_GeomFromText('POINT (37.80640411376953 -96.40658569335938)')),
-     (69,1,ST_GeomFromText('POINT (37.80640411376953 -96.41796875)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (69,2,ST_GeomFromText('POINT (37.7884407043457 -96.41796875)')),
-     (69,3,ST_GeomFromText('POINT (37.70759201049805 -96.2016830444336)')),
-     (69,4,ST_GeomFromText('POINT (37.70759201049805 -96.19029998779297)')),
-     (69,5,ST_GeomFromText('POINT (37.716575622558594 -96.19029998779297)')),
-     (70,0,ST_GeomFromText('POINT (37.86030197143555 -96.41796875)')),
-     (70,1,ST_GeomFromText('POINT (37.644710540771484 -96.22444915771484)')),
-     (70,2,ST_GeomFromText('POINT (37.644710540771484 -96.17891693115234)')),
-     (70,3,ST_GeomFromText('POINT (37.86030197143555 -96.19029998779297)')),
-     (71,0,ST_GeomFromText('POINT (38.74538040161133 -97.48151397705078)')),
-     (71,1,ST_GeomFromText('POINT (38.74538040161133 -97.4930419921875)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (71,2,ST_GeomFromText('POINT (38.73639678955078 -97.4930419921875)')),
-     (71,3,ST_GeomFromText('POINT (38.63758087158203 -97.22779846191406)')),
-     (71,4,ST_GeomFromText('POINT (38.63758087158203 -97.21627044677734)')),
-     (71,5,ST_GeomFromText('POINT (38.64656448364258 -97.2047348022461)')),
-     (71,6,ST_GeomFromText('POINT (38.655548095703125 -97.2047348022461)')),
-     (71,7,ST_GeomFromText('POINT (38.66453170776367 -97.22779846191406)')),
-     (72,0,ST_GeomFromText('POINT (38.799278259277344 -97.46997833251953)')),
-     (72,1,ST_GeomFromText('POINT (38.583683013916016 -97.27393341064453)')),
-     (72,2,ST_GeomFromText('POINT (38.583683013916016 -97.22779846191406)')),
-     (72,3,ST_GeomFromText('POINT (38.799278259277344 -97.23933410644531)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (73,0,ST_GeomFromText('POINT (39.686283111572266 -96.82418060302734)')),
-     (73,1,ST_GeomFromText('POINT (39.677303314208984 -96.84757232666016)')),
-     (73,2,ST_GeomFromText('POINT (39.66831970214844 -96.84757232666016)')),
-     (73,3,ST_GeomFromText('POINT (39.6413688659668 -96.37979125976562)')),
-     (73,4,ST_GeomFromText('POINT (39.6413688659668 -96.36809539794922)')),
-     (73,5,ST_GeomFromText('POINT (39.650352478027344 -96.35640716552734)')),
-     (73,6,ST_GeomFromText('POINT (39.677303314208984 -96.35640716552734)')),
-     (73,7,ST_GeomFromText('POINT (39.70425033569336 -96.48504638671875)')),
-     (73,8,ST_GeomFromText('POINT (39.70425033569336 -96.49674224853516)')),
-     (74,0,ST_GeomFromText('POINT (39.686283111572266 -96.70723724365234)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (74,1,ST_GeomFromText('POINT (39.54255676269531 -96.70723724365234)')),
-     (74,2,ST_GeomFromText('POINT (39.54255676269531 -96.66046142578125)')),
-     (74,3,ST_GeomFromText('POINT (39.686283111572266 -96.66046142578125)')),
-     (74,4,ST_GeomFromText('POINT (39.79408264160156 -96.67215728759766)')),
-     (75,0,ST_GeomFromText('POINT (39.728023529052734 -97.68144989013672)')),
-     (75,1,ST_GeomFromText('POINT (39.70107650756836 -97.68144989013672)')),
-     (75,2,ST_GeomFromText('POINT (39.70107650756836 -97.65794372558594)')),
-     (75,3,ST_GeomFromText('POINT (40.006500244140625 -97.29360961914062)')),
-     (75,4,ST_GeomFromText('POINT (40.01548385620117 -97.29360961914062)')),
-     (75,5,ST_GeomFromText('POINT (40.02446746826172 -97.30536651611328)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (75,6,ST_GeomFromText('POINT (40.02446746826172 -97.3171157836914)')),
-     (76,0,ST_GeomFromText('POINT (40.02446746826172 -97.59918212890625)')),
-     (76,1,ST_GeomFromText('POINT (39.59327697753906 -97.59918212890625)')),
-     (76,2,ST_GeomFromText('POINT (39.59327697753906 -97.55216979980469)')),
-     (76,3,ST_GeomFromText('POINT (40.02446746826172 -97.55216979980469)')),
-     (76,4,ST_GeomFromText('POINT (40.13226318359375 -97.56391906738281)')),
-     (77,0,ST_GeomFromText('POINT (40.50944519042969 -95.69341278076172)')),
-     (77,1,ST_GeomFromText('POINT (40.52741241455078 -95.71707153320312)')),
-     (77,2,ST_GeomFromText('POINT (40.52741241455078 -95.7289047241211)')),
-     (77,3,ST_GeomFromText('POINT (40.48249435424805 -95.7289047241211)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (77,4,ST_GeomFromText('POINT (40.39266586303711 -95.610595703125)')),
-     (77,5,ST_GeomFromText('POINT (40.39266586303711 -95.59876251220703)')),
-     (77,6,ST_GeomFromText('POINT (40.401649475097656 -95.59876251220703)')),
-     (78,0,ST_GeomFromText('POINT (40.347747802734375 -95.58692932128906)')),
-     (78,1,ST_GeomFromText('POINT (40.347747802734375 -95.53960418701172)')),
-     (78,2,ST_GeomFromText('POINT (40.5633430480957 -95.55143737792969)')),
-     (79,0,ST_GeomFromText('POINT (40.657981872558594 -95.77965545654297)')),
-     (79,1,ST_GeomFromText('POINT (40.64899826049805 -95.80338287353516)')),
-     (79,2,ST_GeomFromText('POINT (40.6400146484375 -95.80338287353516)')),
-     (79,3,ST_GeomFromText('POINT (40.6400146484375 -95.75592803955078)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (79,4,ST_GeomFromText('POINT (40.64899826049805 -95.74405670166016)')),
-     (79,5,ST_GeomFromText('POINT (40.657981872558594 -95.74405670166016)')),
-     (80,0,ST_GeomFromText('POINT (40.54119873046875 -95.69659423828125)')),
-     (80,1,ST_GeomFromText('POINT (40.54119873046875 -95.64913177490234)')),
-     (80,2,ST_GeomFromText('POINT (40.75679397583008 -95.66100311279297)')),
-     (81,0,ST_GeomFromText('POINT (41.376041412353516 -99.76781463623047)')),
-     (81,1,ST_GeomFromText('POINT (41.376041412353516 -99.79177856445312)')),
-     (81,2,ST_GeomFromText('POINT (41.36705780029297 -99.79177856445312)')),
-     (81,3,ST_GeomFromText('POINT (41.17841339111328 -99.73188018798828)')),
-     (81,4,ST_GeomFromText('POINT (41.17841339111328 -99.71989440917969)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (81,5,ST_GeomFromText('POINT (41.18739700317383 -99.70791625976562)')),
-     (82,0,ST_GeomFromText('POINT (41.169429779052734 -99.81573486328125)')),
-     (82,1,ST_GeomFromText('POINT (41.169429779052734 -99.62406158447266)')),
-     (82,2,ST_GeomFromText('POINT (41.38502502441406 -99.63603973388672)')),
-     (83,0,ST_GeomFromText('POINT (41.5688591003418 -99.62431335449219)')),
-     (83,1,ST_GeomFromText('POINT (41.55987548828125 -99.62431335449219)')),
-     (83,2,ST_GeomFromText('POINT (41.55987548828125 -99.58819580078125)')),
-     (83,3,ST_GeomFromText('POINT (41.63174057006836 -99.52800750732422)')),
-     (83,4,ST_GeomFromText('POINT (41.640724182128906 -99.52800750732422)')),
-     (83,5,ST_GeomFromText('POINT (41.640724182128906 -99.54004669189453)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (83,6,ST_GeomFromText('POINT (41.63174057006836 -99.56411743164062)')),
-     (84,0,ST_GeomFromText('POINT (41.48801040649414 -99.49188995361328)')),
-     (84,1,ST_GeomFromText('POINT (41.48801040649414 -99.44373321533203)')),
-     (84,2,ST_GeomFromText('POINT (41.70360565185547 -99.45577239990234)')),
-     (85,0,ST_GeomFromText('POINT (41.77238082885742 -98.97933197021484)')),
-     (85,1,ST_GeomFromText('POINT (41.70051574707031 -99.00345611572266)')),
-     (85,2,ST_GeomFromText('POINT (41.691532135009766 -99.00345611572266)')),
-     (85,3,ST_GeomFromText('POINT (41.691532135009766 -98.9672622680664)')),
-     (85,4,ST_GeomFromText('POINT (41.763397216796875 -98.9431381225586)')),
-     (85,5,ST_GeomFromText('POINT (41.77238082885742 -98.9431381225586)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (86,0,ST_GeomFromText('POINT (41.619667053222656 -98.89488220214844)')),
-     (86,1,ST_GeomFromText('POINT (41.619667053222656 -98.84662628173828)')),
-     (86,2,ST_GeomFromText('POINT (41.835262298583984 -98.85869598388672)')),
-     (87,0,ST_GeomFromText('POINT (42.656700134277344 -98.22327423095703)')),
-     (87,1,ST_GeomFromText('POINT (42.6477165222168 -98.22327423095703)')),
-     (87,2,ST_GeomFromText('POINT (41.956016540527344 -97.6431884765625)')),
-     (87,3,ST_GeomFromText('POINT (41.9470329284668 -97.63085174560547)')),
-     (87,4,ST_GeomFromText('POINT (41.9470329284668 -97.6185073852539)')),
-     (87,5,ST_GeomFromText('POINT (41.96500015258789 -97.6185073852539)')),
-     (87,6,ST_GeomFromText('POINT (43.213653564453125 -97.66787719726562)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (87,7,ST_GeomFromText('POINT (43.213653564453125 -97.69255828857422)')),
-     (88,0,ST_GeomFromText('POINT (42.70161437988281 -98.24795532226562)')),
-     (88,1,ST_GeomFromText('POINT (41.87517166137695 -98.02580261230469)')),
-     (88,2,ST_GeomFromText('POINT (41.87517166137695 -97.98876953125)')),
-     (88,3,ST_GeomFromText('POINT (43.168739318847656 -97.98876953125)')),
-     (88,4,ST_GeomFromText('POINT (43.27653503417969 -98.00111389160156)')),
-     (88,5,ST_GeomFromText('POINT (43.168739318847656 -98.05048370361328)')),
-     (89,0,ST_GeomFromText('POINT (45.68735122680664 -108.87848663330078)')),
-     (89,1,ST_GeomFromText('POINT (45.72328186035156 -108.6708984375)')),
-     (89,2,ST_GeomFromText('POINT (46.05565643310547 -107.74972534179688)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (89,3,ST_GeomFromText('POINT (46.109554290771484 -107.6329574584961)')),
-     (89,4,ST_GeomFromText('POINT (46.064640045166016 -107.78865051269531)')),
-     (90,0,ST_GeomFromText('POINT (46.11853790283203 -108.99525451660156)')),
-     (90,1,ST_GeomFromText('POINT (45.61548614501953 -108.99525451660156)')),
-     (90,2,ST_GeomFromText('POINT (45.61548614501953 -108.73577117919922)')),
-     (90,3,ST_GeomFromText('POINT (46.11853790283203 -108.73577117919922)')),
-     (90,4,ST_GeomFromText('POINT (46.17243957519531 -108.74874877929688)')),
-     (91,0,ST_GeomFromText('POINT (31.991867065429688 -102.6323013305664)')),
-     (91,1,ST_GeomFromText('POINT (32.21644592285156 -101.94194030761719)')),
-     (91,2,ST_GeomFromText('POINT (32.18949508666992 -102.28180694580078)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (92,0,ST_GeomFromText('POINT (32.234413146972656 -102.18621826171875)')),
-     (92,1,ST_GeomFromText('POINT (32.135597229003906 -102.52609252929688)')),
-     (92,2,ST_GeomFromText('POINT (32.0637321472168 -102.55795288085938)')),
-     (92,3,ST_GeomFromText('POINT (31.973901748657227 -101.87821197509766)')),
-     (92,4,ST_GeomFromText('POINT (31.973901748657227 -101.83572387695312)')),
-     (92,5,ST_GeomFromText('POINT (32.0457649230957 -101.84635162353516)')),
-     (93,0,ST_GeomFromText('POINT (32.59538269042969 -99.78939819335938)')),
-     (93,1,ST_GeomFromText('POINT (32.58639907836914 -99.78939819335938)')),
-     (93,2,ST_GeomFromText('POINT (31.966564178466797 -99.36259460449219)')),
-     (93,3,ST_GeomFromText('POINT (31.957582473754883 -99.3519287109375)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (93,4,ST_GeomFromText('POINT (31.51740837097168 -98.67971801757812)')),
-     (93,5,ST_GeomFromText('POINT (32.6492805480957 -98.3809585571289)')),
-     (93,6,ST_GeomFromText('POINT (32.65826416015625 -98.3809585571289)')),
-     (93,7,ST_GeomFromText('POINT (32.65826416015625 -98.40229797363281)')),
-     (94,0,ST_GeomFromText('POINT (32.59538269042969 -99.31991577148438)')),
-     (94,1,ST_GeomFromText('POINT (32.55046844482422 -99.69336700439453)')),
-     (94,2,ST_GeomFromText('POINT (31.688087463378906 -99.69336700439453)')),
-     (94,3,ST_GeomFromText('POINT (31.61622428894043 -99.6613540649414)')),
-     (94,4,ST_GeomFromText('POINT (31.51740837097168 -99.3519287109375)')),
-     (94,5,ST_GeomFromText('POINT (31.51740837097168 -99.30924224853516)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (94,6,ST_GeomFromText('POINT (31.580291748046875 -98.28492736816406)')),
-     (94,7,ST_GeomFromText('POINT (32.44266891479492 -98.28492736816406)')),
-     (94,8,ST_GeomFromText('POINT (32.65826416015625 -98.29559326171875)')),
-     (95,0,ST_GeomFromText('POINT (34.408294677734375 -97.16753387451172)')),
-     (95,1,ST_GeomFromText('POINT (34.56100845336914 -97.29916381835938)')),
-     (95,2,ST_GeomFromText('POINT (34.56100845336914 -97.31013488769531)')),
-     (95,3,ST_GeomFromText('POINT (34.552024841308594 -97.33206939697266)')),
-     (95,4,ST_GeomFromText('POINT (33.36625671386719 -97.59532165527344)')),
-     (95,5,ST_GeomFromText('POINT (33.35727310180664 -97.59532165527344)')),
-     (95,6,ST_GeomFromText('POINT (33.35727310180664 -97.58435821533203)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (95,7,ST_GeomFromText('POINT (33.61778259277344 -96.64102935791016)')),
-     (95,8,ST_GeomFromText('POINT (33.626766204833984 -96.63005828857422)')),
-     (95,9,ST_GeomFromText('POINT (33.6806640625 -96.57521057128906)')),
-     (95,10,ST_GeomFromText('POINT (33.68964767456055 -96.57521057128906)')),
-     (96,0,ST_GeomFromText('POINT (34.91135025024414 -97.33206939697266)')),
-     (96,1,ST_GeomFromText('POINT (34.83948516845703 -97.36497497558594)')),
-     (96,2,ST_GeomFromText('POINT (34.336429595947266 -97.56241607666016)')),
-     (96,3,ST_GeomFromText('POINT (33.40218734741211 -97.36497497558594)')),
-     (96,4,ST_GeomFromText('POINT (33.312355041503906 -96.6629638671875)')),
-     (96,5,ST_GeomFromText('POINT (33.312355041503906 -96.61908721923828)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (96,6,ST_GeomFromText('POINT (34.74965286254883 -96.61908721923828)')),
-     (96,7,ST_GeomFromText('POINT (34.82151794433594 -96.63005828857422)')),
-     (96,8,ST_GeomFromText('POINT (35.01016616821289 -96.98106384277344)')),
-     (97,0,ST_GeomFromText('POINT (34.2836799621582 -98.93053436279297)')),
-     (97,1,ST_GeomFromText('POINT (34.25672912597656 -98.93053436279297)')),
-     (97,2,ST_GeomFromText('POINT (34.25672912597656 -98.9086685180664)')),
-     (97,3,ST_GeomFromText('POINT (34.68791961669922 -98.78839111328125)')),
-     (97,4,ST_GeomFromText('POINT (34.696903228759766 -98.78839111328125)')),
-     (97,5,ST_GeomFromText('POINT (34.696903228759766 -98.79932403564453)')),
-     (98,0,ST_GeomFromText('POINT (34.72385025024414 -98.76652526855469)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (98,1,ST_GeomFromText('POINT (34.50825881958008 -98.78839111328125)')),
-     (98,2,ST_GeomFromText('POINT (34.22079849243164 -98.78839111328125)')),
-     (98,3,ST_GeomFromText('POINT (34.22079849243164 -98.7446517944336)')),
-     (98,4,ST_GeomFromText('POINT (34.50825881958008 -98.7446517944336)')),
-     (98,5,ST_GeomFromText('POINT (34.72385025024414 -98.75558471679688)')),
-     (99,0,ST_GeomFromText('POINT (34.31204605102539 -94.48274230957031)')),
-     (99,1,ST_GeomFromText('POINT (34.30306625366211 -94.4936294555664)')),
-     (99,2,ST_GeomFromText('POINT (34.285099029541016 -94.4936294555664)')),
-     (99,3,ST_GeomFromText('POINT (34.285099029541016 -94.46095275878906)')),
-     (99,4,ST_GeomFromText('POINT (34.29408264160156 -94.43917083740234)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (99,5,ST_GeomFromText('POINT (34.30306625366211 -94.43917083740234)')),
-     (99,6,ST_GeomFromText('POINT (34.31204605102539 -94.46095275878906)')),
-     (100,0,ST_GeomFromText('POINT (34.186283111572266 -94.3956069946289)')),
-     (100,1,ST_GeomFromText('POINT (34.186283111572266 -94.35203552246094)')),
-     (100,2,ST_GeomFromText('POINT (34.401878356933594 -94.36293029785156)')),
-     (101,0,ST_GeomFromText('POINT (34.82578659057617 -94.38265228271484)')),
-     (101,1,ST_GeomFromText('POINT (34.80781936645508 -94.40457153320312)')),
-     (101,2,ST_GeomFromText('POINT (34.79883575439453 -94.40457153320312)')),
-     (101,3,ST_GeomFromText('POINT (34.79883575439453 -94.38265228271484)')),
-     (101,4,ST_GeomFromText('POINT (34.80781936645508 -94.34977722167969)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (101,5,ST_GeomFromText('POINT (34.816802978515625 -94.34977722167969)')),
-     (101,6,ST_GeomFromText('POINT (34.82578659057617 -94.37169647216797)')),
-     (102,0,ST_GeomFromText('POINT (34.70002365112305 -94.3059310913086)')),
-     (102,1,ST_GeomFromText('POINT (34.70002365112305 -94.26209259033203)')),
-     (102,2,ST_GeomFromText('POINT (34.915618896484375 -94.27305603027344)')),
-     (103,0,ST_GeomFromText('POINT (35.783172607421875 -95.99406433105469)')),
-     (103,1,ST_GeomFromText('POINT (35.783172607421875 -96.00514221191406)')),
-     (103,2,ST_GeomFromText('POINT (34.90282440185547 -96.06050872802734)')),
-     (103,3,ST_GeomFromText('POINT (34.89384460449219 -96.06050872802734)')),
-     (103,4,ST_GeomFromText('POINT (34.88486099243164 -96.04943084716797)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (103,5,ST_GeomFromText('POINT (34.64231491088867 -95.54005432128906)')),
-     (103,6,ST_GeomFromText('POINT (34.64231491088867 -95.51791381835938)')),
-     (103,7,ST_GeomFromText('POINT (34.65129852294922 -95.49576568603516)')),
-     (103,8,ST_GeomFromText('POINT (34.660282135009766 -95.49576568603516)')),
-     (104,0,ST_GeomFromText('POINT (35.657405853271484 -95.99406433105469)')),
-     (104,1,ST_GeomFromText('POINT (34.90282440185547 -96.07157897949219)')),
-     (104,2,ST_GeomFromText('POINT (34.65129852294922 -95.97191619873047)')),
-     (104,3,ST_GeomFromText('POINT (34.65129852294922 -95.92762756347656)')),
-     (104,4,ST_GeomFromText('POINT (34.759098052978516 -95.85011291503906)')),
-     (104,5,ST_GeomFromText('POINT (34.79502868652344 -95.83903503417969)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (104,6,ST_GeomFromText('POINT (35.657405853271484 -95.83903503417969)')),
-     (104,7,ST_GeomFromText('POINT (35.76520538330078 -95.85011291503906)')),
-     (105,0,ST_GeomFromText('POINT (36.31496047973633 -95.24202728271484)')),
-     (105,1,ST_GeomFromText('POINT (36.30597686767578 -95.24202728271484)')),
-     (105,2,ST_GeomFromText('POINT (35.75800704956055 -95.14144897460938)')),
-     (105,3,ST_GeomFromText('POINT (35.749027252197266 -95.10792541503906)')),
-     (105,4,ST_GeomFromText('POINT (35.749027252197266 -95.09674835205078)')),
-     (105,5,ST_GeomFromText('POINT (36.10834884643555 -94.61619567871094)')),
-     (105,6,ST_GeomFromText('POINT (36.117332458496094 -94.61619567871094)')),
-     (105,7,ST_GeomFromText('POINT (36.395809173583984 -94.82853698730469)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (105,8,ST_GeomFromText('POINT (36.40479278564453 -94.85088348388672)')),
-     (105,9,ST_GeomFromText('POINT (36.40479278564453 -94.862060546875)')),
-     (106,0,ST_GeomFromText('POINT (36.23411178588867 -95.18614959716797)')),
-     (106,1,ST_GeomFromText('POINT (35.65919494628906 -95.02969360351562)')),
-     (106,2,ST_GeomFromText('POINT (35.65919494628906 -94.98499298095703)')),
-     (106,3,ST_GeomFromText('POINT (36.24309539794922 -94.85088348388672)')),
-     (106,4,ST_GeomFromText('POINT (36.48564147949219 -94.99617004394531)')),
-     (107,0,ST_GeomFromText('POINT (35.99821472167969 -92.2283706665039)')),
-     (107,1,ST_GeomFromText('POINT (35.99821472167969 -92.27278900146484)')),
-     (107,2,ST_GeomFromText('POINT (35.95329666137695 -92.36161804199219)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (107,3,ST_GeomFromText('POINT (35.944313049316406 -92.36161804199219)')),
-     (107,4,ST_GeomFromText('POINT (35.7197380065918 -92.20616912841797)')),
-     (107,5,ST_GeomFromText('POINT (35.7197380065918 -92.19506072998047)')),
-     (107,6,ST_GeomFromText('POINT (35.97126388549805 -91.92858123779297)')),
-     (107,7,ST_GeomFromText('POINT (35.980247497558594 -91.92858123779297)')),
-     (108,0,ST_GeomFromText('POINT (35.980247497558594 -92.28388977050781)')),
-     (108,1,ST_GeomFromText('POINT (35.836517333984375 -92.29499053955078)')),
-     (108,2,ST_GeomFromText('POINT (35.728721618652344 -92.25057983398438)')),
-     (108,3,ST_GeomFromText('POINT (35.728721618652344 -92.20616912841797)')),
-     (108,4,ST_GeomFromText('POINT (35.8724479675293 -92.20616912841797)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (108,5,ST_GeomFromText('POINT (35.980247497558594 -92.21726989746094)')),
-     (109,0,ST_GeomFromText('POINT (36.34700012207031 -96.36691284179688)')),
-     (109,1,ST_GeomFromText('POINT (36.35598373413086 -96.38924407958984)')),
-     (109,2,ST_GeomFromText('POINT (36.35598373413086 -96.40040588378906)')),
-     (109,3,ST_GeomFromText('POINT (36.338016510009766 -96.40040588378906)')),
-     (109,4,ST_GeomFromText('POINT (36.24818420410156 -96.33341217041016)')),
-     (109,5,ST_GeomFromText('POINT (36.28411865234375 -96.29991149902344)')),
-     (109,6,ST_GeomFromText('POINT (36.311065673828125 -96.29991149902344)')),
-     (110,0,ST_GeomFromText('POINT (36.185302734375 -96.27758026123047)')),
-     (110,1,ST_GeomFromText('POINT (36.185302734375 -96.23291778564453)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (110,2,ST_GeomFromText('POINT (36.40089797973633 -96.24408721923828)')),
-     (111,0,ST_GeomFromText('POINT (36.565223693847656 -96.20282745361328)')),
-     (111,1,ST_GeomFromText('POINT (36.55624008178711 -96.22523498535156)')),
-     (111,2,ST_GeomFromText('POINT (36.54725646972656 -96.22523498535156)')),
-     (111,3,ST_GeomFromText('POINT (36.538272857666016 -96.20282745361328)')),
-     (111,4,ST_GeomFromText('POINT (36.55624008178711 -96.16921997070312)')),
-     (111,5,ST_GeomFromText('POINT (36.565223693847656 -96.16921997070312)')),
-     (112,0,ST_GeomFromText('POINT (36.43946075439453 -96.12440490722656)')),
-     (112,1,ST_GeomFromText('POINT (36.43946075439453 -96.07959747314453)')),
-     (112,2,ST_GeomFromText('POINT (36.655052185058594 -96.0907974243164)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (113,0,ST_GeomFromText('POINT (37.12004089355469 -101.59293365478516)')),
-     (113,1,ST_GeomFromText('POINT (37.102073669433594 -101.60420989990234)')),
-     (113,2,ST_GeomFromText('POINT (37.09309005737305 -101.60420989990234)')),
-     (113,3,ST_GeomFromText('POINT (37.07512664794922 -101.59293365478516)')),
-     (113,4,ST_GeomFromText('POINT (37.07512664794922 -101.57036590576172)')),
-     (113,5,ST_GeomFromText('POINT (37.084110260009766 -101.54779815673828)')),
-     (113,6,ST_GeomFromText('POINT (37.09309005737305 -101.53651428222656)')),
-     (113,7,ST_GeomFromText('POINT (37.102073669433594 -101.53651428222656)')),
-     (113,8,ST_GeomFromText('POINT (37.12004089355469 -101.54779815673828)')),
-     (114,0,ST_GeomFromText('POINT (36.985294342041016 -101.49137878417969)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (114,1,ST_GeomFromText('POINT (36.985294342041016 -101.44625091552734)')),
-     (114,2,ST_GeomFromText('POINT (37.200889587402344 -101.45752716064453)')),
-     (115,0,ST_GeomFromText('POINT (44.42880630493164 -120.82870483398438)')),
-     (115,1,ST_GeomFromText('POINT (44.35694122314453 -121.04298400878906)')),
-     (115,2,ST_GeomFromText('POINT (44.347957611083984 -121.04298400878906)')),
-     (115,3,ST_GeomFromText('POINT (44.033546447753906 -119.6186752319336)')),
-     (115,4,ST_GeomFromText('POINT (44.033546447753906 -119.59346771240234)')),
-     (115,5,ST_GeomFromText('POINT (44.482704162597656 -117.74060821533203)')),
-     (115,6,ST_GeomFromText('POINT (44.4916877746582 -117.74060821533203)')),
-     (115,7,ST_GeomFromText('POINT (44.4916877746582 -117.75321960449219)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (116,0,ST_GeomFromText('POINT (44.51863479614258 -120.51359558105469)')),
-     (116,1,ST_GeomFromText('POINT (44.50965118408203 -120.8791275024414)')),
-     (116,2,ST_GeomFromText('POINT (44.29405975341797 -121.09339904785156)')),
-     (116,3,ST_GeomFromText('POINT (44.00659942626953 -121.09339904785156)')),
-     (116,4,ST_GeomFromText('POINT (43.97964859008789 -118.91282653808594)')),
-     (116,5,ST_GeomFromText('POINT (43.97964859008789 -118.84980773925781)')),
-     (116,6,ST_GeomFromText('POINT (44.00659942626953 -117.65238189697266)')),
-     (116,7,ST_GeomFromText('POINT (44.07846450805664 -117.63977813720703)')),
-     (116,8,ST_GeomFromText('POINT (44.36592102050781 -117.63977813720703)')),
-     (116,9,ST_GeomFromText('POINT (44.4916877746582 -118.44646453857422)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (116,10,ST_GeomFromText('POINT (44.54558563232422 -119.26575469970703)')),
-     (117,0,ST_GeomFromText('POINT (46.52765655517578 -118.05193328857422)')),
-     (117,1,ST_GeomFromText('POINT (46.52765655517578 -118.06499481201172)')),
-     (117,2,ST_GeomFromText('POINT (46.39291000366211 -118.16950225830078)')),
-     (117,3,ST_GeomFromText('POINT (46.31206512451172 -118.07805633544922)')),
-     (117,4,ST_GeomFromText('POINT (46.33002853393555 -117.93436431884766)')),
-     (117,5,ST_GeomFromText('POINT (46.339012145996094 -117.93436431884766)')),
-     (118,0,ST_GeomFromText('POINT (46.30308151245117 -118.15644073486328)')),
-     (118,1,ST_GeomFromText('POINT (46.30308151245117 -118.10418701171875)')),
-     (118,2,ST_GeomFromText('POINT (46.5186767578125 -117.93436431884766)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (118,3,ST_GeomFromText('POINT (46.5186767578125 -118.05193328857422)')),
-     (119,0,ST_GeomFromText('POINT (48.319313049316406 -120.1118392944336)')),
-     (119,1,ST_GeomFromText('POINT (47.79829406738281 -120.31880187988281)')),
-     (119,2,ST_GeomFromText('POINT (47.789310455322266 -120.31880187988281)')),
-     (119,3,ST_GeomFromText('POINT (47.789310455322266 -120.27741241455078)')),
-     (119,4,ST_GeomFromText('POINT (48.741519927978516 -118.55267333984375)')),
-     (119,5,ST_GeomFromText('POINT (48.75050354003906 -118.55267333984375)')),
-     (119,6,ST_GeomFromText('POINT (49.25355911254883 -119.5323257446289)')),
-     (119,7,ST_GeomFromText('POINT (49.25355911254883 -119.5461196899414)')),
-     (119,8,ST_GeomFromText('POINT (49.163726806640625 -119.60131072998047)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (120,0,ST_GeomFromText('POINT (49.31644058227539 -119.72549438476562)')),
-     (120,1,ST_GeomFromText('POINT (49.271522521972656 -120.42919158935547)')),
-     (120,2,ST_GeomFromText('POINT (48.12168502807617 -120.42919158935547)')),
-     (120,3,ST_GeomFromText('POINT (47.834224700927734 -120.4015884399414)')),
-     (120,4,ST_GeomFromText('POINT (47.762359619140625 -120.16703033447266)')),
-     (120,5,ST_GeomFromText('POINT (47.66354751586914 -119.78068542480469)')),
-     (120,6,ST_GeomFromText('POINT (47.66354751586914 -119.7116928100586)')),
-     (120,7,ST_GeomFromText('POINT (47.7264289855957 -118.38709259033203)')),
-     (120,8,ST_GeomFromText('POINT (49.163726806640625 -118.38709259033203)')),
-     (120,9,ST_GeomFromText('POINT (49.37932205200195 -118.40089416503906)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (121,0,ST_GeomFromText('POINT (40.53064727783203 -123.78182220458984)')),
-     (121,1,ST_GeomFromText('POINT (40.521663665771484 -123.78182220458984)')),
-     (121,2,ST_GeomFromText('POINT (38.500465393066406 -122.01058197021484)')),
-     (121,3,ST_GeomFromText('POINT (38.500465393066406 -121.99861907958984)')),
-     (121,4,ST_GeomFromText('POINT (38.644195556640625 -120.46673583984375)')),
-     (121,5,ST_GeomFromText('POINT (38.65317916870117 -120.45477294921875)')),
-     (121,6,ST_GeomFromText('POINT (38.66215896606445 -120.45477294921875)')),
-     (121,7,ST_GeomFromText('POINT (41.23133087158203 -120.49066925048828)')),
-     (121,8,ST_GeomFromText('POINT (41.34811019897461 -120.5505142211914)')),
-     (121,9,ST_GeomFromText('POINT (41.34811019897461 -120.5624771118164)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (122,0,ST_GeomFromText('POINT (41.330142974853516 -123.36294555664062)')),
-     (122,1,ST_GeomFromText('POINT (41.321163177490234 -123.5185317993164)')),
-     (122,2,ST_GeomFromText('POINT (41.105567932128906 -123.55443572998047)')),
-     (122,3,ST_GeomFromText('POINT (40.53064727783203 -123.56639862060547)')),
-     (122,4,ST_GeomFromText('POINT (38.518428802490234 -123.56639862060547)')),
-     (122,5,ST_GeomFromText('POINT (38.49148178100586 -121.63957977294922)')),
-     (122,6,ST_GeomFromText('POINT (38.49148178100586 -121.59171295166016)')),
-     (122,7,ST_GeomFromText('POINT (38.518428802490234 -120.45477294921875)')),
-     (122,8,ST_GeomFromText('POINT (38.590293884277344 -120.44280242919922)')),
-     (122,9,ST_GeomFromText('POINT (41.177433013916016 -120.44280242919922)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (122,10,ST_GeomFromText('POINT (41.30319595336914 -121.208740234375)')),
-     (122,11,ST_GeomFromText('POINT (41.357093811035156 -121.98664855957031)')),
-     (123,0,ST_GeomFromText('POINT (31.448936462402344 -84.05381774902344)')),
-     (123,1,ST_GeomFromText('POINT (31.448936462402344 -84.0643539428711)')),
-     (123,2,ST_GeomFromText('POINT (31.314189910888672 -84.07489013671875)')),
-     (123,3,ST_GeomFromText('POINT (31.29622459411621 -84.07489013671875)')),
-     (123,4,ST_GeomFromText('POINT (31.29622459411621 -84.05381774902344)')),
-     (123,5,ST_GeomFromText('POINT (31.38605499267578 -84.02220916748047)')),
-     (123,6,ST_GeomFromText('POINT (31.395038604736328 -84.02220916748047)')),
-     (124,0,ST_GeomFromText('POINT (31.260292053222656 -83.98005676269531)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (124,1,ST_GeomFromText('POINT (31.260292053222656 -83.93791198730469)')),
-     (124,2,ST_GeomFromText('POINT (31.475887298583984 -83.94844818115234)')),
-     (125,0,ST_GeomFromText('POINT (31.87354850769043 -88.04885864257812)')),
-     (125,1,ST_GeomFromText('POINT (31.45134162902832 -88.26050567626953)')),
-     (125,2,ST_GeomFromText('POINT (31.442358016967773 -88.26050567626953)')),
-     (125,3,ST_GeomFromText('POINT (31.352527618408203 -87.58323669433594)')),
-     (125,4,ST_GeomFromText('POINT (31.352527618408203 -87.5726547241211)')),
-     (125,5,ST_GeomFromText('POINT (31.89151382446289 -87.3821792602539)')),
-     (125,6,ST_GeomFromText('POINT (31.900497436523438 -87.3821792602539)')),
-     (125,7,ST_GeomFromText('POINT (31.900497436523438 -87.39276123046875)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (126,0,ST_GeomFromText('POINT (31.900497436523438 -87.72080993652344)')),
-     (126,1,ST_GeomFromText('POINT (31.80168342590332 -88.05944061279297)')),
-     (126,2,ST_GeomFromText('POINT (31.72981834411621 -88.10176849365234)')),
-     (126,3,ST_GeomFromText('POINT (31.442358016967773 -88.10176849365234)')),
-     (126,4,ST_GeomFromText('POINT (31.352527618408203 -87.42450714111328)')),
-     (126,5,ST_GeomFromText('POINT (31.352527618408203 -87.37158966064453)')),
-     (126,6,ST_GeomFromText('POINT (31.63998794555664 -87.37158966064453)')),
-     (126,7,ST_GeomFromText('POINT (31.71185302734375 -87.3821792602539)')),
-     (127,0,ST_GeomFromText('POINT (31.810468673706055 -84.61306762695312)')),
-     (127,1,ST_GeomFromText('POINT (31.657756805419922 -84.6342544555664)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (127,2,ST_GeomFromText('POINT (31.648773193359375 -84.6342544555664)')),
-     (127,3,ST_GeomFromText('POINT (31.558942794799805 -84.53889465332031)')),
-     (127,4,ST_GeomFromText('POINT (31.558942794799805 -84.5282974243164)')),
-     (127,5,ST_GeomFromText('POINT (31.63080596923828 -84.43293762207031)')),
-     (127,6,ST_GeomFromText('POINT (31.639789581298828 -84.43293762207031)')),
-     (127,7,ST_GeomFromText('POINT (31.927249908447266 -84.48591613769531)')),
-     (127,8,ST_GeomFromText('POINT (31.927249908447266 -84.49651336669922)')),
-     (128,0,ST_GeomFromText('POINT (31.7745361328125 -84.61306762695312)')),
-     (128,1,ST_GeomFromText('POINT (31.487077713012695 -84.4647216796875)')),
-     (128,2,ST_GeomFromText('POINT (31.487077713012695 -84.4223403930664)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (128,3,ST_GeomFromText('POINT (31.7745361328125 -84.4223403930664)')),
-     (128,4,ST_GeomFromText('POINT (31.990131378173828 -84.43293762207031)')),
-     (129,0,ST_GeomFromText('POINT (33.33662033081055 -81.6044921875)')),
-     (129,1,ST_GeomFromText('POINT (33.33662033081055 -81.62600708007812)')),
-     (129,2,ST_GeomFromText('POINT (33.32763671875 -81.63676452636719)')),
-     (129,3,ST_GeomFromText('POINT (33.31865310668945 -81.63676452636719)')),
-     (129,4,ST_GeomFromText('POINT (33.130008697509766 -81.40011596679688)')),
-     (129,5,ST_GeomFromText('POINT (33.130008697509766 -81.38935852050781)')),
-     (129,6,ST_GeomFromText('POINT (33.13899230957031 -81.38935852050781)')),
-     (129,7,ST_GeomFromText('POINT (33.31865310668945 -81.51844024658203)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (130,0,ST_GeomFromText('POINT (33.33662033081055 -81.62600708007812)')),
-     (130,1,ST_GeomFromText('POINT (33.12102508544922 -81.47541046142578)')),
-     (130,2,ST_GeomFromText('POINT (33.12102508544922 -81.40011596679688)')),
-     (130,3,ST_GeomFromText('POINT (33.33662033081055 -81.41087341308594)')),
-     (131,0,ST_GeomFromText('POINT (33.645957946777344 -92.39788055419922)')),
-     (131,1,ST_GeomFromText('POINT (33.645957946777344 -92.40869140625)')),
-     (131,2,ST_GeomFromText('POINT (33.6369743347168 -92.40869140625)')),
-     (131,3,ST_GeomFromText('POINT (33.34951400756836 -91.965576171875)')),
-     (131,4,ST_GeomFromText('POINT (33.34951400756836 -91.94395446777344)')),
-     (131,5,ST_GeomFromText('POINT (33.42137908935547 -91.74942016601562)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (131,6,ST_GeomFromText('POINT (33.430362701416016 -91.74942016601562)')),
-     (131,7,ST_GeomFromText('POINT (33.43934631347656 -91.76022338867188)')),
-     (132,0,ST_GeomFromText('POINT (33.65494155883789 -92.18172454833984)')),
-     (132,1,ST_GeomFromText('POINT (33.223751068115234 -92.18172454833984)')),
-     (132,2,ST_GeomFromText('POINT (33.223751068115234 -92.13849639892578)')),
-     (132,3,ST_GeomFromText('POINT (33.65494155883789 -92.13849639892578)')),
-     (132,4,ST_GeomFromText('POINT (33.76273727416992 -92.14930725097656)')),
-     (133,0,ST_GeomFromText('POINT (33.841495513916016 -89.80774688720703)')),
-     (133,1,ST_GeomFromText('POINT (33.83251190185547 -89.80774688720703)')),
-     (133,2,ST_GeomFromText('POINT (33.563018798828125 -89.53650665283203)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (133,3,ST_GeomFromText('POINT (33.563018798828125 -89.5256576538086)')),
-     (133,4,ST_GeomFromText('POINT (33.6977653503418 -89.16761016845703)')),
-     (133,5,ST_GeomFromText('POINT (34.084041595458984 -89.14591217041016)')),
-     (133,6,ST_GeomFromText('POINT (34.093021392822266 -89.14591217041016)')),
-     (133,7,ST_GeomFromText('POINT (34.093021392822266 -89.1567611694336)')),
-     (134,0,ST_GeomFromText('POINT (33.985225677490234 -89.57990264892578)')),
-     (134,1,ST_GeomFromText('POINT (33.6977653503418 -89.62330627441406)')),
-     (134,2,ST_GeomFromText('POINT (33.55403518676758 -89.57990264892578)')),
-     (134,3,ST_GeomFromText('POINT (33.55403518676758 -89.53650665283203)')),
-     (134,4,ST_GeomFromText('POINT (33.985225677490234 -89.53650665283203)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (134,5,ST_GeomFromText('POINT (34.093021392822266 -89.54735565185547)')),
-     (135,0,ST_GeomFromText('POINT (34.3770637512207 -93.5042495727539)')),
-     (135,1,ST_GeomFromText('POINT (34.3770637512207 -93.52603149414062)')),
-     (135,2,ST_GeomFromText('POINT (34.35909652709961 -93.52603149414062)')),
-     (135,3,ST_GeomFromText('POINT (33.89197540283203 -93.2646713256836)')),
-     (135,4,ST_GeomFromText('POINT (33.89197540283203 -93.25377655029297)')),
-     (135,5,ST_GeomFromText('POINT (33.90095901489258 -93.23200225830078)')),
-     (135,6,ST_GeomFromText('POINT (33.909942626953125 -93.23200225830078)')),
-     (136,0,ST_GeomFromText('POINT (33.882991790771484 -93.35179138183594)')),
-     (136,1,ST_GeomFromText('POINT (33.882991790771484 -93.25377655029297)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (136,2,ST_GeomFromText('POINT (34.17045211791992 -93.2646713256836)')),
-     (136,3,ST_GeomFromText('POINT (34.38604736328125 -93.27555847167969)')),
-     (137,0,ST_GeomFromText('POINT (35.139888763427734 -87.66118621826172)')),
-     (137,1,ST_GeomFromText('POINT (35.139888763427734 -87.67217254638672)')),
-     (137,2,ST_GeomFromText('POINT (34.744632720947266 -88.05665588378906)')),
-     (137,3,ST_GeomFromText('POINT (34.73564910888672 -88.05665588378906)')),
-     (137,4,ST_GeomFromText('POINT (33.9990348815918 -87.62823486328125)')),
-     (137,5,ST_GeomFromText('POINT (33.9990348815918 -86.85926818847656)')),
-     (137,6,ST_GeomFromText('POINT (34.008018493652344 -86.85926818847656)')),
-     (138,0,ST_GeomFromText('POINT (34.142765045166016 -88.06763458251953)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (138,1,ST_GeomFromText('POINT (33.9990348815918 -88.01271057128906)')),
-     (138,2,ST_GeomFromText('POINT (33.9990348815918 -87.88088989257812)')),
-     (138,3,ST_GeomFromText('POINT (34.070899963378906 -87.86990356445312)')),
-     (138,4,ST_GeomFromText('POINT (35.07700729370117 -87.86990356445312)')),
-     (138,5,ST_GeomFromText('POINT (35.13090515136719 -87.88088989257812)')),
-     (138,6,ST_GeomFromText('POINT (35.07700729370117 -87.91384887695312)')),
-     (139,0,ST_GeomFromText('POINT (34.66715621948242 -89.16392517089844)')),
-     (139,1,ST_GeomFromText('POINT (34.73902130126953 -89.50284576416016)')),
-     (139,2,ST_GeomFromText('POINT (34.73902130126953 -89.51377868652344)')),
-     (139,3,ST_GeomFromText('POINT (34.730037689208984 -89.51377868652344)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (139,4,ST_GeomFromText('POINT (34.478511810302734 -88.6828842163086)')),
-     (139,5,ST_GeomFromText('POINT (34.478511810302734 -88.67195129394531)')),
-     (139,6,ST_GeomFromText('POINT (34.48749542236328 -88.67195129394531)')),
-     (140,0,ST_GeomFromText('POINT (34.73902130126953 -88.98900604248047)')),
-     (140,1,ST_GeomFromText('POINT (34.73902130126953 -89.16392517089844)')),
-     (140,2,ST_GeomFromText('POINT (34.64020538330078 -89.33885192871094)')),
-     (140,3,ST_GeomFromText('POINT (34.56834411621094 -89.37165069580078)')),
-     (140,4,ST_GeomFromText('POINT (34.478511810302734 -88.75941467285156)')),
-     (140,5,ST_GeomFromText('POINT (34.478511810302734 -88.63915252685547)')),
-     (140,6,ST_GeomFromText('POINT (34.550376892089844 -88.63915252685547)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (141,0,ST_GeomFromText('POINT (34.66577911376953 -84.73853302001953)')),
-     (141,1,ST_GeomFromText('POINT (34.656795501708984 -84.73853302001953)')),
-     (141,2,ST_GeomFromText('POINT (34.64781188964844 -84.72758483886719)')),
-     (141,3,ST_GeomFromText('POINT (34.64781188964844 -84.71663665771484)')),
-     (141,4,ST_GeomFromText('POINT (34.74662780761719 -84.33354187011719)')),
-     (141,5,ST_GeomFromText('POINT (34.76459503173828 -84.33354187011719)')),
-     (141,6,ST_GeomFromText('POINT (34.76459503173828 -84.344482421875)')),
-     (142,0,ST_GeomFromText('POINT (34.71967697143555 -84.64002227783203)')),
-     (142,1,ST_GeomFromText('POINT (34.57594680786133 -84.64002227783203)')),
-     (142,2,ST_GeomFromText('POINT (34.57594680786133 -84.59623718261719)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (142,3,ST_GeomFromText('POINT (34.71967697143555 -84.59623718261719)')),
-     (142,4,ST_GeomFromText('POINT (34.827476501464844 -84.60718536376953)')),
-     (143,0,ST_GeomFromText('POINT (35.43562316894531 -92.80059051513672)')),
-     (143,1,ST_GeomFromText('POINT (34.81578826904297 -92.94412994384766)')),
-     (143,2,ST_GeomFromText('POINT (34.80680465698242 -92.94412994384766)')),
-     (143,3,ST_GeomFromText('POINT (34.80680465698242 -92.9330825805664)')),
-     (143,4,ST_GeomFromText('POINT (34.81578826904297 -92.92204284667969)')),
-     (143,5,ST_GeomFromText('POINT (35.13917922973633 -92.53559875488281)')),
-     (143,6,ST_GeomFromText('POINT (35.148162841796875 -92.53559875488281)')),
-     (143,7,ST_GeomFromText('POINT (35.43562316894531 -92.76746368408203)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (144,0,ST_GeomFromText('POINT (35.426639556884766 -92.84475708007812)')),
-     (144,1,ST_GeomFromText('POINT (34.70798873901367 -92.84475708007812)')),
-     (144,2,ST_GeomFromText('POINT (34.70798873901367 -92.80059051513672)')),
-     (144,3,ST_GeomFromText('POINT (35.426639556884766 -92.80059051513672)')),
-     (144,4,ST_GeomFromText('POINT (35.5344352722168 -92.81163024902344)')),
-     (145,0,ST_GeomFromText('POINT (34.84568786621094 -94.28748321533203)')),
-     (145,1,ST_GeomFromText('POINT (34.827720642089844 -94.28748321533203)')),
-     (145,2,ST_GeomFromText('POINT (34.827720642089844 -94.2217025756836)')),
-     (145,3,ST_GeomFromText('POINT (34.84568786621094 -94.2217025756836)')),
-     (145,4,ST_GeomFromText('POINT (34.854671478271484 -94.2436294555664)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (146,0,ST_GeomFromText('POINT (34.72890853881836 -94.17784881591797)')),
-     (146,1,ST_GeomFromText('POINT (34.72890853881836 -94.13398742675781)')),
-     (146,2,ST_GeomFromText('POINT (34.94450378417969 -94.14495086669922)')),
-     (147,0,ST_GeomFromText('POINT (35.444671630859375 -84.12113189697266)')),
-     (147,1,ST_GeomFromText('POINT (35.43568801879883 -84.13217163085938)')),
-     (147,2,ST_GeomFromText('POINT (35.417720794677734 -84.1432113647461)')),
-     (147,3,ST_GeomFromText('POINT (35.40874099731445 -84.1432113647461)')),
-     (147,4,ST_GeomFromText('POINT (35.05839920043945 -84.09906005859375)')),
-     (147,5,ST_GeomFromText('POINT (35.05839920043945 -84.08802032470703)')),
-     (147,6,ST_GeomFromText('POINT (35.0673828125 -84.08802032470703)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (148,0,ST_GeomFromText('POINT (35.28297424316406 -84.04386138916016)')),
-     (148,1,ST_GeomFromText('POINT (34.99551773071289 -84.04386138916016)')),
-     (148,2,ST_GeomFromText('POINT (34.99551773071289 -83.99970245361328)')),
-     (148,3,ST_GeomFromText('POINT (35.28297424316406 -83.99970245361328)')),
-     (148,4,ST_GeomFromText('POINT (35.49856948852539 -84.0107421875)')),
-     (149,0,ST_GeomFromText('POINT (35.555397033691406 -91.12662506103516)')),
-     (149,1,ST_GeomFromText('POINT (35.12420654296875 -91.47039031982422)')),
-     (149,2,ST_GeomFromText('POINT (35.1152229309082 -91.47039031982422)')),
-     (149,3,ST_GeomFromText('POINT (35.1152229309082 -91.45930480957031)')),
-     (149,4,ST_GeomFromText('POINT (35.71709060668945 -90.68305206298828)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (149,5,ST_GeomFromText('POINT (35.72607421875 -90.68305206298828)')),
-     (149,6,ST_GeomFromText('POINT (35.82489013671875 -90.89375305175781)')),
-     (149,7,ST_GeomFromText('POINT (35.82489013671875 -90.90483856201172)')),
-     (150,0,ST_GeomFromText('POINT (35.88777160644531 -90.97137451171875)')),
-     (150,1,ST_GeomFromText('POINT (35.78895568847656 -91.32623291015625)')),
-     (150,2,ST_GeomFromText('POINT (35.71709060668945 -91.41494750976562)')),
-     (150,3,ST_GeomFromText('POINT (35.142173767089844 -91.3594970703125)')),
-     (150,4,ST_GeomFromText('POINT (35.05234146118164 -90.64978790283203)')),
-     (150,5,ST_GeomFromText('POINT (35.05234146118164 -90.60543060302734)')),
-     (150,6,ST_GeomFromText('POINT (35.627262115478516 -90.60543060302734)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (150,7,ST_GeomFromText('POINT (35.699127197265625 -90.61651611328125)')),
-     (151,0,ST_GeomFromText('POINT (35.732177734375 -93.77694702148438)')),
-     (151,1,ST_GeomFromText('POINT (35.732177734375 -93.78802490234375)')),
-     (151,2,ST_GeomFromText('POINT (35.72319793701172 -93.78802490234375)')),
-     (151,3,ST_GeomFromText('POINT (35.309974670410156 -93.61080169677734)')),
-     (151,4,ST_GeomFromText('POINT (35.309974670410156 -93.5886459350586)')),
-     (151,5,ST_GeomFromText('POINT (35.66929626464844 -93.40035247802734)')),
-     (151,6,ST_GeomFromText('POINT (35.678279876708984 -93.40035247802734)')),
-     (152,0,ST_GeomFromText('POINT (35.678279876708984 -93.71048736572266)')),
-     (152,1,ST_GeomFromText('POINT (35.24708938598633 -93.69940948486328)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (152,2,ST_GeomFromText('POINT (35.24708938598633 -93.65510559082031)')),
-     (152,3,ST_GeomFromText('POINT (35.678279876708984 -93.65510559082031)')),
-     (152,4,ST_GeomFromText('POINT (35.78607940673828 -93.66618347167969)')),
-     (153,0,ST_GeomFromText('POINT (36.632137298583984 -87.98678588867188)')),
-     (153,1,ST_GeomFromText('POINT (36.62315368652344 -87.98678588867188)')),
-     (153,2,ST_GeomFromText('POINT (36.254844665527344 -87.7177505493164)')),
-     (153,3,ST_GeomFromText('POINT (35.904502868652344 -86.5743408203125)')),
-     (153,4,ST_GeomFromText('POINT (35.904502868652344 -86.5631332397461)')),
-     (153,5,ST_GeomFromText('POINT (35.91348648071289 -86.5631332397461)')),
-     (153,6,ST_GeomFromText('POINT (36.72196578979492 -87.06757354736328)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (153,7,ST_GeomFromText('POINT (36.72196578979492 -87.07878875732422)')),
-     (154,0,ST_GeomFromText('POINT (36.58721923828125 -87.79621887207031)')),
-     (154,1,ST_GeomFromText('POINT (35.886539459228516 -87.74016571044922)')),
-     (154,2,ST_GeomFromText('POINT (35.886539459228516 -87.69532775878906)')),
-     (154,3,ST_GeomFromText('POINT (36.67705154418945 -87.69532775878906)')),
-     (154,4,ST_GeomFromText('POINT (36.73094940185547 -87.70653533935547)')),
-     (155,0,ST_GeomFromText('POINT (36.63705825805664 -91.63556671142578)')),
-     (155,1,ST_GeomFromText('POINT (36.63705825805664 -91.64676666259766)')),
-     (155,2,ST_GeomFromText('POINT (36.412479400634766 -91.71394348144531)')),
-     (155,3,ST_GeomFromText('POINT (36.39451599121094 -91.71394348144531)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (155,4,ST_GeomFromText('POINT (36.376548767089844 -91.5459976196289)')),
-     (155,5,ST_GeomFromText('POINT (36.376548767089844 -91.53480529785156)')),
-     (155,6,ST_GeomFromText('POINT (36.439430236816406 -91.27729034423828)')),
-     (155,7,ST_GeomFromText('POINT (36.44841384887695 -91.27729034423828)')),
-     (156,0,ST_GeomFromText('POINT (36.628074645996094 -91.64676666259766)')),
-     (156,1,ST_GeomFromText('POINT (36.52027893066406 -91.79232025146484)')),
-     (156,2,ST_GeomFromText('POINT (36.376548767089844 -91.60198211669922)')),
-     (156,3,ST_GeomFromText('POINT (36.376548767089844 -91.55719757080078)')),
-     (156,4,ST_GeomFromText('POINT (36.52027893066406 -91.55719757080078)')),
-     (156,5,ST_GeomFromText('POINT (36.628074645996094 -91.56838989257812)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (157,0,ST_GeomFromText('POINT (39.03853225708008 -89.53166961669922)')),
-     (157,1,ST_GeomFromText('POINT (39.02954864501953 -89.53166961669922)')),
-     (157,2,ST_GeomFromText('POINT (37.691062927246094 -88.09223175048828)')),
-     (157,3,ST_GeomFromText('POINT (37.691062927246094 -88.08062744140625)')),
-     (157,4,ST_GeomFromText('POINT (39.1822624206543 -87.23321533203125)')),
-     (157,5,ST_GeomFromText('POINT (39.191246032714844 -87.23321533203125)')),
-     (157,6,ST_GeomFromText('POINT (39.191246032714844 -87.24482727050781)')),
-     (158,0,ST_GeomFromText('POINT (39.26311111450195 -89.601318359375)')),
-     (158,1,ST_GeomFromText('POINT (37.82581329345703 -89.40397644042969)')),
-     (158,2,ST_GeomFromText('POINT (37.6102180480957 -89.36914825439453)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (158,3,ST_GeomFromText('POINT (37.58326721191406 -88.2895736694336)')),
-     (158,4,ST_GeomFromText('POINT (37.58326721191406 -88.2431411743164)')),
-     (158,5,ST_GeomFromText('POINT (37.62818145751953 -87.12874603271484)')),
-     (158,6,ST_GeomFromText('POINT (39.06547927856445 -87.12874603271484)')),
-     (158,7,ST_GeomFromText('POINT (39.13734436035156 -87.14035034179688)')),
-     (158,8,ST_GeomFromText('POINT (39.299041748046875 -87.88328552246094)')),
-     (159,0,ST_GeomFromText('POINT (39.16403579711914 -97.39128875732422)')),
-     (159,1,ST_GeomFromText('POINT (39.17301940917969 -97.40288543701172)')),
-     (159,2,ST_GeomFromText('POINT (39.17301940917969 -97.41448211669922)')),
-     (159,3,ST_GeomFromText('POINT (39.04725646972656 -97.43766784667969)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (159,4,ST_GeomFromText('POINT (39.02928924560547 -97.43766784667969)')),
-     (159,5,ST_GeomFromText('POINT (38.984375 -97.27533721923828)')),
-     (159,6,ST_GeomFromText('POINT (38.984375 -97.26374816894531)')),
-     (159,7,ST_GeomFromText('POINT (38.99335479736328 -97.26374816894531)')),
-     (160,0,ST_GeomFromText('POINT (39.182003021240234 -97.47245025634766)')),
-     (160,1,ST_GeomFromText('POINT (38.966407775878906 -97.34490966796875)')),
-     (160,2,ST_GeomFromText('POINT (38.966407775878906 -97.24055480957031)')),
-     (160,3,ST_GeomFromText('POINT (39.182003021240234 -97.24055480957031)')),
-     (161,0,ST_GeomFromText('POINT (40.77186584472656 -100.06757354736328)')),
-     (161,1,ST_GeomFromText('POINT (40.762882232666016 -100.09133911132812)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (161,2,ST_GeomFromText('POINT (40.75389862060547 -100.09133911132812)')),
-     (161,3,ST_GeomFromText('POINT (40.75389862060547 -100.06757354736328)')),
-     (161,4,ST_GeomFromText('POINT (40.762882232666016 -100.03191375732422)')),
-     (161,5,ST_GeomFromText('POINT (40.77186584472656 -100.03191375732422)')),
-     (162,0,ST_GeomFromText('POINT (40.65508270263672 -99.98436737060547)')),
-     (162,1,ST_GeomFromText('POINT (40.65508270263672 -99.93682861328125)')),
-     (162,2,ST_GeomFromText('POINT (40.87067794799805 -99.9487075805664)')),
-     (163,0,ST_GeomFromText('POINT (40.9052734375 -100.53740692138672)')),
-     (163,1,ST_GeomFromText('POINT (40.887306213378906 -100.54933166503906)')),
-     (163,2,ST_GeomFromText('POINT (40.86035919189453 -100.54933166503906)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (163,3,ST_GeomFromText('POINT (40.86035919189453 -100.5254898071289)')),
-     (163,4,ST_GeomFromText('POINT (40.87832260131836 -100.46587371826172)')),
-     (163,5,ST_GeomFromText('POINT (41.06697082519531 -100.22740936279297)')),
-     (163,6,ST_GeomFromText('POINT (41.075950622558594 -100.22740936279297)')),
-     (163,7,ST_GeomFromText('POINT (41.075950622558594 -100.23933410644531)')),
-     (164,0,ST_GeomFromText('POINT (40.86035919189453 -100.31087493896484)')),
-     (164,1,ST_GeomFromText('POINT (40.86035919189453 -100.26318359375)')),
-     (164,2,ST_GeomFromText('POINT (41.075950622558594 -100.27510070800781)')),
-     (165,0,ST_GeomFromText('POINT (44.083736419677734 -94.88423919677734)')),
-     (165,1,ST_GeomFromText('POINT (44.07475280761719 -94.88423919677734)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (165,2,ST_GeomFromText('POINT (44.07475280761719 -94.84663391113281)')),
-     (165,3,ST_GeomFromText('POINT (44.083736419677734 -94.84663391113281)')),
-     (166,0,ST_GeomFromText('POINT (43.966957092285156 -94.78396606445312)')),
-     (166,1,ST_GeomFromText('POINT (43.966957092285156 -94.73382568359375)')),
-     (166,2,ST_GeomFromText('POINT (44.182552337646484 -94.7463607788086)')),
-     (167,0,ST_GeomFromText('POINT (45.43802261352539 -94.04259490966797)')),
-     (167,1,ST_GeomFromText('POINT (45.429039001464844 -94.04259490966797)')),
-     (167,2,ST_GeomFromText('POINT (45.213443756103516 -93.71939086914062)')),
-     (167,3,ST_GeomFromText('POINT (45.213443756103516 -93.70645904541016)')),
-     (167,4,ST_GeomFromText('POINT (45.887176513671875 -93.60303497314453)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (167,5,ST_GeomFromText('POINT (45.90514373779297 -93.60303497314453)')),
-     (167,6,ST_GeomFromText('POINT (45.90514373779297 -93.64181518554688)')),
-     (168,0,ST_GeomFromText('POINT (45.8602294921875 -94.12017059326172)')),
-     (168,1,ST_GeomFromText('POINT (45.57276916503906 -94.14602661132812)')),
-     (168,2,ST_GeomFromText('POINT (45.141578674316406 -93.93917083740234)')),
-     (168,3,ST_GeomFromText('POINT (45.141578674316406 -93.88745880126953)')),
-     (168,4,ST_GeomFromText('POINT (45.8602294921875 -93.88745880126953)')),
-     (168,5,ST_GeomFromText('POINT (45.96802520751953 -93.90038299560547)')),
-     (169,0,ST_GeomFromText('POINT (43.963722229003906 -108.04471588134766)')),
-     (169,1,ST_GeomFromText('POINT (43.95473861694336 -108.04471588134766)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (169,2,ST_GeomFromText('POINT (43.95473861694336 -108.00713348388672)')),
-     (169,3,ST_GeomFromText('POINT (44.01762008666992 -107.89437866210938)')),
-     (169,4,ST_GeomFromText('POINT (44.12541580200195 -107.89437866210938)')),
-     (170,0,ST_GeomFromText('POINT (43.936771392822266 -108.0948257446289)')),
-     (170,1,ST_GeomFromText('POINT (43.936771392822266 -107.83174133300781)')),
-     (170,2,ST_GeomFromText('POINT (44.152366638183594 -107.84426879882812)')),
-     (171,0,ST_GeomFromText('POINT (44.947837829589844 -108.05509185791016)')),
-     (171,1,ST_GeomFromText('POINT (44.947837829589844 -108.06781768798828)')),
-     (171,2,ST_GeomFromText('POINT (44.9208869934082 -108.06781768798828)')),
-     (171,3,ST_GeomFromText('POINT (44.9208869934082 -108.05509185791016)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (171,4,ST_GeomFromText('POINT (44.92987060546875 -108.02965545654297)')),
-     (171,5,ST_GeomFromText('POINT (44.9388542175293 -108.02965545654297)')),
-     (172,0,ST_GeomFromText('POINT (44.82207489013672 -107.97877502441406)')),
-     (172,1,ST_GeomFromText('POINT (44.82207489013672 -107.91516876220703)')),
-     (172,2,ST_GeomFromText('POINT (45.03767013549805 -107.92788696289062)')),
-     (173,0,ST_GeomFromText('POINT (46.00839614868164 -116.35104370117188)')),
-     (173,1,ST_GeomFromText('POINT (45.89161682128906 -116.29923248291016)')),
-     (173,2,ST_GeomFromText('POINT (45.89161682128906 -116.27333068847656)')),
-     (173,3,ST_GeomFromText('POINT (45.97246551513672 -116.1178970336914)')),
-     (173,4,ST_GeomFromText('POINT (45.981449127197266 -116.10494232177734)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (173,5,ST_GeomFromText('POINT (45.99043273925781 -116.10494232177734)')),
-     (174,0,ST_GeomFromText('POINT (45.83771896362305 -116.143798828125)')),
-     (174,1,ST_GeomFromText('POINT (45.83771896362305 -116.09199523925781)')),
-     (174,2,ST_GeomFromText('POINT (46.053314208984375 -116.10494232177734)')),
-     (175,0,ST_GeomFromText('POINT (46.06087112426758 -115.33698272705078)')),
-     (175,1,ST_GeomFromText('POINT (46.05188751220703 -115.33698272705078)')),
-     (175,2,ST_GeomFromText('POINT (46.042903900146484 -115.32400512695312)')),
-     (175,3,ST_GeomFromText('POINT (46.042903900146484 -115.31102752685547)')),
-     (175,4,ST_GeomFromText('POINT (46.06087112426758 -115.31102752685547)')),
-     (176,0,ST_GeomFromText('POINT (45.944087982177734 -115.24613952636719)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (176,1,ST_GeomFromText('POINT (45.944087982177734 -115.1812515258789)')),
-     (176,2,ST_GeomFromText('POINT (46.15968322753906 -115.19422912597656)')),
-     (177,0,ST_GeomFromText('POINT (46.25761795043945 -116.41439819335938)')),
-     (177,1,ST_GeomFromText('POINT (46.248634338378906 -116.41439819335938)')),
-     (177,2,ST_GeomFromText('POINT (46.248634338378906 -116.38833618164062)')),
-     (177,3,ST_GeomFromText('POINT (46.2666015625 -116.21893310546875)')),
-     (177,4,ST_GeomFromText('POINT (46.27558517456055 -116.21893310546875)')),
-     (177,5,ST_GeomFromText('POINT (46.31151580810547 -116.23196411132812)')),
-     (177,6,ST_GeomFromText('POINT (46.31151580810547 -116.25802612304688)')),
-     (178,0,ST_GeomFromText('POINT (46.16778564453125 -116.23196411132812)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (178,1,ST_GeomFromText('POINT (46.16778564453125 -116.17984008789062)')),
-     (178,2,ST_GeomFromText('POINT (46.38338088989258 -116.19287109375)')),
-     (179,0,ST_GeomFromText('POINT (46.5921516418457 -117.43508911132812)')),
-     (179,1,ST_GeomFromText('POINT (46.51130294799805 -117.5921401977539)')),
-     (179,2,ST_GeomFromText('POINT (46.43943786621094 -117.44817352294922)')),
-     (179,3,ST_GeomFromText('POINT (46.46638870239258 -117.4089126586914)')),
-     (179,4,ST_GeomFromText('POINT (46.520286560058594 -117.3565673828125)')),
-     (179,5,ST_GeomFromText('POINT (46.52927017211914 -117.3565673828125)')),
-     (179,6,ST_GeomFromText('POINT (46.5921516418457 -117.42200469970703)')),
-     (180,0,ST_GeomFromText('POINT (46.403507232666016 -117.39582824707031)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (180,1,ST_GeomFromText('POINT (46.403507232666016 -117.34347534179688)')),
-     (180,2,ST_GeomFromText('POINT (46.619102478027344 -117.3565673828125)')),
-     (181,0,ST_GeomFromText('POINT (46.949745178222656 -117.72721862792969)')),
-     (181,1,ST_GeomFromText('POINT (46.949745178222656 -117.74038696289062)')),
-     (181,2,ST_GeomFromText('POINT (46.77008056640625 -117.67453002929688)')),
-     (181,3,ST_GeomFromText('POINT (46.77008056640625 -117.6613540649414)')),
-     (181,4,ST_GeomFromText('POINT (46.7790641784668 -117.64817810058594)')),
-     (181,5,ST_GeomFromText('POINT (46.886863708496094 -117.64817810058594)')),
-     (182,0,ST_GeomFromText('POINT (46.75211715698242 -117.59548950195312)')),
-     (182,1,ST_GeomFromText('POINT (46.75211715698242 -117.55596923828125)'));
-INSERT INTO polygon_point (mask_id,point_id,coordinate) VALUES
-     (182,2,ST_GeomFromText('POINT (46.96771240234375 -117.56914520263672)'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (1,1,ST_GeomFromText('POINT (36.46148681640625 -96.5511245727539)'),ST_GeomFromText('POINT (36.74910354614258 -96.19298553466797)'),145.092,1.91335,290.843,294.526,43.4834,0.0953613,ST_GeomFromText('POLYGON ((36.46148681640625 -96.5511245727539, 36.74910354614258 -96.5511245727539, 36.74910354614258 -96.19298553466797, 36.46148681640625 -96.19298553466797, 36.46148681640625 -96.5511245727539))')),
+     (2,1,ST_GeomFromText('POINT (46.61035919189453 -111.96013641357422)'),ST_GeomFromText('POINT (46.8978385925293 -111.5405502319336)'),161.362,1.64917,278.753,284.014,53.7549,0.0,ST_GeomFromText('POLYGON ((46.61035919189453 -111.96013641357422, 46.8978385925293 -111.96013641357422, 46.8978385925293 -111.5405502319336, 46.61035919189453 -111.5405502319336, 46.61035919189453 -111.96013641357422))')),
+     (3,1,ST_GeomFromText('POINT (39.16218566894531 -93.82846069335938)'),ST_GeomFromText('POINT (42.9030647277832 -89.2498779296875)'),272.581,6.09735,276.434,278.87,29.888,0.0,ST_GeomFromText('POLYGON ((39.16218566894531 -93.82846069335938, 42.9030647277832 -93.82846069335938, 42.9030647277832 -89.2498779296875, 39.16218566894531 -89.2498779296875, 39.16218566894531 -93.82846069335938))')),
+     (4,1,ST_GeomFromText('POINT (32.40029525756836 -82.63731384277344)'),ST_GeomFromText('POINT (33.55131530761719 -81.60846710205078)'),255.753,4.4005,291.76,294.343,33.878,0.0,ST_GeomFromText('POLYGON ((32.40029525756836 -82.63731384277344, 33.55131530761719 -82.63731384277344, 33.55131530761719 -81.60846710205078, 32.40029525756836 -81.60846710205078, 32.40029525756836 -82.63731384277344))')),
+     (5,1,ST_GeomFromText('POINT (33.11381912231445 -80.50120544433594)'),ST_GeomFromText('POINT (33.97715759277344 -79.4654541015625)'),249.118,4.6221,292.188,294.947,31.3705,0.0,ST_GeomFromText('POLYGON ((33.11381912231445 -80.50120544433594, 33.97715759277344 -80.50120544433594, 33.97715759277344 -79.4654541015625, 33.11381912231445 -79.4654541015625, 33.11381912231445 -80.50120544433594))')),
+     (6,1,ST_GeomFromText('POINT (33.0116081237793 -83.97045135498047)'),ST_GeomFromText('POINT (33.874691009521484 -82.59114074707031)'),261.453,3.38224,291.877,294.392,35.369,0.0,ST_GeomFromText('POLYGON ((33.0116081237793 -83.97045135498047, 33.874691009521484 -83.97045135498047, 33.874691009521484 -82.59114074707031, 33.0116081237793 -82.59114074707031, 33.0116081237793 -83.97045135498047))')),
+     (7,1,ST_GeomFromText('POINT (33.444149017333984 -85.63385772705078)'),ST_GeomFromText('POINT (34.01939392089844 -85.28792572021484)'),276.536,3.30212,289.861,292.826,42.2537,0.0,ST_GeomFromText('POLYGON ((33.444149017333984 -85.63385772705078, 34.01939392089844 -85.63385772705078, 34.01939392089844 -85.28792572021484, 33.444149017333984 -85.28792572021484, 33.444149017333984 -85.63385772705078))')),
+     (8,1,ST_GeomFromText('POINT (33.70273208618164 -82.69898986816406)'),ST_GeomFromText('POINT (34.27822494506836 -81.65809631347656)'),262.83,4.86301,292.362,294.992,32.8977,0.0,ST_GeomFromText('POLYGON ((33.70273208618164 -82.69898986816406, 34.27822494506836 -82.69898986816406, 34.27822494506836 -81.65809631347656, 33.70273208618164 -81.65809631347656, 33.70273208618164 -82.69898986816406))')),
+     (9,1,ST_GeomFromText('POINT (34.001319885253906 -80.9576416015625)'),ST_GeomFromText('POINT (34.57685089111328 -80.26110076904297)'),227.719,3.32548,292.699,295.58,27.1259,0.0,ST_GeomFromText('POLYGON ((34.001319885253906 -80.9576416015625, 34.57685089111328 -80.9576416015625, 34.57685089111328 -80.26110076904297, 34.001319885253906 -80.26110076904297, 34.001319885253906 -80.9576416015625))')),
+     (10,1,ST_GeomFromText('POINT (34.062992095947266 -78.55426788330078)'),ST_GeomFromText('POINT (34.350746154785156 -77.85855865478516)'),237.68,2.93252,290.799,294.084,34.6606,0.0,ST_GeomFromText('POLYGON ((34.062992095947266 -78.55426788330078, 34.350746154785156 -78.55426788330078, 34.350746154785156 -77.85855865478516, 34.062992095947266 -77.85855865478516, 34.062992095947266 -78.55426788330078))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (11,1,ST_GeomFromText('POINT (34.8125 -80.20854187011719)'),ST_GeomFromText('POINT (35.10020065307617 -79.15544128417969)'),265.968,3.90525,291.922,294.226,30.8734,0.0,ST_GeomFromText('POLYGON ((34.8125 -80.20854187011719, 35.10020065307617 -80.20854187011719, 35.10020065307617 -79.15544128417969, 34.8125 -79.15544128417969, 34.8125 -80.20854187011719))')),
+     (12,1,ST_GeomFromText('POINT (35.51723861694336 -82.0479965209961)'),ST_GeomFromText('POINT (36.09272384643555 -80.98381805419922)'),270.726,5.40729,289.596,293.509,27.1932,0.0,ST_GeomFromText('POLYGON ((35.51723861694336 -82.0479965209961, 36.09272384643555 -82.0479965209961, 36.09272384643555 -80.98381805419922, 35.51723861694336 -80.98381805419922, 35.51723861694336 -82.0479965209961))')),
+     (13,1,ST_GeomFromText('POINT (26.410228729248047 -81.71448516845703)'),ST_GeomFromText('POINT (27.56133270263672 -80.42281341552734)'),113.026,1.88223,295.769,298.785,45.6265,0.0,ST_GeomFromText('POLYGON ((26.410228729248047 -81.71448516845703, 27.56133270263672 -81.71448516845703, 27.56133270263672 -80.42281341552734, 26.410228729248047 -80.42281341552734, 26.410228729248047 -81.71448516845703))')),
+     (14,1,ST_GeomFromText('POINT (27.12138557434082 -82.05194854736328)'),ST_GeomFromText('POINT (27.6966552734375 -81.72779846191406)'),137.429,1.07444,294.646,297.407,46.6169,0.0,ST_GeomFromText('POLYGON ((27.12138557434082 -82.05194854736328, 27.6966552734375 -82.05194854736328, 27.6966552734375 -81.72779846191406, 27.12138557434082 -81.72779846191406, 27.12138557434082 -82.05194854736328))')),
+     (15,1,ST_GeomFromText('POINT (27.600048065185547 -82.54598999023438)'),ST_GeomFromText('POINT (27.88774299621582 -82.2209243774414)'),163.399,1.99501,292.739,297.353,44.8882,0.0,ST_GeomFromText('POLYGON ((27.600048065185547 -82.54598999023438, 27.88774299621582 -82.54598999023438, 27.88774299621582 -82.2209243774414, 27.600048065185547 -82.2209243774414, 27.600048065185547 -82.54598999023438))')),
+     (16,1,ST_GeomFromText('POINT (28.818883895874023 -82.4157943725586)'),ST_GeomFromText('POINT (29.10663604736328 -82.0871810913086)'),244.363,1.31579,292.441,296.56,33.0718,0.0,ST_GeomFromText('POLYGON ((28.818883895874023 -82.4157943725586, 29.10663604736328 -82.4157943725586, 29.10663604736328 -82.0871810913086, 28.818883895874023 -82.0871810913086, 28.818883895874023 -82.4157943725586))')),
+     (17,1,ST_GeomFromText('POINT (29.634410858154297 -82.49757385253906)'),ST_GeomFromText('POINT (30.497549057006836 -81.83273315429688)'),289.87,1.7237,292.125,295.262,27.508,0.0,ST_GeomFromText('POLYGON ((29.634410858154297 -82.49757385253906, 30.497549057006836 -82.49757385253906, 30.497549057006836 -81.83273315429688, 29.634410858154297 -81.83273315429688, 29.634410858154297 -82.49757385253906))')),
+     (18,1,ST_GeomFromText('POINT (29.834495544433594 -83.20563507080078)'),ST_GeomFromText('POINT (30.12206268310547 -82.54151916503906)'),284.144,1.62788,292.998,294.999,25.447,0.0,ST_GeomFromText('POLYGON ((29.834495544433594 -83.20563507080078, 30.12206268310547 -83.20563507080078, 30.12206268310547 -82.54151916503906, 29.834495544433594 -82.54151916503906, 29.834495544433594 -83.20563507080078))')),
+     (19,1,ST_GeomFromText('POINT (30.086528778076172 -84.6080322265625)'),ST_GeomFromText('POINT (30.661882400512695 -84.2746353149414)'),200.168,1.55871,291.211,294.674,31.0093,0.0,ST_GeomFromText('POLYGON ((30.086528778076172 -84.6080322265625, 30.661882400512695 -84.6080322265625, 30.661882400512695 -84.2746353149414, 30.086528778076172 -84.2746353149414, 30.086528778076172 -84.6080322265625))')),
+     (20,1,ST_GeomFromText('POINT (30.370092391967773 -84.29512786865234)'),ST_GeomFromText('POINT (30.94561767578125 -83.62605285644531)'),269.033,1.82866,291.631,294.544,32.4437,0.0,ST_GeomFromText('POLYGON ((30.370092391967773 -84.29512786865234, 30.94561767578125 -84.29512786865234, 30.94561767578125 -83.62605285644531, 30.370092391967773 -83.62605285644531, 30.370092391967773 -84.29512786865234))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (21,1,ST_GeomFromText('POINT (30.713977813720703 -87.107666015625)'),ST_GeomFromText('POINT (31.0014705657959 -86.77275085449219)'),251.61,1.5851,290.729,294.734,32.9595,0.0,ST_GeomFromText('POLYGON ((30.713977813720703 -87.107666015625, 31.0014705657959 -87.107666015625, 31.0014705657959 -86.77275085449219, 30.713977813720703 -86.77275085449219, 30.713977813720703 -87.107666015625))')),
+     (22,1,ST_GeomFromText('POINT (30.861038208007812 -87.11625671386719)'),ST_GeomFromText('POINT (31.148542404174805 -86.78079986572266)'),273.315,2.01712,291.4,294.468,32.9585,0.0,ST_GeomFromText('POLYGON ((30.861038208007812 -87.11625671386719, 31.148542404174805 -87.11625671386719, 31.148542404174805 -86.78079986572266, 30.861038208007812 -86.78079986572266, 30.861038208007812 -87.11625671386719))')),
+     (23,1,ST_GeomFromText('POINT (31.071956634521484 -87.1207046508789)'),ST_GeomFromText('POINT (31.359493255615234 -86.78443145751953)'),256.909,1.74525,291.714,293.6,32.3726,0.0,ST_GeomFromText('POLYGON ((31.071956634521484 -87.1207046508789, 31.359493255615234 -87.1207046508789, 31.359493255615234 -86.78443145751953, 31.071956634521484 -86.78443145751953, 31.071956634521484 -87.1207046508789))')),
+     (24,1,ST_GeomFromText('POINT (31.167247772216797 -84.62726593017578)'),ST_GeomFromText('POINT (31.454853057861328 -84.29068756103516)'),267.069,3.02109,291.121,292.068,33.8345,0.0,ST_GeomFromText('POLYGON ((31.167247772216797 -84.62726593017578, 31.454853057861328 -84.62726593017578, 31.454853057861328 -84.29068756103516, 31.167247772216797 -84.29068756103516, 31.167247772216797 -84.62726593017578))')),
+     (25,1,ST_GeomFromText('POINT (31.302656173706055 -84.39421844482422)'),ST_GeomFromText('POINT (31.5902042388916 -84.05713653564453)'),277.709,3.55737,291.041,291.511,30.875,0.0,ST_GeomFromText('POLYGON ((31.302656173706055 -84.39421844482422, 31.5902042388916 -84.39421844482422, 31.5902042388916 -84.05713653564453, 31.302656173706055 -84.05713653564453, 31.302656173706055 -84.39421844482422))')),
+     (26,1,ST_GeomFromText('POINT (31.391019821166992 -81.80372619628906)'),ST_GeomFromText('POINT (31.678508758544922 -81.4663314819336)'),285.802,2.6411,292.627,294.422,27.1514,0.0,ST_GeomFromText('POLYGON ((31.391019821166992 -81.80372619628906, 31.678508758544922 -81.80372619628906, 31.678508758544922 -81.4663314819336, 31.391019821166992 -81.4663314819336, 31.391019821166992 -81.80372619628906))')),
+     (27,1,ST_GeomFromText('POINT (32.06714630126953 -85.72249603271484)'),ST_GeomFromText('POINT (32.354713439941406 -85.38262939453125)'),276.479,2.33804,291.323,293.331,40.9839,0.0,ST_GeomFromText('POLYGON ((32.06714630126953 -85.72249603271484, 32.354713439941406 -85.72249603271484, 32.354713439941406 -85.38262939453125, 32.06714630126953 -85.38262939453125, 32.06714630126953 -85.72249603271484))')),
+     (28,1,ST_GeomFromText('POINT (32.38069152832031 -81.41996002197266)'),ST_GeomFromText('POINT (32.668426513671875 -80.39627838134766)'),263.023,4.76891,292.381,294.213,31.8161,0.0,ST_GeomFromText('POLYGON ((32.38069152832031 -81.41996002197266, 32.668426513671875 -81.41996002197266, 32.668426513671875 -80.39627838134766, 32.38069152832031 -80.39627838134766, 32.38069152832031 -81.41996002197266))')),
+     (29,1,ST_GeomFromText('POINT (32.52851104736328 -81.48596954345703)'),ST_GeomFromText('POINT (33.10383987426758 -81.14370727539062)'),255.897,4.6002,292.615,294.514,31.9526,0.0,ST_GeomFromText('POLYGON ((32.52851104736328 -81.48596954345703, 33.10383987426758 -81.48596954345703, 33.10383987426758 -81.14370727539062, 32.52851104736328 -81.14370727539062, 32.52851104736328 -81.48596954345703))')),
+     (30,1,ST_GeomFromText('POINT (32.75856399536133 -85.09857177734375)'),ST_GeomFromText('POINT (33.33393478393555 -84.41212463378906)'),279.566,3.05593,290.934,293.751,34.3685,0.0,ST_GeomFromText('POLYGON ((32.75856399536133 -85.09857177734375, 33.33393478393555 -85.09857177734375, 33.33393478393555 -84.41212463378906, 32.75856399536133 -84.41212463378906, 32.75856399536133 -85.09857177734375))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (31,1,ST_GeomFromText('POINT (32.5771598815918 -88.11705780029297)'),ST_GeomFromText('POINT (33.440269470214844 -86.7444839477539)'),255.718,2.16851,290.48,292.952,40.4517,0.0,ST_GeomFromText('POLYGON ((32.5771598815918 -88.11705780029297, 33.440269470214844 -88.11705780029297, 33.440269470214844 -86.7444839477539, 32.5771598815918 -86.7444839477539, 32.5771598815918 -88.11705780029297))')),
+     (32,1,ST_GeomFromText('POINT (47.51405334472656 -110.9845199584961)'),ST_GeomFromText('POINT (47.80168914794922 -110.5574951171875)'),102.407,2.83372,272.005,273.039,67.8447,0.0,ST_GeomFromText('POLYGON ((47.51405334472656 -110.9845199584961, 47.80168914794922 -110.9845199584961, 47.80168914794922 -110.5574951171875, 47.51405334472656 -110.5574951171875, 47.51405334472656 -110.9845199584961))')),
+     (33,1,ST_GeomFromText('POINT (36.256629943847656 -92.70265197753906)'),ST_GeomFromText('POINT (36.8319091796875 -92.34446716308594)'),249.459,1.48729,292.471,295.555,42.1677,0.0,ST_GeomFromText('POLYGON ((36.256629943847656 -92.70265197753906, 36.8319091796875 -92.70265197753906, 36.8319091796875 -92.34446716308594, 36.256629943847656 -92.34446716308594, 36.256629943847656 -92.70265197753906))')),
+     (34,1,ST_GeomFromText('POINT (37.366817474365234 -96.91858673095703)'),ST_GeomFromText('POINT (37.654541015625 -96.55599212646484)'),67.1445,7.00897,290.232,293.332,44.6821,0.0,ST_GeomFromText('POLYGON ((37.366817474365234 -96.91858673095703, 37.654541015625 -96.91858673095703, 37.654541015625 -96.55599212646484, 37.366817474365234 -96.55599212646484, 37.366817474365234 -96.91858673095703))')),
+     (35,1,ST_GeomFromText('POINT (37.608673095703125 -96.47489166259766)'),ST_GeomFromText('POINT (37.896236419677734 -96.11106872558594)'),68.3491,7.89602,289.258,290.253,41.6196,0.0,ST_GeomFromText('POLYGON ((37.608673095703125 -96.47489166259766, 37.896236419677734 -96.47489166259766, 37.896236419677734 -96.11106872558594, 37.608673095703125 -96.11106872558594, 37.608673095703125 -96.47489166259766))')),
+     (36,1,ST_GeomFromText('POINT (38.547630310058594 -97.52764129638672)'),ST_GeomFromText('POINT (38.835208892822266 -97.15904235839844)'),51.1406,7.2831,284.793,288.199,40.999,0.0,ST_GeomFromText('POLYGON ((38.547630310058594 -97.52764129638672, 38.835208892822266 -97.52764129638672, 38.835208892822266 -97.15904235839844, 38.547630310058594 -97.15904235839844, 38.547630310058594 -97.52764129638672))')),
+     (37,1,ST_GeomFromText('POINT (39.524532318115234 -96.96451568603516)'),ST_GeomFromText('POINT (39.812049865722656 -96.21709442138672)'),52.9954,6.70168,281.212,283.565,41.615,0.0,ST_GeomFromText('POLYGON ((39.524532318115234 -96.96451568603516, 39.812049865722656 -96.96451568603516, 39.812049865722656 -96.21709442138672, 39.524532318115234 -96.21709442138672, 39.524532318115234 -96.96451568603516))')),
+     (38,1,ST_GeomFromText('POINT (39.574951171875 -97.85773468017578)'),ST_GeomFromText('POINT (40.150230407714844 -97.1082992553711)'),58.1107,7.34539,280.58,281.603,42.4412,0.0,ST_GeomFromText('POLYGON ((39.574951171875 -97.85773468017578, 40.150230407714844 -97.85773468017578, 40.150230407714844 -97.1082992553711, 39.574951171875 -97.1082992553711, 39.574951171875 -97.85773468017578))')),
+     (39,1,ST_GeomFromText('POINT (40.311683654785156 -95.84721374511719)'),ST_GeomFromText('POINT (40.59927749633789 -95.46929168701172)'),32.6943,6.81553,278.52,280.369,26.7397,0.0,ST_GeomFromText('POLYGON ((40.311683654785156 -95.84721374511719, 40.59927749633789 -95.84721374511719, 40.59927749633789 -95.46929168701172, 40.311683654785156 -95.46929168701172, 40.311683654785156 -95.84721374511719))')),
+     (40,1,ST_GeomFromText('POINT (40.505252838134766 -95.9576416015625)'),ST_GeomFromText('POINT (40.792728424072266 -95.5787124633789)'),28.5674,7.1557,278.01,279.93,24.9546,0.0,ST_GeomFromText('POLYGON ((40.505252838134766 -95.9576416015625, 40.792728424072266 -95.9576416015625, 40.792728424072266 -95.5787124633789, 40.505252838134766 -95.5787124633789, 40.505252838134766 -95.9576416015625))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (41,1,ST_GeomFromText('POINT (41.13328170776367 -99.93553161621094)'),ST_GeomFromText('POINT (41.420955657958984 -99.55294036865234)'),74.1128,5.10565,277.379,279.809,43.6802,0.0,ST_GeomFromText('POLYGON ((41.13328170776367 -99.93553161621094, 41.420955657958984 -99.93553161621094, 41.420955657958984 -99.55294036865234, 41.13328170776367 -99.55294036865234, 41.13328170776367 -99.93553161621094))')),
+     (42,1,ST_GeomFromText('POINT (41.45199203491211 -99.75674438476562)'),ST_GeomFromText('POINT (41.73953628540039 -99.37225341796875)'),73.9136,4.6288,276.566,279.264,45.0371,0.0,ST_GeomFromText('POLYGON ((41.45199203491211 -99.75674438476562, 41.73953628540039 -99.75674438476562, 41.73953628540039 -99.37225341796875, 41.45199203491211 -99.37225341796875, 41.45199203491211 -99.75674438476562))')),
+     (43,1,ST_GeomFromText('POINT (41.58364486694336 -99.1602783203125)'),ST_GeomFromText('POINT (41.87119674682617 -98.77505493164062)'),50.1943,4.98738,277.887,278.207,43.0679,0.0,ST_GeomFromText('POLYGON ((41.58364486694336 -99.1602783203125, 41.87119674682617 -99.1602783203125, 41.87119674682617 -98.77505493164062, 41.58364486694336 -98.77505493164062, 41.58364486694336 -99.1602783203125))')),
+     (44,1,ST_GeomFromText('POINT (41.85578918457031 -98.3096694946289)'),ST_GeomFromText('POINT (43.29450225830078 -97.52824401855469)'),33.1422,4.24038,273.132,275.274,27.8758,0.0,ST_GeomFromText('POLYGON ((41.85578918457031 -98.3096694946289, 43.29450225830078 -98.3096694946289, 43.29450225830078 -97.52824401855469, 41.85578918457031 -97.52824401855469, 41.85578918457031 -98.3096694946289))')),
+     (45,1,ST_GeomFromText('POINT (45.60602951049805 -109.07310485839844)'),ST_GeomFromText('POINT (46.181419372558594 -107.41958618164062)'),195.072,1.49443,276.71,278.957,53.9821,0.0,ST_GeomFromText('POLYGON ((45.60602951049805 -109.07310485839844, 46.181419372558594 -109.07310485839844, 46.181419372558594 -107.41958618164062, 45.60602951049805 -107.41958618164062, 45.60602951049805 -109.07310485839844))')),
+     (46,1,ST_GeomFromText('POINT (31.95567512512207 -102.79161834716797)'),ST_GeomFromText('POINT (32.24339294433594 -101.7728271484375)'),150.809,2.40098,288.268,292.396,45.8861,0.0,ST_GeomFromText('POLYGON ((31.95567512512207 -102.79161834716797, 32.24339294433594 -102.79161834716797, 32.24339294433594 -101.7728271484375, 31.95567512512207 -101.7728271484375, 31.95567512512207 -102.79161834716797))')),
+     (47,1,ST_GeomFromText('POINT (31.507144927978516 -99.92810821533203)'),ST_GeomFromText('POINT (32.65826416015625 -98.2301254272461)'),208.323,3.70827,289.909,292.405,58.8363,0.0,ST_GeomFromText('POLYGON ((31.507144927978516 -99.92810821533203, 32.65826416015625 -99.92810821533203, 32.65826416015625 -98.2301254272461, 31.507144927978516 -98.2301254272461, 31.507144927978516 -99.92810821533203))')),
+     (48,1,ST_GeomFromText('POINT (33.2925910949707 -97.60629272460938)'),ST_GeomFromText('POINT (35.01914978027344 -96.56302642822266)'),176.616,3.78866,292.414,295.404,45.5188,0.0,ST_GeomFromText('POLYGON ((33.2925910949707 -97.60629272460938, 35.01914978027344 -97.60629272460938, 35.01914978027344 -96.56302642822266, 33.2925910949707 -96.56302642822266, 33.2925910949707 -97.60629272460938))')),
+     (49,1,ST_GeomFromText('POINT (34.18438720703125 -99.02894592285156)'),ST_GeomFromText('POINT (34.75978469848633 -98.68009948730469)'),209.254,3.96656,293.016,295.374,44.8618,0.0,ST_GeomFromText('POLYGON ((34.18438720703125 -99.02894592285156, 34.75978469848633 -99.02894592285156, 34.75978469848633 -98.68009948730469, 34.18438720703125 -98.68009948730469, 34.18438720703125 -99.02894592285156))')),
+     (50,1,ST_GeomFromText('POINT (34.15032958984375 -94.6352310180664)'),ST_GeomFromText('POINT (34.43781280517578 -94.2872314453125)'),222.823,2.84828,286.285,292.989,48.6167,0.0,ST_GeomFromText('POLYGON ((34.15032958984375 -94.6352310180664, 34.43781280517578 -94.6352310180664, 34.43781280517578 -94.2872314453125, 34.15032958984375 -94.2872314453125, 34.15032958984375 -94.6352310180664))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (51,1,ST_GeomFromText('POINT (34.664058685302734 -94.54705047607422)'),ST_GeomFromText('POINT (34.9515495300293 -94.1968994140625)'),216.762,2.71037,292.165,293.334,38.2544,0.0,ST_GeomFromText('POLYGON ((34.664058685302734 -94.54705047607422, 34.9515495300293 -94.54705047607422, 34.9515495300293 -94.1968994140625, 34.664058685302734 -94.1968994140625, 34.664058685302734 -94.54705047607422))')),
+     (52,1,ST_GeomFromText('POINT (34.632057189941406 -96.12694549560547)'),ST_GeomFromText('POINT (35.783172607421875 -95.42267608642578)'),185.657,3.67955,292.355,293.819,44.8018,0.0,ST_GeomFromText('POLYGON ((34.632057189941406 -96.12694549560547, 35.783172607421875 -96.12694549560547, 35.783172607421875 -95.42267608642578, 34.632057189941406 -95.42267608642578, 34.632057189941406 -96.12694549560547))')),
+     (53,1,ST_GeomFromText('POINT (35.6405029296875 -95.27555847167969)'),ST_GeomFromText('POINT (36.50360870361328 -94.56356811523438)'),213.22,1.9885,292.463,295.226,43.5953,0.0,ST_GeomFromText('POLYGON ((35.6405029296875 -95.27555847167969, 36.50360870361328 -95.27555847167969, 36.50360870361328 -94.56356811523438, 35.6405029296875 -94.56356811523438, 35.6405029296875 -95.27555847167969))')),
+     (54,1,ST_GeomFromText('POINT (35.710445404052734 -92.49485778808594)'),ST_GeomFromText('POINT (35.99821472167969 -91.78504180908203)'),309.315,1.36631,294.314,295.54,41.4329,0.0,ST_GeomFromText('POLYGON ((35.710445404052734 -92.49485778808594, 35.99821472167969 -92.49485778808594, 35.99821472167969 -91.78504180908203, 35.710445404052734 -91.78504180908203, 35.710445404052734 -92.49485778808594))')),
+     (55,1,ST_GeomFromText('POINT (36.14925003051758 -96.52323150634766)'),ST_GeomFromText('POINT (36.43682861328125 -96.1664810180664)'),162.815,2.17097,293.518,297.251,41.229,0.0,ST_GeomFromText('POLYGON ((36.14925003051758 -96.52323150634766, 36.43682861328125 -96.52323150634766, 36.43682861328125 -96.1664810180664, 36.14925003051758 -96.1664810180664, 36.14925003051758 -96.52323150634766))')),
+     (56,1,ST_GeomFromText('POINT (36.40350341796875 -96.37086486816406)'),ST_GeomFromText('POINT (36.69098663330078 -96.01300048828125)'),148.925,1.9348,290.943,296.104,47.2827,0.0,ST_GeomFromText('POLYGON ((36.40350341796875 -96.37086486816406, 36.69098663330078 -96.37086486816406, 36.69098663330078 -96.01300048828125, 36.40350341796875 -96.01300048828125, 36.40350341796875 -96.37086486816406))')),
+     (57,1,ST_GeomFromText('POINT (36.949317932128906 -101.73961639404297)'),ST_GeomFromText('POINT (37.236820220947266 -101.3791732788086)'),86.7227,5.90784,292.081,294.207,24.6831,0.0,ST_GeomFromText('POLYGON ((36.949317932128906 -101.73961639404297, 37.236820220947266 -101.73961639404297, 37.236820220947266 -101.3791732788086, 36.949317932128906 -101.3791732788086, 36.949317932128906 -101.73961639404297))')),
+     (58,1,ST_GeomFromText('POINT (43.97015380859375 -121.1942367553711)'),ST_GeomFromText('POINT (44.54558563232422 -117.5780258178711)'),216.538,2.38632,283.81,285.532,49.7558,0.0,ST_GeomFromText('POLYGON ((43.97015380859375 -121.1942367553711, 44.54558563232422 -121.1942367553711, 44.54558563232422 -117.5780258178711, 43.97015380859375 -117.5780258178711, 43.97015380859375 -121.1942367553711))')),
+     (59,1,ST_GeomFromText('POINT (46.26691436767578 -118.26094055175781)'),ST_GeomFromText('POINT (46.55460739135742 -117.84375)'),225.737,6.97095,285.97,289.089,48.9121,0.0,ST_GeomFromText('POLYGON ((46.26691436767578 -118.26094055175781, 46.55460739135742 -118.26094055175781, 46.55460739135742 -117.84375, 46.26691436767578 -117.84375, 46.26691436767578 -118.26094055175781))')),
+     (60,1,ST_GeomFromText('POINT (47.65292739868164 -120.51197814941406)'),ST_GeomFromText('POINT (49.37932205200195 -118.34004974365234)'),228.858,1.2993,280.736,283.312,60.5798,0.0,ST_GeomFromText('POLYGON ((47.65292739868164 -120.51197814941406, 49.37932205200195 -120.51197814941406, 49.37932205200195 -118.34004974365234, 47.65292739868164 -118.34004974365234, 47.65292739868164 -120.51197814941406))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (61,1,ST_GeomFromText('POINT (38.47929763793945 -123.8177261352539)'),ST_GeomFromText('POINT (41.357093811035156 -120.44055938720703)'),201.363,2.23767,283.952,287.861,55.8676,0.0,ST_GeomFromText('POLYGON ((38.47929763793945 -123.8177261352539, 41.357093811035156 -123.8177261352539, 41.357093811035156 -120.44055938720703, 38.47929763793945 -120.44055938720703, 38.47929763793945 -123.8177261352539))')),
+     (62,1,ST_GeomFromText('POINT (31.224191665649414 -84.21187591552734)'),ST_GeomFromText('POINT (31.51181983947754 -83.87516021728516)'),269.293,3.10554,290.973,292.024,29.8306,0.0,ST_GeomFromText('POLYGON ((31.224191665649414 -84.21187591552734, 31.51181983947754 -84.21187591552734, 31.51181983947754 -83.87516021728516, 31.224191665649414 -83.87516021728516, 31.224191665649414 -84.21187591552734))')),
+     (63,1,ST_GeomFromText('POINT (31.333959579467773 -88.3239974975586)'),ST_GeomFromText('POINT (31.909481048583984 -87.3102798461914)'),250.53,1.85979,292.959,293.413,36.4516,0.0,ST_GeomFromText('POLYGON ((31.333959579467773 -88.3239974975586, 31.909481048583984 -88.3239974975586, 31.909481048583984 -87.3102798461914, 31.333959579467773 -87.3102798461914, 31.333959579467773 -88.3239974975586))')),
+     (64,1,ST_GeomFromText('POINT (31.45073699951172 -84.69783020019531)'),ST_GeomFromText('POINT (32.02606201171875 -84.35961151123047)'),281.204,2.76098,291.564,292.358,33.4377,0.0,ST_GeomFromText('POLYGON ((31.45073699951172 -84.69783020019531, 32.02606201171875 -84.69783020019531, 32.02606201171875 -84.35961151123047, 31.45073699951172 -84.35961151123047, 31.45073699951172 -84.69783020019531))')),
+     (65,1,ST_GeomFromText('POINT (33.084869384765625 -81.6797866821289)'),ST_GeomFromText('POINT (33.37255096435547 -81.33586883544922)'),246.767,4.80095,292.678,295.677,30.5762,0.0,ST_GeomFromText('POLYGON ((33.084869384765625 -81.6797866821289, 33.37255096435547 -81.6797866821289, 33.37255096435547 -81.33586883544922, 33.084869384765625 -81.33586883544922, 33.084869384765625 -81.6797866821289))')),
+     (66,1,ST_GeomFromText('POINT (33.2054557800293 -92.41950225830078)'),ST_GeomFromText('POINT (33.780704498291016 -91.72938537597656)'),231.371,2.92674,291.245,291.872,40.036,0.0,ST_GeomFromText('POLYGON ((33.2054557800293 -92.41950225830078, 33.780704498291016 -92.41950225830078, 33.780704498291016 -91.72938537597656, 33.2054557800293 -91.72938537597656, 33.2054557800293 -92.41950225830078))')),
+     (67,1,ST_GeomFromText('POINT (33.535491943359375 -89.81859588623047)'),ST_GeomFromText('POINT (34.11098861694336 -89.1258316040039)'),245.396,3.10824,292.0,292.607,43.3569,0.0,ST_GeomFromText('POLYGON ((33.535491943359375 -89.81859588623047, 34.11098861694336 -89.81859588623047, 34.11098861694336 -89.1258316040039, 33.535491943359375 -89.1258316040039, 33.535491943359375 -89.81859588623047))')),
+     (68,1,ST_GeomFromText('POINT (33.84652328491211 -93.54780578613281)'),ST_GeomFromText('POINT (34.42197799682617 -93.20020294189453)'),224.503,2.91806,289.725,292.166,42.499,0.0,ST_GeomFromText('POLYGON ((33.84652328491211 -93.54780578613281, 34.42197799682617 -93.54780578613281, 34.42197799682617 -93.20020294189453, 33.84652328491211 -93.20020294189453, 33.84652328491211 -93.54780578613281))')),
+     (69,1,ST_GeomFromText('POINT (33.98876953125 -88.155517578125)'),ST_GeomFromText('POINT (35.139888763427734 -86.75786590576172)'),253.382,3.07286,290.82,293.501,41.1452,0.0,ST_GeomFromText('POLYGON ((33.98876953125 -88.155517578125, 35.139888763427734 -88.155517578125, 35.139888763427734 -86.75786590576172, 33.98876953125 -86.75786590576172, 33.98876953125 -88.155517578125))')),
+     (70,1,ST_GeomFromText('POINT (34.46026611328125 -89.61217498779297)'),ST_GeomFromText('POINT (34.74800491333008 -88.5634994506836)'),265.537,2.83957,293.087,293.796,44.3255,0.0,ST_GeomFromText('POLYGON ((34.46026611328125 -89.61217498779297, 34.74800491333008 -89.61217498779297, 34.74800491333008 -88.5634994506836, 34.46026611328125 -88.5634994506836, 34.46026611328125 -89.61217498779297))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (71,1,ST_GeomFromText('POINT (34.557857513427734 -84.88082885742188)'),ST_GeomFromText('POINT (34.84543991088867 -84.18107604980469)'),170.156,3.24264,289.31,292.412,44.0605,0.0,ST_GeomFromText('POLYGON ((34.557857513427734 -84.88082885742188, 34.84543991088867 -84.88082885742188, 34.84543991088867 -84.18107604980469, 34.557857513427734 -84.18107604980469, 34.557857513427734 -84.88082885742188))')),
+     (72,1,ST_GeomFromText('POINT (34.6893196105957 -93.0876693725586)'),ST_GeomFromText('POINT (35.55240249633789 -92.38432312011719)'),223.406,2.44067,292.152,296.423,40.5995,0.0,ST_GeomFromText('POLYGON ((34.6893196105957 -93.0876693725586, 35.55240249633789 -93.0876693725586, 35.55240249633789 -92.38432312011719, 34.6893196105957 -92.38432312011719, 34.6893196105957 -93.0876693725586))')),
+     (73,1,ST_GeomFromText('POINT (34.69294738769531 -94.4190444946289)'),ST_GeomFromText('POINT (34.98043441772461 -94.06874084472656)'),196.479,2.52041,291.845,292.889,38.4209,0.0,ST_GeomFromText('POLYGON ((34.69294738769531 -94.4190444946289, 34.98043441772461 -94.4190444946289, 34.98043441772461 -94.06874084472656, 34.69294738769531 -94.06874084472656, 34.69294738769531 -94.4190444946289))')),
+     (74,1,ST_GeomFromText('POINT (34.95915603637695 -84.2867202758789)'),ST_GeomFromText('POINT (35.53450393676758 -83.93467712402344)'),218.795,3.51886,288.161,291.673,42.3354,0.0,ST_GeomFromText('POLYGON ((34.95915603637695 -84.2867202758789, 35.53450393676758 -84.2867202758789, 35.53450393676758 -83.93467712402344, 34.95915603637695 -83.93467712402344, 34.95915603637695 -84.2867202758789))')),
+     (75,1,ST_GeomFromText('POINT (35.03358459472656 -91.60346221923828)'),ST_GeomFromText('POINT (35.89675521850586 -90.54374694824219)'),273.338,2.33739,292.985,294.629,44.4502,0.0,ST_GeomFromText('POLYGON ((35.03358459472656 -91.60346221923828, 35.89675521850586 -91.60346221923828, 35.89675521850586 -90.54374694824219, 35.03358459472656 -90.54374694824219, 35.03358459472656 -91.60346221923828))')),
+     (76,1,ST_GeomFromText('POINT (35.22866439819336 -93.9430923461914)'),ST_GeomFromText('POINT (35.80404281616211 -93.23632049560547)'),233.473,1.70737,291.738,294.713,44.6703,0.0,ST_GeomFromText('POLYGON ((35.22866439819336 -93.9430923461914, 35.80404281616211 -93.9430923461914, 35.80404281616211 -93.23632049560547, 35.22866439819336 -93.23632049560547, 35.22866439819336 -93.9430923461914))')),
+     (77,1,ST_GeomFromText('POINT (35.87663650512695 -87.98678588867188)'),ST_GeomFromText('POINT (36.739933013916016 -86.55830383300781)'),252.643,2.71036,290.692,293.027,39.9311,0.0,ST_GeomFromText('POLYGON ((35.87663650512695 -87.98678588867188, 36.739933013916016 -87.98678588867188, 36.739933013916016 -86.55830383300781, 35.87663650512695 -86.55830383300781, 35.87663650512695 -87.98678588867188))')),
+     (78,1,ST_GeomFromText('POINT (36.358299255371094 -91.84829711914062)'),ST_GeomFromText('POINT (36.64604187011719 -91.13259887695312)'),82.1714,1.91974,293.081,294.739,42.4844,0.0,ST_GeomFromText('POLYGON ((36.358299255371094 -91.84829711914062, 36.64604187011719 -91.84829711914062, 36.64604187011719 -91.13259887695312, 36.358299255371094 -91.13259887695312, 36.358299255371094 -91.84829711914062))')),
+     (79,1,ST_GeomFromText('POINT (37.572608947753906 -89.65935516357422)'),ST_GeomFromText('POINT (39.299041748046875 -87.08779907226562)'),265.813,5.37782,285.169,287.953,31.7828,0.0,ST_GeomFromText('POLYGON ((37.572608947753906 -89.65935516357422, 39.299041748046875 -89.65935516357422, 39.299041748046875 -87.08779907226562, 37.572608947753906 -87.08779907226562, 37.572608947753906 -89.65935516357422))')),
+     (80,1,ST_GeomFromText('POINT (38.930267333984375 -97.53042602539062)'),ST_GeomFromText('POINT (39.217933654785156 -97.15996551513672)'),68.7983,7.65773,282.632,287.068,41.1099,0.0,ST_GeomFromText('POLYGON ((38.930267333984375 -97.53042602539062, 39.217933654785156 -97.53042602539062, 39.217933654785156 -97.15996551513672, 38.930267333984375 -97.15996551513672, 38.930267333984375 -97.53042602539062))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (81,1,ST_GeomFromText('POINT (40.6191291809082 -100.24585723876953)'),ST_GeomFromText('POINT (40.906612396240234 -99.86629486083984)'),87.0947,5.532,280.196,280.744,44.5308,0.0,ST_GeomFromText('POLYGON ((40.6191291809082 -100.24585723876953, 40.906612396240234 -100.24585723876953, 40.906612396240234 -99.86629486083984, 40.6191291809082 -99.86629486083984, 40.6191291809082 -100.24585723876953))')),
+     (82,1,ST_GeomFromText('POINT (40.82418441772461 -100.57318115234375)'),ST_GeomFromText('POINT (41.11188507080078 -100.1921157836914)'),93.8232,5.25656,280.047,280.34,48.1099,0.0,ST_GeomFromText('POLYGON ((40.82418441772461 -100.57318115234375, 41.11188507080078 -100.57318115234375, 41.11188507080078 -100.1921157836914, 40.82418441772461 -100.1921157836914, 40.82418441772461 -100.57318115234375))')),
+     (83,1,ST_GeomFromText('POINT (43.93101501464844 -95.0597152709961)'),ST_GeomFromText('POINT (44.218482971191406 -94.6595687866211)'),344.252,5.86456,270.141,271.329,27.6963,0.0,ST_GeomFromText('POLYGON ((43.93101501464844 -95.0597152709961, 44.218482971191406 -95.0597152709961, 44.218482971191406 -94.6595687866211, 43.93101501464844 -94.6595687866211, 43.93101501464844 -95.0597152709961))')),
+     (84,1,ST_GeomFromText('POINT (45.12283706665039 -94.22359466552734)'),ST_GeomFromText('POINT (45.985992431640625 -93.40205383300781)'),315.679,5.0846,267.465,270.059,41.7074,0.0,ST_GeomFromText('POLYGON ((45.12283706665039 -94.22359466552734, 45.985992431640625 -94.22359466552734, 45.985992431640625 -93.40205383300781, 45.12283706665039 -93.40205383300781, 45.12283706665039 -94.22359466552734))')),
+     (85,1,ST_GeomFromText('POINT (43.900630950927734 -108.15746307373047)'),ST_GeomFromText('POINT (44.18830108642578 -107.75737762451172)'),265.591,1.04167,281.923,284.411,46.0,0.0,ST_GeomFromText('POLYGON ((43.900630950927734 -108.15746307373047, 44.18830108642578 -108.15746307373047, 44.18830108642578 -107.75737762451172, 43.900630950927734 -107.75737762451172, 43.900630950927734 -108.15746307373047))')),
+     (86,1,ST_GeomFromText('POINT (44.786128997802734 -108.24590301513672)'),ST_GeomFromText('POINT (45.07360076904297 -107.83983612060547)'),221.154,2.30665,277.044,279.383,50.209,0.0,ST_GeomFromText('POLYGON ((44.786128997802734 -108.24590301513672, 45.07360076904297 -108.24590301513672, 45.07360076904297 -107.83983612060547, 44.786128997802734 -107.83983612060547, 44.786128997802734 -108.24590301513672))')),
+     (87,1,ST_GeomFromText('POINT (45.80165481567383 -116.42875671386719)'),ST_GeomFromText('POINT (46.0892448425293 -116.01508331298828)'),257.174,2.80732,284.918,288.012,42.1655,0.0,ST_GeomFromText('POLYGON ((45.80165481567383 -116.42875671386719, 46.0892448425293 -116.42875671386719, 46.0892448425293 -116.01508331298828, 45.80165481567383 -116.01508331298828, 45.80165481567383 -116.42875671386719))')),
+     (88,1,ST_GeomFromText('POINT (45.90814208984375 -115.51866912841797)'),ST_GeomFromText('POINT (46.19561767578125 -115.10444641113281)'),241.094,1.86715,284.949,284.999,56.3311,0.0,ST_GeomFromText('POLYGON ((45.90814208984375 -115.51866912841797, 46.19561767578125 -115.51866912841797, 46.19561767578125 -115.10444641113281, 45.90814208984375 -115.10444641113281, 45.90814208984375 -115.51866912841797))')),
+     (89,1,ST_GeomFromText('POINT (46.13179397583008 -116.51864624023438)'),ST_GeomFromText('POINT (46.419315338134766 -116.1025390625)'),259.039,3.71854,285.317,289.643,47.4126,0.0,ST_GeomFromText('POLYGON ((46.13179397583008 -116.51864624023438, 46.419315338134766 -116.51864624023438, 46.419315338134766 -116.1025390625, 46.13179397583008 -116.1025390625, 46.13179397583008 -116.51864624023438))')),
+     (90,1,ST_GeomFromText('POINT (46.36740493774414 -117.68375396728516)'),ST_GeomFromText('POINT (46.655033111572266 -117.26580047607422)'),232.653,3.60588,286.091,288.589,51.2686,0.0,ST_GeomFromText('POLYGON ((46.36740493774414 -117.68375396728516, 46.655033111572266 -117.68375396728516, 46.655033111572266 -117.26580047607422, 46.36740493774414 -117.26580047607422, 46.36740493774414 -117.68375396728516))'));
+INSERT INTO region (fire_id,run_id,min_coord,max_coord,wind_direction,wind_speed,temp_min,temp_max,humidity,precipitation,bounds) VALUES
+     (91,1,ST_GeomFromText('POINT (46.71598815917969 -117.8984603881836)'),ST_GeomFromText('POINT (47.00364303588867 -117.47797393798828)'),226.476,7.12532,287.175,288.669,53.353,0.0,ST_GeomFromText('POLYGON ((46.71598815917969 -117.8984603881836, 47.00364303588867 -117.8984603881836, 47.00364303588867 -117.47797393798828, 46.71598815917969 -117.47797393798828, 46.71598815917969 -117.8984603881836))'));
+
+
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,1,1,ST_GeomFromText('POLYGON ((36.59638977050781 -96.40538024902344, 36.587406158447266 -96.40538024902344, 36.53350830078125 -96.3941650390625, 36.53350830078125 -96.3829574584961, 36.5424919128418 -96.36053466796875, 36.587406158447266 -96.34931945800781, 36.59638977050781 -96.34931945800781, 36.686222076416016 -96.36053466796875, 36.686222076416016 -96.37174224853516, 36.59638977050781 -96.40538024902344))')),
+     (2,1,1,ST_GeomFromText('POLYGON ((36.49757766723633 -96.30447387695312, 36.49757766723633 -96.25962829589844, 36.71316909790039 -96.27084350585938, 36.49757766723633 -96.30447387695312))')),
+     (1,2,1,ST_GeomFromText('POLYGON ((46.763092041015625 -111.77608489990234, 46.74512481689453 -111.77608489990234, 46.74512481689453 -111.73664093017578, 46.75410842895508 -111.73664093017578, 46.763092041015625 -111.74979400634766, 46.763092041015625 -111.77608489990234))')),
+     (2,2,1,ST_GeomFromText('POLYGON ((46.64631271362305 -111.6840591430664, 46.64631271362305 -111.61832427978516, 46.861907958984375 -111.6314697265625, 46.64631271362305 -111.6840591430664))')),
+     (1,3,1,ST_GeomFromText('POLYGON ((41.67237854003906 -92.78606414794922, 41.2591552734375 -93.82846069335938, 41.25017166137695 -93.82846069335938, 39.561344146728516 -93.10491180419922, 39.30083465576172 -92.56531524658203, 39.30083465576172 -92.55305480957031, 42.543739318847656 -89.24190521240234, 42.5527229309082 -89.24190521240234, 42.5527229309082 -89.26642608642578, 41.67237854003906 -92.78606414794922))')),
+     (2,3,1,ST_GeomFromText('POLYGON ((42.9030647277832 -91.95214080810547, 42.87611389160156 -93.5218734741211, 42.85814666748047 -93.55866241455078, 39.19303894042969 -93.55866241455078, 39.175071716308594 -90.41919708251953, 39.175071716308594 -90.37014770507812, 42.840179443359375 -90.37014770507812, 42.85814666748047 -90.38240814208984, 42.9030647277832 -91.95214080810547))')),
+     (1,4,1,ST_GeomFromText('POLYGON ((33.50639724731445 -82.49718475341797, 33.50639724731445 -82.50796508789062, 33.49741744995117 -82.50796508789062, 33.05724334716797 -82.41094970703125, 32.6619873046875 -82.27082824707031, 32.45537567138672 -82.03368377685547, 32.45537567138672 -82.02291107177734, 32.91351318359375 -81.75343322753906, 32.9224967956543 -81.75343322753906, 33.183006286621094 -81.99057006835938, 33.50639724731445 -82.49718475341797))')),
+     (2,4,1,ST_GeomFromText('POLYGON ((33.44351577758789 -82.36783599853516, 33.37165069580078 -82.4001693725586, 32.581138610839844 -82.59419250488281, 32.509273529052734 -82.45407104492188, 32.41944122314453 -81.71031951904297, 32.41944122314453 -81.66719818115234, 33.281822204589844 -81.66719818115234, 33.35368728637695 -81.677978515625, 33.54233169555664 -82.02291107177734, 33.44351577758789 -82.36783599853516))')),
+     (1,5,1,ST_GeomFromText('POLYGON ((33.97715759277344 -79.94873809814453, 33.65376663208008 -80.4470443725586, 33.64478302001953 -80.4470443725586, 33.22257614135742 -79.61292266845703, 33.22257614135742 -79.60209655761719, 33.240543365478516 -79.58042907714844, 33.60885238647461 -79.5262680053711, 33.617835998535156 -79.5262680053711, 33.97715759277344 -79.56959533691406, 33.97715759277344 -79.94873809814453))')),
+     (2,5,1,ST_GeomFromText('POLYGON ((33.968177795410156 -79.88374328613281, 33.869361877441406 -80.2520523071289, 33.58190155029297 -80.4037094116211, 33.22257614135742 -80.26288604736328, 33.132747650146484 -79.56959533691406, 33.132747650146484 -79.5262680053711, 33.707664489746094 -79.5262680053711, 33.7795295715332 -79.53709411621094, 33.968177795410156 -79.88374328613281))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,6,1,ST_GeomFromText('POLYGON ((33.76689529418945 -83.67831420898438, 33.76689529418945 -83.68914031982422, 33.13807678222656 -83.8730697631836, 33.129093170166016 -83.8730697631836, 33.129093170166016 -83.85143280029297, 33.43452072143555 -82.6937255859375, 33.443504333496094 -82.6937255859375, 33.650115966796875 -83.03995513916016, 33.76689529418945 -83.67831420898438))')),
+     (2,6,1,ST_GeomFromText('POLYGON ((33.6680793762207 -83.8189697265625, 33.1650276184082 -83.8838882446289, 33.021297454833984 -83.73241424560547, 33.021297454833984 -83.68914031982422, 33.81180953979492 -83.68914031982422, 33.86570739746094 -83.69995880126953, 33.6680793762207 -83.8189697265625))')),
+     (1,7,1,ST_GeomFromText('POLYGON ((33.884647369384766 -85.56883239746094, 33.884647369384766 -85.60134887695312, 33.86668014526367 -85.60134887695312, 33.58820343017578 -85.34123229980469, 33.58820343017578 -85.33039855957031, 33.59718704223633 -85.33039855957031, 33.884647369384766 -85.56883239746094))')),
+     (2,7,1,ST_GeomFromText('POLYGON ((33.76786422729492 -85.39542388916016, 33.480403900146484 -85.39542388916016, 33.480403900146484 -85.3520736694336, 33.76786422729492 -85.3520736694336, 33.98345947265625 -85.36290740966797, 33.76786422729492 -85.39542388916016))')),
+     (1,8,1,ST_GeomFromText('POLYGON ((34.251277923583984 -82.29674530029297, 34.251277923583984 -82.32936096191406, 33.90991973876953 -82.53591918945312, 33.900936126708984 -82.53591918945312, 33.73923873901367 -82.05757904052734, 33.73923873901367 -82.04670715332031, 34.0626335144043 -81.84014892578125, 34.07161331176758 -81.84014892578125, 34.251277923583984 -82.29674530029297))')),
+     (2,8,1,ST_GeomFromText('POLYGON ((34.17042922973633 -82.65550231933594, 33.88296890258789 -82.6446304321289, 33.81110382080078 -82.48155975341797, 33.72127151489258 -81.76405334472656, 33.72127151489258 -81.72056579589844, 34.008731842041016 -81.72056579589844, 34.080596923828125 -81.73143768310547, 34.26924133300781 -82.0793228149414, 34.17042922973633 -82.65550231933594))')),
+     (1,9,1,ST_GeomFromText('POLYGON ((34.424137115478516 -80.9249038696289, 34.41515350341797 -80.9249038696289, 34.0198974609375 -80.87035369873047, 34.0198974609375 -80.8485336303711, 34.23549270629883 -80.30302429199219, 34.244476318359375 -80.30302429199219, 34.496002197265625 -80.39030456542969, 34.50498580932617 -80.40121459960938, 34.567867279052734 -80.54305267333984, 34.567867279052734 -80.55396270751953, 34.424137115478516 -80.9249038696289))')),
+     (2,9,1,ST_GeomFromText('POLYGON ((34.41515350341797 -80.90308380126953, 34.16362762451172 -80.90308380126953, 34.0198974609375 -80.71761322021484, 34.0198974609375 -80.6739730834961, 34.451087951660156 -80.6739730834961, 34.55888366699219 -80.68488311767578, 34.41515350341797 -80.90308380126953))')),
+     (1,10,1,ST_GeomFromText('POLYGON ((34.34176254272461 -78.4454574584961, 34.08125305175781 -78.0102310180664, 34.072269439697266 -77.97759246826172, 34.072269439697266 -77.96670532226562, 34.08125305175781 -77.96670532226562, 34.09023666381836 -77.97759246826172, 34.34176254272461 -78.4454574584961))')),
+     (2,10,1,ST_GeomFromText('POLYGON ((34.08125305175781 -78.43457794189453, 34.08125305175781 -78.2822494506836, 34.22498321533203 -78.27136993408203, 34.33277893066406 -78.2822494506836, 34.08125305175781 -78.43457794189453))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,11,1,ST_GeomFromText('POLYGON ((35.07324981689453 -79.78032684326172, 35.07324981689453 -79.80228424072266, 34.884605407714844 -80.08776092529297, 34.8756217956543 -80.08776092529297, 34.84867477416992 -79.30819702148438, 34.84867477416992 -79.2862319946289, 34.85765838623047 -79.2862319946289, 35.07324981689453 -79.78032684326172))')),
+     (2,11,1,ST_GeomFromText('POLYGON ((34.99240493774414 -80.15364074707031, 34.92053985595703 -79.96697998046875, 34.83070755004883 -79.38505554199219, 34.83070755004883 -79.22035217285156, 34.90257263183594 -79.23133850097656, 35.091217041015625 -79.58268737792969, 34.99240493774414 -80.15364074707031))')),
+     (1,12,1,ST_GeomFromText('POLYGON ((35.77831268310547 -81.8923568725586, 35.76933288574219 -81.8923568725586, 35.55373764038086 -81.74784088134766, 35.55373764038086 -81.72560119628906, 36.05678939819336 -81.14752960205078, 36.065773010253906 -81.14752960205078, 36.065773010253906 -81.15864562988281, 35.77831268310547 -81.8923568725586))')),
+     (2,12,1,ST_GeomFromText('POLYGON ((36.083740234375 -81.41433715820312, 35.98492431640625 -81.77007293701172, 35.91305923461914 -81.80342102050781, 35.62560272216797 -81.80342102050781, 35.535770416259766 -81.09194946289062, 35.535770416259766 -81.04747772216797, 35.8232307434082 -81.04747772216797, 35.89509582519531 -81.05859375, 36.083740234375 -81.41433715820312))')),
+     (1,13,1,ST_GeomFromText('POLYGON ((27.15709114074707 -81.14703369140625, 26.582172393798828 -81.6739501953125, 26.57318878173828 -81.6739501953125, 26.42047691345215 -80.99503326416016, 26.42047691345215 -80.98490142822266, 26.546239852905273 -80.51878356933594, 26.680986404418945 -80.4782485961914, 27.543365478515625 -80.71131134033203, 27.56133270263672 -80.73157501220703, 27.56133270263672 -80.74171447753906, 27.15709114074707 -81.14703369140625))')),
+     (2,13,1,ST_GeomFromText('POLYGON ((27.336753845214844 -81.68408203125, 26.851665496826172 -81.59288787841797, 26.42047691345215 -81.5016860961914, 26.42047691345215 -81.4510269165039, 27.498449325561523 -81.4510269165039, 27.552349090576172 -81.4611587524414, 27.336753845214844 -81.68408203125))')),
+     (1,14,1,ST_GeomFromText('POLYGON ((27.570890426635742 -82.04180145263672, 27.570890426635742 -82.05194854736328, 27.561908721923828 -82.05194854736328, 27.25648307800293 -81.89976501464844, 27.25648307800293 -81.88961791992188, 27.50800895690918 -81.73743438720703, 27.516992568969727 -81.73743438720703, 27.570890426635742 -82.04180145263672))')),
+     (2,14,1,ST_GeomFromText('POLYGON ((27.445127487182617 -81.82874298095703, 27.157669067382812 -81.82874298095703, 27.157669067382812 -81.78816223144531, 27.445127487182617 -81.78816223144531, 27.660722732543945 -81.79830932617188, 27.445127487182617 -81.82874298095703))')),
+     (1,15,1,ST_GeomFromText('POLYGON ((27.86079216003418 -82.50533294677734, 27.86079216003418 -82.5155029296875, 27.851810455322266 -82.5155029296875, 27.833843231201172 -82.50533294677734, 27.636215209960938 -82.27157592773438, 27.636215209960938 -82.26141357421875, 27.645198822021484 -82.26141357421875, 27.86079216003418 -82.50533294677734))')),
+     (2,15,1,ST_GeomFromText('POLYGON ((27.86079216003418 -82.53582763671875, 27.636215209960938 -82.34272003173828, 27.636215209960938 -82.28173828125, 27.851810455322266 -82.29190063476562, 27.86079216003418 -82.53582763671875))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,16,1,ST_GeomFromText('POLYGON ((28.962905883789062 -82.29241943359375, 28.953922271728516 -82.29241943359375, 28.837142944335938 -82.24101257324219, 28.837142944335938 -82.23072814941406, 29.097652435302734 -82.23072814941406, 29.097652435302734 -82.24101257324219, 28.962905883789062 -82.29241943359375))')),
+     (2,16,1,ST_GeomFromText('POLYGON ((29.070703506469727 -82.24101257324219, 28.8551082611084 -82.3232650756836, 28.8551082611084 -82.14847564697266, 29.070703506469727 -82.15876007080078, 29.070703506469727 -82.24101257324219))')),
+     (1,17,1,ST_GeomFromText('POLYGON ((30.20110511779785 -82.41416931152344, 30.192123413085938 -82.41416931152344, 29.733983993530273 -81.99715423583984, 29.725000381469727 -81.98672485351562, 29.725000381469727 -81.97630310058594, 30.407716751098633 -81.9241714477539, 30.41670036315918 -81.9241714477539, 30.41670036315918 -81.93460083007812, 30.20110511779785 -82.41416931152344))')),
+     (2,17,1,ST_GeomFromText('POLYGON ((30.192123413085938 -82.40374755859375, 29.653135299682617 -82.26821899414062, 29.653135299682617 -82.22651672363281, 30.371784210205078 -82.22651672363281, 30.479581832885742 -82.2369384765625, 30.192123413085938 -82.40374755859375))')),
+     (1,18,1,ST_GeomFromText('POLYGON ((30.0322322845459 -83.06024169921875, 30.02324867248535 -83.06024169921875, 29.942401885986328 -82.8629150390625, 29.93341827392578 -82.7071304321289, 29.93341827392578 -82.69674682617188, 29.942401885986328 -82.69674682617188, 30.0322322845459 -82.81098175048828, 30.0322322845459 -83.06024169921875))')),
+     (2,18,1,ST_GeomFromText('POLYGON ((29.996299743652344 -82.98754119873047, 29.852569580078125 -82.97715759277344, 29.852569580078125 -82.93561553955078, 29.996299743652344 -82.93561553955078, 30.104097366333008 -82.94599914550781, 29.996299743652344 -82.98754119873047))')),
+     (1,19,1,ST_GeomFromText('POLYGON ((30.58103370666504 -84.45137786865234, 30.34747314453125 -84.53492736816406, 30.338489532470703 -84.53492736816406, 30.311540603637695 -84.52448272705078, 30.18577766418457 -84.36783599853516, 30.18577766418457 -84.35739135742188, 30.194759368896484 -84.35739135742188, 30.58103370666504 -84.4409408569336, 30.58103370666504 -84.45137786865234))')),
+     (2,19,1,ST_GeomFromText('POLYGON ((30.338489532470703 -84.55581665039062, 30.122894287109375 -84.37828063964844, 30.122894287109375 -84.33650970458984, 30.410354614257812 -84.33650970458984, 30.62594985961914 -84.3469467163086, 30.338489532470703 -84.55581665039062))')),
+     (1,20,1,ST_GeomFromText('POLYGON ((30.936634063720703 -83.98091125488281, 30.936634063720703 -83.99137878417969, 30.90070152282715 -84.17991638183594, 30.703073501586914 -84.29512786865234, 30.694089889526367 -84.29512786865234, 30.59527587890625 -84.21133422851562, 30.397647857666016 -83.9599609375, 30.38866424560547 -83.81332397460938, 30.38866424560547 -83.80284881591797, 30.532394409179688 -83.63526153564453, 30.658157348632812 -83.64573669433594, 30.855785369873047 -83.82379913330078, 30.936634063720703 -83.98091125488281))')),
+     (2,20,1,ST_GeomFromText('POLYGON ((30.819852828979492 -84.23228454589844, 30.64019203186035 -84.24275970458984, 30.38866424560547 -84.22180938720703, 30.38866424560547 -84.0228042602539, 30.532394409179688 -84.0228042602539, 30.927650451660156 -84.03327941894531, 30.819852828979492 -84.23228454589844))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,21,1,ST_GeomFromText('POLYGON ((30.875707626342773 -86.9504623413086, 30.857742309570312 -86.97142028808594, 30.848758697509766 -86.97142028808594, 30.83977508544922 -86.92949676513672, 30.83977508544922 -86.91902160644531, 30.866724014282227 -86.91902160644531, 30.875707626342773 -86.92949676513672, 30.875707626342773 -86.9504623413086))')),
+     (2,21,1,ST_GeomFromText('POLYGON ((30.74994468688965 -86.88758087158203, 30.74994468688965 -86.8351821899414, 30.965538024902344 -86.84565734863281, 30.74994468688965 -86.88758087158203))')),
+     (1,22,1,ST_GeomFromText('POLYGON ((31.004812240600586 -86.99030303955078, 30.986846923828125 -86.99030303955078, 30.986846923828125 -86.96930694580078, 31.013795852661133 -86.91682434082031, 31.02277946472168 -86.91682434082031, 31.031761169433594 -86.92732238769531, 31.031761169433594 -86.93782043457031, 31.004812240600586 -86.99030303955078))')),
+     (2,22,1,ST_GeomFromText('POLYGON ((30.897014617919922 -86.88533782958984, 30.897014617919922 -86.84335327148438, 31.11260986328125 -86.85384368896484, 30.897014617919922 -86.88533782958984))')),
+     (1,23,1,ST_GeomFromText('POLYGON ((31.260679244995117 -86.99446868896484, 31.260679244995117 -87.0155029296875, 31.251697540283203 -87.0260238647461, 31.242713928222656 -87.0260238647461, 31.179832458496094 -86.91030883789062, 31.179832458496094 -86.88926696777344, 31.188814163208008 -86.88926696777344, 31.260679244995117 -86.99446868896484))')),
+     (2,23,1,ST_GeomFromText('POLYGON ((31.107967376708984 -86.88926696777344, 31.107967376708984 -86.8471908569336, 31.32356071472168 -86.85770416259766, 31.107967376708984 -86.88926696777344))')),
+     (1,24,1,ST_GeomFromText('POLYGON ((31.38298797607422 -84.51142883300781, 31.38298797607422 -84.52195739746094, 31.248241424560547 -84.52195739746094, 31.248241424560547 -84.50090026855469, 31.320106506347656 -84.40612030029297, 31.32908821105957 -84.40612030029297, 31.38298797607422 -84.51142883300781))')),
+     (2,24,1,ST_GeomFromText('POLYGON ((31.203325271606445 -84.39559173583984, 31.203325271606445 -84.35346984863281, 31.418920516967773 -84.36399841308594, 31.203325271606445 -84.39559173583984))')),
+     (1,25,1,ST_GeomFromText('POLYGON ((31.464441299438477 -84.29930877685547, 31.45545768737793 -84.29930877685547, 31.419525146484375 -84.25711822509766, 31.419525146484375 -84.24657440185547, 31.446474075317383 -84.20439147949219, 31.47342300415039 -84.1727523803711, 31.491390228271484 -84.1727523803711, 31.491390228271484 -84.19384765625, 31.464441299438477 -84.29930877685547))')),
+     (2,25,1,ST_GeomFromText('POLYGON ((31.33867645263672 -84.1622085571289, 31.33867645263672 -84.12002563476562, 31.554271697998047 -84.13056945800781, 31.33867645263672 -84.1622085571289))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,26,1,ST_GeomFromText('POLYGON ((31.54376220703125 -81.69816589355469, 31.52579689025879 -81.69816589355469, 31.52579689025879 -81.67705535888672, 31.54376220703125 -81.5820541381836, 31.552745819091797 -81.5820541381836, 31.552745819091797 -81.60316467285156, 31.54376220703125 -81.69816589355469))')),
+     (2,26,1,ST_GeomFromText('POLYGON ((31.426982879638672 -81.57149505615234, 31.426982879638672 -81.5292739868164, 31.642576217651367 -81.53982543945312, 31.426982879638672 -81.57149505615234))')),
+     (1,27,1,ST_GeomFromText('POLYGON ((32.21098327636719 -85.61615753173828, 32.20199966430664 -85.61615753173828, 32.16606903076172 -85.52044677734375, 32.16606903076172 -85.50981140136719, 32.255897521972656 -85.49917602539062, 32.2648811340332 -85.49917602539062, 32.2648811340332 -85.50981140136719, 32.21098327636719 -85.61615753173828))')),
+     (2,27,1,ST_GeomFromText('POLYGON ((32.10318374633789 -85.4885482788086, 32.10318374633789 -85.44600677490234, 32.31877899169922 -85.4566421508789, 32.10318374633789 -85.4885482788086))')),
+     (1,28,1,ST_GeomFromText('POLYGON ((32.61452865600586 -81.31324768066406, 32.60554504394531 -81.31324768066406, 32.45283508300781 -81.05713653564453, 32.443851470947266 -80.85438537597656, 32.623512268066406 -80.5235824584961, 32.623512268066406 -80.60894775390625, 32.61452865600586 -81.31324768066406))')),
+     (2,28,1,ST_GeomFromText('POLYGON ((32.659446716308594 -80.81169891357422, 32.560630798339844 -81.15318298339844, 32.488765716552734 -81.21720886230469, 32.39893341064453 -80.50223541259766, 32.39893341064453 -80.45954895019531, 32.47079849243164 -80.47022247314453, 32.659446716308594 -80.81169891357422))')),
+     (1,29,1,ST_GeomFromText('POLYGON ((33.005027770996094 -81.41090393066406, 32.99604415893555 -81.421630859375, 32.987060546875 -81.421630859375, 32.64570236206055 -81.38945770263672, 32.63671875 -81.37873840332031, 32.63671875 -81.36801147460938, 32.95112609863281 -81.21788024902344, 32.96010971069336 -81.21788024902344, 33.005027770996094 -81.41090393066406))')),
+     (2,29,1,ST_GeomFromText('POLYGON ((32.78044891357422 -81.38945770263672, 32.56485366821289 -81.25005340576172, 32.56485366821289 -81.2071533203125, 32.85231399536133 -81.2071533203125, 33.067909240722656 -81.21788024902344, 32.78044891357422 -81.38945770263672))')),
+     (1,30,1,ST_GeomFromText('POLYGON ((33.244102478027344 -85.02330780029297, 33.19020462036133 -85.02330780029297, 32.848846435546875 -84.95880126953125, 32.848846435546875 -84.94804382324219, 32.85783004760742 -84.4964599609375, 32.86681365966797 -84.4964599609375, 33.25308609008789 -84.67924499511719, 33.244102478027344 -85.02330780029297))')),
+     (2,30,1,ST_GeomFromText('POLYGON ((33.20817184448242 -84.96955108642578, 33.0644416809082 -84.96955108642578, 32.776981353759766 -84.86203002929688, 32.776981353759766 -84.81902313232422, 33.20817184448242 -84.81902313232422, 33.31596755981445 -84.82977294921875, 33.20817184448242 -84.96955108642578))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,31,1,ST_GeomFromText('POLYGON ((33.34145736694336 -87.52497863769531, 32.88331604003906 -88.063232421875, 32.874332427978516 -88.063232421875, 32.68568801879883 -87.60033416748047, 32.68568801879883 -87.57880401611328, 33.089927673339844 -86.8037109375, 33.09891128540039 -86.8037109375, 33.34145736694336 -87.52497863769531))')),
+     (2,31,1,ST_GeomFromText('POLYGON ((33.37738800048828 -87.8802261352539, 32.802467346191406 -87.8909912109375, 32.586875915527344 -87.8909912109375, 32.586875915527344 -87.83716583251953, 33.37738800048828 -87.83716583251953, 33.4312858581543 -87.84793090820312, 33.37738800048828 -87.8802261352539))')),
+     (1,32,1,ST_GeomFromText('POLYGON ((47.7477912902832 -110.83740997314453, 47.7477912902832 -110.85078430175781, 47.70287322998047 -110.89090728759766, 47.58609390258789 -110.87753295898438, 47.613040924072266 -110.79728698730469, 47.69388961791992 -110.6635513305664, 47.70287322998047 -110.6635513305664, 47.738807678222656 -110.73042297363281, 47.7477912902832 -110.83740997314453))')),
+     (2,32,1,ST_GeomFromText('POLYGON ((47.5501594543457 -110.71704864501953, 47.5501594543457 -110.63680267333984, 47.76575469970703 -110.65017700195312, 47.5501594543457 -110.71704864501953))')),
+     (1,33,1,ST_GeomFromText('POLYGON ((36.71512985229492 -92.59041595458984, 36.71512985229492 -92.60163879394531, 36.39173889160156 -92.70265197753906, 36.382755279541016 -92.70265197753906, 36.382755279541016 -92.6914291381836, 36.526485443115234 -92.36595153808594, 36.535465240478516 -92.35472869873047, 36.54444885253906 -92.35472869873047, 36.71512985229492 -92.59041595458984))')),
+     (2,33,1,ST_GeomFromText('POLYGON ((36.58038330078125 -92.46695709228516, 36.29292297363281 -92.45573425292969, 36.29292297363281 -92.41084289550781, 36.58038330078125 -92.41084289550781, 36.79597854614258 -92.42206573486328, 36.58038330078125 -92.46695709228516))')),
+     (1,34,1,ST_GeomFromText('POLYGON ((37.420982360839844 -96.83915710449219, 37.3940315246582 -96.83915710449219, 37.3940315246582 -96.82781219482422, 37.4119987487793 -96.79376983642578, 37.61861038208008 -96.6576156616211, 37.63657760620117 -96.6576156616211, 37.627593994140625 -96.66896057128906, 37.420982360839844 -96.83915710449219))')),
+     (2,34,1,ST_GeomFromText('POLYGON ((37.61861038208008 -96.86185455322266, 37.40301513671875 -96.87319946289062, 37.40301513671875 -96.62357330322266, 37.61861038208008 -96.63491821289062, 37.61861038208008 -96.86185455322266))')),
+     (1,35,1,ST_GeomFromText('POLYGON ((37.80640411376953 -96.40658569335938, 37.80640411376953 -96.41796875, 37.7884407043457 -96.41796875, 37.70759201049805 -96.2016830444336, 37.70759201049805 -96.19029998779297, 37.716575622558594 -96.19029998779297, 37.80640411376953 -96.40658569335938))')),
+     (2,35,1,ST_GeomFromText('POLYGON ((37.86030197143555 -96.41796875, 37.644710540771484 -96.22444915771484, 37.644710540771484 -96.17891693115234, 37.86030197143555 -96.19029998779297, 37.86030197143555 -96.41796875))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,36,1,ST_GeomFromText('POLYGON ((38.74538040161133 -97.48151397705078, 38.74538040161133 -97.4930419921875, 38.73639678955078 -97.4930419921875, 38.63758087158203 -97.22779846191406, 38.63758087158203 -97.21627044677734, 38.64656448364258 -97.2047348022461, 38.655548095703125 -97.2047348022461, 38.66453170776367 -97.22779846191406, 38.74538040161133 -97.48151397705078))')),
+     (2,36,1,ST_GeomFromText('POLYGON ((38.799278259277344 -97.46997833251953, 38.583683013916016 -97.27393341064453, 38.583683013916016 -97.22779846191406, 38.799278259277344 -97.23933410644531, 38.799278259277344 -97.46997833251953))')),
+     (1,37,1,ST_GeomFromText('POLYGON ((39.686283111572266 -96.82418060302734, 39.677303314208984 -96.84757232666016, 39.66831970214844 -96.84757232666016, 39.6413688659668 -96.37979125976562, 39.6413688659668 -96.36809539794922, 39.650352478027344 -96.35640716552734, 39.677303314208984 -96.35640716552734, 39.70425033569336 -96.48504638671875, 39.70425033569336 -96.49674224853516, 39.686283111572266 -96.82418060302734))')),
+     (2,37,1,ST_GeomFromText('POLYGON ((39.686283111572266 -96.70723724365234, 39.54255676269531 -96.70723724365234, 39.54255676269531 -96.66046142578125, 39.686283111572266 -96.66046142578125, 39.79408264160156 -96.67215728759766, 39.686283111572266 -96.70723724365234))')),
+     (1,38,1,ST_GeomFromText('POLYGON ((39.728023529052734 -97.68144989013672, 39.70107650756836 -97.68144989013672, 39.70107650756836 -97.65794372558594, 40.006500244140625 -97.29360961914062, 40.01548385620117 -97.29360961914062, 40.02446746826172 -97.30536651611328, 40.02446746826172 -97.3171157836914, 39.728023529052734 -97.68144989013672))')),
+     (2,38,1,ST_GeomFromText('POLYGON ((40.02446746826172 -97.59918212890625, 39.59327697753906 -97.59918212890625, 39.59327697753906 -97.55216979980469, 40.02446746826172 -97.55216979980469, 40.13226318359375 -97.56391906738281, 40.02446746826172 -97.59918212890625))')),
+     (1,39,1,ST_GeomFromText('POLYGON ((40.50944519042969 -95.69341278076172, 40.52741241455078 -95.71707153320312, 40.52741241455078 -95.7289047241211, 40.48249435424805 -95.7289047241211, 40.39266586303711 -95.610595703125, 40.39266586303711 -95.59876251220703, 40.401649475097656 -95.59876251220703, 40.50944519042969 -95.69341278076172))')),
+     (2,39,1,ST_GeomFromText('POLYGON ((40.347747802734375 -95.58692932128906, 40.347747802734375 -95.53960418701172, 40.5633430480957 -95.55143737792969, 40.347747802734375 -95.58692932128906))')),
+     (1,40,1,ST_GeomFromText('POLYGON ((40.657981872558594 -95.77965545654297, 40.64899826049805 -95.80338287353516, 40.6400146484375 -95.80338287353516, 40.6400146484375 -95.75592803955078, 40.64899826049805 -95.74405670166016, 40.657981872558594 -95.74405670166016, 40.657981872558594 -95.77965545654297))')),
+     (2,40,1,ST_GeomFromText('POLYGON ((40.54119873046875 -95.69659423828125, 40.54119873046875 -95.64913177490234, 40.75679397583008 -95.66100311279297, 40.54119873046875 -95.69659423828125))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,41,1,ST_GeomFromText('POLYGON ((41.376041412353516 -99.76781463623047, 41.376041412353516 -99.79177856445312, 41.36705780029297 -99.79177856445312, 41.17841339111328 -99.73188018798828, 41.17841339111328 -99.71989440917969, 41.18739700317383 -99.70791625976562, 41.376041412353516 -99.76781463623047))')),
+     (2,41,1,ST_GeomFromText('POLYGON ((41.169429779052734 -99.81573486328125, 41.169429779052734 -99.62406158447266, 41.38502502441406 -99.63603973388672, 41.169429779052734 -99.81573486328125))')),
+     (1,42,1,ST_GeomFromText('POLYGON ((41.5688591003418 -99.62431335449219, 41.55987548828125 -99.62431335449219, 41.55987548828125 -99.58819580078125, 41.63174057006836 -99.52800750732422, 41.640724182128906 -99.52800750732422, 41.640724182128906 -99.54004669189453, 41.63174057006836 -99.56411743164062, 41.5688591003418 -99.62431335449219))')),
+     (2,42,1,ST_GeomFromText('POLYGON ((41.48801040649414 -99.49188995361328, 41.48801040649414 -99.44373321533203, 41.70360565185547 -99.45577239990234, 41.48801040649414 -99.49188995361328))')),
+     (1,43,1,ST_GeomFromText('POLYGON ((41.77238082885742 -98.97933197021484, 41.70051574707031 -99.00345611572266, 41.691532135009766 -99.00345611572266, 41.691532135009766 -98.9672622680664, 41.763397216796875 -98.9431381225586, 41.77238082885742 -98.9431381225586, 41.77238082885742 -98.97933197021484))')),
+     (2,43,1,ST_GeomFromText('POLYGON ((41.619667053222656 -98.89488220214844, 41.619667053222656 -98.84662628173828, 41.835262298583984 -98.85869598388672, 41.619667053222656 -98.89488220214844))')),
+     (1,44,1,ST_GeomFromText('POLYGON ((42.656700134277344 -98.22327423095703, 42.6477165222168 -98.22327423095703, 41.956016540527344 -97.6431884765625, 41.9470329284668 -97.63085174560547, 41.9470329284668 -97.6185073852539, 41.96500015258789 -97.6185073852539, 43.213653564453125 -97.66787719726562, 43.213653564453125 -97.69255828857422, 42.656700134277344 -98.22327423095703))')),
+     (2,44,1,ST_GeomFromText('POLYGON ((42.70161437988281 -98.24795532226562, 41.87517166137695 -98.02580261230469, 41.87517166137695 -97.98876953125, 43.168739318847656 -97.98876953125, 43.27653503417969 -98.00111389160156, 43.168739318847656 -98.05048370361328, 42.70161437988281 -98.24795532226562))')),
+     (1,45,1,ST_GeomFromText('POLYGON ((45.68735122680664 -108.87848663330078, 45.72328186035156 -108.6708984375, 46.05565643310547 -107.74972534179688, 46.109554290771484 -107.6329574584961, 46.064640045166016 -107.78865051269531, 45.68735122680664 -108.87848663330078))')),
+     (2,45,1,ST_GeomFromText('POLYGON ((46.11853790283203 -108.99525451660156, 45.61548614501953 -108.99525451660156, 45.61548614501953 -108.73577117919922, 46.11853790283203 -108.73577117919922, 46.17243957519531 -108.74874877929688, 46.11853790283203 -108.99525451660156))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,46,1,ST_GeomFromText('POLYGON ((31.991867065429688 -102.6323013305664, 32.21644592285156 -101.94194030761719, 32.18949508666992 -102.28180694580078, 31.991867065429688 -102.6323013305664))')),
+     (2,46,1,ST_GeomFromText('POLYGON ((32.234413146972656 -102.18621826171875, 32.135597229003906 -102.52609252929688, 32.0637321472168 -102.55795288085938, 31.973901748657227 -101.87821197509766, 31.973901748657227 -101.83572387695312, 32.0457649230957 -101.84635162353516, 32.234413146972656 -102.18621826171875))')),
+     (1,47,1,ST_GeomFromText('POLYGON ((32.59538269042969 -99.78939819335938, 32.58639907836914 -99.78939819335938, 31.966564178466797 -99.36259460449219, 31.957582473754883 -99.3519287109375, 31.51740837097168 -98.67971801757812, 32.6492805480957 -98.3809585571289, 32.65826416015625 -98.3809585571289, 32.65826416015625 -98.40229797363281, 32.59538269042969 -99.78939819335938))')),
+     (2,47,1,ST_GeomFromText('POLYGON ((32.59538269042969 -99.31991577148438, 32.55046844482422 -99.69336700439453, 31.688087463378906 -99.69336700439453, 31.61622428894043 -99.6613540649414, 31.51740837097168 -99.3519287109375, 31.51740837097168 -99.30924224853516, 31.580291748046875 -98.28492736816406, 32.44266891479492 -98.28492736816406, 32.65826416015625 -98.29559326171875, 32.59538269042969 -99.31991577148438))')),
+     (1,48,1,ST_GeomFromText('POLYGON ((34.408294677734375 -97.16753387451172, 34.56100845336914 -97.29916381835938, 34.56100845336914 -97.31013488769531, 34.552024841308594 -97.33206939697266, 33.36625671386719 -97.59532165527344, 33.35727310180664 -97.59532165527344, 33.35727310180664 -97.58435821533203, 33.61778259277344 -96.64102935791016, 33.626766204833984 -96.63005828857422, 33.6806640625 -96.57521057128906, 33.68964767456055 -96.57521057128906, 34.408294677734375 -97.16753387451172))')),
+     (2,48,1,ST_GeomFromText('POLYGON ((34.91135025024414 -97.33206939697266, 34.83948516845703 -97.36497497558594, 34.336429595947266 -97.56241607666016, 33.40218734741211 -97.36497497558594, 33.312355041503906 -96.6629638671875, 33.312355041503906 -96.61908721923828, 34.74965286254883 -96.61908721923828, 34.82151794433594 -96.63005828857422, 35.01016616821289 -96.98106384277344, 34.91135025024414 -97.33206939697266))')),
+     (1,49,1,ST_GeomFromText('POLYGON ((34.2836799621582 -98.93053436279297, 34.25672912597656 -98.93053436279297, 34.25672912597656 -98.9086685180664, 34.68791961669922 -98.78839111328125, 34.696903228759766 -98.78839111328125, 34.696903228759766 -98.79932403564453, 34.2836799621582 -98.93053436279297))')),
+     (2,49,1,ST_GeomFromText('POLYGON ((34.72385025024414 -98.76652526855469, 34.50825881958008 -98.78839111328125, 34.22079849243164 -98.78839111328125, 34.22079849243164 -98.7446517944336, 34.50825881958008 -98.7446517944336, 34.72385025024414 -98.75558471679688, 34.72385025024414 -98.76652526855469))')),
+     (1,50,1,ST_GeomFromText('POLYGON ((34.31204605102539 -94.48274230957031, 34.30306625366211 -94.4936294555664, 34.285099029541016 -94.4936294555664, 34.285099029541016 -94.46095275878906, 34.29408264160156 -94.43917083740234, 34.30306625366211 -94.43917083740234, 34.31204605102539 -94.46095275878906, 34.31204605102539 -94.48274230957031))')),
+     (2,50,1,ST_GeomFromText('POLYGON ((34.186283111572266 -94.3956069946289, 34.186283111572266 -94.35203552246094, 34.401878356933594 -94.36293029785156, 34.186283111572266 -94.3956069946289))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,51,1,ST_GeomFromText('POLYGON ((34.82578659057617 -94.38265228271484, 34.80781936645508 -94.40457153320312, 34.79883575439453 -94.40457153320312, 34.79883575439453 -94.38265228271484, 34.80781936645508 -94.34977722167969, 34.816802978515625 -94.34977722167969, 34.82578659057617 -94.37169647216797, 34.82578659057617 -94.38265228271484))')),
+     (2,51,1,ST_GeomFromText('POLYGON ((34.70002365112305 -94.3059310913086, 34.70002365112305 -94.26209259033203, 34.915618896484375 -94.27305603027344, 34.70002365112305 -94.3059310913086))')),
+     (1,52,1,ST_GeomFromText('POLYGON ((35.783172607421875 -95.99406433105469, 35.783172607421875 -96.00514221191406, 34.90282440185547 -96.06050872802734, 34.89384460449219 -96.06050872802734, 34.88486099243164 -96.04943084716797, 34.64231491088867 -95.54005432128906, 34.64231491088867 -95.51791381835938, 34.65129852294922 -95.49576568603516, 34.660282135009766 -95.49576568603516, 35.783172607421875 -95.99406433105469))')),
+     (2,52,1,ST_GeomFromText('POLYGON ((35.657405853271484 -95.99406433105469, 34.90282440185547 -96.07157897949219, 34.65129852294922 -95.97191619873047, 34.65129852294922 -95.92762756347656, 34.759098052978516 -95.85011291503906, 34.79502868652344 -95.83903503417969, 35.657405853271484 -95.83903503417969, 35.76520538330078 -95.85011291503906, 35.657405853271484 -95.99406433105469))')),
+     (1,53,1,ST_GeomFromText('POLYGON ((36.31496047973633 -95.24202728271484, 36.30597686767578 -95.24202728271484, 35.75800704956055 -95.14144897460938, 35.749027252197266 -95.10792541503906, 35.749027252197266 -95.09674835205078, 36.10834884643555 -94.61619567871094, 36.117332458496094 -94.61619567871094, 36.395809173583984 -94.82853698730469, 36.40479278564453 -94.85088348388672, 36.40479278564453 -94.862060546875, 36.31496047973633 -95.24202728271484))')),
+     (2,53,1,ST_GeomFromText('POLYGON ((36.23411178588867 -95.18614959716797, 35.65919494628906 -95.02969360351562, 35.65919494628906 -94.98499298095703, 36.24309539794922 -94.85088348388672, 36.48564147949219 -94.99617004394531, 36.23411178588867 -95.18614959716797))')),
+     (1,54,1,ST_GeomFromText('POLYGON ((35.99821472167969 -92.2283706665039, 35.99821472167969 -92.27278900146484, 35.95329666137695 -92.36161804199219, 35.944313049316406 -92.36161804199219, 35.7197380065918 -92.20616912841797, 35.7197380065918 -92.19506072998047, 35.97126388549805 -91.92858123779297, 35.980247497558594 -91.92858123779297, 35.99821472167969 -92.2283706665039))')),
+     (2,54,1,ST_GeomFromText('POLYGON ((35.980247497558594 -92.28388977050781, 35.836517333984375 -92.29499053955078, 35.728721618652344 -92.25057983398438, 35.728721618652344 -92.20616912841797, 35.8724479675293 -92.20616912841797, 35.980247497558594 -92.21726989746094, 35.980247497558594 -92.28388977050781))')),
+     (1,55,1,ST_GeomFromText('POLYGON ((36.34700012207031 -96.36691284179688, 36.35598373413086 -96.38924407958984, 36.35598373413086 -96.40040588378906, 36.338016510009766 -96.40040588378906, 36.24818420410156 -96.33341217041016, 36.28411865234375 -96.29991149902344, 36.311065673828125 -96.29991149902344, 36.34700012207031 -96.36691284179688))')),
+     (2,55,1,ST_GeomFromText('POLYGON ((36.185302734375 -96.27758026123047, 36.185302734375 -96.23291778564453, 36.40089797973633 -96.24408721923828, 36.185302734375 -96.27758026123047))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,56,1,ST_GeomFromText('POLYGON ((36.565223693847656 -96.20282745361328, 36.55624008178711 -96.22523498535156, 36.54725646972656 -96.22523498535156, 36.538272857666016 -96.20282745361328, 36.55624008178711 -96.16921997070312, 36.565223693847656 -96.16921997070312, 36.565223693847656 -96.20282745361328))')),
+     (2,56,1,ST_GeomFromText('POLYGON ((36.43946075439453 -96.12440490722656, 36.43946075439453 -96.07959747314453, 36.655052185058594 -96.0907974243164, 36.43946075439453 -96.12440490722656))')),
+     (1,57,1,ST_GeomFromText('POLYGON ((37.12004089355469 -101.59293365478516, 37.102073669433594 -101.60420989990234, 37.09309005737305 -101.60420989990234, 37.07512664794922 -101.59293365478516, 37.07512664794922 -101.57036590576172, 37.084110260009766 -101.54779815673828, 37.09309005737305 -101.53651428222656, 37.102073669433594 -101.53651428222656, 37.12004089355469 -101.54779815673828, 37.12004089355469 -101.59293365478516))')),
+     (2,57,1,ST_GeomFromText('POLYGON ((36.985294342041016 -101.49137878417969, 36.985294342041016 -101.44625091552734, 37.200889587402344 -101.45752716064453, 36.985294342041016 -101.49137878417969))')),
+     (1,58,1,ST_GeomFromText('POLYGON ((44.42880630493164 -120.82870483398438, 44.35694122314453 -121.04298400878906, 44.347957611083984 -121.04298400878906, 44.033546447753906 -119.6186752319336, 44.033546447753906 -119.59346771240234, 44.482704162597656 -117.74060821533203, 44.4916877746582 -117.74060821533203, 44.4916877746582 -117.75321960449219, 44.42880630493164 -120.82870483398438))')),
+     (2,58,1,ST_GeomFromText('POLYGON ((44.51863479614258 -120.51359558105469, 44.50965118408203 -120.8791275024414, 44.29405975341797 -121.09339904785156, 44.00659942626953 -121.09339904785156, 43.97964859008789 -118.91282653808594, 43.97964859008789 -118.84980773925781, 44.00659942626953 -117.65238189697266, 44.07846450805664 -117.63977813720703, 44.36592102050781 -117.63977813720703, 44.4916877746582 -118.44646453857422, 44.54558563232422 -119.26575469970703, 44.51863479614258 -120.51359558105469))')),
+     (1,59,1,ST_GeomFromText('POLYGON ((46.52765655517578 -118.05193328857422, 46.52765655517578 -118.06499481201172, 46.39291000366211 -118.16950225830078, 46.31206512451172 -118.07805633544922, 46.33002853393555 -117.93436431884766, 46.339012145996094 -117.93436431884766, 46.52765655517578 -118.05193328857422))')),
+     (2,59,1,ST_GeomFromText('POLYGON ((46.30308151245117 -118.15644073486328, 46.30308151245117 -118.10418701171875, 46.5186767578125 -117.93436431884766, 46.5186767578125 -118.05193328857422, 46.30308151245117 -118.15644073486328))')),
+     (1,60,1,ST_GeomFromText('POLYGON ((48.319313049316406 -120.1118392944336, 47.79829406738281 -120.31880187988281, 47.789310455322266 -120.31880187988281, 47.789310455322266 -120.27741241455078, 48.741519927978516 -118.55267333984375, 48.75050354003906 -118.55267333984375, 49.25355911254883 -119.5323257446289, 49.25355911254883 -119.5461196899414, 49.163726806640625 -119.60131072998047, 48.319313049316406 -120.1118392944336))')),
+     (2,60,1,ST_GeomFromText('POLYGON ((49.31644058227539 -119.72549438476562, 49.271522521972656 -120.42919158935547, 48.12168502807617 -120.42919158935547, 47.834224700927734 -120.4015884399414, 47.762359619140625 -120.16703033447266, 47.66354751586914 -119.78068542480469, 47.66354751586914 -119.7116928100586, 47.7264289855957 -118.38709259033203, 49.163726806640625 -118.38709259033203, 49.37932205200195 -118.40089416503906, 49.31644058227539 -119.72549438476562))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,61,1,ST_GeomFromText('POLYGON ((40.53064727783203 -123.78182220458984, 40.521663665771484 -123.78182220458984, 38.500465393066406 -122.01058197021484, 38.500465393066406 -121.99861907958984, 38.644195556640625 -120.46673583984375, 38.65317916870117 -120.45477294921875, 38.66215896606445 -120.45477294921875, 41.23133087158203 -120.49066925048828, 41.34811019897461 -120.5505142211914, 41.34811019897461 -120.5624771118164, 40.53064727783203 -123.78182220458984))')),
+     (2,61,1,ST_GeomFromText('POLYGON ((41.330142974853516 -123.36294555664062, 41.321163177490234 -123.5185317993164, 41.105567932128906 -123.55443572998047, 40.53064727783203 -123.56639862060547, 38.518428802490234 -123.56639862060547, 38.49148178100586 -121.63957977294922, 38.49148178100586 -121.59171295166016, 38.518428802490234 -120.45477294921875, 38.590293884277344 -120.44280242919922, 41.177433013916016 -120.44280242919922, 41.30319595336914 -121.208740234375, 41.357093811035156 -121.98664855957031, 41.330142974853516 -123.36294555664062))')),
+     (1,62,1,ST_GeomFromText('POLYGON ((31.448936462402344 -84.05381774902344, 31.448936462402344 -84.0643539428711, 31.314189910888672 -84.07489013671875, 31.29622459411621 -84.07489013671875, 31.29622459411621 -84.05381774902344, 31.38605499267578 -84.02220916748047, 31.395038604736328 -84.02220916748047, 31.448936462402344 -84.05381774902344))')),
+     (2,62,1,ST_GeomFromText('POLYGON ((31.260292053222656 -83.98005676269531, 31.260292053222656 -83.93791198730469, 31.475887298583984 -83.94844818115234, 31.260292053222656 -83.98005676269531))')),
+     (1,63,1,ST_GeomFromText('POLYGON ((31.87354850769043 -88.04885864257812, 31.45134162902832 -88.26050567626953, 31.442358016967773 -88.26050567626953, 31.352527618408203 -87.58323669433594, 31.352527618408203 -87.5726547241211, 31.89151382446289 -87.3821792602539, 31.900497436523438 -87.3821792602539, 31.900497436523438 -87.39276123046875, 31.87354850769043 -88.04885864257812))')),
+     (2,63,1,ST_GeomFromText('POLYGON ((31.900497436523438 -87.72080993652344, 31.80168342590332 -88.05944061279297, 31.72981834411621 -88.10176849365234, 31.442358016967773 -88.10176849365234, 31.352527618408203 -87.42450714111328, 31.352527618408203 -87.37158966064453, 31.63998794555664 -87.37158966064453, 31.71185302734375 -87.3821792602539, 31.900497436523438 -87.72080993652344))')),
+     (1,64,1,ST_GeomFromText('POLYGON ((31.810468673706055 -84.61306762695312, 31.657756805419922 -84.6342544555664, 31.648773193359375 -84.6342544555664, 31.558942794799805 -84.53889465332031, 31.558942794799805 -84.5282974243164, 31.63080596923828 -84.43293762207031, 31.639789581298828 -84.43293762207031, 31.927249908447266 -84.48591613769531, 31.927249908447266 -84.49651336669922, 31.810468673706055 -84.61306762695312))')),
+     (2,64,1,ST_GeomFromText('POLYGON ((31.7745361328125 -84.61306762695312, 31.487077713012695 -84.4647216796875, 31.487077713012695 -84.4223403930664, 31.7745361328125 -84.4223403930664, 31.990131378173828 -84.43293762207031, 31.7745361328125 -84.61306762695312))')),
+     (1,65,1,ST_GeomFromText('POLYGON ((33.33662033081055 -81.6044921875, 33.33662033081055 -81.62600708007812, 33.32763671875 -81.63676452636719, 33.31865310668945 -81.63676452636719, 33.130008697509766 -81.40011596679688, 33.130008697509766 -81.38935852050781, 33.13899230957031 -81.38935852050781, 33.31865310668945 -81.51844024658203, 33.33662033081055 -81.6044921875))')),
+     (2,65,1,ST_GeomFromText('POLYGON ((33.33662033081055 -81.62600708007812, 33.12102508544922 -81.47541046142578, 33.12102508544922 -81.40011596679688, 33.33662033081055 -81.41087341308594, 33.33662033081055 -81.62600708007812))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,66,1,ST_GeomFromText('POLYGON ((33.645957946777344 -92.39788055419922, 33.645957946777344 -92.40869140625, 33.6369743347168 -92.40869140625, 33.34951400756836 -91.965576171875, 33.34951400756836 -91.94395446777344, 33.42137908935547 -91.74942016601562, 33.430362701416016 -91.74942016601562, 33.43934631347656 -91.76022338867188, 33.645957946777344 -92.39788055419922))')),
+     (2,66,1,ST_GeomFromText('POLYGON ((33.65494155883789 -92.18172454833984, 33.223751068115234 -92.18172454833984, 33.223751068115234 -92.13849639892578, 33.65494155883789 -92.13849639892578, 33.76273727416992 -92.14930725097656, 33.65494155883789 -92.18172454833984))')),
+     (1,67,1,ST_GeomFromText('POLYGON ((33.841495513916016 -89.80774688720703, 33.83251190185547 -89.80774688720703, 33.563018798828125 -89.53650665283203, 33.563018798828125 -89.5256576538086, 33.6977653503418 -89.16761016845703, 34.084041595458984 -89.14591217041016, 34.093021392822266 -89.14591217041016, 34.093021392822266 -89.1567611694336, 33.841495513916016 -89.80774688720703))')),
+     (2,67,1,ST_GeomFromText('POLYGON ((33.985225677490234 -89.57990264892578, 33.6977653503418 -89.62330627441406, 33.55403518676758 -89.57990264892578, 33.55403518676758 -89.53650665283203, 33.985225677490234 -89.53650665283203, 34.093021392822266 -89.54735565185547, 33.985225677490234 -89.57990264892578))')),
+     (1,68,1,ST_GeomFromText('POLYGON ((34.3770637512207 -93.5042495727539, 34.3770637512207 -93.52603149414062, 34.35909652709961 -93.52603149414062, 33.89197540283203 -93.2646713256836, 33.89197540283203 -93.25377655029297, 33.90095901489258 -93.23200225830078, 33.909942626953125 -93.23200225830078, 34.3770637512207 -93.5042495727539))')),
+     (2,68,1,ST_GeomFromText('POLYGON ((33.882991790771484 -93.35179138183594, 33.882991790771484 -93.25377655029297, 34.17045211791992 -93.2646713256836, 34.38604736328125 -93.27555847167969, 33.882991790771484 -93.35179138183594))')),
+     (1,69,1,ST_GeomFromText('POLYGON ((35.139888763427734 -87.66118621826172, 35.139888763427734 -87.67217254638672, 34.744632720947266 -88.05665588378906, 34.73564910888672 -88.05665588378906, 33.9990348815918 -87.62823486328125, 33.9990348815918 -86.85926818847656, 34.008018493652344 -86.85926818847656, 35.139888763427734 -87.66118621826172))')),
+     (2,69,1,ST_GeomFromText('POLYGON ((34.142765045166016 -88.06763458251953, 33.9990348815918 -88.01271057128906, 33.9990348815918 -87.88088989257812, 34.070899963378906 -87.86990356445312, 35.07700729370117 -87.86990356445312, 35.13090515136719 -87.88088989257812, 35.07700729370117 -87.91384887695312, 34.142765045166016 -88.06763458251953))')),
+     (1,70,1,ST_GeomFromText('POLYGON ((34.66715621948242 -89.16392517089844, 34.73902130126953 -89.50284576416016, 34.73902130126953 -89.51377868652344, 34.730037689208984 -89.51377868652344, 34.478511810302734 -88.6828842163086, 34.478511810302734 -88.67195129394531, 34.48749542236328 -88.67195129394531, 34.66715621948242 -89.16392517089844))')),
+     (2,70,1,ST_GeomFromText('POLYGON ((34.73902130126953 -88.98900604248047, 34.73902130126953 -89.16392517089844, 34.64020538330078 -89.33885192871094, 34.56834411621094 -89.37165069580078, 34.478511810302734 -88.75941467285156, 34.478511810302734 -88.63915252685547, 34.550376892089844 -88.63915252685547, 34.73902130126953 -88.98900604248047))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,71,1,ST_GeomFromText('POLYGON ((34.66577911376953 -84.73853302001953, 34.656795501708984 -84.73853302001953, 34.64781188964844 -84.72758483886719, 34.64781188964844 -84.71663665771484, 34.74662780761719 -84.33354187011719, 34.76459503173828 -84.33354187011719, 34.76459503173828 -84.344482421875, 34.66577911376953 -84.73853302001953))')),
+     (2,71,1,ST_GeomFromText('POLYGON ((34.71967697143555 -84.64002227783203, 34.57594680786133 -84.64002227783203, 34.57594680786133 -84.59623718261719, 34.71967697143555 -84.59623718261719, 34.827476501464844 -84.60718536376953, 34.71967697143555 -84.64002227783203))')),
+     (1,72,1,ST_GeomFromText('POLYGON ((35.43562316894531 -92.80059051513672, 34.81578826904297 -92.94412994384766, 34.80680465698242 -92.94412994384766, 34.80680465698242 -92.9330825805664, 34.81578826904297 -92.92204284667969, 35.13917922973633 -92.53559875488281, 35.148162841796875 -92.53559875488281, 35.43562316894531 -92.76746368408203, 35.43562316894531 -92.80059051513672))')),
+     (2,72,1,ST_GeomFromText('POLYGON ((35.426639556884766 -92.84475708007812, 34.70798873901367 -92.84475708007812, 34.70798873901367 -92.80059051513672, 35.426639556884766 -92.80059051513672, 35.5344352722168 -92.81163024902344, 35.426639556884766 -92.84475708007812))')),
+     (1,73,1,ST_GeomFromText('POLYGON ((34.84568786621094 -94.28748321533203, 34.827720642089844 -94.28748321533203, 34.827720642089844 -94.2217025756836, 34.84568786621094 -94.2217025756836, 34.854671478271484 -94.2436294555664, 34.84568786621094 -94.28748321533203))')),
+     (2,73,1,ST_GeomFromText('POLYGON ((34.72890853881836 -94.17784881591797, 34.72890853881836 -94.13398742675781, 34.94450378417969 -94.14495086669922, 34.72890853881836 -94.17784881591797))')),
+     (1,74,1,ST_GeomFromText('POLYGON ((35.444671630859375 -84.12113189697266, 35.43568801879883 -84.13217163085938, 35.417720794677734 -84.1432113647461, 35.40874099731445 -84.1432113647461, 35.05839920043945 -84.09906005859375, 35.05839920043945 -84.08802032470703, 35.0673828125 -84.08802032470703, 35.444671630859375 -84.12113189697266))')),
+     (2,74,1,ST_GeomFromText('POLYGON ((35.28297424316406 -84.04386138916016, 34.99551773071289 -84.04386138916016, 34.99551773071289 -83.99970245361328, 35.28297424316406 -83.99970245361328, 35.49856948852539 -84.0107421875, 35.28297424316406 -84.04386138916016))')),
+     (1,75,1,ST_GeomFromText('POLYGON ((35.555397033691406 -91.12662506103516, 35.12420654296875 -91.47039031982422, 35.1152229309082 -91.47039031982422, 35.1152229309082 -91.45930480957031, 35.71709060668945 -90.68305206298828, 35.72607421875 -90.68305206298828, 35.82489013671875 -90.89375305175781, 35.82489013671875 -90.90483856201172, 35.555397033691406 -91.12662506103516))')),
+     (2,75,1,ST_GeomFromText('POLYGON ((35.88777160644531 -90.97137451171875, 35.78895568847656 -91.32623291015625, 35.71709060668945 -91.41494750976562, 35.142173767089844 -91.3594970703125, 35.05234146118164 -90.64978790283203, 35.05234146118164 -90.60543060302734, 35.627262115478516 -90.60543060302734, 35.699127197265625 -90.61651611328125, 35.88777160644531 -90.97137451171875))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,76,1,ST_GeomFromText('POLYGON ((35.732177734375 -93.77694702148438, 35.732177734375 -93.78802490234375, 35.72319793701172 -93.78802490234375, 35.309974670410156 -93.61080169677734, 35.309974670410156 -93.5886459350586, 35.66929626464844 -93.40035247802734, 35.678279876708984 -93.40035247802734, 35.732177734375 -93.77694702148438))')),
+     (2,76,1,ST_GeomFromText('POLYGON ((35.678279876708984 -93.71048736572266, 35.24708938598633 -93.69940948486328, 35.24708938598633 -93.65510559082031, 35.678279876708984 -93.65510559082031, 35.78607940673828 -93.66618347167969, 35.678279876708984 -93.71048736572266))')),
+     (1,77,1,ST_GeomFromText('POLYGON ((36.632137298583984 -87.98678588867188, 36.62315368652344 -87.98678588867188, 36.254844665527344 -87.7177505493164, 35.904502868652344 -86.5743408203125, 35.904502868652344 -86.5631332397461, 35.91348648071289 -86.5631332397461, 36.72196578979492 -87.06757354736328, 36.72196578979492 -87.07878875732422, 36.632137298583984 -87.98678588867188))')),
+     (2,77,1,ST_GeomFromText('POLYGON ((36.58721923828125 -87.79621887207031, 35.886539459228516 -87.74016571044922, 35.886539459228516 -87.69532775878906, 36.67705154418945 -87.69532775878906, 36.73094940185547 -87.70653533935547, 36.58721923828125 -87.79621887207031))')),
+     (1,78,1,ST_GeomFromText('POLYGON ((36.63705825805664 -91.63556671142578, 36.63705825805664 -91.64676666259766, 36.412479400634766 -91.71394348144531, 36.39451599121094 -91.71394348144531, 36.376548767089844 -91.5459976196289, 36.376548767089844 -91.53480529785156, 36.439430236816406 -91.27729034423828, 36.44841384887695 -91.27729034423828, 36.63705825805664 -91.63556671142578))')),
+     (2,78,1,ST_GeomFromText('POLYGON ((36.628074645996094 -91.64676666259766, 36.52027893066406 -91.79232025146484, 36.376548767089844 -91.60198211669922, 36.376548767089844 -91.55719757080078, 36.52027893066406 -91.55719757080078, 36.628074645996094 -91.56838989257812, 36.628074645996094 -91.64676666259766))')),
+     (1,79,1,ST_GeomFromText('POLYGON ((39.03853225708008 -89.53166961669922, 39.02954864501953 -89.53166961669922, 37.691062927246094 -88.09223175048828, 37.691062927246094 -88.08062744140625, 39.1822624206543 -87.23321533203125, 39.191246032714844 -87.23321533203125, 39.191246032714844 -87.24482727050781, 39.03853225708008 -89.53166961669922))')),
+     (2,79,1,ST_GeomFromText('POLYGON ((39.26311111450195 -89.601318359375, 37.82581329345703 -89.40397644042969, 37.6102180480957 -89.36914825439453, 37.58326721191406 -88.2895736694336, 37.58326721191406 -88.2431411743164, 37.62818145751953 -87.12874603271484, 39.06547927856445 -87.12874603271484, 39.13734436035156 -87.14035034179688, 39.299041748046875 -87.88328552246094, 39.26311111450195 -89.601318359375))')),
+     (1,80,1,ST_GeomFromText('POLYGON ((39.16403579711914 -97.39128875732422, 39.17301940917969 -97.40288543701172, 39.17301940917969 -97.41448211669922, 39.04725646972656 -97.43766784667969, 39.02928924560547 -97.43766784667969, 38.984375 -97.27533721923828, 38.984375 -97.26374816894531, 38.99335479736328 -97.26374816894531, 39.16403579711914 -97.39128875732422))')),
+     (2,80,1,ST_GeomFromText('POLYGON ((39.182003021240234 -97.47245025634766, 38.966407775878906 -97.34490966796875, 38.966407775878906 -97.24055480957031, 39.182003021240234 -97.24055480957031, 39.182003021240234 -97.47245025634766))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,81,1,ST_GeomFromText('POLYGON ((40.77186584472656 -100.06757354736328, 40.762882232666016 -100.09133911132812, 40.75389862060547 -100.09133911132812, 40.75389862060547 -100.06757354736328, 40.762882232666016 -100.03191375732422, 40.77186584472656 -100.03191375732422, 40.77186584472656 -100.06757354736328))')),
+     (2,81,1,ST_GeomFromText('POLYGON ((40.65508270263672 -99.98436737060547, 40.65508270263672 -99.93682861328125, 40.87067794799805 -99.9487075805664, 40.65508270263672 -99.98436737060547))')),
+     (1,82,1,ST_GeomFromText('POLYGON ((40.9052734375 -100.53740692138672, 40.887306213378906 -100.54933166503906, 40.86035919189453 -100.54933166503906, 40.86035919189453 -100.5254898071289, 40.87832260131836 -100.46587371826172, 41.06697082519531 -100.22740936279297, 41.075950622558594 -100.22740936279297, 41.075950622558594 -100.23933410644531, 40.9052734375 -100.53740692138672))')),
+     (2,82,1,ST_GeomFromText('POLYGON ((40.86035919189453 -100.31087493896484, 40.86035919189453 -100.26318359375, 41.075950622558594 -100.27510070800781, 40.86035919189453 -100.31087493896484))')),
+     (1,83,1,ST_GeomFromText('POLYGON ((44.083736419677734 -94.88423919677734, 44.07475280761719 -94.88423919677734, 44.07475280761719 -94.84663391113281, 44.083736419677734 -94.84663391113281, 44.083736419677734 -94.88423919677734))')),
+     (2,83,1,ST_GeomFromText('POLYGON ((43.966957092285156 -94.78396606445312, 43.966957092285156 -94.73382568359375, 44.182552337646484 -94.7463607788086, 43.966957092285156 -94.78396606445312))')),
+     (1,84,1,ST_GeomFromText('POLYGON ((45.43802261352539 -94.04259490966797, 45.429039001464844 -94.04259490966797, 45.213443756103516 -93.71939086914062, 45.213443756103516 -93.70645904541016, 45.887176513671875 -93.60303497314453, 45.90514373779297 -93.60303497314453, 45.90514373779297 -93.64181518554688, 45.43802261352539 -94.04259490966797))')),
+     (2,84,1,ST_GeomFromText('POLYGON ((45.8602294921875 -94.12017059326172, 45.57276916503906 -94.14602661132812, 45.141578674316406 -93.93917083740234, 45.141578674316406 -93.88745880126953, 45.8602294921875 -93.88745880126953, 45.96802520751953 -93.90038299560547, 45.8602294921875 -94.12017059326172))')),
+     (1,85,1,ST_GeomFromText('POLYGON ((43.963722229003906 -108.04471588134766, 43.95473861694336 -108.04471588134766, 43.95473861694336 -108.00713348388672, 44.01762008666992 -107.89437866210938, 44.12541580200195 -107.89437866210938, 43.963722229003906 -108.04471588134766))')),
+     (2,85,1,ST_GeomFromText('POLYGON ((43.936771392822266 -108.0948257446289, 43.936771392822266 -107.83174133300781, 44.152366638183594 -107.84426879882812, 43.936771392822266 -108.0948257446289))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,86,1,ST_GeomFromText('POLYGON ((44.947837829589844 -108.05509185791016, 44.947837829589844 -108.06781768798828, 44.9208869934082 -108.06781768798828, 44.9208869934082 -108.05509185791016, 44.92987060546875 -108.02965545654297, 44.9388542175293 -108.02965545654297, 44.947837829589844 -108.05509185791016))')),
+     (2,86,1,ST_GeomFromText('POLYGON ((44.82207489013672 -107.97877502441406, 44.82207489013672 -107.91516876220703, 45.03767013549805 -107.92788696289062, 44.82207489013672 -107.97877502441406))')),
+     (1,87,1,ST_GeomFromText('POLYGON ((46.00839614868164 -116.35104370117188, 45.89161682128906 -116.29923248291016, 45.89161682128906 -116.27333068847656, 45.97246551513672 -116.1178970336914, 45.981449127197266 -116.10494232177734, 45.99043273925781 -116.10494232177734, 46.00839614868164 -116.35104370117188))')),
+     (2,87,1,ST_GeomFromText('POLYGON ((45.83771896362305 -116.143798828125, 45.83771896362305 -116.09199523925781, 46.053314208984375 -116.10494232177734, 45.83771896362305 -116.143798828125))')),
+     (1,88,1,ST_GeomFromText('POLYGON ((46.06087112426758 -115.33698272705078, 46.05188751220703 -115.33698272705078, 46.042903900146484 -115.32400512695312, 46.042903900146484 -115.31102752685547, 46.06087112426758 -115.31102752685547, 46.06087112426758 -115.33698272705078))')),
+     (2,88,1,ST_GeomFromText('POLYGON ((45.944087982177734 -115.24613952636719, 45.944087982177734 -115.1812515258789, 46.15968322753906 -115.19422912597656, 45.944087982177734 -115.24613952636719))')),
+     (1,89,1,ST_GeomFromText('POLYGON ((46.25761795043945 -116.41439819335938, 46.248634338378906 -116.41439819335938, 46.248634338378906 -116.38833618164062, 46.2666015625 -116.21893310546875, 46.27558517456055 -116.21893310546875, 46.31151580810547 -116.23196411132812, 46.31151580810547 -116.25802612304688, 46.25761795043945 -116.41439819335938))')),
+     (2,89,1,ST_GeomFromText('POLYGON ((46.16778564453125 -116.23196411132812, 46.16778564453125 -116.17984008789062, 46.38338088989258 -116.19287109375, 46.16778564453125 -116.23196411132812))')),
+     (1,90,1,ST_GeomFromText('POLYGON ((46.5921516418457 -117.43508911132812, 46.51130294799805 -117.5921401977539, 46.43943786621094 -117.44817352294922, 46.46638870239258 -117.4089126586914, 46.520286560058594 -117.3565673828125, 46.52927017211914 -117.3565673828125, 46.5921516418457 -117.42200469970703, 46.5921516418457 -117.43508911132812))')),
+     (2,90,1,ST_GeomFromText('POLYGON ((46.403507232666016 -117.39582824707031, 46.403507232666016 -117.34347534179688, 46.619102478027344 -117.3565673828125, 46.403507232666016 -117.39582824707031))'));
+INSERT INTO mask (status_id,fire_id,run_id,polygon) VALUES
+     (1,91,1,ST_GeomFromText('POLYGON ((46.949745178222656 -117.72721862792969, 46.949745178222656 -117.74038696289062, 46.77008056640625 -117.67453002929688, 46.77008056640625 -117.6613540649414, 46.7790641784668 -117.64817810058594, 46.886863708496094 -117.64817810058594, 46.949745178222656 -117.72721862792969))')),
+     (2,91,1,ST_GeomFromText('POLYGON ((46.75211715698242 -117.59548950195312, 46.75211715698242 -117.55596923828125, 46.96771240234375 -117.56914520263672, 46.75211715698242 -117.59548950195312))'));
@@ -1,12 +1,159 @@
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import requests.adapters
 import constants
+import threading
+import time
 BASE_URL = 'https://api.twilio.com/2010-04-01/Accounts'
 API_ACCOUNT_SID = constants.TWILLIO_ACCOUNT_SID
 API_ACCOUNT_AUTH_TOKEN = constants.TWILLIO_ACCOUNT_AUTH_TOKEN
+FROM_NUMBER = "+17407626065"
+
+# match these to the Twilio account limits (messages per second, and how many may be sent at once after a quiet period)
+MESSAGES_PER_SECOND = 1
+MESSAGE_BURST = 5
+
+# maximum number of requests to Twilio in flight at once
+MAX_CONCURRENCY = 4
 
 footer = ("\n\nNOTE: Ember-Alert does not supercede your local authorities orders. Ember-Alert uses satellite data to"
     + "detect fires and is not 100% accurate. Please check with your local authorities before taking action.")
 
+
+class TokenBucket:
+    """
+    Constructor
+
+    Args:
+      rate: Number of tokens added per second
+      capacity: Maximum number of tokens held at once
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        # wait until a token is available and take it
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class MessageDispatcher:
+    """
+    Constructor
+
+    Args:
+      base_url: Twilio accounts endpoint, which can be pointed at a local fake server
+      max_workers: Maximum number of requests in flight at once
+      rate: Messages sent per second
+      burst: Messages that may be sent at once after a quiet period
+      attempts: Number of times a message is attempted on 429 and 5xx responses or connection errors
+      backoff: Delay in seconds before the first retry when Twilio does not send Retry-After, doubled after every attempt
+    """
+    def __init__(self, base_url=BASE_URL, max_workers=MAX_CONCURRENCY, rate=MESSAGES_PER_SECOND, burst=MESSAGE_BURST, attempts=4, backoff=1.0):
+        self.url = f'{base_url}/{API_ACCOUNT_SID}/Messages'
+        self.attempts = attempts
+        self.backoff = backoff
+        self.bucket = TokenBucket(rate, burst)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # one session keeps the connections to Twilio open between messages
+        self.session = requests.Session()
+        self.session.auth = requests.auth.HTTPBasicAuth(API_ACCOUNT_SID, API_ACCOUNT_AUTH_TOKEN)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+    # returns a future resolving to the delivery result of the message
+    def submit(self, phone_number, message):
+        return self.executor.submit(self._send, phone_number, message)
+
+    # messages: list of (phone_number, message). returns the delivery results in the same order
+    def send_all(self, messages):
+        futures = [self.submit(phone_number, message) for phone_number, message in messages]
+        return [future.result() for future in futures]
+
+    def _send(self, phone_number, message):
+        params = {'Body': message + footer, 'From': FROM_NUMBER, 'To': phone_number}
+        result = {'to': phone_number, 'success': False, 'status': None, 'sid': None, 'error': None, 'attempts': 0}
+
+        for attempt in range(1, self.attempts + 1):
+            self.bucket.acquire()
+            result['attempts'] = attempt
+            retry_after = None
+
+            try:
+                r = self.session.post(self.url, data=params, timeout=30)
+            except requests.RequestException as e:
+                result['error'] = str(e)
+            else:
+                result['status'] = r.status_code
+
+                if r.status_code == 201:
+                    result['success'] = True
+                    result['error'] = None
+                    try:
+                        result['sid'] = r.json().get('sid')
+                    except ValueError:
+                        pass
+                    return result
+
+                result['error'] = r.text
+
+                # other client errors (invalid number, unsubscribed recipient...) will not succeed on retry
+                if r.status_code != 429 and r.status_code < 500:
+                    return result
+
+                retry_after = r.headers.get('Retry-After')
+
+            if attempt < self.attempts:
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = self.backoff * 2 ** (attempt - 1)
+                time.sleep(delay)
+
+        print(f"ERROR: Message to {phone_number} failed to send. {result['error']}")
+        return result
+
+
+# shared by every caller in the process, created on first use
+dispatcher = None
+dispatcher_lock = threading.Lock()
+
+def get_dispatcher():
+    global dispatcher
+
+    with dispatcher_lock:
+        if dispatcher is None:
+            dispatcher = MessageDispatcher()
+
+    return dispatcher
+
 def send_opt_in_message(phone_number):
     message = ("You're now signed up to receive alerts from EmberAlert! Please note that EmberAlert does not"
         +" replace the need to follow local government orders. \n \nTo stop receiving alerts please reply with OPTOUT")
@@ -17,12 +164,8 @@ def send_opt_out_message(phone_number):
     send_message(phone_number, message)
 
 def send_message(phone_number, message):
-    authInfo = requests.auth.HTTPBasicAuth(API_ACCOUNT_SID, API_ACCOUNT_AUTH_TOKEN)
-    url = f'{BASE_URL}/{API_ACCOUNT_SID}/Messages'
-    params = {'Body': message + footer, 'From': "+17407626065", 'To': phone_number}
-    try:
-        r = requests.post(url, data=params, auth=authInfo)
-        if r != 201:
-            assert("Message Failed to send")
-    except Exception as e:
-        print("ERROR: " + e)
\ No newline at end of file
+    return get_dispatcher().submit(phone_number, message).result()['success']
+
+# messages: list of (phone_number, message). returns the delivery result of every message
+def send_messages(messages):
+    return get_dispatcher().send_all(messages)
@@ -0,0 +1,109 @@
+import Clustering
+
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.metrics import adjusted_rand_score
+import hdbscan
+import numpy as np
+import os
+import pandas as pd
+import pytest
+
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'firms_sample.csv')
+
+MIN_CLUSTER_SIZE = 3
+
+# Share of the compared detections that may be noise in one clustering and clustered in the other
+MAX_NOISE_DIFFERENCE = 0.01
+
+
+@pytest.fixture(scope='module')
+def sample():
+    """
+    Day of confident detections in the FIRMS area, clustered by grouping and by the single HDBSCAN of the baseline
+
+    The sample is synthetic, in the columns of the FIRMS responses: fires and fire complexes of 20 to 250 detections in
+    the west, small fires of 2 to 12 detections across the area and scattered single detections.
+    """
+    df = pd.read_csv(SAMPLE_PATH)
+    lats, lngs = df['latitude'].to_numpy(), df['longitude'].to_numpy()
+
+    baseline = hdbscan.HDBSCAN(metric='haversine', min_cluster_size=MIN_CLUSTER_SIZE).fit(np.radians(df[['latitude', 'longitude']])).labels_
+    labels = Clustering.cluster_detections(lats, lngs, MIN_CLUSTER_SIZE)
+    groups = Clustering.group_detections(lats, lngs)
+
+    return baseline, labels, groups
+
+
+def _spanning_groups(baseline: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    Auxiliary function to find the groups holding a baseline cluster that chains detections across groups
+    """
+    spanning = [cluster for cluster in np.unique(baseline[baseline >= 0]) if len(np.unique(groups[baseline == cluster])) > 1]
+    return np.unique(groups[np.isin(baseline, spanning)])
+
+
+def test_clusters_stay_within_groups(sample):
+    _, labels, groups = sample
+
+    for cluster in np.unique(labels[labels >= 0]):
+        assert len(np.unique(groups[labels == cluster])) == 1
+
+
+def test_parity_with_single_hdbscan(sample):
+    """
+    Allowed differences from the baseline:
+      - Baseline clusters chaining detections further apart than the link distance are not compared, with the rest of
+        their groups, as grouping never clusters across that distance
+      - Detections on the border of a cluster may be noise in one clustering and clustered in the other, up to
+        MAX_NOISE_DIFFERENCE of the compared detections
+    Detections clustered by both are split into the same clusters.
+    """
+    baseline, labels, groups = sample
+
+    compared = ~np.isin(groups, _spanning_groups(baseline, groups))
+    baseline, labels = baseline[compared], labels[compared]
+
+    # Most of the sample is compared, so the exclusion does not hide a wholesale difference
+    assert compared.mean() > 0.5
+
+    assert np.mean((baseline < 0) != (labels < 0)) <= MAX_NOISE_DIFFERENCE
+
+    clustered = (baseline >= 0) & (labels >= 0)
+    assert adjusted_rand_score(baseline[clustered], labels[clustered]) == 1
+
+
+def test_isolated_group_is_one_cluster():
+    # Two fires 100 km. apart, each small enough to be a single cluster
+    rng = np.random.default_rng(0)
+    lats = np.concatenate((40 + rng.normal(0, 0.01, 8), 41 + rng.normal(0, 0.01, 8)))
+    lngs = np.concatenate((-120 + rng.normal(0, 0.01, 8), -120 + rng.normal(0, 0.01, 8)))
+
+    labels = Clustering.cluster_detections(lats, lngs, MIN_CLUSTER_SIZE)
+
+    assert (labels >= 0).all()
+    assert len(np.unique(labels[:8])) == 1 and len(np.unique(labels[8:])) == 1
+    assert labels[0] != labels[8]
+
+
+def test_incremental_matches_full_clustering(sample):
+    df = pd.read_csv(SAMPLE_PATH)
+    lats, lngs = df['latitude'].to_numpy(), df['longitude'].to_numpy()
+    keys = (df['latitude'].astype(str) + ',' + df['longitude'].astype(str) + ',' + df['acq_time'].astype(str)).to_numpy()
+
+    clusterer = Clustering.IncrementalClusterer(MIN_CLUSTER_SIZE)
+    clusterer.update(lats[:len(lats) // 2], lngs[:len(lats) // 2], keys[:len(lats) // 2])
+    labels, _ = clusterer.update(lats, lngs, keys)
+
+    assert adjusted_rand_score(sample[1], labels) == 1
+
+
+def test_worker_pool_matches_this_process(sample, monkeypatch):
+    df = pd.read_csv(SAMPLE_PATH)
+
+    # Small tasks, so the groups are spread over several tasks and workers
+    monkeypatch.setattr(Clustering, 'PARALLEL_CHUNK_SIZE', 200)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        labels = Clustering.cluster_detections(df['latitude'].to_numpy(), df['longitude'].to_numpy(), MIN_CLUSTER_SIZE, executor=pool)
+
+    assert np.array_equal(sample[1], labels)
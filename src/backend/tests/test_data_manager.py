@@ -0,0 +1,103 @@
+import DataManager
+
+import mysql.connector
+import pytest
+
+
+class FakeConnection:
+    """
+    Constructor
+
+    Args:
+      name: Name telling the pooled and dedicated connections apart
+      ping_error: Error raised by the health check, if any
+    """
+    def __init__(self, name: str, ping_error: Exception=None):
+        self.name = name
+        self.ping_error = ping_error
+        self.pings = 0
+        self.closed = False
+
+    def ping(self, reconnect: bool, attempts: int, delay: int):
+        self.pings += 1
+        if self.ping_error is not None:
+            raise self.ping_error
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool:
+    """
+    Constructor
+
+    Args:
+      connections: Connections handed out in order, then PoolError as when every pooled connection is in use
+    """
+    def __init__(self, connections: list[FakeConnection]):
+        self.connections = list(connections)
+
+    def get_connection(self) -> FakeConnection:
+        if len(self.connections) == 0:
+            raise mysql.connector.errors.PoolError('Failed getting connection; pool exhausted')
+        return self.connections.pop(0)
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """
+    Pool of a single fake connection, with the dedicated connections opened by mysql.connector.connect
+    """
+    pooled = FakeConnection('pooled')
+    dedicated = []
+
+    def connect(**config):
+        assert config == DataManager.CONNECTION_CONFIG
+        dedicated.append(FakeConnection('dedicated'))
+        return dedicated[-1]
+
+    monkeypatch.setattr(DataManager, 'connection_pool', FakePool([pooled]))
+    monkeypatch.setattr(mysql.connector, 'connect', connect)
+
+    return pooled, dedicated
+
+
+def test_pooled_connection_is_checked(connections):
+    pooled, dedicated = connections
+
+    assert DataManager.open_connection() is pooled
+    assert pooled.pings == 1 and dedicated == []
+
+
+def test_exhausted_pool_falls_back_to_a_dedicated_connection(connections):
+    pooled, dedicated = connections
+
+    assert DataManager.open_connection() is pooled
+    fallback = DataManager.open_connection()
+
+    assert fallback is dedicated[0] and fallback.name == 'dedicated'
+    assert pooled.pings == 1
+
+
+def test_failed_health_check_releases_the_connection(monkeypatch):
+    broken = FakeConnection('pooled', mysql.connector.errors.InterfaceError('Connection lost'))
+    monkeypatch.setattr(DataManager, 'connection_pool', FakePool([broken]))
+
+    with pytest.raises(mysql.connector.errors.InterfaceError):
+        DataManager.open_connection()
+
+    assert broken.closed
+
+
+def test_pool_is_created_once(monkeypatch):
+    created = []
+
+    def create_pool(**config):
+        created.append(config)
+        return FakePool([])
+
+    monkeypatch.setattr(DataManager, 'connection_pool', None)
+    monkeypatch.setattr(mysql.connector.pooling, 'MySQLConnectionPool', create_pool)
+
+    assert DataManager.get_connection_pool() is DataManager.get_connection_pool()
+    assert len(created) == 1 and created[0]['pool_size'] == DataManager.POOL_SIZE
@@ -0,0 +1,103 @@
+from FetchScheduler import FetchScheduler, LimitAPI, wait_all
+
+import FetchScheduler as fetch_scheduler
+import pytest
+import threading
+import time
+
+
+@pytest.fixture
+def delays(monkeypatch):
+    """
+    Delays the scheduler slept for between attempts, which are not waited
+    """
+    delays = []
+    monkeypatch.setattr(fetch_scheduler.time, 'sleep', delays.append)
+    return delays
+
+
+def _failing(failures: int) -> callable:
+    """
+    Auxiliary function to create a fake fetch function that fails a number of times before returning, counting its calls
+    """
+    calls = []
+
+    def fetch(value):
+        calls.append(value)
+        if len(calls) <= failures:
+            raise ConnectionError(f'attempt {len(calls)} failed')
+        return value
+
+    fetch.calls = calls
+    return fetch
+
+
+def test_retries_until_success(delays):
+    fetch = _failing(2)
+
+    with FetchScheduler(1, attempts=5) as scheduler:
+        assert scheduler.submit(fetch, 'data').result() == 'data'
+
+    assert len(fetch.calls) == 3
+    assert len(delays) == 2
+
+
+def test_error_is_raised_after_the_last_attempt(delays):
+    fetch = _failing(10)
+
+    with FetchScheduler(1, attempts=4) as scheduler:
+        with pytest.raises(ConnectionError, match='attempt 4 failed'):
+            scheduler.submit(fetch, 'data').result()
+
+    assert len(fetch.calls) == 4
+    assert len(delays) == 3
+
+
+def test_backoff_is_jittered_exponential_and_capped(delays):
+    with FetchScheduler(1, attempts=6, backoff=1.0, max_backoff=5.0) as scheduler:
+        with pytest.raises(ConnectionError):
+            scheduler.submit(_failing(10), 'data').result()
+
+    # Each delay is between half and all of the doubled backoff, which is capped at max_backoff
+    for delay, backoff in zip(delays, [1, 2, 4, 5, 5], strict=True):
+        assert backoff * 0.5 <= delay <= backoff
+
+
+def test_wait_all_raises_the_first_failure(delays):
+    with FetchScheduler(4, attempts=2) as scheduler:
+        futures = [scheduler.submit(fetch, index) for index, fetch in enumerate([_failing(0), _failing(10), _failing(1)])]
+
+        with pytest.raises(ConnectionError):
+            wait_all(futures)
+
+        # The other requests still finish
+        assert futures[0].result() == 0 and futures[2].result() == 2
+
+
+def test_wait_all_keeps_order():
+    def fetch(value, delay):
+        time.sleep(delay)
+        return value
+
+    # Earlier requests finish later
+    with FetchScheduler(3) as scheduler:
+        futures = [scheduler.submit(fetch, index, delay) for index, delay in enumerate([0.1, 0.05, 0])]
+
+        assert wait_all(futures) == [0, 1, 2]
+
+
+def test_waiting_caller_does_not_hold_the_limit():
+    limiter = LimitAPI(1, 0.5, cushion=0)
+    limiter.call()
+
+    waiting = threading.Thread(target=limiter.call)
+    waiting.start()
+    time.sleep(0.1)
+
+    # Another caller checking the limit is answered while the first waits for the refresh
+    start = time.monotonic()
+    assert not limiter.can_call()
+    assert time.monotonic() - start < 0.1
+
+    waiting.join()
+    assert limiter.calls == 1
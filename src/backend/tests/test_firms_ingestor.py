@@ -0,0 +1,113 @@
+from FirmsIngestor import FirmsIngestor
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+import pytest
+import threading
+
+
+HEADER = 'latitude,longitude,acq_date,acq_time,confidence\n'
+
+
+@pytest.fixture
+def firms_server():
+    """
+    Stub FIRMS endpoint returning the rows of the served list, which the test changes between fetches
+    """
+    served = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = (HEADER + ''.join(served)).encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_port}', served
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_late_detection_is_kept(firms_server):
+    url, served = firms_server
+    ingestor = FirmsIngestor('key', 'area', ['VIIRS_SNPP_NRT'], base_url=url)
+
+    served.append('46.1,-116.1,2024-08-01,1130,h\n')
+    assert len(ingestor.fetch('2024-08-01')) == 1
+
+    # Published after the 11:30 detection was fetched, but acquired earlier
+    served.append('46.2,-116.2,2024-08-01,1000,h\n')
+    df = ingestor.fetch('2024-08-01')
+
+    assert sorted(df['acq_time']) == ['1000', '1130']
+
+
+def test_detections_are_not_repeated(firms_server, tmp_path):
+    url, served = firms_server
+    served.extend([
+        '46.1,-116.1,2024-08-01,1130,h\n',
+        '46.1,-116.1,2024-08-01,1130,h\n',
+        '46.3,-116.3,2024-08-01,1200,l\n'
+    ])
+
+    FirmsIngestor('key', 'area', ['VIIRS_SNPP_NRT'], tmp_path, base_url=url).fetch('2024-08-01')
+
+    # A new process reloads the retained detections and is served the same rows again
+    df = FirmsIngestor('key', 'area', ['VIIRS_SNPP_NRT'], tmp_path, base_url=url).fetch('2024-08-01')
+
+    assert len(df) == 1
+
+
+def test_second_fetch_adds_only_new_rows(firms_server, monkeypatch):
+    url, served = firms_server
+    ingestor = FirmsIngestor('key', 'area', ['VIIRS_SNPP_NRT'], base_url=url)
+
+    served.extend([
+        '46.1,-116.1,2024-08-01,0300,h\n',
+        '46.2,-116.2,2024-08-01,0930,h\n',
+        '46.3,-116.3,2024-08-01,1130,h\n'
+    ])
+    ingestor.fetch('2024-08-01')
+
+    # Rows added by each fetch
+    read = []
+    read_source = ingestor._read_source
+
+    def recording_read_source(*args):
+        read.append(read_source(*args))
+        return read[-1]
+
+    monkeypatch.setattr(ingestor, '_read_source', recording_read_source)
+
+    served.append('46.4,-116.4,2024-08-01,1300,h\n')
+    df = ingestor.fetch('2024-08-01')
+
+    # Every detection of the date is returned, but only the new row is added
+    assert len(df) == 4
+    assert read[0]['acquired'].tolist() == [pd.Timestamp('2024-08-01 13:00')]
+
+
+def test_detection_older_than_grace_is_dropped(firms_server):
+    url, served = firms_server
+    ingestor = FirmsIngestor('key', 'area', ['VIIRS_SNPP_NRT'], base_url=url, grace=pd.Timedelta(hours=3))
+
+    served.append('46.1,-116.1,2024-08-01,1200,h\n')
+    ingestor.fetch('2024-08-01')
+
+    # Published after the 12:00 detection was fetched, within and beyond the grace window
+    served.extend([
+        '46.2,-116.2,2024-08-01,0930,h\n',
+        '46.3,-116.3,2024-08-01,0830,h\n'
+    ])
+    df = ingestor.fetch('2024-08-01')
+
+    assert sorted(df['acq_time']) == ['0930', '1200']
@@ -0,0 +1,124 @@
+from math import atan2, cos, radians, sin, sqrt
+
+import Geodesy
+import numpy as np
+import pytest
+
+
+def haversine(coord1: tuple[float, float], coord2: tuple[float, float]) -> dict[str, float]:
+    """
+    Scalar haversine of the baseline DataRetriever
+    """
+    lat1, lng1, lat2, lng2 = map(radians, [coord1[0], coord1[1], coord2[0], coord2[1]])
+
+    return {
+        "lat": _haversine(lat1, (lng1 + lng2) / 2.0, lat2, (lng1 + lng2) / 2.0),
+        "lng": _haversine((lat1 + lat2) / 2.0, lng1, (lat1 + lat2) / 2.0, lng2),
+        "dst": _haversine(lat1, lng1, lat2, lng2)
+    }
+
+
+def _haversine(lat1: float=0.0, lng1: float=0.0, lat2: float=0.0, lng2: float=0.0) -> float:
+    """
+    Auxiliary function of the baseline to compute the haversine distance
+    """
+    lat = lat2 - lat1
+    lng = lng2 - lng1
+
+    a = sin(lat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(lng / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1-a))
+    return c * 6371
+
+
+def adjusted_coordinate(coordinate: tuple[float, float], lat_adj: float, lng_adj: float) -> tuple[float, float]:
+    """
+    Scalar coordinate adjustment of the baseline DataRetriever
+    """
+    return (
+        coordinate[0] + lat_adj / Geodesy.ARC_DEGREE_DISTANCE,
+        coordinate[1] + lng_adj / (cos(radians(coordinate[0])) * Geodesy.ARC_DEGREE_DISTANCE)
+    )
+
+
+# Pairs of points across the antimeridian, at and next to the poles, on the equator and within the FIRMS area
+EDGE_PAIRS = [
+    ((10.0, 179.9), (10.5, -179.9)),
+    ((-45.0, -179.5), (-44.0, 179.5)),
+    ((0.0, 180.0), (0.0, -180.0)),
+    ((89.9, 0.0), (89.9, 180.0)),
+    ((90.0, 0.0), (89.0, 45.0)),
+    ((-90.0, 10.0), (-89.5, -170.0)),
+    ((0.0, 0.0), (0.0, 0.0)),
+    ((0.0, -10.0), (0.0, 10.0)),
+    ((25.0, -125.0), (50.0, -65.0)),
+    ((40.1234, -120.5678), (40.1234, -120.5678))
+]
+
+
+@pytest.mark.parametrize('coord1, coord2', EDGE_PAIRS)
+def test_haversine_components_edge_cases(coord1, coord2):
+    expected = haversine(coord1, coord2)
+
+    d_lat, d_lng, d_all = Geodesy.haversine_components(*coord1, *coord2)
+
+    assert d_lat == pytest.approx(expected['lat'], rel=1e-12, abs=1e-9)
+    assert d_lng == pytest.approx(expected['lng'], rel=1e-12, abs=1e-9)
+    assert d_all == pytest.approx(expected['dst'], rel=1e-12, abs=1e-9)
+
+
+def test_haversine_components_broadcast():
+    rng = np.random.default_rng(0)
+    lats1, lngs1 = rng.uniform(-90, 90, 40), rng.uniform(-180, 180, 40)
+    lats2, lngs2 = rng.uniform(-90, 90, 30), rng.uniform(-180, 180, 30)
+
+    # Every first point against every second point
+    d_lat, d_lng, d_all = Geodesy.haversine_components(lats1[:, None], lngs1[:, None], lats2[None, :], lngs2[None, :])
+
+    assert d_lat.shape == d_lng.shape == d_all.shape == (40, 30)
+    for i in range(40):
+        for j in range(30):
+            expected = haversine((lats1[i], lngs1[i]), (lats2[j], lngs2[j]))
+            assert d_lat[i, j] == pytest.approx(expected['lat'], rel=1e-12, abs=1e-9)
+            assert d_lng[i, j] == pytest.approx(expected['lng'], rel=1e-12, abs=1e-9)
+            assert d_all[i, j] == pytest.approx(expected['dst'], rel=1e-12, abs=1e-9)
+
+
+def test_haversine_components_scalar_origin():
+    # One origin against many points, as get_current_mask measures the detections of a cluster
+    rng = np.random.default_rng(1)
+    origin = (48.5, -121.25)
+    lats, lngs = rng.uniform(47, 49, 100), rng.uniform(-123, -120, 100)
+
+    d_lat, d_lng, _ = Geodesy.haversine_components(origin[0], origin[1], lats, lngs)
+
+    np.testing.assert_allclose(d_lat, [haversine(origin, point)['lat'] for point in zip(lats, lngs)], rtol=1e-12)
+    np.testing.assert_allclose(d_lng, [haversine(origin, point)['lng'] for point in zip(lats, lngs)], rtol=1e-12)
+
+
+@pytest.mark.parametrize('origin', [(0.0, 0.0), (40.0, -120.0), (-33.9, 151.2), (10.0, 179.95), (89.9, 0.0), (-89.99, 45.0)])
+def test_offset_coordinates_edge_cases(origin):
+    for lat_adj, lng_adj in [(0.0, 0.0), (32.0, -32.0), (-250.5, 1000.0), (1e-6, -1e-6)]:
+        lat, lng = Geodesy.offset_coordinates(origin, lat_adj, lng_adj)
+
+        # Longitudes are not wrapped across the antimeridian, like the baseline
+        assert (float(lat), float(lng)) == pytest.approx(adjusted_coordinate(origin, lat_adj, lng_adj), rel=1e-12, abs=1e-12)
+
+
+def test_offset_coordinates_broadcast():
+    # The grid of process_clusters: one origin offset by every pair of row and column offsets
+    origin = (44.2, -114.7)
+    i_offsets, j_offsets = np.meshgrid(32 * np.arange(6), 32 * np.arange(9), indexing='ij')
+
+    lats, lngs = Geodesy.offset_coordinates(origin, -i_offsets, j_offsets)
+
+    assert lats.shape == lngs.shape == (6, 9)
+    for i in range(6):
+        for j in range(9):
+            assert (lats[i, j], lngs[i, j]) == pytest.approx(adjusted_coordinate(origin, -32 * i, 32 * j), rel=1e-12)
+
+    # Many origins each offset once, as get_mask_coords adjusts the origin per cell
+    origins = (np.array([10.0, 20.0, 30.0]), np.array([-100.0, 0.0, 100.0]))
+    lats, lngs = Geodesy.offset_coordinates(origins, np.array([1.0, 2.0, 3.0]), np.array([-1.0, -2.0, -3.0]))
+
+    for k in range(3):
+        assert (lats[k], lngs[k]) == pytest.approx(adjusted_coordinate((origins[0][k], origins[1][k]), k + 1.0, -(k + 1.0)), rel=1e-12)
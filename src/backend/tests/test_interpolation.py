@@ -0,0 +1,84 @@
+from scipy.interpolate import griddata
+
+import Interpolation
+import numpy as np
+import pytest
+
+
+N_ATTRIBUTES = 10
+
+
+def lattice_coords(shape: tuple[int, int], spacing: int=32) -> np.ndarray:
+    """
+    Grid points of a region, every spacing cells from its origin as the engine samples them
+    """
+    ys, xs = np.meshgrid(spacing * np.arange(round(shape[0] / spacing) + 1), spacing * np.arange(round(shape[1] / spacing) + 1), indexing='ij')
+    return np.column_stack((xs.ravel(), ys.ravel())).astype(np.float64)
+
+
+def reference(coords: np.ndarray, values: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """
+    Interpolation of the baseline, calling griddata for every attribute over its valid samples
+    """
+    xv, yv = np.meshgrid(np.arange(0, shape[1]), np.arange(0, shape[0]))
+
+    attributes = []
+    for attribute in values.T:
+        valid = ~np.isnan(attribute)
+        attributes.append(griddata(coords[valid], attribute[valid], (xv, yv), method='linear', fill_value=np.mean(attribute[valid])))
+
+    return np.stack(attributes, axis=-1)
+
+
+def random_values(rng: np.random.Generator, size: int, missing: float) -> np.ndarray:
+    """
+    Values of every attribute at every sample on different scales, with some missing
+    """
+    values = rng.normal(0, 1, (size, N_ATTRIBUTES)) * 10.0 ** rng.integers(-2, 4, N_ATTRIBUTES)
+
+    # Half the attributes are missing at some samples, but never at the first three
+    missing = rng.random((size, N_ATTRIBUTES)) < missing
+    missing[:3] = False
+    missing[:, N_ATTRIBUTES // 2:] = False
+    values[missing] = np.nan
+
+    return values
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_lattice_matches_griddata(seed):
+    rng = np.random.default_rng(seed)
+    shape = tuple(int(value) for value in rng.integers(40, 200, 2))
+    coords = lattice_coords(shape)
+    values = random_values(rng, len(coords), 0.2)
+
+    expected = reference(coords, values, shape)
+    actual = Interpolation.GridInterpolator(coords, shape).interpolate(values)
+
+    assert actual.shape == expected.shape and actual.dtype == np.float32
+    np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-6 * np.nanmax(np.abs(values)))
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_scattered_matches_griddata(seed):
+    rng = np.random.default_rng(seed)
+    shape = tuple(int(value) for value in rng.integers(10, 120, 2))
+    coords = rng.uniform(-5, np.array(shape[::-1]) + 5, (int(rng.integers(4, 80)), 2))
+    values = random_values(rng, len(coords), 0.3)
+
+    expected = reference(coords, values, shape)
+    actual = Interpolation.GridInterpolator(coords, shape).interpolate(values)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-6 * np.nanmax(np.abs(values)))
+
+
+def test_triangulations_are_shared():
+    rng = np.random.default_rng(0)
+    shape = (64, 96)
+    coords = lattice_coords(shape)
+    values = random_values(rng, len(coords), 0.0)
+
+    interpolator = Interpolation.GridInterpolator(coords, shape)
+    interpolator.interpolate(values)
+
+    assert len(interpolator.weights) == 1
@@ -0,0 +1,120 @@
+from messages import MessageDispatcher
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+import json
+import pytest
+import threading
+import time
+
+
+@pytest.fixture
+def twilio_server():
+    """
+    Fake Twilio endpoint answering each recipient with its scripted responses in order, then with 201
+
+    Responses are (status, headers, delay in seconds) and every request is recorded as (recipient, time received).
+    """
+    responses = {}
+    received = []
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            to = parse_qs(self.rfile.read(int(self.headers['Content-Length'])).decode())['To'][0]
+
+            with lock:
+                received.append((to, time.monotonic()))
+                status, headers, delay = responses.get(to, []).pop(0) if responses.get(to) else (201, {}, 0)
+
+            time.sleep(delay)
+
+            body = json.dumps({'sid': f'SM{to}'} if status == 201 else {'message': f'status {status}'}).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_port}', responses, received
+
+    server.shutdown()
+    server.server_close()
+
+
+def _dispatcher(url: str) -> MessageDispatcher:
+    """
+    Auxiliary function to create a dispatcher whose rate limit and backoff do not slow the tests down
+    """
+    return MessageDispatcher(base_url=url, rate=1000, burst=1000, attempts=4, backoff=0.01)
+
+
+def test_created_message(twilio_server):
+    url, _, received = twilio_server
+
+    with _dispatcher(url) as dispatcher:
+        result = dispatcher.submit('15550000001', 'Fire nearby').result()
+
+    assert result['success'] and result['status'] == 201
+    assert result['sid'] == 'SM15550000001'
+    assert result['attempts'] == 1 and len(received) == 1
+
+
+def test_client_error_is_not_retried(twilio_server):
+    url, responses, received = twilio_server
+    responses['15550000001'] = [(400, {}, 0)]
+
+    with _dispatcher(url) as dispatcher:
+        result = dispatcher.submit('15550000001', 'Fire nearby').result()
+
+    assert not result['success'] and result['status'] == 400
+    assert result['attempts'] == 1 and len(received) == 1
+
+
+def test_too_many_requests_waits_for_retry_after(twilio_server):
+    url, responses, received = twilio_server
+    responses['15550000001'] = [(429, {'Retry-After': '0.3'}, 0)]
+
+    with _dispatcher(url) as dispatcher:
+        result = dispatcher.submit('15550000001', 'Fire nearby').result()
+
+    assert result['success'] and result['attempts'] == 2
+    assert received[1][1] - received[0][1] >= 0.3
+
+
+def test_server_errors_are_retried(twilio_server):
+    url, responses, received = twilio_server
+    responses['15550000001'] = [(503, {}, 0), (500, {}, 0)]
+    responses['15550000002'] = [(503, {}, 0)] * 4
+
+    with _dispatcher(url) as dispatcher:
+        recovered = dispatcher.submit('15550000001', 'Fire nearby').result()
+        failed = dispatcher.submit('15550000002', 'Fire nearby').result()
+
+    assert recovered['success'] and recovered['attempts'] == 3
+    assert not failed['success'] and failed['status'] == 503
+    assert failed['attempts'] == 4 and len(received) == 7
+
+
+def test_send_all_keeps_message_order(twilio_server):
+    url, responses, _ = twilio_server
+
+    # Earlier messages are answered later, so they complete out of order
+    phone_numbers = [f'1555000000{index}' for index in range(6)]
+    for index, phone_number in enumerate(phone_numbers):
+        responses[phone_number] = [(201, {}, 0.05 * (len(phone_numbers) - index))]
+
+    with _dispatcher(url) as dispatcher:
+        results = dispatcher.send_all([(phone_number, 'Fire nearby') for phone_number in phone_numbers])
+
+    assert [result['to'] for result in results] == phone_numbers
+    assert [result['sid'] for result in results] == [f'SM{phone_number}' for phone_number in phone_numbers]
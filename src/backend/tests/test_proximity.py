@@ -0,0 +1,95 @@
+from Services import Proximity
+
+import Geodesy
+import Geometry
+import numpy as np
+import pytest
+
+
+def random_polygon(rng: np.random.Generator, centre: tuple[float, float], radius: float, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Star shaped polygon around a centre, with its vertices in order and radius in km.
+    """
+    angles = np.sort(rng.uniform(0, 2 * np.pi, size))
+    distances = radius * rng.uniform(0.3, 1, size)
+
+    return Geodesy.offset_coordinates(centre, distances * np.sin(angles), distances * np.cos(angles))
+
+
+def random_scene(seed: int) -> tuple[list[tuple[str, float, float]], list[tuple[int, np.ndarray, np.ndarray]]]:
+    """
+    Users scattered around a few fires, some inside them and some far away
+    """
+    rng = np.random.default_rng(seed)
+
+    polygons = []
+    for fire_id in range(int(rng.integers(1, 8))):
+        centre = (float(rng.uniform(30, 48)), float(rng.uniform(-124, -70)))
+        polygons.append((fire_id, *random_polygon(rng, centre, rng.uniform(1, 30), int(rng.integers(3, 60)))))
+
+    users = []
+    for user in range(400):
+        fire_id, polygon_lats, polygon_lngs = polygons[rng.integers(len(polygons))]
+        lat, lng = Geodesy.offset_coordinates((polygon_lats.mean(), polygon_lngs.mean()), rng.normal(0, 60), rng.normal(0, 60))
+        users.append((f'{user:010d}', float(lat), float(lng)))
+
+    return users, polygons
+
+
+def brute_force(users: list[tuple[str, float, float]], polygons: list[tuple[int, np.ndarray, np.ndarray]], radius: float) -> dict[str, tuple[int, float]]:
+    """
+    Closest polygon to every user within the radius, measuring every user against every polygon
+    """
+    lats = np.array([user[1] for user in users])
+    lngs = np.array([user[2] for user in users])
+
+    nearest = {}
+
+    for fire_id, polygon_lats, polygon_lngs in polygons:
+        distances = Geometry.polygon_distances(lats, lngs, polygon_lats, polygon_lngs)
+
+        for (phone_number, _, _), distance in zip(users, distances.tolist()):
+            if distance <= radius and (phone_number not in nearest or distance < nearest[phone_number][1]):
+                nearest[phone_number] = (fire_id, distance)
+
+    return nearest
+
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('radius', [5.0, 50.0, 200.0])
+def test_matches_brute_force(seed, radius):
+    users, polygons = random_scene(seed)
+
+    nearest = Proximity.users_near_polygons(Proximity.UserIndex(users), polygons, radius)
+    expected = brute_force(users, polygons, radius)
+
+    assert nearest.keys() == expected.keys()
+    for phone_number, (fire_id, distance) in expected.items():
+        assert nearest[phone_number][0] == fire_id
+        assert nearest[phone_number][1] == pytest.approx(distance, abs=1e-9)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_distances_agree_with_haversine(seed):
+    users, polygons = random_scene(seed)
+
+    nearest = Proximity.users_near_polygons(Proximity.UserIndex(users), polygons, 200.0)
+
+    # The closest point of a polygon is at most as far as its closest vertex, and is no further from it than the longest edge
+    for phone_number, lat, lng in users:
+        if phone_number not in nearest or nearest[phone_number][1] == 0:
+            continue
+
+        fire_id, distance = nearest[phone_number]
+        _, polygon_lats, polygon_lngs = polygons[fire_id]
+        vertex_distances = Geodesy.haversine_distance(np.radians(lat), np.radians(lng), np.radians(polygon_lats), np.radians(polygon_lngs))
+        edge_lengths = Geodesy.haversine_distance(*np.radians((polygon_lats, polygon_lngs, np.roll(polygon_lats, -1), np.roll(polygon_lngs, -1))))
+
+        assert distance <= vertex_distances.min() + 1e-9
+        assert distance >= vertex_distances.min() - edge_lengths.max() - 1e-6
+
+
+def test_no_users():
+    polygon_lats, polygon_lngs = random_polygon(np.random.default_rng(0), (40, -120), 10, 12)
+
+    assert Proximity.users_near_polygons(Proximity.UserIndex([]), [(0, polygon_lats, polygon_lngs)], 50.0) == {}
@@ -0,0 +1,63 @@
+from PIL import Image, ImageDraw
+
+import DataRetriever
+import Geodesy
+import numpy as np
+import pandas as pd
+import pytest
+
+
+SOURCES = ['MODIS_NRT', 'VIIRS_NOAA20_NRT', 'VIIRS_NOAA21_NRT', 'VIIRS_SNPP_NRT']
+
+
+def draw_mask(d_lat: int, d_lng: int, origin: tuple[float, float], points: pd.DataFrame) -> np.ndarray:
+    """
+    Reference mask of the baseline, drawing every footprint with PIL on the fine grid and downsampling it
+    """
+    width = d_lng * DataRetriever.SCALING_FACTOR
+    height = d_lat * DataRetriever.SCALING_FACTOR
+
+    img = Image.new('1', (width, height))
+
+    draw = ImageDraw.Draw(img)
+    for _, row in points.iterrows():
+        offset_y, offset_x, _ = Geodesy.haversine_components(origin[0], origin[1], row['latitude'], row['longitude'])
+
+        offset_y = offset_y * DataRetriever.SCALING_FACTOR
+        offset_x = offset_x * DataRetriever.SCALING_FACTOR
+
+        adjustment = (1 if 'MODIS' in row['source'] else 0.375) * DataRetriever.SCALING_FACTOR
+        draw.rectangle([(offset_x - adjustment, offset_y - adjustment), (offset_x + adjustment, offset_y + adjustment)], fill=1)
+
+    return np.array(img.resize((round(width / DataRetriever.SCALING_FACTOR), round(height / DataRetriever.SCALING_FACTOR))))
+
+
+def random_points(rng: np.random.Generator, d_lat: int, d_lng: int, origin: tuple[float, float]) -> pd.DataFrame:
+    """
+    Random detections in and around a region south east of the origin, some with footprints crossing its edges
+    """
+    size = rng.integers(1, 60)
+    lats, lngs = Geodesy.offset_coordinates(
+        origin,
+        -rng.uniform(-2, d_lat + 2, size),
+        rng.uniform(-2, d_lng + 2, size)
+    )
+
+    return pd.DataFrame({'latitude': lats, 'longitude': lngs, 'source': rng.choice(SOURCES, size)})
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_mask_matches_pil(seed):
+    rng = np.random.default_rng(seed)
+    d_lat, d_lng = (int(value) for value in rng.integers(1, 2 * DataRetriever.BLOCK_SIZE, 2))
+    origin = (float(rng.uniform(25, 50)), float(rng.uniform(-125, -65)))
+    points = random_points(rng, d_lat, d_lng, origin)
+
+    np.testing.assert_array_equal(DataRetriever.get_current_mask(d_lat, d_lng, origin, points), draw_mask(d_lat, d_lng, origin, points))
+
+
+def test_unknown_source_is_rejected():
+    points = pd.DataFrame({'latitude': [40.0], 'longitude': [-120.0], 'source': ['LANDSAT_NRT']})
+
+    with pytest.raises(Exception):
+        DataRetriever.get_current_mask(4, 4, (40.1, -120.1), points)